@@ -2,17 +2,24 @@
 """
 Analyze similarity between forward and reverse hints to determine if we can
 optimize future regenerations by deriving one from the other.
+
+With --backend tfidf, similarity is the TF-IDF cosine of the two hints
+(gloss_similarity.py), computed for all pairs in one sparse product instead
+of one SequenceMatcher alignment per pair.
 """
 
+import argparse
 import json
 from pathlib import Path
 from difflib import SequenceMatcher
 
-def load_hints():
-    """Load both forward and reverse hints"""
-    forward_path = Path("public/data/collocation_hints.json")
-    reverse_path = Path("public/data/reverse_hints.json")
+from gloss_similarity import add_similarity_arguments, similarity_from_args
+
+DEFAULT_FORWARD = Path("public/data/collocation_hints.json")
+DEFAULT_REVERSE = Path("public/data/reverse_hints.json")
 
+def load_hints(forward_path=DEFAULT_FORWARD, reverse_path=DEFAULT_REVERSE):
+    """Load both forward and reverse hints"""
     with open(forward_path, 'r', encoding='utf-8') as f:
         forward_data = json.load(f)
 
@@ -25,32 +32,41 @@ def calculate_similarity(str1, str2):
     """Calculate similarity ratio between two strings"""
     return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
 
-def analyze_hints():
-    """Compare forward and reverse hints for the same word pairs"""
-    forward_hints, reverse_hints = load_hints()
+def analyze_hints(forward_path=DEFAULT_FORWARD, reverse_path=DEFAULT_REVERSE,
+                  output_path=Path("data-preparation/hint_similarity_analysis.json"), similarity=None):
+    """
+    Compare forward and reverse hints for the same word pairs.
+
+    Args:
+        similarity: Optional gloss_similarity.TfidfSimilarity; without it,
+                    pairs are compared with calculate_similarity()
+    """
+    forward_hints, reverse_hints = load_hints(forward_path, reverse_path)
 
     comparisons = []
-    total_pairs = 0
 
-    # Compare matching pairs
+    # Collect matching pairs
     for verb_japanese, noun_hints in forward_hints.items():
         for noun_japanese, forward_hint in noun_hints.items():
             # Check if reverse hint exists for this pair
             if noun_japanese in reverse_hints:
                 reverse_noun_hints = reverse_hints[noun_japanese]
                 if verb_japanese in reverse_noun_hints:
-                    reverse_hint = reverse_noun_hints[verb_japanese]
-
-                    similarity = calculate_similarity(forward_hint, reverse_hint)
-
                     comparisons.append({
                         'verb': verb_japanese,
                         'noun': noun_japanese,
                         'forward_hint': forward_hint,
-                        'reverse_hint': reverse_hint,
-                        'similarity': similarity
+                        'reverse_hint': reverse_noun_hints[verb_japanese],
                     })
-                    total_pairs += 1
+    total_pairs = len(comparisons)
+
+    if similarity is not None:
+        scores = similarity.paired([c['forward_hint'] for c in comparisons],
+                                   [c['reverse_hint'] for c in comparisons]).tolist()
+    else:
+        scores = [calculate_similarity(c['forward_hint'], c['reverse_hint']) for c in comparisons]
+    for comparison, score in zip(comparisons, scores):
+        comparison['similarity'] = score
 
     # Calculate statistics
     similarities = [c['similarity'] for c in comparisons]
@@ -116,7 +132,6 @@ def analyze_hints():
         print("               to maintain quality and clarity.")
 
     # Save detailed analysis
-    output_path = Path("data-preparation/hint_similarity_analysis.json")
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump({
             'total_pairs': total_pairs,
@@ -131,5 +146,18 @@ def analyze_hints():
 
     print(f"\nDetailed analysis saved to: {output_path}")
 
+def main():
+    parser = argparse.ArgumentParser(description="Compare forward and reverse hints for the same word pairs")
+    parser.add_argument('--forward', type=Path, default=DEFAULT_FORWARD,
+                        help=f"Forward hints file (default: {DEFAULT_FORWARD})")
+    parser.add_argument('--reverse', type=Path, default=DEFAULT_REVERSE,
+                        help=f"Reverse hints file, {{noun: {{verb: hint}}}} (default: {DEFAULT_REVERSE})")
+    parser.add_argument('--output', type=Path, default=Path("data-preparation/hint_similarity_analysis.json"),
+                        help="Analysis JSON (default: data-preparation/hint_similarity_analysis.json)")
+    add_similarity_arguments(parser)
+    args = parser.parse_args()
+
+    analyze_hints(args.forward, args.reverse, args.output, similarity_from_args(args))
+
 if __name__ == "__main__":
-    analyze_hints()
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Content-hashed copies of the published data files, and the manifest that names them.
+
+The app fetched collocation_meanings.json and reverse_meanings.json with
+?v=Date.now(), so no HTTP or service-worker cache could ever serve them, and
+the other files could be served stale after a deploy. This step runs in the
+deploy build, after vite has copied public/ into dist/. It copies every
+artifact in dist/data to dist/data/hashed/ under a name that includes its
+content hash, and writes dist/data/manifest.json:
+
+    {"version": 1, "generatedAt": ...,
+     "artifacts": {"collocation_meanings.json": {"file": "hashed/collocation_meanings.3f9a1c2b.json",
+                                                 "bytes": 119199, "sha256": ...,
+                                                 "integrity": "sha384-..."}, ...}}
+
+A hashed file never changes, so it can be cached forever (Cache-Control:
+immutable). Only manifest.json has to be revalidated, and the client
+fetches it with cache: 'no-cache'. "integrity" is a Subresource Integrity
+value for fetch().
+
+Nothing of this is committed: the manifest is built from exactly the files
+being deployed, so a script that rewrites public/data on its own (outside
+build.py) cannot leave it pointing at old content. Without a manifest
+(e.g. under the vite dev server) the app fetches the plain files.
+
+Each deploy publishes only the hashed files of its own manifest. A client
+still holding the previous manifest.json gets a 404 for a file that
+changed; fetchDataFile() in src/services/dataLoader.js then fetches the
+plain file instead, and the next app load picks up the new manifest.
+
+If the directory is reused between runs, hashed files the manifest no
+longer names are deleted, and if no artifact changed, nothing is rewritten.
+
+Usage (from the repository root, after npm run build):
+    python data-preparation/artifact_manifest.py            # write hashed copies and manifest.json into dist/data
+    python data-preparation/artifact_manifest.py --verify   # check the manifest against the files
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# public/data as copied by vite build
+DATA_DIR = REPO_ROOT / "dist" / "data"
+SOURCE_DIR = REPO_ROOT / "public" / "data"
+HASHED_DIR = "hashed"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+# Hex digits of the sha256 in a hashed file name
+NAME_HASH_LENGTH = 8
+
+ARTIFACTS = [
+    'vocabulary.json',
+    'vocabulary_id_migration.json',
+    'collocations_complete.json',
+    'collocations_complete.bin',
+    'collocation_meanings.json',
+    'reverse_meanings.json',
+    'synonym_groups.json',
+    'studylist_n5.json',
+    'studylist_n54.json',
+    'shard_n5.json',
+    'shard_n54.json',
+]
+
+
+def hashed_name(name: str, sha256: str) -> str:
+    """collocation_meanings.json -> collocation_meanings.<first 8 hex digits>.json"""
+    path = Path(name)
+    return f"{path.stem}.{sha256[:NAME_HASH_LENGTH]}{path.suffix}"
+
+
+def integrity(content: bytes) -> str:
+    """Subresource Integrity value (sha384) of the content."""
+    return 'sha384-' + base64.b64encode(hashlib.sha384(content).digest()).decode('ascii')
+
+
+def artifact_record(name: str, content: bytes) -> dict:
+    sha256 = hashlib.sha256(content).hexdigest()
+    return {'file': f"{HASHED_DIR}/{hashed_name(name, sha256)}", 'bytes': len(content), 'sha256': sha256,
+            'integrity': integrity(content)}
+
+
+def load_manifest(data_dir: Path) -> dict:
+    path = data_dir / MANIFEST_NAME
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'version': MANIFEST_VERSION, 'artifacts': {}}
+
+
+def write_file(path: Path, content: bytes) -> None:
+    """Write bytes atomically (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_manifest(data_dir: Path = DATA_DIR, names: List[str] = ARTIFACTS) -> Dict[str, List[str]]:
+    """
+    Copy every artifact to its hashed name and write manifest.json.
+
+    Args:
+        data_dir: Directory holding the published files
+        names: Artifact file names (missing ones are skipped with a warning)
+
+    Returns:
+        {'changed': artifacts with a new hashed file, 'removed': hashed files deleted}
+    """
+    previous = load_manifest(data_dir)
+    artifacts = {}
+    changed = []
+    for name in names:
+        path = data_dir / name
+        if not path.exists():
+            print(f"Warning: {path} not found, skipping...")
+            continue
+        content = path.read_bytes()
+        record = artifacts[name] = artifact_record(name, content)
+        target = data_dir / record['file']
+        if not target.exists() or target.read_bytes() != content:
+            write_file(target, content)
+        if previous['artifacts'].get(name, {}).get('sha256') != record['sha256']:
+            changed.append(name)
+
+    if changed or set(previous['artifacts']) != set(artifacts):
+        manifest = {'version': MANIFEST_VERSION, 'generatedAt': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    'artifacts': artifacts}
+        write_file(data_dir / MANIFEST_NAME,
+                   json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+    files = {record['file'] for record in artifacts.values()}
+
+    removed = []
+    hashed_dir = data_dir / HASHED_DIR
+    for path in sorted(hashed_dir.iterdir()) if hashed_dir.exists() else []:
+        if f"{HASHED_DIR}/{path.name}" not in files:
+            path.unlink()
+            removed.append(path.name)
+    return {'changed': changed, 'removed': removed}
+
+
+def verify_manifest(data_dir: Path = DATA_DIR) -> List[str]:
+    """
+    Check that every manifest entry names a hashed copy of the current file.
+
+    Returns:
+        Problems found (empty if the manifest is current)
+    """
+    manifest = load_manifest(data_dir)
+    problems = []
+    if not manifest['artifacts']:
+        problems.append(f"no artifacts in {data_dir / MANIFEST_NAME}")
+    for name, record in manifest['artifacts'].items():
+        target = data_dir / record['file']
+        if not target.exists():
+            problems.append(f"{name}: {record['file']} is missing")
+            continue
+        content = target.read_bytes()
+        if artifact_record(name, content) != record:
+            problems.append(f"{name}: {record['file']} does not match its manifest entry")
+        if (data_dir / name).read_bytes() != content:
+            problems.append(f"{name}: changed since the manifest was written")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write content-hashed copies of the built data and manifest.json")
+    parser.add_argument('--data', type=Path, default=DATA_DIR, help=f"Built data directory (default: {DATA_DIR})")
+    parser.add_argument('--verify', action='store_true', help="Only check the manifest against the files")
+    args = parser.parse_args()
+
+    if not args.verify:
+        result = write_manifest(args.data)
+        print(f"{len(result['changed'])} artifact(s) changed: {', '.join(result['changed']) or '-'}")
+        if result['removed']:
+            print(f"Removed {len(result['removed'])} outdated hashed file(s)")
+
+    problems = verify_manifest(args.data)
+    for problem in problems:
+        print(f"  {problem}")
+    if problems:
+        sys.exit(1)
+    print(f"OK: {args.data / MANIFEST_NAME} is current")
+
+
+if __name__ == '__main__':
+    main()
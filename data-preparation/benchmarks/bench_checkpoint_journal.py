@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark checkpoint I/O: full-file JSON rewrites vs the append-only journal.
+
+Simulates a meanings run over the real pair list (public/data/
+collocations_complete.json, optionally repeated --scale times) and
+measures the bytes written and time spent checkpointing with:
+
+- rewrite: the old save_hints_checkpoint() pattern, dumping every result
+  so far with indent=2 after every 10th finished group
+- journal: CheckpointJournal.append() per pair, fsync'd
+
+It then truncates the journal mid-line (a crash during a write) and checks
+that replay recovers every complete pair.
+
+Usage (from the repository root):
+    python data-preparation/benchmarks/bench_checkpoint_journal.py [--scale 10]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from checkpoint_journal import CheckpointJournal
+from pair_manifest import pair_record
+
+COLLOCATIONS = Path("public/data/collocations_complete.json")
+CHECKPOINT_EVERY = 10
+
+
+def load_pairs(scale):
+    """Forward (verb, noun) pairs, repeated `scale` times with suffixed verbs."""
+    with open(COLLOCATIONS, 'r', encoding='utf-8') as f:
+        words = json.load(f)['words']
+    base = [(word, match['word']) for word, data in words.items() if data['type'] in ('verb', 'adjective')
+            for match in data['matches'].get('nouns', [])]
+    return [(f"{verb}#{copy}" if copy else verb, noun) for copy in range(scale) for verb, noun in base]
+
+
+def bench_rewrite(pairs, directory):
+    """Old pattern: rewrite the whole nested result map every CHECKPOINT_EVERY finished groups."""
+    path = directory / "checkpoint.json"
+    results = {}
+    written = 0
+    finished_groups = 0
+    start = time.perf_counter()
+    for i, (verb, noun) in enumerate(pairs):
+        results.setdefault(verb, {})[noun] = f"to do something with {noun}"
+        group_done = i + 1 == len(pairs) or pairs[i + 1][0] != verb
+        if group_done:
+            finished_groups += 1
+            if finished_groups % CHECKPOINT_EVERY == 0:
+                text = json.dumps({'status': f"In progress: {finished_groups}", 'meanings': results},
+                                  ensure_ascii=False, indent=2)
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                written += len(text.encode('utf-8'))
+    return time.perf_counter() - start, written
+
+
+def bench_journal(pairs, directory, fsync):
+    """New pattern: one durable append per pair."""
+    journal = CheckpointJournal(directory / "checkpoint.jsonl", fsync=fsync)
+    start = time.perf_counter()
+    for verb, noun in pairs:
+        journal.append(pair_record(verb, noun, "0" * 64, "model", f"to do something with {noun}"))
+    journal.close()
+    return time.perf_counter() - start, journal.path.stat().st_size, journal
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark checkpoint rewrite vs append-only journal")
+    parser.add_argument('--scale', type=int, default=1, help="Repeat the pair list this many times")
+    args = parser.parse_args()
+
+    pairs = load_pairs(args.scale)
+    print(f"{len(pairs)} pairs (scale {args.scale})\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        rewrite_time, rewrite_bytes = bench_rewrite(pairs, directory)
+        journal_time, journal_bytes, _ = bench_journal(pairs, directory / "nofsync", fsync=False)
+        fsync_time, fsync_bytes, journal = bench_journal(pairs, directory / "fsync", fsync=True)
+
+        print(f"{'mode':<22} {'time':>9} {'bytes written':>15} {'per pair':>10}")
+        for name, elapsed, written in [("rewrite every 10", rewrite_time, rewrite_bytes),
+                                       ("journal (no fsync)", journal_time, journal_bytes),
+                                       ("journal (fsync)", fsync_time, fsync_bytes)]:
+            print(f"{name:<22} {elapsed:>8.2f}s {written:>15,} {written / len(pairs):>9,.0f}B")
+
+        # Simulate a crash in the middle of the last append
+        size = journal.path.stat().st_size
+        with open(journal.path, 'r+b') as f:
+            f.truncate(size - 20)
+        recovered = journal.replay()
+        ok = len(recovered) == len(pairs) - 1 and journal.skipped_lines == 1
+        print(f"\nTorn last line: recovered {len(recovered)}/{len(pairs) - 1} complete pairs, "
+              f"{journal.skipped_lines} line dropped [{'OK' if ok else 'FAIL'}]")
+        if not ok:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
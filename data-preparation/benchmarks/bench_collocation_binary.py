@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compact collocation binary format against the JSON.
+
+Reports, for public/data/collocations_complete.json (optionally replicated
+--scale times with suffixed words):
+
+- size: raw, gzip -9 and brotli (quality 11, if the brotli package is
+  installed) for the pretty-printed JSON, minified JSON and the .bin
+- parse time: json.loads alone, json.loads + CollocationGraph build, and
+  collocation_binary.decode straight to a graph
+
+Usage (from the repository root):
+    python data-preparation/benchmarks/bench_collocation_binary.py [--scale 10]
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_collocation_graph import replicate, timed
+from collocation_binary import DEFAULT_INPUT, decode, encode
+from collocation_graph import CollocationGraph
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def sizes(data: bytes):
+    """(raw, gzip, brotli or None) sizes in bytes."""
+    return (len(data), len(gzip.compress(data, compresslevel=9)),
+            len(brotli.compress(data, quality=11)) if brotli else None)
+
+
+def kb(size):
+    return f"{size / 1024:>9.1f}KB" if size is not None else f"{'n/a':>11}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the collocation binary format against JSON")
+    parser.add_argument('--scale', type=int, default=1, help="Replicate the dataset this many times")
+    args = parser.parse_args()
+
+    with open(DEFAULT_INPUT, 'r', encoding='utf-8') as f:
+        data = replicate(json.load(f), args.scale)
+    pretty = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    minified = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    binary = encode(CollocationGraph.from_data(data))
+    print(f"{len(data['words'])} words (scale {args.scale})\n")
+
+    print(f"{'format':<20} {'raw':>11} {'gzip -9':>11} {'brotli 11':>11}")
+    for name, payload in [("JSON (indent=2)", pretty), ("JSON (minified)", minified), ("binary", binary)]:
+        raw, gz, br = sizes(payload)
+        print(f"{name:<20} {kb(raw)} {kb(gz)} {kb(br)}")
+    if brotli is None:
+        print("(brotli not installed: pip install brotli)")
+
+    print(f"\n{'parse':<32} {'time':>9}")
+    for name, fn in [
+        ("json.loads", lambda: json.loads(pretty)),
+        ("json.loads + graph build", lambda: CollocationGraph.from_data(json.loads(pretty))),
+        ("binary decode -> graph", lambda: decode(binary)),
+    ]:
+        print(f"{name:<32} {timed(fn) * 1000:>7.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark collocation_graph.CollocationGraph against the dict-of-dicts.
+
+Compares, for collocations_complete.json (optionally replicated --scale
+times with suffixed words):
+
+- load time: json.load alone vs json.load + graph build
+- retained memory: the parsed JSON vs the graph (raw JSON freed)
+- queries: neighbors / score / degree / full pair walk, dict walk vs graph
+
+Usage:
+    python benchmarks/bench_collocation_graph.py [--scale 10]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from collocation_graph import DEFAULT_PATH, CollocationGraph
+
+
+def replicate(data, scale):
+    """Copy every word `scale` times, suffixing words (and their matches) with #copy."""
+    if scale == 1:
+        return data
+    words = {}
+    for copy in range(scale):
+        suffix = f"#{copy}" if copy else ""
+        for word, entry in data['words'].items():
+            entry = dict(entry)
+            entry['word'] = word + suffix
+            entry['matches'] = {key: [dict(match, word=match['word'] + suffix) for match in matches]
+                                for key, matches in entry['matches'].items()}
+            words[word + suffix] = entry
+    return dict(data, words=words)
+
+
+def measure(build):
+    """(seconds, retained bytes, result) for build()."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, retained, result
+
+
+def timed(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def dict_score(words, word, other):
+    """Score lookup the way the scripts do it: walk the word's match lists."""
+    entry = words.get(word)
+    if not entry:
+        return None
+    for matches in entry['matches'].values():
+        for match in matches:
+            if match['word'] == other:
+                return match['score']
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the shared collocation graph")
+    parser.add_argument('--scale', type=int, default=1, help="Replicate the dataset this many times")
+    args = parser.parse_args()
+
+    with open(DEFAULT_PATH, 'r', encoding='utf-8') as f:
+        text = json.dumps(replicate(json.load(f), args.scale), ensure_ascii=False)
+    print(f"Dataset: {len(text) / 1024 / 1024:.1f} MB JSON (scale {args.scale})\n")
+
+    dict_time, dict_bytes, data = measure(lambda: json.loads(text))
+    graph_time, graph_bytes, graph = measure(lambda: CollocationGraph.from_data(json.loads(text)))
+    words = data['words']
+    print(f"{'':<22} {'load':>9} {'retained':>12}")
+    print(f"{'dict-of-dicts':<22} {dict_time:>8.3f}s {dict_bytes / 1024 / 1024:>10.1f}MB")
+    print(f"{'CollocationGraph':<22} {graph_time:>8.3f}s {graph_bytes / 1024 / 1024:>10.1f}MB "
+          f"({graph_bytes / dict_bytes:.0%} of dict)")
+
+    edges = list(graph.pairs())
+    sample = edges[::max(1, len(edges) // 20000)]
+    print(f"\nQueries ({len(sample)} sampled edges, {len(edges)} total):")
+    rows = [
+        ("neighbors",
+         lambda: [[match['word'] for match in words[verb]['matches']['nouns']] for verb, _, _ in sample],
+         lambda: [graph.neighbors(verb) for verb, _, _ in sample]),
+        ("score (noun, verb)",
+         lambda: [dict_score(words, noun, verb) for verb, noun, _ in sample],
+         lambda: [graph.score(noun, verb) for verb, noun, _ in sample]),
+        ("degree",
+         lambda: [sum(len(matches) for matches in words[noun]['matches'].values()) for _, noun, _ in sample],
+         lambda: [graph.degree(noun) for _, noun, _ in sample]),
+        ("walk all pairs",
+         lambda: [(word, match['word']) for word, entry in words.items() if entry['type'] != 'noun'
+                  for match in entry['matches'].get('nouns', [])],
+         lambda: list(graph.pairs())),
+    ]
+    print(f"{'':<22} {'dict':>9} {'graph':>9}")
+    for name, dict_fn, graph_fn in rows:
+        assert dict_fn() == graph_fn() or name == "walk all pairs"
+        print(f"{name:<22} {timed(dict_fn) * 1000:>7.1f}ms {timed(graph_fn) * 1000:>7.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
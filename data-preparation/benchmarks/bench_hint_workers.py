@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark the rule-based hint generators' --workers mode (hint_workers.py)
+against their serial path, on synthetic data.
+
+synthetic_data.generate(--scale) supplies the vocabulary rows and
+collocation mappings, written as a collocations_complete.json with every
+word's reading and English gloss. Each generator then classifies every
+verb (and adjective) in process and with each --workers count:
+
+    verb-specific  scripts/regenerate_verb_specific_hints.py  VerbSpecificHintGenerator
+    quality v7     scripts/fix_hint_quality_v7.py             HintQualityFixer
+    comprehensive  scripts/comprehensive_hint_fixer_v8.py     ComprehensiveHintFixer
+
+Only generate_hints() is timed (including starting the pool and sending
+each worker its copy of the generator). "same" compares the saved hints
+file byte for byte with the serial one, and the merged counters
+(VerbSpecificHintGenerator.hint_usage_stats, ComprehensiveHintFixer.stats)
+with the serial ones, in order.
+
+Usage (from data-preparation/):
+    python benchmarks/bench_hint_workers.py [--scale 100] [--workers 2 4]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PREP = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PREP))
+sys.path.insert(0, str(PREP / "scripts"))
+
+from collocation_graph import CollocationGraph
+from comprehensive_hint_fixer_v8 import ComprehensiveHintFixer
+from fix_hint_quality_v7 import HintQualityFixer
+from regenerate_verb_specific_hints import VerbSpecificHintGenerator
+from synthetic_data import generate
+
+
+def write_collocations(scale: int, path: Path) -> int:
+    """Write the synthetic collocations_complete.json; returns its pair count."""
+    graph = CollocationGraph.from_collocations(generate(scale).collocations_data())
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(graph.to_data(), f, ensure_ascii=False, indent=2)
+    return graph.pair_count
+
+
+def run_verb_specific(collocations: Path, output: Path, workers: int):
+    generator = VerbSpecificHintGenerator(str(collocations))
+    generator.load_collocations()
+    start = time.perf_counter()
+    generator.generate_hints(workers)
+    elapsed = time.perf_counter() - start
+    generator.save_hints(str(output))
+    return elapsed, list(generator.hint_usage_stats.items())
+
+
+def run_quality(collocations: Path, output: Path, workers: int):
+    fixer = HintQualityFixer()
+    fixer.load_data(str(collocations))
+    start = time.perf_counter()
+    hints = fixer.generate_hints(workers)
+    elapsed = time.perf_counter() - start
+    fixer.save_hints(hints, str(output))
+    return elapsed, None
+
+
+def run_comprehensive(collocations: Path, output: Path, workers: int):
+    fixer = ComprehensiveHintFixer()
+    fixer.load_data(str(collocations))
+    start = time.perf_counter()
+    hints = fixer.generate_hints(workers)
+    elapsed = time.perf_counter() - start
+    fixer.save_hints(hints, str(output))
+    return elapsed, dict(fixer.stats)
+
+
+GENERATORS = {
+    'verb-specific': run_verb_specific,
+    'quality v7': run_quality,
+    'comprehensive': run_comprehensive,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the hint generators' --workers mode against the serial path")
+    parser.add_argument('--scale', type=int, default=100, help="Copies of the real data set (default: 100)")
+    parser.add_argument('--workers', type=int, nargs='+', default=sorted({2, os.cpu_count() or 1} - {1}) or [2],
+                        help="Worker counts to time (default: 2 and the CPU count)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        collocations = directory / "collocations_complete.json"
+        pairs = write_collocations(args.scale, collocations)
+        print(f"scale {args.scale}: {pairs:,} pairs, {os.cpu_count()} CPU(s)\n")
+        print(f"{'generator':<14} {'serial':>8}" + ''.join(f" {f'x{workers}':>8} {'speedup':>8}  same"
+                                                         for workers in args.workers))
+        for name, run in GENERATORS.items():
+            serial_path = directory / "serial.json"
+            with contextlib.redirect_stdout(io.StringIO()):
+                serial, serial_stats = run(collocations, serial_path, 1)
+            line = f"{name:<14} {serial:>7.2f}s"
+            for workers in args.workers:
+                path = directory / f"workers_{workers}.json"
+                with contextlib.redirect_stdout(io.StringIO()):
+                    elapsed, stats = run(collocations, path, workers)
+                same = path.read_bytes() == serial_path.read_bytes() and stats == serial_stats
+                line += f" {elapsed:>7.2f}s {serial / elapsed:>7.1f}x {str(same):>5}"
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
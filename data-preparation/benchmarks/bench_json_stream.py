@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark peak memory of json.load against the streaming reader (json_stream).
+
+Writes a synthetic dataset (every file replicated --scale times with
+#copy-suffixed words, indent=2 like the real files) to a temporary
+directory and runs each workload both ways:
+
+- load graph        json.load + CollocationGraph.from_data vs load_graph's streamed from_entries
+- scan meanings     count collocation_meanings.json pairs
+- validate hints    validate_hints_final.analyze_hint_distribution over the hints file
+- reverse index     raw/create_reverse_mappings.py: json.load, merged dict and json.dump
+                    vs streamed input and write_entries (outputs checked byte-identical)
+
+Peak memory is traced with tracemalloc in a separate run from the timing.
+
+Usage (from data-preparation/):
+    python benchmarks/bench_json_stream.py [--scale 100]
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PREP = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PREP))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_collocation_graph import replicate
+from collocation_graph import CollocationGraph
+from json_stream import iter_entries, iter_hints
+from validate_hints_final import analyze_hint_distribution
+
+COLLOCATIONS = PREP / "input" / "collocations.json"
+COMPLETE = PREP / "input" / "collocations_complete.json"
+HINTS = PREP / "input" / "collocation_hints.json"
+MEANINGS = PREP.parent / "public" / "data" / "collocation_meanings.json"
+
+
+def replicate_map(data: dict, key: str, scale: int, copy_entry) -> dict:
+    """Copy every entry of data[key] `scale` times; copy_entry(entry, suffix) suffixes the words inside."""
+    entries = {}
+    for copy in range(scale):
+        suffix = f"#{copy}" if copy else ""
+        for word, entry in data[key].items():
+            entries[word + suffix] = copy_entry(entry, suffix)
+    return dict(data, **{key: entries})
+
+
+def write_dataset(directory: Path, scale: int) -> dict:
+    """Write the replicated files; {name: path}."""
+    def load(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def suffix_keys(entry, suffix):
+        return {noun + suffix: value for noun, value in entry.items()}
+
+    def suffix_collocation(entry, suffix):
+        return dict(entry, word=entry['word'] + suffix,
+                    matches=[dict(match, word=match['word'] + suffix) for match in entry['matches']])
+
+    datasets = {
+        'complete': replicate(load(COMPLETE), scale),
+        'collocations': replicate_map(load(COLLOCATIONS), 'collocations', scale, suffix_collocation),
+        'hints': replicate_map(load(HINTS), 'hints', scale, suffix_keys),
+        'meanings': replicate_map(load(MEANINGS), 'meanings', scale, suffix_keys),
+    }
+    paths = {}
+    for name, data in datasets.items():
+        paths[name] = directory / f"{name}.json"
+        with open(paths[name], 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    return paths
+
+
+def load_reverse_mappings(input_path: Path, output_path: Path):
+    """raw/create_reverse_mappings.py as a module, reading and writing the given files."""
+    spec = importlib.util.spec_from_file_location('create_reverse_mappings', PREP / "raw" / "create_reverse_mappings.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.INPUT_FILE, module.OUTPUT_FILE = input_path, output_path
+    return module
+
+
+def reverse_index_full(input_path: Path, output_path: Path) -> None:
+    """The builder as it was: the whole input, the reverse map and the merged output all in memory."""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    graph = CollocationGraph.from_collocations(data)
+    reverse_map = {}
+    for noun in graph.words_of_type('noun'):
+        info = graph.info(noun)
+        reverse_map[noun] = {'word': noun, 'reading': info['reading'], 'english': info['english'], 'type': 'noun'}
+        for kind, key in (('verb', 'verbs'), ('adjective', 'adjectives')):
+            reverse_map[noun][key] = [{'word': word, 'reading': graph.info(word)['reading'],
+                                       'english': graph.info(word)['english'], 'score': score}
+                                      for word, score in graph.neighbor_scores(noun, kind)]
+    merged = {"version": "2.0.0", "generatedAt": data['generatedAt'], "totalPairs": data['totalPairs'],
+              "totalWords": data['totalWords'] + len(reverse_map), "words": {}}
+    for word, entry in data['collocations'].items():
+        merged['words'][word] = {'word': entry['word'], 'reading': entry['reading'], 'english': entry['english'],
+                                 'type': entry['type'], 'matches': {'nouns': entry['matches']}}
+    for noun, entry in reverse_map.items():
+        merged['words'][noun] = {'word': entry['word'], 'reading': entry['reading'], 'english': entry['english'],
+                                 'type': 'noun', 'matches': {'verbs': entry['verbs'], 'adjectives': entry['adjectives']}}
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, ensure_ascii=False, indent=2)
+
+
+def workloads(paths: dict, directory: Path):
+    """(name, full, streamed) callables."""
+    def load(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def stream_graph():
+        header = {}
+        return CollocationGraph.from_entries(iter_entries(paths['complete'], 'words', header), header)
+
+    builder = load_reverse_mappings(paths['collocations'], directory / "complete_streamed.json")
+
+    def stream_reverse():
+        header, entries = builder.merge_bidirectional_data(*builder.load_collocations())
+        builder.save_complete_collocations(header, entries)
+
+    return [
+        ("load graph",
+         lambda: CollocationGraph.from_data(load(paths['complete'])),
+         stream_graph),
+        ("scan meanings",
+         lambda: sum(len(nouns) for nouns in load(paths['meanings'])['meanings'].values()),
+         lambda: sum(len(nouns) for _, nouns in iter_entries(paths['meanings'], 'meanings'))),
+        ("validate hints",
+         lambda: analyze_hint_distribution(load(paths['hints'])['hints'].items()),
+         lambda: analyze_hint_distribution(iter_hints(paths['hints']))),
+        ("reverse index",
+         lambda: reverse_index_full(paths['collocations'], directory / "complete_full.json"),
+         stream_reverse),
+    ]
+
+
+def peak(fn) -> int:
+    """Peak traced bytes while running fn()."""
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak_bytes
+
+
+def elapsed(fn) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark json.load vs the streaming JSON reader")
+    parser.add_argument('--scale', type=int, default=100, help="Replicate the dataset this many times (default: 100)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        paths = write_dataset(directory, args.scale)
+        print(f"Synthetic dataset (scale {args.scale}):")
+        for name, path in paths.items():
+            print(f"  {path.name:<20} {path.stat().st_size / 1024 / 1024:>8.1f} MB")
+
+        print(f"\n{'workload':<16} {'json.load peak':>15} {'stream peak':>12} {'ratio':>7} "
+              f"{'json.load':>10} {'stream':>9}")
+        silent = open(directory / "log.txt", 'w', encoding='utf-8')
+        for name, full, streamed in workloads(paths, directory):
+            stdout, sys.stdout = sys.stdout, silent
+            try:
+                full_peak, stream_peak = peak(full), peak(streamed)
+                full_time, stream_time = elapsed(full), elapsed(streamed)
+            finally:
+                sys.stdout = stdout
+            print(f"{name:<16} {full_peak / 1024 / 1024:>13.1f}MB {stream_peak / 1024 / 1024:>10.1f}MB "
+                  f"{stream_peak / full_peak:>6.1%} {full_time:>9.2f}s {stream_time:>8.2f}s")
+        silent.close()
+
+        same = (directory / "complete_full.json").read_bytes() == (directory / "complete_streamed.json").read_bytes()
+        print(f"\nreverse index outputs byte-identical: {same}")
+        if not same:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark compiled keyword classification against the rule-by-rule loops.
+
+For every verb/adjective -> noun pair in collocations_complete.json
+(replicated --scale times, with each copy's glosses reordered so copies are
+not identical strings) it classifies the noun gloss with the rule tables the
+hint scripts use, once evaluated rule by rule the way the scripts used to
+(keyword_classifier.naive_first / naive_best) and once with the compiled
+classifiers:
+
+- verb-specific   rules/verb_specific_hints.json (VerbSpecificHintGenerator), first match
+- best-score      rules/category_scores.json (ComprehensiveHintFixer), best score
+- semantic        refine_hints' whole-word SEMANTIC_PATTERNS, first match
+
+and reports the per-pair cost of each.
+
+Usage (from data-preparation/):
+    python benchmarks/bench_keyword_classifier.py [--scales 1 10 100]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_collocation_graph import replicate
+from collocation_graph import CollocationGraph
+from hint_rules import CATEGORY_SCORE_RULES, VERB_SPECIFIC_RULES, RuleTable, load_rules
+from keyword_classifier import naive_best, naive_first
+from refine_hints import SEMANTIC_CLASSIFIER
+
+DEFAULT_INPUT = Path(__file__).resolve().parent.parent / "input" / "collocations_complete.json"
+
+
+def verb_specific_tables(graph: CollocationGraph):
+    """{verb: table} for the table VerbSpecificHintGenerator uses for each verb."""
+    rules = load_rules(VERB_SPECIFIC_RULES)
+    return {word: rules.table_for(word) or rules['generic'] for word in graph.words_of_type('verb', 'adjective')}
+
+
+def best_score_tables(graph: CollocationGraph):
+    """{word: table} for the categories ComprehensiveHintFixer scores each word's nouns against."""
+    rules = load_rules(CATEGORY_SCORE_RULES)
+    empty = RuleTable('empty', {})
+    tables = {}
+    for word in graph.words_of_type('verb', 'adjective'):
+        if graph.type(word) == 'verb':
+            table = rules.table_for(word, 'verb')
+        else:
+            table = next((rules.table_for(form, 'adjective') for form in [word, word.replace('い', ''), word + 'い']
+                          if rules.table_for(form, 'adjective')), None)
+        tables[word] = table or empty
+    return tables
+
+
+def shuffled_glosses(data: dict, seed: int = 0) -> dict:
+    """Reorder the senses of every gloss in the replicated copies (words with a #copy suffix)."""
+    rng = random.Random(seed)
+    for word, entry in data['words'].items():
+        if '#' not in word:
+            continue
+        for matches in entry['matches'].values():
+            for match in matches:
+                senses = match['english'].split('; ')
+                rng.shuffle(senses)
+                match['english'] = '; '.join(senses)
+    return data
+
+
+def workloads(data: dict):
+    """(name, [(table, gloss)], naive, compiled) for each classification style."""
+    # Copies use their original word's tables
+    graph = CollocationGraph.from_data(data)
+    original = CollocationGraph.from_data(json.loads(DEFAULT_INPUT.read_text('utf-8')))
+    verb_tables = verb_specific_tables(original)
+    best_tables = best_score_tables(original)
+
+    verb_pairs, best_pairs, semantic_pairs = [], [], []
+    for word in graph.words_of_type('verb', 'adjective'):
+        base = word.split('#')[0]
+        for match in graph.matches(word):
+            english = match['english'].lower()
+            verb_pairs.append((verb_tables[base], english))
+            best_pairs.append((best_tables[base], english))
+            semantic_pairs.append((SEMANTIC_CLASSIFIER, english))
+
+    return [
+        ("verb-specific (first match)", verb_pairs,
+         lambda c, text: naive_first(c.rules, text, c.default), lambda c, text: c.first(text)),
+        ("best-score", best_pairs,
+         lambda c, text: naive_best(c.rules, text, c.default), lambda c, text: c.best(text)),
+        ("semantic (whole words)", semantic_pairs,
+         lambda c, text: naive_first(c.rules, text, c.default, words=True), lambda c, text: c.first(text)),
+    ]
+
+
+def per_pair(classify, pairs) -> float:
+    start = time.perf_counter()
+    for classifier, text in pairs:
+        classify(classifier, text)
+    return (time.perf_counter() - start) / len(pairs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compiled keyword classification")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help="Replicate the dataset these many times (default: 1 10 100)")
+    args = parser.parse_args()
+
+    with open(DEFAULT_INPUT, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    print(f"{'workload':<30} {'scale':>5} {'pairs':>9} {'loops':>10} {'compiled':>10} {'speedup':>8}")
+    for scale in args.scales:
+        for name, pairs, naive, compiled in workloads(shuffled_glosses(replicate(data, scale))):
+            naive_time = per_pair(naive, pairs)
+            compiled_time = per_pair(compiled, pairs)
+            print(f"{name:<30} {scale:>5} {len(pairs):>9,} {naive_time * 1e6:>8.2f}us {compiled_time * 1e6:>8.2f}us "
+                  f"{naive_time / compiled_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-level shards (level_shards.py) against the full published
+artifacts: what an N5 learner downloads and parses, and what the N5+N4 path
+costs when it is assembled from shards. The shards are built in memory from
+public/data, as the deploy build writes them.
+
+Rows:
+
+    full       vocabulary.json, collocations_complete.json,
+               collocation_meanings.json and reverse_meanings.json
+    n5         shard_n5.json alone
+    n5 + n54   both shards, parsed and merged (merge_shards)
+
+Columns: bytes on disk, gzip -6 bytes (what a compressing server sends)
+and the best of --repeat json.loads() timings (plus the merge for the
+last row).
+
+Usage (from data-preparation/):
+    python benchmarks/bench_level_shards.py [--repeat 5]
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from level_shards import SOURCE_DIR, build_shards, load_levels, merge_shards
+from release_patches import ARTIFACTS, canonical, load_artifacts
+
+
+def best_of(repeat: int, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the level shards with the full artifacts")
+    parser.add_argument('--repeat', type=int, default=5, help="Timing repetitions, best kept (default: 5)")
+    args = parser.parse_args()
+
+    full = [(SOURCE_DIR / filename).read_bytes() for filename in ARTIFACTS.values()]
+    # Serialized as level_shards.write_shards() writes them
+    shards = build_shards(load_artifacts(SOURCE_DIR), load_levels(SOURCE_DIR))
+    base, increment = (canonical(shard).encode('utf-8') for shard in shards[:2])
+
+    rows = [
+        ('full', full, lambda: [json.loads(payload) for payload in full]),
+        ('n5', [base], lambda: json.loads(base)),
+        ('n5 + n54', [base, increment], lambda: merge_shards([json.loads(base), json.loads(increment)])),
+    ]
+    full_bytes = sum(len(payload) for payload in full)
+    full_gzip = sum(len(gzip.compress(payload, 6)) for payload in full)
+    full_time = None
+    print(f"{'path':<10} {'bytes':>11} {'gzip':>9} {'parse':>9}  vs full (bytes / gzip / parse)")
+    for name, payloads, parse in rows:
+        size = sum(len(payload) for payload in payloads)
+        compressed = sum(len(gzip.compress(payload, 6)) for payload in payloads)
+        elapsed = best_of(args.repeat, parse)
+        full_time = full_time or elapsed
+        print(f"{name:<10} {size:>11,} {compressed:>9,} {elapsed * 1000:>7.1f}ms  "
+              f"{size / full_bytes:>5.0%} / {compressed / full_gzip:>4.0%} / {elapsed / full_time:>4.0%}")
+
+
+if __name__ == '__main__':
+    main()
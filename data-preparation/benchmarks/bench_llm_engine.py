@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark llm_engine.HintEngine against the fake Anthropic server.
+
+Runs the same batch of prompts at several concurrency levels and reports
+wall-clock time and speedup over the serial (concurrency=1) baseline.
+Every 10th request is rejected with a 429 to include retry overhead.
+
+Usage:
+    python benchmarks/bench_llm_engine.py --prompts 200 --latency 0.2
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_anthropic_server import start_server
+from llm_engine import HintEngine
+
+
+def run_level(base_url, prompts, concurrency, rps):
+    """Run all prompts at one concurrency level and return (seconds, stats)."""
+    engine = HintEngine(concurrency=concurrency, requests_per_second=rps,
+                        base_url=base_url, base_delay=0.05, max_delay=1.0)
+    jobs = [(i, prompt, "fallback") for i, prompt in enumerate(prompts)]
+
+    start = time.perf_counter()
+    results = engine.run_sync(jobs)
+    elapsed = time.perf_counter() - start
+
+    assert len(results) == len(prompts)
+    return elapsed, engine.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the async hint engine")
+    parser.add_argument('--prompts', type=int, default=200, help="Number of prompts (default: 200)")
+    parser.add_argument('--latency', type=float, default=0.2, help="Fake API latency in seconds (default: 0.2)")
+    parser.add_argument('--rps', type=float, default=1000.0, help="Token bucket rate (default: 1000)")
+    parser.add_argument('--fail-every', type=int, default=10, help="Inject a 429 every Nth request (default: 10)")
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 8, 32])
+    args = parser.parse_args()
+
+    os.environ.setdefault("ANTHROPIC_API_KEY", "sk-fake-benchmark")
+    server = start_server(latency=args.latency, fail_every=args.fail_every)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    prompts = [f"Create a clear hint for collocation #{i}" for i in range(args.prompts)]
+
+    print("=" * 70)
+    print(f"HintEngine benchmark: {args.prompts} prompts, {args.latency}s latency, 429 every {args.fail_every}")
+    print("=" * 70)
+    print(f"{'concurrency':>12} {'seconds':>10} {'req/s':>10} {'retries':>8} {'failures':>9} {'speedup':>8}")
+
+    baseline = None
+    for level in args.levels:
+        elapsed, stats = run_level(base_url, prompts, level, args.rps)
+        baseline = baseline or elapsed
+        print(f"{level:>12} {elapsed:>10.2f} {args.prompts / elapsed:>10.1f} "
+              f"{stats['retries']:>8} {stats['failures']:>9} {baseline / elapsed:>7.1f}x")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Time every pipeline stage on synthetic data at increasing scales.
+
+For each --scales value, synthetic_data.generate() writes a scaled N54.csv,
+collocation mappings and hints file to a temporary directory, and the
+stages run in process on it, in pipeline order, each reading the previous
+stage's output:
+
+    categorize    raw/categorize_vocabulary.py     N54.csv -> vocabulary_by_type.json
+    vocabulary    raw/create_vocabulary_json.py    -> vocabulary.json
+    collocations  raw/generate_collocations.py     -> collocations.json (synthetic mappings)
+    complete      raw/create_reverse_mappings.py   -> collocations_complete.json + normalized output
+    hints         VerbSpecificHintGenerator        -> verb-specific hints (rule classification)
+    validation    validate_hints.HintValidator and validate_hints_final on the synthetic hints
+    export        collocation_binary + convert_studylists
+
+Stage output goes to a log file in the temporary directory. The results
+(seconds per stage and scale, plus the dataset sizes) are written as JSON
+to --output so runs on one machine can be diffed across commits (the file
+is not committed: timings depend on the machine); the table printed at the
+end also shows how each stage grows from one scale to the next (1.0 =
+linear, 2.0 = quadratic).
+
+Usage (from data-preparation/):
+    python benchmarks/bench_pipeline.py [--scales 10 100 1000] [--output output/bench_pipeline.json]
+"""
+
+import argparse
+import importlib.util
+import json
+import math
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+PREP = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PREP))
+sys.path.insert(0, str(PREP / "raw"))
+sys.path.insert(0, str(PREP / "scripts"))
+
+import collocation_graph
+from collocation_binary import write_binary
+from collocation_graph import load_graph
+from collocation_refs import load_json, write_normalized
+from convert_studylists import convert_csv_to_json
+from regenerate_verb_specific_hints import VerbSpecificHintGenerator
+from synthetic_data import generate, load_mappings
+from validate_hints import HintValidator
+from validate_hints_final import analyze_hint_distribution, generate_report, load_hints
+
+DEFAULT_OUTPUT = PREP / "output" / "bench_pipeline.json"
+
+
+def load_script(relative_path: str):
+    """Import a pipeline script as a module, so its file constants can be pointed at the synthetic data."""
+    path = PREP / relative_path
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Workspace:
+    """The synthetic inputs and every stage's output file for one scale."""
+
+    def __init__(self, directory: Path, inputs: Dict[str, Path]):
+        self.directory = directory
+        self.n54 = inputs['N54.csv']
+        self.hints = inputs['collocation_hints.json']
+        self.verb_mappings, self.adjective_mappings = load_mappings(inputs['collocation_mappings.json'])
+        self.by_type = directory / "vocabulary_by_type.json"
+        self.vocabulary = directory / "vocabulary.json"
+        self.collocations = directory / "collocations.json"
+        self.complete = directory / "collocations_complete.json"
+        self.normalized = directory / "collocations_normalized.json"
+        self.index = directory / "collocation_vocab_index.json"
+        self.verb_hints = directory / "collocation_hints_refined.json"
+        self.binary = directory / "collocations_complete.bin"
+
+
+def stage_categorize(workspace: Workspace) -> None:
+    script = load_script("raw/categorize_vocabulary.py")
+    script.N54_FILE, script.OUTPUT_FILE = workspace.n54, workspace.by_type
+    script.categorize_vocabulary()
+
+
+def stage_vocabulary(workspace: Workspace) -> None:
+    script = load_script("raw/create_vocabulary_json.py")
+    script.INPUT_FILE, script.OUTPUT_FILE = workspace.by_type, workspace.vocabulary
+    script.main()
+
+
+def stage_collocations(workspace: Workspace) -> None:
+    script = load_script("raw/generate_collocations.py")
+    script.INPUT_FILE, script.OUTPUT_FILE = workspace.by_type, workspace.collocations
+    script.get_verb_noun_collocations = lambda: workspace.verb_mappings
+    script.get_adjective_noun_collocations = lambda: workspace.adjective_mappings
+    script.main()
+
+
+def stage_complete(workspace: Workspace) -> None:
+    script = load_script("raw/create_reverse_mappings.py")
+    script.INPUT_FILE, script.OUTPUT_FILE = workspace.collocations, workspace.complete
+    header, graph = script.load_collocations()
+    script.save_complete_collocations(*script.merge_bidirectional_data(header, graph))
+    write_normalized(load_graph(workspace.complete), load_json(workspace.vocabulary),
+                     workspace.normalized, workspace.index)
+
+
+def stage_hints(workspace: Workspace) -> None:
+    generator = VerbSpecificHintGenerator(str(workspace.complete))
+    generator.load_collocations()
+    generator.generate_hints()
+    generator.save_hints(str(workspace.verb_hints))
+
+
+def stage_validation(workspace: Workspace) -> None:
+    HintValidator(str(workspace.complete), str(workspace.hints)).generate_report(
+        str(workspace.directory / "VALIDATION_REPORT.md"))
+    generate_report(analyze_hint_distribution(load_hints(str(workspace.hints))),
+                    str(workspace.directory / "FINAL_VALIDATION.md"))
+
+
+def stage_export(workspace: Workspace) -> None:
+    write_binary(load_graph(workspace.complete), workspace.binary)
+    convert_csv_to_json(workspace.n54, workspace.directory / "studylist_n54.json")
+
+
+STAGES: List[Tuple[str, Callable[[Workspace], None]]] = [
+    ('categorize', stage_categorize),
+    ('vocabulary', stage_vocabulary),
+    ('collocations', stage_collocations),
+    ('complete', stage_complete),
+    ('hints', stage_hints),
+    ('validation', stage_validation),
+    ('export', stage_export),
+]
+
+
+def run_scale(scale: int, seed: int) -> dict:
+    """Generate the data set for one scale and time every stage on it."""
+    dataset = generate(scale, seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        workspace = Workspace(directory, dataset.write(directory))
+        del dataset
+
+        stages = {}
+        with open(directory / "stages.log", 'w', encoding='utf-8') as log:
+            for name, stage in STAGES:
+                # Every stage loads its inputs itself, as it would as a script
+                collocation_graph._loaded.clear()
+                stdout, sys.stdout = sys.stdout, log
+                try:
+                    start = time.perf_counter()
+                    stage(workspace)
+                    seconds = time.perf_counter() - start
+                finally:
+                    sys.stdout = stdout
+                stages[name] = {'seconds': round(seconds, 4)}
+                print(f"  {name:<14} {seconds:>9.2f}s")
+
+        summary = {
+            'words': sum(1 for _ in open(workspace.n54, encoding='utf-8')) - 1,
+            'pairs': load_graph(workspace.complete).pair_count,
+            'hinted_pairs': sum(len(nouns) for _, nouns in load_hints(str(workspace.hints))),
+            'complete_bytes': workspace.complete.stat().st_size,
+        }
+    return {'dataset': summary, 'stages': stages,
+            'total_seconds': round(sum(stage['seconds'] for stage in stages.values()), 4)}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PREP, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_growth(runs: Dict[str, dict]) -> None:
+    """Seconds per stage and scale, with the growth exponent between consecutive scales."""
+    scales = list(runs)
+    print(f"\n{'stage':<14}" + ''.join(f"{'x' + scale:>11}" for scale in scales) + "   growth")
+    for name, _ in STAGES:
+        times = [runs[scale]['stages'][name]['seconds'] for scale in scales]
+        growth = [math.log(max(b, 1e-6) / max(a, 1e-6)) / math.log(int(s2) / int(s1))
+                  for (a, b), (s1, s2) in zip(zip(times, times[1:]), zip(scales, scales[1:]))]
+        print(f"{name:<14}" + ''.join(f"{seconds:>10.2f}s" for seconds in times)
+              + "   " + ' '.join(f"{exponent:.2f}" for exponent in growth))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every pipeline stage on synthetic data")
+    parser.add_argument('--scales', type=int, nargs='+', default=[10, 100],
+                        help="Copies of the real data set (default: 10 100; 1000 takes a while)")
+    parser.add_argument('--seed', type=int, default=0, help="Synthetic data seed (default: 0)")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT,
+                        help=f"Results JSON (default: {DEFAULT_OUTPUT.relative_to(PREP)})")
+    args = parser.parse_args()
+
+    runs = {}
+    for scale in args.scales:
+        print(f"Scale {scale}x:")
+        runs[str(scale)] = run_scale(scale, args.seed)
+
+    results = {
+        'benchmark': 'pipeline',
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'seed': args.seed,
+        'runs': runs,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+    print_growth(runs)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark find_synonym_groups (SynonymIndex blocking, and TF-IDF candidates
+with --backend tfidf) against the all-pairs scan.
+
+Nouns come from synthetic_data.generate(), truncated to each --nouns size.
+Synthetic copies reuse the real senses and readings, so every word and
+reading would be shared by all `scale` copies, where a real dictionary keeps
+gaining new words as it grows. Copies are therefore split into families of
+--family copies, and each family after the first spells the words of its
+glosses and its readings its own way ("day" -> "day_3"): words stay shared
+within a family (and so do near-duplicate glosses and homophones), and the
+vocabulary grows with the noun count.
+
+The tfidf column times find_synonym_groups with gloss_similarity's
+TfidfSimilarity (default options) finding the English synonym candidates,
+up to --tfidf-limit nouns (its sparse products still cover every pair, only
+in blocks); "same" compares its groups with the blocked ones, which can
+differ where more than top_k near-identical glosses compete for one noun's
+neighbour slots ("third/fifth/sixth day of the month"). The all-pairs scan
+(find_synonym_groups_naive) only runs up to --naive-limit nouns, and its
+groups are compared too.
+
+Usage (from data-preparation/):
+    python benchmarks/bench_synonym_groups.py [--nouns 1000 10000 100000] [--family 10]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from find_synonym_groups import find_synonym_groups, find_synonym_groups_naive
+from gloss_similarity import TfidfSimilarity
+from synonym_index import SynonymIndex
+from synthetic_data import generate
+
+WORD = re.compile(r'\w+')
+REAL_NOUNS = 782
+
+
+def synthetic_nouns(count: int, family: int, seed: int = 0) -> List[dict]:
+    """The first `count` synthetic nouns, each copy family with its own spellings."""
+    rows = generate(math.ceil(count / REAL_NOUNS) + 1, seed).rows
+    nouns = []
+    for row in rows:
+        if row['type'] != 'noun':
+            continue
+        _, suffixed, copy = row['japanese'].rpartition('#')
+        spelling = int(copy) // family if suffixed else 0
+        if spelling:
+            row = dict(row, english=WORD.sub(lambda m: f"{m.group()}_{spelling}", row['english']),
+                       reading=f"{row['reading']}_{spelling}")
+        nouns.append(row)
+        if len(nouns) == count:
+            break
+    return nouns
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def same_groups(groups, others) -> bool:
+    return json.dumps(groups, ensure_ascii=False) == json.dumps(others, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark blocked synonym detection against the all-pairs scan")
+    parser.add_argument('--nouns', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="Noun counts to time (default: 1000 10000 100000)")
+    parser.add_argument('--family', type=int, default=10,
+                        help="Synthetic copies sharing one spelling of their words (default: 10)")
+    parser.add_argument('--tfidf-limit', type=int, default=20000,
+                        help="Largest noun count to run the tfidf backend on (default: 20000)")
+    parser.add_argument('--naive-limit', type=int, default=2000,
+                        help="Largest noun count to run the all-pairs scan on (default: 2000)")
+    args = parser.parse_args()
+
+    print(f"{'nouns':>8} {'index':>8} {'blocked':>9} {'candidates':>11} {'groups':>7} "
+          f"{'tfidf':>9}  same {'all-pairs':>10}  same")
+    previous = None
+    for count in args.nouns:
+        nouns = synthetic_nouns(count, args.family)
+        index, build = timed(SynonymIndex, nouns)
+        candidates = sum(len(index.candidates(i)) for i in range(len(nouns)))
+        groups, blocked = timed(find_synonym_groups, nouns)
+        line = f"{len(nouns):>8} {build:>7.2f}s {blocked:>8.2f}s {candidates:>11,} {len(groups):>7}"
+        if count <= args.tfidf_limit:
+            tfidf_groups, tfidf = timed(find_synonym_groups, nouns, TfidfSimilarity())
+            line += f" {tfidf:>8.2f}s {str(same_groups(groups, tfidf_groups)):>5}"
+        if count <= args.naive_limit:
+            naive_groups, naive = timed(find_synonym_groups_naive, nouns)
+            line += f" {naive:>9.2f}s {str(same_groups(groups, naive_groups)):>5}"
+        if previous:
+            line += f"   growth {math.log(blocked / previous[1]) / math.log(len(nouns) / previous[0]):.2f}"
+        print(line)
+        previous = (len(nouns), blocked)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass validation engine against the six validators it
+replaces, on synthetic data at increasing scales.
+
+For each --scales value, synthetic_data.generate() supplies the hints file
+and collocation mappings; the mappings are turned into a
+collocations_complete.json with CollocationGraph.from_collocations(). The
+"six validators" column runs, one after the other, each as its own script
+would (loading its own inputs, with the collocation graph cache cleared
+before each):
+
+    validate_hints.HintValidator.generate_report
+    validate_hints_v2 (pairs, hint sharing, report)
+    validate_hints_final (distribution, report)
+    verify_hint_coverage (coverage, report)
+    raw/validate_hints_quality.main
+    final_validation.validate
+
+The engine columns load the data once (cache cleared too) and run every
+rule, in process and with --workers processes, including writing the
+Markdown and JSON reports. The incremental columns run the engine with a
+ValidationCache: "cold" fills an empty cache, then one verb's hints are
+edited in the hints file and "1 verb edited" times the run that re-checks
+only that verb (checking that its report matches a full run). The
+"grouped" columns repeat the incremental runs on the same hints written in
+the per-verb hint group format of collocation_hints_refined.json, the file
+the generate -> refine -> validate loop edits.
+
+Usage (from data-preparation/):
+    python benchmarks/bench_validation.py [--scales 1 10 50] [--workers 4]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Tuple
+
+PREP = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PREP))
+sys.path.insert(0, str(PREP / "raw"))
+
+import collocation_graph
+import final_validation
+import validate_hints_final
+import validate_hints_quality
+import validate_hints_v2
+import verify_hint_coverage
+from collocation_graph import CollocationGraph, load_graph
+from json_stream import iter_hints
+from synthetic_data import generate
+from validate_hints import HintValidator
+from validation_engine import RULES, PairIndex, ValidationCache, ValidationEngine, build_report, write_report
+
+
+def write_inputs(scale: int, directory: Path):
+    """Write the synthetic hints file and collocations_complete.json; returns (complete, hints, pairs)."""
+    dataset = generate(scale)
+    hints_path = dataset.write(directory)['collocation_hints.json']
+    collocations = {}
+    for word_type, mappings in (('verb', dataset.verb_mappings), ('adjective', dataset.adjective_mappings)):
+        for word, nouns in mappings.items():
+            collocations[word] = {'type': word_type,
+                                  'matches': [{'word': noun, 'score': score} for noun, score in nouns]}
+    graph = CollocationGraph.from_collocations({'collocations': collocations})
+    complete = directory / "collocations_complete.json"
+    with open(complete, 'w', encoding='utf-8') as f:
+        json.dump(graph.to_data(), f, ensure_ascii=False, indent=2)
+
+    # final_validation.py reads input/collocation_hints_refined.json from the working directory
+    (directory / "input").mkdir()
+    os.symlink(hints_path, directory / "input" / "collocation_hints_refined.json")
+    return complete, hints_path, graph.pair_count
+
+
+def run_six(complete: Path, hints: Path, directory: Path) -> None:
+    """Each validator as its own script would run it."""
+    collocation_graph._loaded.clear()
+    HintValidator(str(complete), str(hints)).generate_report(str(directory / "VALIDATION_REPORT.md"))
+
+    collocation_graph._loaded.clear()
+    graph = load_graph(complete)
+    hint_pairs, pair_to_hint, hint_to_pairs = validate_hints_v2.extract_all_pairs_from_hints(iter_hints(hints))
+    validate_hints_v2.generate_report(validate_hints_v2.extract_all_pairs_from_collocations(graph), hint_pairs,
+                                      pair_to_hint, hint_to_pairs,
+                                      validate_hints_v2.count_verbs_per_hint(hint_to_pairs), graph,
+                                      str(directory / "VALIDATION_REPORT_V2.md"))
+
+    validate_hints_final.generate_report(
+        validate_hints_final.analyze_hint_distribution(validate_hints_final.load_hints(str(hints))),
+        str(directory / "FINAL_VALIDATION_V3.md"))
+
+    collocation_graph._loaded.clear()
+    graph = load_graph(complete)
+    results = verify_hint_coverage.analyze_hint_coverage(graph, verify_hint_coverage.load_json_file(hints),
+                                                         verify_hint_coverage.extract_verb_noun_pairs(graph))
+    verify_hint_coverage.generate_markdown_report(results, graph, directory / "HINT_COVERAGE_REPORT.md")
+
+    collocation_graph._loaded.clear()
+    validate_hints_quality.HINTS_FILE, validate_hints_quality.COLLOCATIONS_FILE = hints, complete
+    validate_hints_quality.main()
+
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        final_validation.validate()
+    finally:
+        os.chdir(cwd)
+
+
+def run_engine(complete: Path, hints: Path, directory: Path, workers: int, cached: bool = False) -> None:
+    collocation_graph._loaded.clear()
+    rules = [rule() for rule in RULES.values()]
+    cache = ValidationCache(directory / "validation_cache.json", rules) if cached else None
+    index = PairIndex.load(complete, hints, cache)
+    report = build_report(index, ValidationEngine(rules, workers).run(index, cache),
+                          {'collocations': str(complete), 'hints': str(hints)})
+    if cache is not None:
+        cache.save()
+    write_report(report, rules, directory / "validation_report.md", directory / "validation_report.json")
+
+
+def write_grouped(hints: Path, path: Path) -> None:
+    """The hints file in the refine step's format: per verb, hint groups with the nouns they cover."""
+    with open(hints, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    verbs = {}
+    for verb, noun_hints in data['hints'].items():
+        groups = {}
+        for noun, hint in noun_hints.items():
+            groups.setdefault(hint, []).append(noun)
+        verbs[verb] = {'word': verb, 'total_nouns': len(noun_hints),
+                       'hints': [{'hint': hint, 'noun_count': len(nouns), 'example_nouns': nouns[:5],
+                                  'all_nouns': nouns} for hint, nouns in groups.items()],
+                       'noun_assignments': noun_hints}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': '1.0', 'description': 'synthetic refined hints', 'verbs': verbs},
+                  f, ensure_ascii=False, indent=2)
+
+
+def edit_one_verb(hints: Path) -> None:
+    """Rewrite one hint of the middle verb, as a hint-fixing pass would."""
+    with open(hints, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if 'verbs' in data:
+        verbs = list(data['verbs'])
+        entry = data['verbs'][verbs[len(verbs) // 2]]
+        group = entry['hints'][0]
+        group['hint'] = f"{group['hint']} (edited)"
+        for noun in group['all_nouns']:
+            entry['noun_assignments'][noun] = group['hint']
+    else:
+        verbs = list(data['hints'])
+        noun_hints = data['hints'][verbs[len(verbs) // 2]]
+        noun = next(iter(noun_hints))
+        noun_hints[noun] = f"{noun_hints[noun]} (edited)"
+    with open(hints, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn(*args)
+    return time.perf_counter() - start
+
+
+def incremental(complete: Path, hints: Path, directory: Path) -> Tuple[float, float, bool]:
+    """(cold cache, 1 verb edited) seconds, and whether the incremental report matches a full run."""
+    directory.mkdir(exist_ok=True)
+    cold = timed(run_engine, complete, hints, directory, 1, True)
+    edit_one_verb(hints)
+    edited = timed(run_engine, complete, hints, directory, 1, True)
+    report = (directory / "validation_report.json").read_bytes()
+    run_engine(complete, hints, directory, 1)
+    return cold, edited, report == (directory / "validation_report.json").read_bytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the validation engine against the six separate validators")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 50],
+                        help="Copies of the real data set (default: 1 10 50)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for the parallel engine column (default: CPU count)")
+    args = parser.parse_args()
+
+    print(f"{'scale':>6} {'pairs':>9} {'six validators':>15} {'engine':>9} "
+          f"{f'engine x{args.workers}':>11} {'speedup':>8} {'cold cache':>11} {'1 verb edited':>14}  same "
+          f"{'grouped cold':>13} {'grouped edited':>15}  same")
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            complete, hints, pairs = write_inputs(scale, directory)
+            six = timed(run_six, complete, hints, directory)
+            engine = timed(run_engine, complete, hints, directory, 1)
+            parallel = timed(run_engine, complete, hints, directory, args.workers)
+            grouped = directory / "collocation_hints_grouped.json"
+            write_grouped(hints, grouped)
+            cold, edited, same = incremental(complete, hints, directory)
+            # Own directory: the grouped hints expand to the same verb hashes as the flat ones
+            grouped_cold, grouped_edited, grouped_same = incremental(complete, grouped, directory / "grouped")
+        print(f"{scale:>6} {pairs:>9,} {six:>14.2f}s {engine:>8.2f}s {parallel:>10.2f}s "
+              f"{six / min(engine, parallel):>7.1f}x {cold:>10.2f}s {edited:>13.2f}s {str(same):>5} "
+              f"{grouped_cold:>12.2f}s {grouped_edited:>14.2f}s {str(grouped_same):>5}")
+
+
+if __name__ == '__main__':
+    main()
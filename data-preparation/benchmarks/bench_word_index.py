@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HINT_COVERAGE_REPORT.md generation of verify_hint_coverage.py
+with WordIndex lookups against the original linear scan, on synthetic data.
+
+For each --scales value, synthetic_data.generate() supplies the vocabulary
+(written as vocabulary.json), the collocations (collocations_complete.json)
+and the hints. Columns:
+
+    build    load_word_index() with no saved index: hash both files, read
+             vocabulary.json, index it plus the graph's words, save (the
+             graph is already loaded, as it is in verify_hint_coverage.py)
+    load     load_word_index() again, reusing the saved index
+    scan     generate_markdown_report() with the original find_noun_info,
+             which walked every verb's match list in the parsed
+             collocations_complete.json for each noun it printed
+    index    generate_markdown_report() with WordIndex lookups
+    same     both reports are identical
+
+The analysis (analyze_hint_coverage) is shared and not timed.
+
+Usage (from data-preparation/):
+    python benchmarks/bench_word_index.py [--scales 1 10 100]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import collocation_graph
+import verify_hint_coverage
+from collocation_graph import CollocationGraph, load_graph
+from synthetic_data import generate
+from word_index import load_word_index
+
+
+def scan_noun_info(noun_word: str, collocations_data: Dict) -> Dict:
+    """verify_hint_coverage.find_noun_info before the word index: a scan of every verb's matches."""
+    for verb_data in collocations_data.get('words', {}).values():
+        for noun_obj in verb_data.get('matches', {}).get('nouns', []):
+            if noun_obj.get('word') == noun_word:
+                return noun_obj
+    return {'word': noun_word, 'reading': '', 'english': ''}
+
+
+def write_inputs(scale: int, directory: Path):
+    """Write vocabulary.json and collocations_complete.json; returns (vocabulary, complete, hints, pairs)."""
+    dataset = generate(scale)
+    vocabulary = directory / "vocabulary.json"
+    with open(vocabulary, 'w', encoding='utf-8') as f:
+        json.dump({'version': '1.0.0', 'totalWords': len(dataset.rows),
+                   'vocabulary': [{'id': f"synthetic-{position}", 'japanese': row['japanese'],
+                                   'reading': row['reading'], 'english': row['english'], 'type': row['type'],
+                                   'frequency': float(row['frequency'] or 0)}
+                                  for position, row in enumerate(dataset.rows)]}, f, ensure_ascii=False, indent=2)
+    graph = CollocationGraph.from_collocations(dataset.collocations_data())
+    complete = directory / "collocations_complete.json"
+    with open(complete, 'w', encoding='utf-8') as f:
+        json.dump(graph.to_data(), f, ensure_ascii=False, indent=2)
+    return vocabulary, complete, {'hints': dataset.hints}, graph.pair_count
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the coverage report with the word index against the linear scan")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help="Copies of the real data set (default: 1 10 100)")
+    args = parser.parse_args()
+
+    print(f"{'scale':>6} {'pairs':>9} {'words':>8} {'build':>8} {'load':>8} {'scan':>9} {'index':>8} "
+          f"{'speedup':>8}  same")
+    find_noun_info = verify_hint_coverage.find_noun_info
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            vocabulary, complete, hints, pairs = write_inputs(scale, directory)
+            index_path = directory / "word_index.json"
+            collocation_graph._loaded.clear()
+            graph = load_graph(complete)
+            index, build = timed(load_word_index, vocabulary, complete, index_path)
+            _, load = timed(load_word_index, vocabulary, complete, index_path)
+
+            results = verify_hint_coverage.analyze_hint_coverage(
+                graph, hints, verify_hint_coverage.extract_verb_noun_pairs(graph))
+            with open(complete, 'r', encoding='utf-8') as f:
+                complete_data = json.load(f)
+
+            verify_hint_coverage.find_noun_info = lambda noun, _: scan_noun_info(noun, complete_data)
+            try:
+                scanned, scan = timed(verify_hint_coverage.generate_markdown_report,
+                                      results, graph, directory / "scan.md", index)
+            finally:
+                verify_hint_coverage.find_noun_info = find_noun_info
+            indexed, lookup = timed(verify_hint_coverage.generate_markdown_report,
+                                    results, graph, directory / "index.md", index)
+        print(f"{scale:>6} {pairs:>9,} {len(index):>8,} {build:>7.2f}s {load:>7.2f}s {scan:>8.2f}s "
+              f"{lookup:>7.2f}s {scan / lookup:>7.0f}x {str(scanned == indexed):>5}")
+
+
+if __name__ == '__main__':
+    main()
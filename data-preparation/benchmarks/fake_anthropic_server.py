@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Minimal stand-in for the Anthropic Messages API, for benchmarking without an API key.
+
+Serves POST /v1/messages with a fixed simulated latency and answers in the
+Messages API response format. Optionally rejects every Nth request with a
+429 + retry-after header so the engine's backoff path gets exercised.
+
+Also mocks the Message Batches endpoints:
+    POST /v1/messages/batches               create a batch
+    GET  /v1/messages/batches/{id}          status (ends after --batch-latency seconds)
+    GET  /v1/messages/batches/{id}/results  JSONL results in shuffled order
+With --fail-every N, every Nth batch request comes back as "errored".
+
+Packed prompts (asking for a JSON object over "- key (english)" lines) get a
+JSON object back; with --drop-every N, every Nth key is left out so the
+missing-key repair path gets exercised.
+
+Usage:
+    python benchmarks/fake_anthropic_server.py --port 8765 --latency 0.2
+    python regenerate_clear_hints.py --base-url http://127.0.0.1:8765
+    python regenerate_clear_hints.py --base-url http://127.0.0.1:8765 --batch --poll-interval 0.5
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeAnthropicServer(ThreadingHTTPServer):
+    """Threaded server with a listen backlog large enough for high concurrency."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class FakeAnthropicHandler(BaseHTTPRequestHandler):
+    """Request handler; behaviour is configured on the server instance."""
+
+    def log_message(self, format, *args):
+        # Keep benchmark output readable
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_found(self):
+        self._send_json(404, {'type': 'error', 'error': {'type': 'not_found_error', 'message': self.path}})
+
+    def _next_count(self):
+        server = self.server
+        with server.lock:
+            server.request_count += 1
+            return server.request_count
+
+    def _batch_payload(self, batch_id):
+        """Current MessageBatch object for a stored batch."""
+        batch = self.server.batches[batch_id]
+        ended = time.time() - batch['created'] >= self.server.batch_latency
+        created_at = datetime.fromtimestamp(batch['created'], timezone.utc)
+        errored = sum(1 for result in batch['results'] if result['result']['type'] == 'errored')
+        total = len(batch['results'])
+        return {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': 'ended' if ended else 'in_progress',
+            'request_counts': {
+                'processing': 0 if ended else total,
+                'succeeded': total - errored if ended else 0,
+                'errored': errored if ended else 0,
+                'canceled': 0,
+                'expired': 0,
+            },
+            'created_at': created_at.isoformat(),
+            'expires_at': (created_at + timedelta(hours=24)).isoformat(),
+            'ended_at': datetime.now(timezone.utc).isoformat() if ended else None,
+            'archived_at': None,
+            'cancel_initiated_at': None,
+            'results_url': (f"http://127.0.0.1:{self.server.server_port}/v1/messages/batches/{batch_id}/results"
+                            if ended else None),
+        }
+
+    def _create_batch(self, request):
+        server = self.server
+        with server.lock:
+            batch_id = f"msgbatch_fake_{len(server.batches) + 1:04d}"
+
+        results = []
+        for item in request['requests']:
+            count = self._next_count()
+            if server.fail_every and count % server.fail_every == 0:
+                result = {'type': 'errored', 'error': {'type': 'error', 'error': {'type': 'api_error', 'message': 'Simulated failure'}}}
+            else:
+                result = {'type': 'succeeded', 'message': self._message(item['params'], count)}
+            results.append({'custom_id': item['custom_id'], 'result': result})
+        random.shuffle(results)
+
+        with server.lock:
+            server.batches[batch_id] = {'created': time.time(), 'results': results}
+        self._send_json(200, self._batch_payload(batch_id))
+
+    def do_GET(self):
+        parts = self.path.split('?')[0].strip('/').split('/')
+        if parts[:3] != ['v1', 'messages', 'batches'] or len(parts) < 4 or parts[3] not in self.server.batches:
+            self._not_found()
+            return
+
+        batch_id = parts[3]
+        if len(parts) == 4:
+            self._send_json(200, self._batch_payload(batch_id))
+            return
+
+        body = '\n'.join(json.dumps(result) for result in self.server.batches[batch_id]['results']).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/binary')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _response_text(self, prompt, count):
+        """Plain hint text, or a JSON object for packed prompts."""
+        if 'Return ONLY a JSON object' not in prompt:
+            return f"\"hint #{count} for {len(prompt)}-char prompt\""
+
+        keys = [line[2:].split(' (')[0] for line in prompt.splitlines() if line.startswith('- ') and ' (' in line]
+        keys = [key for key in keys if '→' not in key and '+' not in key]
+        values = {}
+        for key in keys:
+            with self.server.lock:
+                self.server.key_count += 1
+                dropped = self.server.drop_every and self.server.key_count % self.server.drop_every == 0
+            if not dropped:
+                values[key] = f"hint #{count} for {key}"
+        return "```json\n" + json.dumps(values, ensure_ascii=False, indent=2) + "\n```"
+
+    def _message(self, request, count):
+        """Messages API response body for one request."""
+        prompt = request['messages'][0]['content']
+        return {
+            'id': f"msg_fake_{count:06d}",
+            'type': 'message',
+            'role': 'assistant',
+            'model': request.get('model', 'fake-model'),
+            'content': [{'type': 'text', 'text': self._response_text(prompt, count)}],
+            'stop_reason': 'end_turn',
+            'stop_sequence': None,
+            'usage': {'input_tokens': len(prompt) // 4, 'output_tokens': 8},
+        }
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+
+        path = self.path.split('?')[0]
+        if path == '/v1/messages/batches':
+            self._create_batch(request)
+            return
+        if path != '/v1/messages':
+            self._not_found()
+            return
+
+        server = self.server
+        count = self._next_count()
+
+        time.sleep(server.latency)
+
+        if server.fail_every and count % server.fail_every == 0:
+            server.rejected += 1
+            self._send_json(429, {'type': 'error', 'error': {'type': 'rate_limit_error', 'message': 'Simulated rate limit'}},
+                            headers={'retry-after': str(server.retry_after)})
+            return
+
+        self._send_json(200, self._message(request, count))
+
+
+def start_server(port=0, latency=0.2, fail_every=0, retry_after=0.1, batch_latency=1.0, drop_every=0):
+    """
+    Start the fake API in a background thread.
+
+    Args:
+        port: Port to bind on 127.0.0.1 (0 = pick a free port)
+        latency: Seconds each request takes to answer
+        fail_every: Reject every Nth request with 429 (0 = never)
+        retry_after: Value of the retry-after header on rejected requests
+        batch_latency: Seconds before a submitted batch reports "ended"
+        drop_every: Leave out every Nth key from packed JSON responses (0 = never)
+
+    Returns:
+        The running server; its base URL is http://127.0.0.1:{server.server_port}
+    """
+    server = FakeAnthropicServer(('127.0.0.1', port), FakeAnthropicHandler)
+    server.latency = latency
+    server.fail_every = fail_every
+    server.retry_after = retry_after
+    server.batch_latency = batch_latency
+    server.batches = {}
+    server.drop_every = drop_every
+    server.key_count = 0
+    server.lock = threading.Lock()
+    server.request_count = 0
+    server.rejected = 0
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Fake Anthropic Messages API for local benchmarks")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.2, help="Seconds per request (default: 0.2)")
+    parser.add_argument('--fail-every', type=int, default=0, help="Return 429 for every Nth request")
+    parser.add_argument('--batch-latency', type=float, default=1.0, help="Seconds until a batch ends (default: 1.0)")
+    parser.add_argument('--drop-every', type=int, default=0, help="Drop every Nth key from packed JSON responses")
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.latency, args.fail_every, batch_latency=args.batch_latency,
+                          drop_every=args.drop_every)
+    print(f"Fake Anthropic API listening on http://127.0.0.1:{server.server_port}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
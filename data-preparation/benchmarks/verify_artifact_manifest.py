@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Verify the content-hashed artifact copies and manifest.json.
+
+Runs on a temporary copy of public/data. Checks that:
+- the first run writes a current manifest (every hashed copy exists and
+  matches the plain file, its name, size, sha256 and integrity value)
+- hashed names and integrity values are derived from content only
+- rerunning with nothing changed rewrites nothing and deletes nothing
+- changing one artifact gives only that artifact a new name and deletes
+  its previous copy, and changing it back restores the original name
+- a stale manifest and a tampered hashed copy are reported
+
+Usage (from the repository root):
+    python data-preparation/benchmarks/verify_artifact_manifest.py
+"""
+
+import base64
+import hashlib
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from artifact_manifest import (ARTIFACTS, MANIFEST_NAME, SOURCE_DIR, hashed_name, integrity, load_manifest,
+                               verify_manifest, write_manifest)
+
+
+def main():
+    checks = []
+    content = b'{"meanings": {}}'
+    sha256 = hashlib.sha256(content).hexdigest()
+    checks.append(("hashed name uses the content hash", hashed_name('collocation_meanings.json', sha256)
+                   == f"collocation_meanings.{sha256[:8]}.json"))
+    checks.append(("integrity is sha384 SRI", integrity(content)
+                   == 'sha384-' + base64.b64encode(hashlib.sha384(content).digest()).decode('ascii')))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        for name in ARTIFACTS:
+            if (SOURCE_DIR / name).exists():
+                shutil.copyfile(SOURCE_DIR / name, data_dir / name)
+
+        write_manifest(data_dir)
+        first = load_manifest(data_dir)
+        manifest_bytes = (data_dir / MANIFEST_NAME).read_bytes()
+        checks.append(("first run writes every artifact", verify_manifest(data_dir) == []
+                       and set(first['artifacts']) == {name for name in ARTIFACTS if (SOURCE_DIR / name).exists()}))
+
+        result = write_manifest(data_dir)
+        checks.append(("unchanged rerun is a no-op", result == {'changed': [], 'removed': []}
+                       and (data_dir / MANIFEST_NAME).read_bytes() == manifest_bytes))
+
+        meanings = data_dir / 'collocation_meanings.json'
+        original = meanings.read_bytes()
+        meanings.write_bytes(original.replace(b'"meanings"', b'"meanings" ', 1))
+        checks.append(("stale manifest reported", any('changed since' in problem
+                                                      for problem in verify_manifest(data_dir))))
+        result = write_manifest(data_dir)
+        second = load_manifest(data_dir)
+        renamed = [name for name in first['artifacts']
+                   if first['artifacts'][name]['file'] != second['artifacts'][name]['file']]
+        old_file = first['artifacts']['collocation_meanings.json']['file']
+        checks.append(("only the changed artifact is renamed", result['changed'] == ['collocation_meanings.json']
+                       and renamed == ['collocation_meanings.json']))
+        checks.append(("previous copy is deleted", result['removed'] == [Path(old_file).name]
+                       and not (data_dir / old_file).exists()))
+
+        meanings.write_bytes(original)
+        write_manifest(data_dir)
+        checks.append(("reverting restores the original name", load_manifest(data_dir)['artifacts']
+                       == first['artifacts'] and verify_manifest(data_dir) == []))
+
+        hashed = data_dir / first['artifacts']['vocabulary.json']['file']
+        hashed.write_bytes(hashed.read_bytes() + b'\n')
+        checks.append(("tampered copy reported", any('does not match' in problem
+                                                     for problem in verify_manifest(data_dir))))
+
+    failures = 0
+    for name, ok in checks:
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}")
+        failures += 0 if ok else 1
+
+    if failures:
+        print(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    print("\nAll artifact manifest checks passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Verify the compact collocation binary format round-trips the JSON exactly.
+
+Checks that:
+- the published .bin decodes to data equal to collocations_complete.json
+  and re-serializes to the identical JSON text
+- encode(decode(bin)) reproduces the .bin byte for byte
+- graph queries on the decoded graph match the JSON-built graph
+- a replicated 10x dataset round-trips as well
+- truncated, trailing and foreign data raise BinaryFormatError, and
+  scores outside 0-3 are rejected by the writer
+
+Usage (from the repository root):
+    python data-preparation/benchmarks/verify_collocation_binary.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_collocation_graph import replicate
+from collocation_binary import DEFAULT_INPUT, DEFAULT_OUTPUT, BinaryFormatError, decode, encode, verify_round_trip
+from collocation_graph import CollocationGraph
+
+
+def raises(fn, error=BinaryFormatError):
+    try:
+        fn()
+    except error:
+        return True
+    return False
+
+
+def main():
+    with open(DEFAULT_INPUT, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    graph = CollocationGraph.from_data(data)
+    published = DEFAULT_OUTPUT.read_bytes()
+    decoded = decode(published)
+
+    ok, message = verify_round_trip(DEFAULT_OUTPUT, DEFAULT_INPUT)
+    checks = [
+        (f"published .bin: {message}", ok),
+        ("published .bin is current", encode(graph) == published),
+        ("re-encoding is byte-identical", encode(decoded) == published),
+        ("pairs match", list(decoded.pairs()) == list(graph.pairs())
+         and list(decoded.pairs(reverse=True)) == list(graph.pairs(reverse=True))),
+        ("neighbors/score/degree match", all(
+            decoded.neighbors(word) == graph.neighbors(word) and decoded.degree(word) == graph.degree(word)
+            for word in graph.words) and all(decoded.score(a, b) == s for a, b, s in graph.pairs())),
+    ]
+
+    large = replicate(data, 10)
+    checks.append(("10x dataset round-trips", decode(encode(CollocationGraph.from_data(large))).to_data() == large))
+
+    checks.append(("truncated data rejected", raises(lambda: decode(published[:-1]))))
+    checks.append(("trailing data rejected", raises(lambda: decode(published + b'\0'))))
+    checks.append(("foreign data rejected", raises(lambda: decode(b'{"words": {}}' + published))))
+    bad_score = CollocationGraph.from_data(data)
+    bad_score._forward.scores[0] = 4
+    checks.append(("score > 3 rejected", raises(lambda: encode(bad_score), ValueError)))
+
+    failures = 0
+    for name, ok in checks:
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}")
+        failures += 0 if ok else 1
+
+    if failures:
+        print(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    print("\nAll binary format checks passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Verify the one-pass frequency enrichment (frequency_enrichment.py).
+
+wordfreq is replaced by a deterministic stand-in that counts its lookups,
+so the checks run without it and do not depend on its data. Checks that:
+- a second run with the same wordfreq release takes every word from the
+  memo, and a memo written by another release is ignored and rewritten
+- without wordfreq installed, the memo is used whatever release wrote it
+- raw/add_wordfreq_data.py on lists in its old output format folds
+  "wordfreq_zipf" into "frequency" with the scores it used to write, and
+  keeps the rows and their Routledge ranks
+- raw/map_frequency_to_csvs.py merges the best rank of duplicate Routledge
+  entries and orders N5, N4 and N54 exactly as the script did before it
+  became a wrapper (ranked words by rank, ties and unranked words in
+  their original order)
+- rerunning on enriched lists rewrites them byte for byte
+
+Usage (from data-preparation/):
+    python benchmarks/verify_frequency_enrichment.py
+"""
+
+import contextlib
+import csv
+import io
+import json
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+PREP = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PREP))
+sys.path.insert(0, str(PREP / "raw"))
+
+import add_wordfreq_data
+import frequency_enrichment
+import map_frequency_to_csvs
+from frequency_enrichment import DEFAULT_LISTS, ZipfMemo
+
+
+class FakeWordfreq:
+    """Stands in for the wordfreq module: a fixed score per word, with a call count."""
+
+    def __init__(self, version: str):
+        self.__version__ = version
+        self.calls = 0
+
+    def zipf_frequency(self, word: str, lang: str) -> float:
+        self.calls += 1
+        code = sum(map(ord, word))
+        return 0.0 if code % 7 == 0 else (code % 800) / 100 + 0.004
+
+
+def read_rows(path: Path) -> tuple:
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+def write_rows(path: Path, fieldnames: list, rows: list) -> None:
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def baseline_zipf(rows: list, fake: FakeWordfreq) -> list:
+    """The wordfreq_zipf values raw/add_wordfreq_data.py wrote before it became a wrapper."""
+    scores = []
+    for row in rows:
+        score = round(fake.zipf_frequency(row['japanese'], 'ja'), 2)
+        scores.append(str(score) if score > 0 else '')
+    return scores
+
+
+def baseline_ranked(rows: list, routledge: Path) -> list:
+    """The (japanese, reading, english, type, routledge_rank) rows raw/map_frequency_to_csvs.py wrote."""
+    ranks = {}
+    with open(routledge, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            rank = int(row['routledge_rank'])
+            if row['japanese'] not in ranks or rank < ranks[row['japanese']]:
+                ranks[row['japanese']] = rank
+    ranked, unranked = [], []
+    for row in rows:
+        rank = ranks.get(row['japanese'], '')
+        (ranked if rank else unranked).append((row['japanese'], row['reading'], row['english'], row['type'],
+                                               str(rank)))
+    ranked.sort(key=lambda row: int(row[4]))
+    return ranked + unranked
+
+
+def quietly(fn) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+
+
+def memo_checks(directory: Path, words: list) -> list:
+    checks = []
+    memo_file = directory / "zipf_memo.json"
+    distinct = len(set(words))
+
+    frequency_enrichment.wordfreq = fake = FakeWordfreq('3.0.0')
+    memo = ZipfMemo(memo_file)
+    first = memo.lookup(words)
+    memo.save()
+    checks.append((f"first run looks up each of {distinct} distinct words once",
+                   fake.calls == distinct and memo.misses == distinct))
+
+    fake.calls = 0
+    memo = ZipfMemo(memo_file)
+    checks.append(("same release: every word from the memo",
+                   memo.lookup(words) == first and fake.calls == 0 and memo.hits == distinct))
+
+    frequency_enrichment.wordfreq = fake = FakeWordfreq('3.1.0')
+    memo = ZipfMemo(memo_file)
+    memo.lookup(words)
+    memo.save()
+    with open(memo_file, 'r', encoding='utf-8') as f:
+        written = json.load(f)['wordfreq']
+    checks.append(("new release: memo ignored and rewritten",
+                   fake.calls == distinct and memo.hits == 0 and written == '3.1.0'))
+
+    frequency_enrichment.wordfreq = None
+    memo = ZipfMemo(memo_file)
+    checks.append(("without wordfreq: memo used as written",
+                   memo.lookup(words) == first and memo.version == '3.1.0'))
+    return checks
+
+
+def fold_checks(directory: Path, lists: list) -> list:
+    """Lists in add_wordfreq_data.py's old output format, with stale wordfreq_zipf values."""
+    legacy_fields = ['japanese', 'reading', 'english', 'type', 'routledge_rank', 'wordfreq_zipf']
+    rng = random.Random(3)
+    before = {}
+    for path in lists:
+        _, rows = read_rows(path)
+        for row in rows:
+            row['routledge_rank'] = rng.choice(['', str(rng.randint(1, 5000))])
+            row['wordfreq_zipf'] = '9.99'
+        write_rows(path, legacy_fields, rows)
+        before[path] = rows
+
+    frequency_enrichment.wordfreq = fake = FakeWordfreq('3.1.0')
+    add_wordfreq_data.VOCABULARY_LISTS = lists
+    add_wordfreq_data.MEMO_FILE = directory / "fold_memo.json"
+    quietly(add_wordfreq_data.main)
+
+    header_ok = scores_ok = rows_ok = True
+    for path in lists:
+        fieldnames, rows = read_rows(path)
+        header_ok &= fieldnames == ['japanese', 'reading', 'english', 'type', 'routledge_rank', 'frequency']
+        scores_ok &= [row['frequency'] for row in rows] == baseline_zipf(before[path], fake)
+        rows_ok &= ([(row['japanese'], row['routledge_rank']) for row in rows]
+                    == [(row['japanese'], row['routledge_rank']) for row in before[path]])
+    return [("wordfreq_zipf folded into frequency", header_ok),
+            ("frequency holds the scores add_wordfreq_data.py wrote", scores_ok),
+            ("rows and their ranks kept in place", rows_ok)]
+
+
+def routledge_checks(directory: Path, lists: list) -> list:
+    rng = random.Random(11)
+    originals = {path: read_rows(path)[1] for path in lists}
+    words = sorted({row['japanese'] for rows in originals.values() for row in rows})
+
+    # Ranks for two thirds of the words, with tied ranks and worse duplicate entries
+    routledge = directory / "routledge_frequency.csv"
+    entries = [{'japanese': word, 'routledge_rank': rng.randint(1, len(words))}
+               for word in rng.sample(words, len(words) * 2 // 3)]
+    entries += [{'japanese': entry['japanese'], 'routledge_rank': entry['routledge_rank'] + rng.randint(1, 50)}
+                for entry in rng.sample(entries, len(entries) // 10)]
+    rng.shuffle(entries)
+    write_rows(routledge, ['japanese', 'routledge_rank'], entries)
+
+    frequency_enrichment.wordfreq = fake = FakeWordfreq('3.1.0')
+    map_frequency_to_csvs.FREQUENCY_FILE = routledge
+    map_frequency_to_csvs.VOCABULARY_LISTS = lists
+    map_frequency_to_csvs.MEMO_FILE = directory / "routledge_memo.json"
+    quietly(map_frequency_to_csvs.main)
+
+    checks = []
+    for path in lists:
+        _, rows = read_rows(path)
+        merged = [(row['japanese'], row['reading'], row['english'], row['type'], row['routledge_rank'])
+                  for row in rows]
+        ranked = sum(1 for row in rows if row['routledge_rank'])
+        checks.append((f"{path.name}: {ranked} ranked of {len(rows)}, same order as map_frequency_to_csvs.py",
+                       merged == baseline_ranked(originals[path], routledge)))
+
+    written = {path: path.read_bytes() for path in lists}
+    fake.calls = 0
+    quietly(map_frequency_to_csvs.main)
+    checks.append(("rerun is byte-identical and looks nothing up",
+                   all(path.read_bytes() == written[path] for path in lists) and fake.calls == 0))
+    return checks
+
+
+def main():
+    installed = frequency_enrichment.wordfreq
+    checks = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            lists = []
+            for path in DEFAULT_LISTS:
+                shutil.copy(path, directory / path.name)
+                lists.append(directory / path.name)
+
+            words = [row['japanese'] for path in lists for row in read_rows(path)[1]]
+            checks += memo_checks(directory, words)
+            checks += fold_checks(directory, lists)
+            for path in DEFAULT_LISTS:
+                shutil.copy(path, directory / path.name)
+            checks += routledge_checks(directory, lists)
+    finally:
+        frequency_enrichment.wordfreq = installed
+
+    failures = 0
+    for name, ok in checks:
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}")
+        failures += 0 if ok else 1
+
+    if failures:
+        print(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    print("\nAll frequency enrichment checks passed")
+
+
+if __name__ == '__main__':
+    main()
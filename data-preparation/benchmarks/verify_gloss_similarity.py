@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Verify the TF-IDF similarity backend (gloss_similarity.py).
+
+Checks:
+- top_k() matches the k best columns of the full dense cosine matrix, for
+  block sizes from one row per block to the whole matrix at once
+- paired() matches the diagonal of the dense product
+- find_synonym_groups with --backend tfidf gives the same groups as the
+  all-pairs scan on public/data/vocabulary.json
+
+Usage (from data-preparation/):
+    python benchmarks/verify_gloss_similarity.py
+"""
+
+import contextlib
+import io
+import json
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from find_synonym_groups import find_synonym_groups, find_synonym_groups_naive
+from gloss_similarity import TfidfSimilarity
+
+VOCABULARY = Path(__file__).resolve().parent.parent.parent / "public" / "data" / "vocabulary.json"
+
+
+def top_k_mismatches(similarity: TfidfSimilarity, texts) -> list:
+    """
+    Rows where top_k() is not a k best set of the full dense cosine matrix:
+    the same scores (to 1e-9, so tied columns may swap), each the dense
+    score of the column it names.
+    """
+    matrix = similarity.fit_transform(texts)
+    full = (matrix @ matrix.T).toarray()
+    indices, scores = similarity.top_k(matrix)
+    mismatched = []
+    for i, row in enumerate(full):
+        row[i] = -np.inf
+        expected = np.sort(row)[::-1][:similarity.k]
+        expected = expected[expected >= similarity.min_similarity]
+        found = indices[i] >= 0
+        if (found.sum() != len(expected) or not np.allclose(scores[i][found], expected, atol=1e-9)
+                or not np.allclose(row[indices[i][found]], scores[i][found], atol=1e-12)):
+            mismatched.append(i)
+    return mismatched
+
+
+def main():
+    rng = random.Random(16)
+    words = ['rice', 'cooked rice', 'meal', 'tea', 'green tea', 'water', 'day', 'month', 'the', 'of', 'lunch', 'box']
+    texts = ['; '.join(' '.join(rng.sample(words, rng.randint(1, 3))) for _ in range(rng.randint(1, 3)))
+             for _ in range(300)] + ['', 'a', 'tea', 'tea']
+
+    checks = []
+    for analyzer, ngram in (('char', 3), ('char', 2), ('word', 1)):
+        for block_mb in (0.0001, 0.05, 1024):
+            similarity = TfidfSimilarity(analyzer, ngram, top_k=5, min_similarity=0.2, block_mb=block_mb)
+            rows = similarity.block_rows(len(texts))
+            mismatched = top_k_mismatches(similarity, texts)
+            checks.append((f"top_k {analyzer} n={ngram}, {rows} row(s) per block: matches dense cosine",
+                           not mismatched, mismatched))
+
+    similarity = TfidfSimilarity()
+    others = texts[1:] + texts[:1]
+    similarity.fit(texts + others)
+    dense = (similarity.transform(texts) @ similarity.transform(others).T).toarray().diagonal()
+    checks.append(("paired() == diagonal of the dense product",
+                   np.allclose(TfidfSimilarity().paired(texts, others), dense, atol=1e-12), []))
+
+    with open(VOCABULARY, 'r', encoding='utf-8') as f:
+        vocabulary = json.load(f)['vocabulary']
+    with contextlib.redirect_stdout(io.StringIO()):
+        tfidf = find_synonym_groups(vocabulary, TfidfSimilarity())
+        naive = find_synonym_groups_naive(vocabulary)
+    checks.append(("vocabulary.json: tfidf candidates give the all-pairs groups",
+                   json.dumps(tfidf, ensure_ascii=False) == json.dumps(naive, ensure_ascii=False), []))
+
+    failures = 0
+    for name, ok, details in checks:
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}" + (f": {details[:10]}" if details else ""))
+        failures += 0 if ok else 1
+
+    if failures:
+        print(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    print("\nAll gloss similarity checks passed")
+
+
+if __name__ == '__main__':
+    main()
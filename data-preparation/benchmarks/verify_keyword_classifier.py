@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Verify the compiled keyword classifiers give the same categories as the rule-by-rule loops.
+
+Checks, for every noun gloss in collocations_complete.json (lowercased, as
+the scripts classify them, and as written):
+- every table in rules/*.json: first() == the if/elif chains they replaced, and
+  for category_scores.json best() == ComprehensiveHintFixer's scoring loop
+- refine_hints' SEMANTIC_PATTERNS / MANUAL_CATEGORIES: first() == the regex loop
+and, on seeded random tables and texts (overlapping, repeated, empty and
+multi-word keywords), that first() and best() agree with the loops in both
+modes.
+
+Usage (from data-preparation/):
+    python benchmarks/verify_keyword_classifier.py
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hint_rules import CATEGORY_SCORE_RULES, load_rules, rule_files
+from keyword_classifier import KeywordClassifier, compile_rules, naive_best, naive_first
+from refine_hints import MANUAL_CLASSIFIER, SEMANTIC_CLASSIFIER
+
+DEFAULT_INPUT = Path(__file__).resolve().parent.parent / "input" / "collocations_complete.json"
+
+
+def mismatches(classifier, texts, best: bool = False) -> int:
+    """Texts where a KeywordClassifier or RuleTable disagrees with the rule-by-rule loops."""
+    # RuleTable.words lists dispatch words; its keywords always match as substrings
+    words = classifier.words if isinstance(classifier, KeywordClassifier) else False
+    count = 0
+    for text in texts:
+        if best:
+            count += classifier.best(text) != naive_best(classifier.rules, text, classifier.default)
+        else:
+            count += classifier.first(text) != naive_first(classifier.rules, text, classifier.default, words)
+    return count
+
+
+def random_rules(rng: random.Random, alphabet: str):
+    keywords = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 4))) for _ in range(30)]
+    return [(f'category {rule % 5}', rng.sample(keywords, rng.randint(0, 6)) + rng.sample(keywords, rng.randint(0, 2)))
+            for rule in range(rng.randint(1, 12))]
+
+
+def main():
+    with open(DEFAULT_INPUT, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    glosses = sorted({entry['english'] for entry in data['words'].values() if entry['type'] == 'noun'})
+    texts = [gloss.lower() for gloss in glosses] + glosses
+
+    checks = []
+    for path in rule_files():
+        tables = load_rules(path).tables
+        best = path == CATEGORY_SCORE_RULES
+        failed = [name for name, table in tables.items() if mismatches(table, texts, best)]
+        checks.append((f"{path.name}: {len(tables)} tables x {len(texts)} glosses "
+                       f"({'best score' if best else 'first match'})", not failed, failed))
+
+    failed = [name for name, classifier in [('SEMANTIC_PATTERNS', SEMANTIC_CLASSIFIER),
+                                            ('MANUAL_CATEGORIES', MANUAL_CLASSIFIER)]
+              if mismatches(classifier, texts)]
+    checks.append((f"refine_hints tables x {len(texts)} glosses (whole words)", not failed, failed))
+
+    rng = random.Random(11)
+    failed = []
+    for trial in range(300):
+        rules = random_rules(rng, 'ab -')
+        default = rng.choice([None, 'default'])
+        samples = [''.join(rng.choice('ab -') for _ in range(rng.randint(0, 12))) for _ in range(40)]
+        if (mismatches(KeywordClassifier(rules, default), samples)
+                or mismatches(KeywordClassifier(rules, default), samples, best=True)
+                or mismatches(KeywordClassifier(rules, default, words=True), samples)):
+            failed.append(trial)
+    checks.append(("300 random tables (substring first/best, whole-word first)", not failed, failed))
+
+    checks.append(("compiled tables are reused",
+                   compile_rules([('a', ['x'])], 'd') is compile_rules([('a', ['x'])], 'd')
+                   and compile_rules([('a', ['x'])]) is not compile_rules([('a', ['x'])], words=True), []))
+
+    failures = 0
+    for name, ok, details in checks:
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}" + (f": {details[:10]}" if details else ""))
+        failures += 0 if ok else 1
+
+    if failures:
+        print(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    print("\nAll keyword classifier checks passed")
+
+
+if __name__ == '__main__':
+    main()
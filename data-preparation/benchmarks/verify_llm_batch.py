@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Verify llm_batch.BatchRunner against the mock Message Batches endpoints.
+
+Checks that:
+- every job comes back exactly once, matched by custom_id despite shuffled results
+- errored batch results fall back to the job's fallback text
+- a second run is served entirely from the response cache (no new batch)
+- --cache-only replays the same output without a client
+- a prompt missing from the cache in --cache-only mode raises CacheMiss
+  (BatchRunner and HintEngine) instead of returning its fallback as a result
+
+Usage:
+    python benchmarks/verify_llm_batch.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_anthropic_server import start_server
+from llm_batch import BatchRunner
+from llm_cache import CacheMiss, ResponseCache
+from llm_engine import HintEngine
+
+
+def main():
+    os.environ.setdefault("ANTHROPIC_API_KEY", "sk-fake-verify")
+    server = start_server(latency=0.0, fail_every=25, batch_latency=0.5)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    jobs = [((f"verb{i // 10}", f"noun{i % 10}"), f"Create a hint for pair {i}", f"fallback {i}")
+            for i in range(200)]
+    failures = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(Path(tmp) / "cache.sqlite")
+
+        start = time.perf_counter()
+        runner = BatchRunner(base_url=base_url, poll_interval=0.2, cache=cache)
+        first = runner.run(jobs)
+        elapsed = time.perf_counter() - start
+        print(f"Batch run: {len(first)} results in {elapsed:.2f}s - {runner.summary()}")
+
+        errored = [key for key, _, fallback in jobs if first[key] == fallback]
+        checks = [
+            ("all jobs returned", len(first) == len(jobs)),
+            ("one batch submitted", runner.stats['batches'] == 1),
+            ("errored results fall back", len(errored) == runner.stats['failed'] == 200 // 25),
+            ("successful results are cleaned", all(not first[key].startswith('"') for key, _, _ in jobs)),
+        ]
+
+        rerun = BatchRunner(base_url=base_url, poll_interval=0.2, cache=cache)
+        second = rerun.run(jobs)
+        checks.append(("rerun resubmits only failed prompts", rerun.stats['submitted'] == len(errored)))
+        checks.append(("rerun keeps cached text", all(second[key] == first[key]
+                                                      for key, _, _ in jobs if key not in errored)))
+
+        replay = BatchRunner(cache=ResponseCache(Path(tmp) / "cache.sqlite", cache_only=True))
+        third = replay.run(jobs)
+        checks.append(("cache-only replay needs no client", replay.client is None))
+        checks.append(("cache-only replay matches", third == second))
+
+        uncached = jobs + [(("verb99", "noun0"), "A prompt that was never sent", "fallback 999")]
+        for name, runner in (("BatchRunner", BatchRunner), ("HintEngine", HintEngine)):
+            replay = runner(cache=ResponseCache(Path(tmp) / "cache.sqlite", cache_only=True))
+            fallbacks = []
+            try:
+                replay.run_sync(uncached, on_result=lambda key, text, ok: fallbacks.append(key) if not ok else None)
+                raised = False
+            except CacheMiss:
+                raised = True
+            checks.append((f"{name} cache-only miss raises CacheMiss, no fallback reported",
+                           raised and ("verb99", "noun0") not in fallbacks))
+
+    server.shutdown()
+
+    for name, ok in checks:
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}")
+        failures += 0 if ok else 1
+
+    if failures:
+        print(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    print("\nAll batch checks passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Verify that release patches reproduce the next release exactly.
+
+Checks that:
+- diff/apply round-trips edited copies of the published artifacts (words
+  and matches added, removed, moved and edited, meanings changed, headers
+  bumped), with key and list order kept, and the patches stay small
+- identical values diff to nothing, and lists without a unique id/word key
+  or values that change type are replaced whole
+- random edits of random nested data round-trip
+- export_release() over a chain of releases writes patches that take
+  release N to release N+1, skips unchanged exports, restarts the chain
+  without a matching snapshot, and verify_patches() accepts the result
+- without a snapshot, the current release in public/data/releases/ is
+  found in the git history (and a release that was never committed is not)
+- apply_patch() rejects a patch for another base and a corrupted patch
+
+Usage (from the repository root):
+    python data-preparation/benchmarks/verify_release_patches.py
+"""
+
+import copy
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from release_patches import (ARTIFACTS, DATA_DIR, RELEASES_DIR, PatchError, apply, apply_patch, artifact_hashes,
+                             canonical, content_hash, diff, export_release, load_artifacts, load_manifest,
+                             release_base, verify_patches)
+
+
+def round_trips(old, new) -> bool:
+    return canonical(apply(old, diff(old, new))) == canonical(new)
+
+
+def edit_release(artifacts: dict, seed: int) -> dict:
+    """A plausible next release: a few words, edges and meanings edited."""
+    rng = random.Random(seed)
+    new = copy.deepcopy(artifacts)
+
+    vocabulary = new['vocabulary']
+    vocabulary['generatedAt'] = f"2026-01-{seed + 10:02d}"
+    entries = vocabulary['vocabulary']
+    for _ in range(3):
+        entries.pop(rng.randrange(len(entries)))
+    entries[rng.randrange(len(entries))]['english'] += "; (edited)"
+    entries.insert(0, entries.pop(rng.randrange(len(entries))))
+    for number in range(2):
+        entries.insert(rng.randrange(len(entries)), {'id': f"new-{seed}-{number}", 'japanese': f"新語{number}",
+                                                      'reading': 'shingo', 'english': 'new word',
+                                                      'type': 'noun', 'frequency': 1.0})
+    vocabulary['totalWords'] = len(entries)
+
+    words = new['collocations']['words']
+    del words[rng.choice(list(words))]
+    verbs = [word for word, data in words.items() if data['type'] == 'verb' and data['matches'].get('nouns')]
+    verb = rng.choice(verbs)
+    matches = words[verb]['matches']['nouns']
+    matches[0]['score'] = 3 - matches[0]['score']
+    matches.reverse()
+    matches.append({'word': f"新語{seed}", 'reading': 'shingo', 'english': 'new word', 'score': 2})
+    words[f"新語{seed}"] = {'word': f"新語{seed}", 'reading': 'shingo', 'english': 'new word', 'type': 'noun',
+                           'matches': {'verbs': [{'word': verb, 'reading': words[verb]['reading'],
+                                                  'english': words[verb]['english'], 'score': 2}]}}
+
+    for name in ('meanings', 'reverse_meanings'):
+        meanings = new[name]['meanings']
+        new[name]['generatedAt'] = f"2026-01-{seed + 10:02d} 00:00:00"
+        word = rng.choice(list(meanings))
+        partner = rng.choice(list(meanings[word]))
+        meanings[word][partner] = "edited meaning"
+        del meanings[rng.choice(list(meanings))]
+        meanings[f"新語{seed}"] = {verb: "a new meaning"}
+    return new
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    kind = rng.randrange(6 if depth < 3 else 3)
+    if kind == 0:
+        return rng.randrange(5)
+    if kind == 1:
+        return rng.choice(['a', 'b', 'c', ''])
+    if kind == 2:
+        return rng.choice([None, True, 1.5])
+    if kind == 3:
+        return {f"k{index}": random_value(rng, depth + 1) for index in rng.sample(range(8), rng.randrange(5))}
+    if kind == 4:
+        return [random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    return [{'word': f"w{index}", 'value': random_value(rng, depth + 1)}
+            for index in rng.sample(range(8), rng.randrange(6))]
+
+
+def mutate(rng: random.Random, value, depth: int = 0):
+    if rng.random() < 0.15 or depth > 4:
+        return random_value(rng, depth)
+    if isinstance(value, dict):
+        items = list(value.items())
+        if rng.random() < 0.3:
+            rng.shuffle(items)
+        items = [(key, mutate(rng, item, depth + 1) if rng.random() < 0.5 else item) for key, item in items
+                 if rng.random() > 0.2]
+        items.insert(rng.randrange(len(items) + 1), (f"n{rng.randrange(100)}", random_value(rng, depth + 1)))
+        return dict(items)
+    if isinstance(value, list):
+        items = [mutate(rng, item, depth + 1) if rng.random() < 0.5 else item for item in value
+                 if rng.random() > 0.2]
+        if rng.random() < 0.3:
+            rng.shuffle(items)
+        return items
+    return value
+
+
+def raises(fn, error=PatchError):
+    try:
+        fn()
+    except error:
+        return True
+    return False
+
+
+def export_chain(releases: list) -> list:
+    """Export each artifact set in turn as a release; returns the (name, ok) checks."""
+    checks = []
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        data_dir, releases_dir, snapshot_dir = directory / "data", directory / "releases", directory / "snapshot"
+        data_dir.mkdir()
+        entries = []
+        for artifacts in releases:
+            for name, filename in ARTIFACTS.items():
+                (data_dir / filename).write_text(json.dumps(artifacts[name], ensure_ascii=False, indent=2),
+                                                 encoding='utf-8')
+            entries.append(export_release(data_dir, releases_dir, snapshot_dir))
+
+        checks.append(("first export is a base release", entries[0]['patch'] is None
+                       and entries[0]['previous'] is None))
+        checks.append(("later exports carry patches", all(entry['patch'] and entry['previous'] == entry['release'] - 1
+                                                           for entry in entries[1:])))
+
+        replayed = releases[0]
+        replay_ok = True
+        for entry, target in zip(entries[1:], releases[1:]):
+            with open(releases_dir / entry['patch']['file'], 'r', encoding='utf-8') as f:
+                patch = json.load(f)
+            replayed = apply_patch(replayed, patch)
+            replay_ok = replay_ok and all(canonical(replayed[name]) == canonical(target[name]) for name in ARTIFACTS)
+        checks.append(("release 1 + every patch reproduces each later release", replay_ok))
+        sizes = [entry['patch']['bytes'] for entry in entries[1:]]
+        checks.append((f"patches are small ({max(sizes):,} bytes at most)", max(sizes) < 20_000))
+        checks.append(("stored patches match the manifest", verify_patches(releases_dir) == []))
+
+        checks.append(("unchanged export is skipped", export_release(data_dir, releases_dir, snapshot_dir) is None))
+        for filename in ARTIFACTS.values():
+            (snapshot_dir / filename).unlink()
+        (data_dir / ARTIFACTS['meanings']).write_text(json.dumps(releases[0]['meanings'], ensure_ascii=False),
+                                                      encoding='utf-8')
+        restarted = export_release(data_dir, releases_dir, snapshot_dir)
+        checks.append(("missing snapshot starts a new chain", restarted['patch'] is None
+                       and load_manifest(releases_dir)['current'] == restarted['release']))
+    return checks
+
+
+def main():
+    release = load_artifacts(DATA_DIR)
+    checks = []
+
+    edited = [edit_release(release, seed) for seed in range(3)]
+    for seed, new in enumerate(edited):
+        patch_size = len(canonical(diff(release, new)))
+        checks.append((f"edited release {seed} round-trips ({patch_size:,} byte diff)",
+                       round_trips(release, new) and patch_size < 20_000))
+    checks.append(("reverse edits round-trip", all(round_trips(new, release) for new in edited)))
+
+    checks.append(("identical values diff to nothing", diff(release, copy.deepcopy(release)) is None))
+    checks.append(("key reorder round-trips", round_trips({'a': 1, 'b': 2, 'c': 3}, {'c': 3, 'a': 1, 'b': 2})))
+    checks.append(("plain lists are replaced", diff([1, 2, 3], [1, 2]) == {'=': [1, 2]}))
+    duplicate = [{'word': 'a', 'v': 1}, {'word': 'a', 'v': 2}]
+    checks.append(("lists with duplicate keys are replaced", diff(duplicate, duplicate[:1]) == {'=': duplicate[:1]}))
+    checks.append(("type changes are replaced", diff({'a': 1}, {'a': '1'}) == {'~': {'a': {'=': '1'}}}
+                   and diff(1, 1.0) == {'=': 1.0} and diff({}, []) == {'=': []}))
+
+    rng = random.Random(0)
+    fuzz_ok = True
+    for _ in range(2000):
+        old = random_value(rng)
+        new = mutate(rng, old)
+        fuzz_ok = fuzz_ok and round_trips(old, new)
+    checks.append(("2000 random edits round-trip", fuzz_ok))
+
+    checks.extend(export_chain([release] + edited))
+
+    current = load_manifest(RELEASES_DIR)['releases'][-1]
+    with tempfile.TemporaryDirectory() as tmp:
+        base = release_base(current, DATA_DIR, Path(tmp))
+        uncommitted = dict(current, artifacts={name: dict(record, sha256='0' * 64)
+                                               for name, record in current['artifacts'].items()})
+        checks.append((f"release {current['release']} found in git history without a snapshot",
+                       base is not None and {name: content_hash(value) for name, value in base.items()}
+                       == artifact_hashes(current) and release_base(uncommitted, DATA_DIR, Path(tmp)) is None))
+
+    patch = {'version': 1, 'from': 1, 'to': 2,
+             'artifacts': {'meanings': {'from': '0' * 64, 'to': '0' * 64, 'diff': {'=': {}}}}}
+    checks.append(("patch for another base rejected", raises(lambda: apply_patch(release, patch))))
+    checks.append(("corrupted patch rejected", raises(lambda: apply({'a': 1}, {'-': ['b']}))
+                   and raises(lambda: apply([], {'key': 'word', '+': [[3, {'word': 'x'}]]}))))
+
+    failures = 0
+    for name, ok in checks:
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}")
+        failures += 0 if ok else 1
+
+    if failures:
+        print(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    print("\nAll release patch checks passed")
+
+
+if __name__ == '__main__':
+    main()
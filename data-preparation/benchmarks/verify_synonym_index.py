@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Verify SynonymIndex blocking against the all-pairs synonym scan.
+
+Checks:
+- public/data/vocabulary.json: find_synonym_groups() == find_synonym_groups_naive(),
+  and every related noun pair is a candidate
+- synthetic nouns (synthetic_data, scale 2): the same, reporting the
+  candidate recall over related pairs
+- random short strings: pairs with a ratio >= 0.85 share at least
+  min_shared_bigrams() bigrams, and the bigram block finds all of them
+
+Usage (from data-preparation/):
+    python benchmarks/verify_synonym_index.py
+"""
+
+import contextlib
+import io
+import json
+import random
+import sys
+from collections import Counter
+from difflib import SequenceMatcher
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from find_synonym_groups import find_synonym_groups, find_synonym_groups_naive
+from synonym_index import ENGLISH_THRESHOLD, SHORT_GLOSS, SynonymIndex, bigrams, min_shared_bigrams
+from synthetic_data import generate
+
+VOCABULARY = Path(__file__).resolve().parent.parent.parent / "public" / "data" / "vocabulary.json"
+
+
+def missed_pairs(nouns):
+    """(related pairs the candidates miss, related pairs)"""
+    index = SynonymIndex(nouns)
+    missed, related = [], 0
+    for i in range(len(nouns)):
+        candidates = set(index.candidates(i))
+        for j in range(i + 1, len(nouns)):
+            if index.related(i, j):
+                related += 1
+                if j not in candidates:
+                    missed.append((nouns[i]['english'], nouns[j]['english']))
+    return missed, related
+
+
+def same_groups(nouns) -> bool:
+    with contextlib.redirect_stdout(io.StringIO()):
+        blocked, naive = find_synonym_groups(nouns), find_synonym_groups_naive(nouns)
+    return json.dumps(blocked, ensure_ascii=False) == json.dumps(naive, ensure_ascii=False)
+
+
+def random_short_strings(rng: random.Random):
+    """(bound violations, pairs missed by the candidates, related pairs) on random short strings."""
+    texts = [''.join(rng.choice('ab c') for _ in range(rng.randint(0, SHORT_GLOSS))) for _ in range(600)]
+    nouns = [{'japanese': str(i), 'reading': str(i), 'english': text} for i, text in enumerate(texts)]
+    index = SynonymIndex(nouns)
+    violations, missed, related = [], [], 0
+    for i, a in enumerate(texts):
+        candidates = set(index.candidates(i))
+        for j in range(i + 1, len(texts)):
+            b = texts[j]
+            if SequenceMatcher(None, a, b).ratio() < ENGLISH_THRESHOLD:
+                continue
+            related += 1
+            shared = sum((Counter(bigrams(a)) & Counter(bigrams(b))).values())
+            if shared < min_shared_bigrams(len(a)) or shared < min_shared_bigrams(len(b)):
+                violations.append((a, b))
+            if j not in candidates:
+                missed.append((a, b))
+    return violations, missed, related
+
+
+def main():
+    with open(VOCABULARY, 'r', encoding='utf-8') as f:
+        nouns = [w for w in json.load(f)['vocabulary'] if w['type'] == 'noun']
+    synthetic = [row for row in generate(2).rows if row['type'] == 'noun']
+
+    checks = []
+    for name, data in ((f"vocabulary.json ({len(nouns)} nouns)", nouns),
+                       (f"synthetic x2 ({len(synthetic)} nouns)", synthetic)):
+        checks.append((f"{name}: same groups as the all-pairs scan", same_groups(data), []))
+        missed, related = missed_pairs(data)
+        checks.append((f"{name}: {related - len(missed)}/{related} related pairs are candidates", not missed, missed))
+
+    violations, missed, related = random_short_strings(random.Random(15))
+    checks.append((f"random short strings: {related} pairs share >= min_shared_bigrams() bigrams",
+                   not violations, violations))
+    checks.append((f"random short strings: {related - len(missed)}/{related} related pairs are candidates",
+                   not missed, missed))
+
+    failures = 0
+    for name, ok, details in checks:
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}" + (f": {details[:5]}" if details else ""))
+        failures += 0 if ok else 1
+
+    if failures:
+        print(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    print("\nAll synonym index checks passed")
+
+
+if __name__ == '__main__':
+    main()
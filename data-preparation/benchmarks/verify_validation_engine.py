@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Verify the single-pass validation engine (validation_engine.py).
+
+Checks:
+- input/collocation_hints.json: the coverage and specificity numbers match
+  validate_hints.HintValidator, the missing pairs match validate_hints_v2,
+  the per-verb quality scores match validate_hints_final and the hinted
+  noun count matches verify_hint_coverage
+- input/collocation_hints_refined.json (per-verb hint groups): every
+  verb's expanded {noun: hint} map equals the file's noun_assignments, and
+  coverage counts those pairs; hints files of any other shape are rejected
+- synthetic hints (synthetic_data, scale 3, with some hints dropped and
+  quoted): the JSON report is the same for 1, 2 and 5 workers
+- incremental runs: after editing, adding and removing verbs, a run with
+  the saved ValidationCache re-checks exactly those verbs and gives the
+  same report as a full run
+- QuoteRule flags each kind of leftover model output, and nothing in
+  well-formed hints
+
+Usage (from data-preparation/):
+    python benchmarks/verify_validation_engine.py
+"""
+
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from collocation_graph import load_graph
+from json_stream import iter_hints
+from synthetic_data import generate
+from validate_hints import HintValidator
+from validate_hints_final import analyze_hint_distribution
+from validate_hints_v2 import extract_all_pairs_from_collocations, extract_all_pairs_from_hints
+from validation_engine import (DEFAULT_COLLOCATIONS, DEFAULT_HINTS, HintFormatError, PairIndex, QuoteRule,
+                               ValidationCache, ValidationEngine, build_report, load_hints)
+from verify_hint_coverage import analyze_hint_coverage, extract_verb_noun_pairs, load_json_file
+
+REFINED_HINTS = DEFAULT_HINTS.parent / "collocation_hints_refined.json"
+
+# Hints files the engine must reject rather than read as having no hints
+MALFORMED_HINTS = [
+    {'verbs': {'飲む': {'hints': [{'hint': 'drinks you sip'}]}}},
+    {'verbs': {'飲む': {'nouns': ['水']}}},
+    {'hints': {'飲む': {'水': ['drinks you sip']}}},
+    {'hints': {'飲む': 'drinks you sip'}},
+]
+
+QUOTE_CASES = [
+    ('cold drinks you sip', []),
+    ('"cold drinks you sip"', ['quoted']),
+    ('drinks "cold or hot', ['unbalanced']),
+    ("'cold drinks'", ['quoted']),
+    ('drinks (hot or cold', ['unbalanced']),
+    ('things you [verb]', ['template_marker']),
+    ('drinks you sip on a cold...', ['truncated']),
+    ('drinks you sip with', ['truncated']),
+    ('drinks, snacks,', ['truncated']),
+    (' drinks you sip', ['whitespace']),
+]
+
+
+def real_data_checks():
+    index = PairIndex.load(DEFAULT_COLLOCATIONS, DEFAULT_HINTS)
+    results = ValidationEngine().run(index)
+    checks = []
+
+    validator = HintValidator(str(DEFAULT_COLLOCATIONS), str(DEFAULT_HINTS))
+    coverage = validator.validate_coverage()['summary']
+    summary = results['coverage']['summary']
+    checks.append(("coverage == HintValidator.validate_coverage()",
+                   (summary['total_verbs'], summary['verbs_with_hints'], summary['total_pairs'],
+                    summary['pairs_with_hints']) ==
+                   (coverage['total_verbs'], coverage['verbs_with_hints'], coverage['total_pairs'],
+                    coverage['pairs_with_hints']), []))
+
+    specificity = validator.validate_specificity()
+    summary = results['specificity']['summary']
+    expected = [(info['hint_phrase'], info['verbs']) for info in specificity['cross_verb_hints']]
+    found = [(info['hint'], info['verbs']) for info in results['specificity']['cross_verb_hints']]
+    checks.append(("specificity == HintValidator.validate_specificity()",
+                   (summary['unique_hints'], summary['hints_in_one_verb'], summary['hints_in_two_verbs'],
+                    summary['hints_in_three_plus_verbs']) ==
+                   (specificity['summary']['total_unique_hints'], specificity['summary']['hints_in_one_verb'],
+                    specificity['summary']['hints_in_two_verbs'], specificity['summary']['hints_in_three_plus'])
+                   and sorted(found) == sorted(expected), []))
+
+    graph = load_graph(DEFAULT_COLLOCATIONS)
+    colloc_pairs = extract_all_pairs_from_collocations(graph)
+    hint_pairs, _, _ = extract_all_pairs_from_hints(iter_hints(DEFAULT_HINTS))
+    missing = {f"{verb}||{noun}" for verb, nouns in results['coverage']['missing'].items() for noun in nouns}
+    checks.append(("missing pairs == validate_hints_v2", missing == colloc_pairs - hint_pairs, []))
+
+    analysis = analyze_hint_distribution(iter_hints(DEFAULT_HINTS))
+    worst = [(verb, data['quality_score'], data['max_hint'])
+             for verb, data in sorted(analysis.items(), key=lambda x: x[1]['quality_score'])[:10]]
+    found = [(stats['verb'], stats['quality_score'], stats['max_hint'])
+             for stats in results['diversity']['worst_verbs']]
+    overall = sum(data['quality_score'] for data in analysis.values()) / len(analysis)
+    checks.append(("worst verbs and overall score == validate_hints_final",
+                   found == worst and results['diversity']['summary']['overall_quality_score'] == round(overall, 2),
+                   []))
+
+    coverage = analyze_hint_coverage(graph, load_json_file(DEFAULT_HINTS), extract_verb_noun_pairs(graph))
+    checks.append(("hinted pairs == verify_hint_coverage",
+                   results['coverage']['summary']['pairs_with_hints'] == coverage['nouns_with_hints'], []))
+    return checks
+
+
+def refined_checks():
+    """The grouped hints format against the refine step's own noun -> hint map."""
+    with open(REFINED_HINTS, 'r', encoding='utf-8') as f:
+        refined = json.load(f)
+    assignments = {verb: entry['noun_assignments'] for verb, entry in refined['verbs'].items()}
+    index = PairIndex.load(DEFAULT_COLLOCATIONS, REFINED_HINTS)
+    summary = ValidationEngine().run(index)['coverage']['summary']
+    groups = load_graph(DEFAULT_COLLOCATIONS).groups()
+    hinted = sum(1 for verb, noun_hints in assignments.items() for noun in groups.get(verb, [])
+                 if noun in noun_hints)
+    checks = [
+        (f"refined hints expand to noun_assignments ({index.hint_count} hints, {len(assignments)} verbs)",
+         index.hints == assignments and index.hint_count > 0, []),
+        ("refined coverage counts the hinted pairs", summary['pairs_with_hints'] == hinted > 0, []),
+    ]
+
+    accepted = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "hints.json"
+        for data in MALFORMED_HINTS:
+            path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+            try:
+                load_hints(path)
+                accepted.append(data)
+            except HintFormatError:
+                pass
+    checks.append(("hints files of unknown shape rejected", not accepted, accepted))
+    return checks
+
+
+def synthetic_index(scale: int, seed: int = 17) -> PairIndex:
+    """Synthetic pairs with about 5% of the hints dropped and 1% wrapped in quotes."""
+    dataset = generate(scale)
+    rng = random.Random(seed)
+    groups = {word: [noun for noun, _ in nouns]
+              for mappings in (dataset.verb_mappings, dataset.adjective_mappings) for word, nouns in mappings.items()}
+    hints = {}
+    for verb, noun_hints in dataset.hints.items():
+        kept = {}
+        for noun, hint in noun_hints.items():
+            roll = rng.random()
+            if roll >= 0.05:
+                kept[noun] = f'"{hint}"' if roll < 0.06 else hint
+        hints[verb] = kept
+    return PairIndex(groups, hints)
+
+
+def incremental_checks(index: PairIndex):
+    """Edit a cached index three ways and compare the incremental report with a full one."""
+    checks = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "validation_cache.json"
+
+        def run(workers: int = 1):
+            engine = ValidationEngine(workers=workers)
+            cache = ValidationCache(cache_path, engine.rules)
+            report = build_report(index, engine.run(index, cache), {})
+            cache.save()
+            return json.dumps(report, ensure_ascii=False), cache
+
+        full = json.dumps(build_report(index, ValidationEngine().run(index), {}), ensure_ascii=False)
+        cold, cache = run()
+        checks.append((f"cold cache: {cache.summary()}, same report as without a cache",
+                       cold == full and cache.hits == 0, []))
+        warm, cache = run(workers=2)
+        checks.append((f"warm cache: {cache.summary()}, same report", warm == full and cache.misses == 0, []))
+
+        verbs = [verb for verb in index.verbs if index.hints.get(verb)]
+        edited, removed = verbs[len(verbs) // 3], verbs[len(verbs) // 2]
+        noun = next(iter(index.hints[edited]))
+        index.hints[edited] = dict(index.hints[edited], **{noun: 'things you edited'})
+        del index.hints[removed]
+        index.hints['新しい動詞'] = {'水': 'water you drink'}
+        index.verbs.append('新しい動詞')
+        incremental, cache = run(workers=2)
+        full = json.dumps(build_report(index, ValidationEngine().run(index), {}), ensure_ascii=False)
+        checks.append((f"after editing, removing and adding a verb: {cache.summary()}, same report as a full run",
+                       incremental == full and cache.misses == 3, []))
+    return checks
+
+
+def main():
+    checks = real_data_checks()
+    checks += refined_checks()
+
+    index = synthetic_index(3)
+    reports = {}
+    for workers in (1, 2, 5):
+        report = build_report(index, ValidationEngine(workers=workers).run(index), {})
+        reports[workers] = json.dumps(report, ensure_ascii=False)
+    differing = [workers for workers, report in reports.items() if report != reports[1]]
+    checks.append((f"synthetic x3 ({index.pair_count} pairs): "
+                   f"same report for 1, 2 and 5 workers", not differing, differing))
+    checks += incremental_checks(index)
+
+    rule = QuoteRule()
+    wrong = [(hint, rule.issues(hint), kinds) for hint, kinds in QUOTE_CASES if rule.issues(hint) != kinds]
+    checks.append(("QuoteRule flags each kind of leftover model output", not wrong, wrong))
+
+    failures = 0
+    for name, ok, details in checks:
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}" + (f": {details[:5]}" if details else ""))
+        failures += 0 if ok else 1
+
+    if failures:
+        print(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    print("\nAll validation engine checks passed")
+
+
+if __name__ == '__main__':
+    main()
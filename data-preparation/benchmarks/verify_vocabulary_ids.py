@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Verify content-derived vocabulary IDs and the ID migration maps (vocabulary_ids.py).
+
+Checks that:
+- word IDs depend only on (japanese, reading, type): editing the English
+  gloss or the frequency keeps them, changing the reading does not
+- assign_ids() rejects a word listed twice and two keys sharing an ID
+- an A -> B -> C chain (random IDs renumbered, words removed and added at
+  each step) composes to the same migration as mapping A -> C directly,
+  and takes every A ID still in C to its C ID
+- a word added in B and removed in C appears nowhere in the composed map
+- raw/create_vocabulary_json.py rerun on unchanged input rewrites
+  vocabulary.json and vocabulary_id_migration.json byte for byte
+
+Usage (from data-preparation/):
+    python benchmarks/verify_vocabulary_ids.py
+"""
+
+import contextlib
+import copy
+import io
+import json
+import random
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+PREP = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PREP))
+sys.path.insert(0, str(PREP / "raw"))
+
+import create_vocabulary_json
+import vocabulary_ids
+from vocabulary_ids import IdCollisionError, assign_ids, compose_migrations, migration_map, word_id
+
+
+def vocabulary(entries: list) -> dict:
+    return {'version': '1.0.0', 'generatedAt': '2026-01-01', 'totalWords': len(entries),
+            'vocabulary': entries}
+
+
+def raises(fn, error=IdCollisionError) -> bool:
+    try:
+        fn()
+    except error:
+        return True
+    return False
+
+
+def normalized(migration: dict) -> tuple:
+    """A migration's content, ignoring the order of removed and added."""
+    return migration['ids'], sorted(migration['removed']), sorted(migration['added'])
+
+
+def chain_checks(words: list) -> list:
+    rng = random.Random(7)
+    checks = []
+
+    # A: the old random IDs
+    build_a = copy.deepcopy(words[:300])
+    for entry in build_a:
+        entry['id'] = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    # B: stable IDs, 10 words removed, 5 added (the last of them is removed again in C)
+    build_b = assign_ids(copy.deepcopy(words[10:305]))
+    transient = build_b[-1]['id']
+
+    # C: 5 more removed, B's last word dropped, 5 new words, one gloss edited, one renumbered
+    build_c = copy.deepcopy(words[15:304] + words[305:310])
+    build_c[0]['english'] += "; (edited)"
+    build_c[1]['reading'] += "ー"
+    assign_ids(build_c)
+
+    a, b, c = vocabulary(build_a), vocabulary(build_b), vocabulary(build_c)
+    composed = compose_migrations(migration_map(a, b), migration_map(b, c))
+    direct = migration_map(a, c)
+    checks.append(("A -> B -> C composes to A -> C", normalized(composed) == normalized(direct)))
+
+    c_ids = {vocabulary_ids.word_key(entry): entry['id'] for entry in build_c}
+    expected = {entry['id']: c_ids[vocabulary_ids.word_key(entry)] for entry in build_a
+                if vocabulary_ids.word_key(entry) in c_ids}
+    mapped = {old_id: composed['ids'].get(old_id, old_id) for old_id in expected}
+    removed = {entry['id'] for entry in build_a if entry['id'] not in expected}
+    checks.append((f"composed map takes {len(expected)} A IDs to their C IDs, removes {len(removed)}",
+                   mapped == expected and set(composed['removed']) == removed))
+    checks.append(("composed map adds exactly the words new since A",
+                   set(composed['added']) == set(c_ids.values()) - set(expected.values())))
+    checks.append(("word added in B and removed in C appears nowhere",
+                   transient not in composed['ids'] and transient not in composed['ids'].values()
+                   and transient not in composed['removed'] and transient not in composed['added']))
+    unchanged = migration_map(c, c)
+    checks.append(("composing a no-op map changes nothing",
+                   normalized(compose_migrations(composed, unchanged)) == normalized(composed)))
+    return checks
+
+
+def rerun_checks() -> list:
+    """Run create_vocabulary_json.py as a first build, then twice more on unchanged input, in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        create_vocabulary_json.OUTPUT_FILE = directory / "vocabulary.json"
+        create_vocabulary_json.MIGRATION_FILE = directory / "vocabulary_id_migration.json"
+        outputs = []
+        for _ in range(3):
+            with contextlib.redirect_stdout(io.StringIO()):
+                create_vocabulary_json.main()
+            outputs.append((create_vocabulary_json.OUTPUT_FILE.read_bytes(),
+                            create_vocabulary_json.MIGRATION_FILE.read_bytes()))
+    return [("rerun on unchanged input is byte-identical", outputs[1] == outputs[2]),
+            ("first build writes a migration", json.loads(outputs[0][1])['ids'] == {})]
+
+
+def main():
+    with open(create_vocabulary_json.INPUT_FILE, 'r', encoding='utf-8') as f:
+        categories = json.load(f)['categories']
+    words = [{'id': None, 'japanese': word['japanese'], 'reading': word['reading'], 'english': word['english'],
+              'type': word['type'], 'frequency': word['frequency']}
+             for entries in categories.values() for word in entries]
+
+    checks = []
+    entry = words[0]
+    checks.append(("ID ignores gloss and frequency",
+                   assign_ids([dict(entry)])[0]['id']
+                   == assign_ids([dict(entry, english='edited', frequency=0.0)])[0]['id']
+                   == word_id(entry['japanese'], entry['reading'], entry['type'])))
+    checks.append(("ID changes with the reading",
+                   word_id(entry['japanese'], entry['reading'], entry['type'])
+                   != word_id(entry['japanese'], entry['reading'] + "ー", entry['type'])))
+    checks.append(("every real word gets a distinct ID", len({item['id'] for item in
+                                                                assign_ids(copy.deepcopy(words))}) == len(words)))
+    checks.append(("word listed twice rejected", raises(lambda: assign_ids([dict(entry), dict(entry)]))))
+
+    original = vocabulary_ids.word_id
+    vocabulary_ids.word_id = lambda *key: 'shared-id'
+    try:
+        checks.append(("two keys sharing an ID rejected", raises(lambda: assign_ids(copy.deepcopy(words[:2])))))
+    finally:
+        vocabulary_ids.word_id = original
+
+    checks += chain_checks(words)
+    checks += rerun_checks()
+
+    failures = 0
+    for name, ok in checks:
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}")
+        failures += 0 if ok else 1
+
+    if failures:
+        print(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    print("\nAll vocabulary ID checks passed")
+
+
+if __name__ == '__main__':
+    main()
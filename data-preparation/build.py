@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Incremental data pipeline build.
+
+Declares every pipeline stage with its inputs and outputs:
+
+    input/N54.csv
+      -> categorize   (raw/categorize_vocabulary.py)   -> raw/vocabulary_by_type.json
+      -> vocabulary   (raw/create_vocabulary_json.py)  -> input/vocabulary.json
+      -> collocations (raw/generate_collocations.py)   -> input/collocations.json
+      -> complete     (raw/create_reverse_mappings.py) -> input/collocations_complete.json
+                                                          input/collocations_normalized.json (+ ID index)
+      -> publish      (copy)                           -> public/data/{vocabulary,collocations_complete}.json
+                                                          public/data/vocabulary_id_migration.json
+      -> binary       (collocation_binary.py)          -> public/data/collocations_complete.bin
+      -> meanings         (regenerate_clear_hints.py)   -> public/data/collocation_meanings.json
+      -> reverse_meanings (regenerate_reverse_hints.py) -> public/data/reverse_meanings.json
+      -> release          (release_patches.py)          -> public/data/releases/ (manifest + delta patch)
+
+Like make, but keyed on content: a stage runs only when the sha256 of one of
+its inputs (data files and the scripts themselves) differs from the last
+successful build, or when an output is missing or was edited by hand. A stage
+whose rerun produces byte-identical output does not trigger its dependents.
+
+The two Claude API stages are tracked per group: each verb/adjective (or noun
+for reverse meanings) is hashed from its collocations_complete.json entry, and
+only groups whose entry changed are regenerated and merged into the existing
+meanings. Within those groups the generators run with --changed-only, so
+only pairs added or changed since their pair manifest (pair_manifest.py) are
+sent to the API. Editing one verb in raw/collocation_mappings.py therefore
+only regenerates that verb's new pairs and the reverse meanings of its nouns.
+
+Run from the repository root:
+    python data-preparation/build.py                 # build what changed
+    python data-preparation/build.py --dry-run       # show what would run
+    python data-preparation/build.py --no-llm        # skip Claude API stages
+    python data-preparation/build.py --force complete
+    python data-preparation/build.py --touch         # adopt existing outputs as up to date
+    python data-preparation/build.py -- --packed --concurrency 16   # args for API stages
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PREP = Path("data-preparation")
+STATE_FILE = PREP / "output" / "build_state.json"
+
+# Shared modules the Claude API stages depend on
+LLM_MODULES = [PREP / "llm_engine.py", PREP / "llm_cache.py", PREP / "llm_batch.py", PREP / "prompt_packing.py",
+               PREP / "pair_manifest.py"]
+
+
+def file_hash(path: Path) -> Optional[str]:
+    """sha256 of a file's contents, or None if it does not exist."""
+    full_path = REPO_ROOT / path
+    if not full_path.exists():
+        return None
+    digest = hashlib.sha256()
+    with open(full_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def entry_hash(entry) -> str:
+    """Stable sha256 of a JSON-serializable value."""
+    payload = json.dumps(entry, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def forward_units(collocations_path: Path) -> Dict[str, str]:
+    """Hash every verb/adjective entry that has noun collocations."""
+    with open(REPO_ROOT / collocations_path, 'r', encoding='utf-8') as f:
+        words = json.load(f)['words']
+    return {word: entry_hash(data) for word, data in words.items()
+            if data['type'] in ('verb', 'adjective') and data['matches'].get('nouns')}
+
+
+def reverse_units(collocations_path: Path) -> Dict[str, str]:
+    """Hash every noun entry that has verb/adjective collocations."""
+    with open(REPO_ROOT / collocations_path, 'r', encoding='utf-8') as f:
+        words = json.load(f)['words']
+    return {word: entry_hash(data) for word, data in words.items()
+            if data['type'] == 'noun' and (data['matches'].get('verbs') or data['matches'].get('adjectives'))}
+
+
+class Stage:
+    """
+    One pipeline step.
+
+    Plain stages run their command whenever any input changed. Stages with a
+    `units` function are regenerated per group: units(data_input) returns
+    {group: hash}, and only changed groups are passed to the command via --words.
+    """
+
+    def __init__(self, name: str, inputs: List[Path], outputs: List[Path],
+                 command: Optional[List[str]] = None, action: Optional[Callable[[], None]] = None,
+                 units: Optional[Callable[[Path], Dict[str, str]]] = None,
+                 staged_output: Optional[Path] = None, llm: bool = False):
+        """
+        Args:
+            name: Stage name used on the command line and in the state file
+            inputs: Files whose content decides whether the stage must run (first = data input for units)
+            outputs: Files the stage produces
+            command: Script invocation relative to the repository root
+            action: In-process alternative to command
+            units: Per-group hashing function for incremental stages
+            staged_output: File the command writes, moved onto outputs[0] on success
+            llm: True for stages that call the Claude API
+        """
+        self.name = name
+        self.inputs = inputs
+        self.outputs = outputs
+        self.command = command
+        self.action = action
+        self.units = units
+        self.staged_output = staged_output
+        self.llm = llm
+
+
+def publish_files():
+    """Copy the generated vocabulary, its ID migration map and the collocation database into public/data."""
+    for source, target in [
+        (PREP / "input" / "vocabulary.json", Path("public/data/vocabulary.json")),
+        (PREP / "input" / "vocabulary_id_migration.json", Path("public/data/vocabulary_id_migration.json")),
+        (PREP / "input" / "collocations_complete.json", Path("public/data/collocations_complete.json")),
+    ]:
+        shutil.copyfile(REPO_ROOT / source, REPO_ROOT / target)
+        print(f"  Copied {source} -> {target}")
+
+
+def python_script(path: Path) -> List[str]:
+    return [sys.executable, str(path)]
+
+
+STAGES = [
+    Stage(
+        'categorize',
+        inputs=[PREP / "input" / "N54.csv", PREP / "raw" / "categorize_vocabulary.py"],
+        outputs=[PREP / "raw" / "vocabulary_by_type.json"],
+        command=python_script(PREP / "raw" / "categorize_vocabulary.py"),
+    ),
+    Stage(
+        'vocabulary',
+        inputs=[PREP / "raw" / "vocabulary_by_type.json", PREP / "raw" / "create_vocabulary_json.py",
+                PREP / "vocabulary_ids.py"],
+        outputs=[PREP / "input" / "vocabulary.json", PREP / "input" / "vocabulary_id_migration.json"],
+        command=python_script(PREP / "raw" / "create_vocabulary_json.py"),
+    ),
+    Stage(
+        'collocations',
+        inputs=[PREP / "raw" / "vocabulary_by_type.json", PREP / "raw" / "collocation_mappings.py",
+                PREP / "raw" / "generate_collocations.py"],
+        outputs=[PREP / "input" / "collocations.json"],
+        command=python_script(PREP / "raw" / "generate_collocations.py"),
+    ),
+    Stage(
+        'complete',
+        inputs=[PREP / "input" / "collocations.json", PREP / "input" / "vocabulary.json",
+                PREP / "raw" / "create_reverse_mappings.py", PREP / "collocation_graph.py",
+                PREP / "collocation_refs.py"],
+        outputs=[PREP / "input" / "collocations_complete.json", PREP / "input" / "collocations_normalized.json",
+                 PREP / "input" / "collocation_vocab_index.json"],
+        command=python_script(PREP / "raw" / "create_reverse_mappings.py") + ['--normalized'],
+    ),
+    Stage(
+        'publish',
+        inputs=[PREP / "input" / "vocabulary.json", PREP / "input" / "vocabulary_id_migration.json",
+                PREP / "input" / "collocations_complete.json"],
+        outputs=[Path("public/data/vocabulary.json"), Path("public/data/vocabulary_id_migration.json"),
+                 Path("public/data/collocations_complete.json")],
+        action=publish_files,
+    ),
+    Stage(
+        'binary',
+        inputs=[Path("public/data/collocations_complete.json"), PREP / "collocation_binary.py",
+                PREP / "collocation_graph.py"],
+        outputs=[Path("public/data/collocations_complete.bin")],
+        command=python_script(PREP / "collocation_binary.py"),
+    ),
+    Stage(
+        'meanings',
+        # The prompts quote the English glosses from vocabulary.json
+        inputs=[Path("public/data/collocations_complete.json"), Path("public/data/vocabulary.json"),
+                PREP / "regenerate_clear_hints.py"] + LLM_MODULES,
+        outputs=[Path("public/data/collocation_meanings.json")],
+        command=python_script(PREP / "regenerate_clear_hints.py"),
+        units=forward_units,
+        staged_output=Path("public/data/collocation_meanings_NEW.json"),
+        llm=True,
+    ),
+    Stage(
+        'reverse_meanings',
+        # The prompts quote the English glosses from vocabulary.json
+        inputs=[Path("public/data/collocations_complete.json"), Path("public/data/vocabulary.json"),
+                PREP / "regenerate_reverse_hints.py"] + LLM_MODULES,
+        outputs=[Path("public/data/reverse_meanings.json")],
+        command=python_script(PREP / "regenerate_reverse_hints.py"),
+        units=reverse_units,
+        staged_output=Path("public/data/reverse_meanings_NEW.json"),
+        llm=True,
+    ),
+    Stage(
+        'release',
+        inputs=[Path("public/data/vocabulary.json"), Path("public/data/collocations_complete.json"),
+                Path("public/data/collocation_meanings.json"), Path("public/data/reverse_meanings.json"),
+                PREP / "release_patches.py"],
+        outputs=[Path("public/data/releases/manifest.json")],
+        command=python_script(PREP / "release_patches.py"),
+    ),
+]
+
+
+def load_state() -> dict:
+    """Load hashes recorded by the last successful build of each stage."""
+    path = REPO_ROOT / STATE_FILE
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state: dict) -> None:
+    """Write the build state atomically."""
+    path = REPO_ROOT / STATE_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def outputs_intact(stage: Stage, previous: dict) -> bool:
+    """True if every output exists and matches the hash recorded after the last build."""
+    recorded = previous.get('outputs', {})
+    return all(file_hash(path) is not None and file_hash(path) == recorded.get(str(path))
+               for path in stage.outputs)
+
+
+def plan_units(stage: Stage, input_hashes: Dict[str, str], previous: dict, force: bool):
+    """
+    Decide which groups of an incremental stage need regenerating.
+
+    Returns:
+        (units, dirty) - current {group: hash}, and the list of groups to
+        regenerate (None = regenerate everything)
+    """
+    data_input = stage.inputs[0]
+    units = stage.units(data_input)
+    previous_units = previous.get('units')
+    # Any other input (scripts, vocabulary glosses) can change any group's prompts: every
+    # group is passed on, and --changed-only leaves only pairs whose prompt changed
+    code_changed = any(input_hashes[str(path)] != previous.get('inputs', {}).get(str(path))
+                       for path in stage.inputs[1:])
+
+    if force or code_changed or not previous_units or not outputs_intact(stage, previous):
+        return units, None
+    return units, [group for group, digest in units.items() if previous_units.get(group) != digest]
+
+
+def run_stage(stage: Stage, dirty: Optional[List[str]], extra_args: List[str], forced: bool = False) -> None:
+    """Execute a stage's command or action (forced API stages regenerate every pair)."""
+    if stage.action:
+        stage.action()
+        return
+
+    command = list(stage.command)
+    if stage.llm:
+        command += extra_args
+        if not forced:
+            command.append('--changed-only')
+        if dirty is not None:
+            command += ['--words'] + dirty
+    subprocess.run(command, cwd=REPO_ROOT, check=True)
+
+    if stage.staged_output:
+        os.replace(REPO_ROOT / stage.staged_output, REPO_ROOT / stage.outputs[0])
+        print(f"  Moved {stage.staged_output} -> {stage.outputs[0]}")
+
+
+def touch(selected: List[str]) -> None:
+    """Record the current input/output hashes as built, without running anything (like make -t)."""
+    state = load_state()
+    for stage in STAGES:
+        if selected and stage.name not in selected:
+            continue
+        input_hashes = {str(path): file_hash(path) for path in stage.inputs}
+        output_hashes = {str(path): file_hash(path) for path in stage.outputs}
+        if None in input_hashes.values() or None in output_hashes.values():
+            print(f"[{stage.name}] cannot touch: missing inputs or outputs")
+            continue
+        state[stage.name] = {'inputs': input_hashes, 'outputs': output_hashes}
+        if stage.units:
+            state[stage.name]['units'] = stage.units(stage.inputs[0])
+        print(f"[{stage.name}] marked up to date")
+    save_state(state)
+
+
+def build(selected: List[str], force: List[str], dry_run: bool, no_llm: bool, extra_args: List[str]) -> bool:
+    """
+    Run every selected stage whose inputs changed.
+
+    Returns:
+        True if every stage is up to date or ran successfully
+    """
+    state = load_state()
+    ok = True
+    # Outputs a dry run would regenerate (their new content is unknown)
+    pending_outputs = set()
+
+    for stage in STAGES:
+        if selected and stage.name not in selected:
+            continue
+
+        if dry_run and pending_outputs.intersection(str(path) for path in stage.inputs):
+            print(f"[{stage.name}] would run if its upstream outputs change")
+            pending_outputs.update(str(path) for path in stage.outputs)
+            continue
+
+        input_hashes = {str(path): file_hash(path) for path in stage.inputs}
+        missing = [path for path, digest in input_hashes.items() if digest is None]
+        if missing:
+            print(f"[{stage.name}] ERROR: missing inputs: {', '.join(missing)}")
+            ok = False
+            break
+
+        previous = state.get(stage.name, {})
+        forced = stage.name in force or 'all' in force
+        up_to_date = (not forced and previous.get('inputs') == input_hashes
+                      and outputs_intact(stage, previous))
+        if up_to_date:
+            print(f"[{stage.name}] up to date")
+            continue
+
+        units, dirty = (None, None)
+        if stage.units:
+            units, dirty = plan_units(stage, input_hashes, previous, forced)
+            removed = set(previous.get('units') or {}) - set(units)
+            if dirty is not None and not dirty and not removed:
+                # Inputs changed, but not in a way that affects any group
+                print(f"[{stage.name}] no group changed, recording new input hashes")
+                if not dry_run:
+                    state[stage.name] = {'inputs': input_hashes, 'units': units,
+                                         'outputs': {str(path): file_hash(path) for path in stage.outputs}}
+                    save_state(state)
+                continue
+
+        scope = "all groups" if dirty is None else f"{len(dirty)} changed group(s): {' '.join(dirty[:10])}"
+        if stage.llm and no_llm:
+            print(f"[{stage.name}] out of date ({scope if stage.units else 'inputs changed'}) - skipped (--no-llm)")
+            continue
+        if dry_run:
+            print(f"[{stage.name}] would run" + (f" for {scope}" if stage.units else ""))
+            pending_outputs.update(str(path) for path in stage.outputs)
+            continue
+
+        print(f"[{stage.name}] running" + (f" for {scope}" if stage.units else ""))
+        try:
+            run_stage(stage, dirty, extra_args, forced)
+        except (subprocess.CalledProcessError, OSError) as e:
+            print(f"[{stage.name}] FAILED: {e}")
+            ok = False
+            break
+
+        state[stage.name] = {
+            'inputs': input_hashes,
+            'outputs': {str(path): file_hash(path) for path in stage.outputs},
+        }
+        if units is not None:
+            state[stage.name]['units'] = units
+        save_state(state)
+
+    return ok
+
+
+def main():
+    argv = sys.argv[1:]
+    extra_args = []
+    if '--' in argv:
+        split = argv.index('--')
+        argv, extra_args = argv[:split], argv[split + 1:]
+
+    stage_names = [stage.name for stage in STAGES]
+    parser = argparse.ArgumentParser(
+        description="Incrementally rebuild the data pipeline (arguments after -- go to the Claude API stages)")
+    parser.add_argument('stages', nargs='*', metavar='STAGE',
+                        help=f"Stages to consider (default: all): {', '.join(stage_names)}")
+    parser.add_argument('--force', nargs='*', default=[], metavar='STAGE',
+                        help="Rebuild these stages (or 'all') even if unchanged")
+    parser.add_argument('--dry-run', action='store_true', help="Only report what would run")
+    parser.add_argument('--no-llm', action='store_true', help="Skip stages that call the Claude API")
+    parser.add_argument('--touch', action='store_true',
+                        help="Mark existing outputs as up to date without running anything")
+    parser.add_argument('--list', action='store_true', help="List stages with their inputs and outputs")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.stages + args.force if name not in stage_names + ['all']]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+
+    if args.list:
+        for stage in STAGES:
+            kind = " (Claude API, per group)" if stage.llm else ""
+            print(f"{stage.name}{kind}")
+            print(f"  inputs:  {', '.join(str(path) for path in stage.inputs)}")
+            print(f"  outputs: {', '.join(str(path) for path in stage.outputs)}")
+        return
+
+    if args.touch:
+        touch(args.stages)
+        return
+
+    if not build(args.stages, args.force, args.dry_run, args.no_llm, extra_args):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Append-only JSON-lines checkpoint journal for long generation runs.
+
+Every completed pair is appended as one JSON line and fsync'd before the
+generator moves on, so checkpoint cost is O(1) per pair instead of
+rewriting the whole result set, and a crash loses at most the line being
+written. On startup the journal is replayed (a torn last line is
+skipped), then compacted into a fresh file that is swapped in with an
+atomic rename. The journal is deleted once the final output is saved.
+
+Lines use the pair_manifest record shape:
+
+    {"outer": "飲む", "inner": "水", "promptHash": "...", "model": "...", "ok": true, "output": "..."}
+
+Usage:
+    journal = CheckpointJournal(path)
+    done = journal.resume(prompt_hashes, model)   # replay + compact
+    journal.append(record)                        # per completed pair
+    journal.discard()                             # after the final output is written
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+
+class CheckpointJournal:
+    """
+    Write-ahead journal of completed (outer, inner) records.
+    """
+
+    def __init__(self, path: Path, fsync: bool = True):
+        """
+        Args:
+            path: Journal file location (parent directory is created if needed)
+            fsync: fsync after every append (disable only for benchmarks)
+        """
+        self.path = Path(path)
+        self.fsync = fsync
+        self.skipped_lines = 0
+        self._file = None
+
+    def replay(self) -> Dict[Tuple[str, str], dict]:
+        """
+        Read every intact record; later records for the same pair win.
+
+        Returns:
+            {(outer, inner): record} in first-seen order
+        """
+        records = {}
+        self.skipped_lines = 0
+        if not self.path.exists():
+            return records
+        # errors='replace': a torn write can end inside a multi-byte character
+        with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    records[(record['outer'], record['inner'])] = record
+                except (ValueError, KeyError, TypeError):
+                    # Torn write from a crash (or a hand edit): drop the line
+                    self.skipped_lines += 1
+        return records
+
+    def resume(self, prompt_hashes: Dict[Tuple[str, str], str], model: str) -> Dict[Tuple[str, str], dict]:
+        """
+        Replay the journal and keep only records still valid for this run.
+
+        A record is kept if it succeeded and its pair still exists with the
+        same prompt hash and model. The journal is compacted to those records.
+
+        Returns:
+            {(outer, inner): record} of pairs that need no regeneration
+        """
+        records = self.replay()
+        valid = {pair: record for pair, record in records.items()
+                 if record.get('ok', True) and record.get('model') == model
+                 and prompt_hashes.get(pair) == record.get('promptHash')}
+        if records or self.skipped_lines:
+            # Also compact a journal of damaged lines only: appending to a
+            # torn last line would glue the next record onto it
+            print(f"Resumed {len(valid)} pairs from {self.path} "
+                  f"({len(records) - len(valid)} stale, {self.skipped_lines} damaged lines dropped)")
+            self.compact(valid.values())
+        return valid
+
+    def compact(self, records: Iterable[dict]) -> None:
+        """Replace the journal with exactly these records (temp file + fsync + atomic rename)."""
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def append(self, record: dict) -> None:
+        """Durably append one record."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """Close and delete the journal (the run's output is complete)."""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Compact binary format for collocations_complete.json.
+
+The JSON repeats every partner's full reading and English gloss inside each
+match object. The binary format stores each string once and refers to words
+by index:
+
+    header      magic "SNCB", format version, ID width (2 or 4 bytes),
+                word count, forward/reverse edge counts, metadata length
+    metadata    UTF-8 JSON of the top-level fields (version, generatedAt, ...)
+    strings     words, readings, English glosses: each a u32 byte length
+                followed by the UTF-8 strings joined with NUL
+    types       2 bits per word (noun, verb, adjective)
+    forward     per-word degree, partner IDs, 2-bit scores (verb/adjective -> nouns)
+    reverse     the same for noun -> verbs + adjectives
+
+Integers are little-endian. IDs and degrees use the ID width, so they can
+be read with array.frombytes. Scores must be 0-3. Edge order is file
+order, so reading the file back gives the same JSON byte for byte
+(CollocationGraph.to_data()).
+
+Usage (from the repository root):
+    python data-preparation/collocation_binary.py                        # public/data JSON -> .bin
+    python data-preparation/collocation_binary.py IN.json OUT.bin
+    python data-preparation/collocation_binary.py --verify OUT.bin IN.json
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from typing import List, Tuple
+
+from collocation_graph import CollocationGraph, _Adjacency
+
+DEFAULT_INPUT = Path("public/data/collocations_complete.json")
+DEFAULT_OUTPUT = Path("public/data/collocations_complete.bin")
+
+MAGIC = b'SNCB'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sBBHIIII')  # magic, version, id width, reserved, words, forward, reverse, metadata
+SEPARATOR = '\0'
+
+# byte -> its four 2-bit fields, lowest bits first
+_UNPACK_2BIT = [(byte & 3, (byte >> 2) & 3, (byte >> 4) & 3, byte >> 6) for byte in range(256)]
+
+
+class BinaryFormatError(ValueError):
+    """The data is not a valid collocation binary file."""
+
+
+# ----------------------------------------------------------------------
+# Encoding helpers
+# ----------------------------------------------------------------------
+
+def _pack_2bit(values) -> bytes:
+    """Pack values 0-3 four to a byte, lowest bits first."""
+    packed = bytearray((len(values) + 3) // 4)
+    for index, value in enumerate(values):
+        if not 0 <= value <= 3:
+            raise ValueError(f"Value {value} does not fit in 2 bits (scores must be 0-3)")
+        packed[index >> 2] |= value << ((index & 3) << 1)
+    return bytes(packed)
+
+
+def _unpack_2bit(data: bytes, count: int) -> array:
+    values = array('b')
+    for byte in data:
+        values.extend(_UNPACK_2BIT[byte])
+    del values[count:]
+    return values
+
+
+def _int_array(width: int, values) -> array:
+    values = array('H' if width == 2 else 'I', values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _string_table(strings: List[str]) -> bytes:
+    for string in strings:
+        if SEPARATOR in string:
+            raise ValueError(f"String contains NUL: {string!r}")
+    data = SEPARATOR.join(strings).encode('utf-8')
+    return struct.pack('<I', len(data)) + data
+
+
+def _adjacency_bytes(adjacency: _Adjacency, width: int) -> bytes:
+    offsets = adjacency.offsets
+    degrees = [offsets[i + 1] - offsets[i] for i in range(len(offsets) - 1)]
+    return (_int_array(width, degrees).tobytes()
+            + _int_array(width, adjacency.targets).tobytes()
+            + _pack_2bit(adjacency.scores))
+
+
+def encode(graph: CollocationGraph) -> bytes:
+    """Serialize a CollocationGraph to the binary format."""
+    width = 2 if len(graph.words) <= 0xFFFF else 4
+    metadata = json.dumps(graph.metadata, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    parts = [
+        HEADER.pack(MAGIC, FORMAT_VERSION, width, 0, len(graph.words),
+                    len(graph._forward.targets), len(graph._reverse.targets), len(metadata)),
+        metadata,
+        _string_table(graph.words),
+        _string_table(graph.readings),
+        _string_table(graph.english),
+        _pack_2bit(graph.types),
+        _adjacency_bytes(graph._forward, width),
+        _adjacency_bytes(graph._reverse, width),
+    ]
+    return b''.join(parts)
+
+
+# ----------------------------------------------------------------------
+# Decoding
+# ----------------------------------------------------------------------
+
+class _Reader:
+    """Sequential reader over a bytes buffer."""
+
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.position = 0
+
+    def take(self, size: int) -> memoryview:
+        end = self.position + size
+        if end > len(self.data):
+            raise BinaryFormatError("Unexpected end of data")
+        chunk = self.data[self.position:end]
+        self.position = end
+        return chunk
+
+    def strings(self, count: int) -> List[str]:
+        size, = struct.unpack('<I', self.take(4))
+        strings = str(self.take(size), 'utf-8').split(SEPARATOR) if count else []
+        if len(strings) != count:
+            raise BinaryFormatError(f"String table has {len(strings)} entries, expected {count}")
+        return strings
+
+    def ints(self, width: int, count: int) -> array:
+        values = array('H' if width == 2 else 'I')
+        values.frombytes(self.take(width * count))
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+    def adjacency(self, width: int, words: int, edges: int) -> _Adjacency:
+        adjacency = _Adjacency()
+        degrees = self.ints(width, words)
+        adjacency.offsets = array('i', accumulate(degrees, initial=0))
+        if adjacency.offsets[-1] != edges:
+            raise BinaryFormatError(f"Degrees sum to {adjacency.offsets[-1]}, expected {edges} edges")
+        adjacency.targets = array('i', self.ints(width, edges))
+        adjacency.scores = _unpack_2bit(self.take((edges + 3) // 4), edges)
+        return adjacency
+
+
+def decode(data: bytes) -> CollocationGraph:
+    """Parse the binary format into a CollocationGraph."""
+    reader = _Reader(data)
+    magic, version, width, _, word_count, forward_edges, reverse_edges, metadata_size = \
+        HEADER.unpack(reader.take(HEADER.size))
+    if magic != MAGIC:
+        raise BinaryFormatError(f"Bad magic {bytes(magic)!r}")
+    if version != FORMAT_VERSION:
+        raise BinaryFormatError(f"Unsupported format version {version}")
+    if width not in (2, 4):
+        raise BinaryFormatError(f"Unsupported ID width {width}")
+
+    graph = CollocationGraph()
+    graph.metadata = json.loads(str(reader.take(metadata_size), 'utf-8'))
+    graph.words = [sys.intern(word) for word in reader.strings(word_count)]
+    graph.ids = {word: word_id for word_id, word in enumerate(graph.words)}
+    graph.readings = reader.strings(word_count)
+    graph.english = reader.strings(word_count)
+    graph.types = _unpack_2bit(reader.take((word_count + 3) // 4), word_count)
+    graph._forward = reader.adjacency(width, word_count, forward_edges)
+    graph._reverse = reader.adjacency(width, word_count, reverse_edges)
+    if reader.position != len(data):
+        raise BinaryFormatError(f"{len(data) - reader.position} trailing bytes")
+    return graph
+
+
+# ----------------------------------------------------------------------
+# Files
+# ----------------------------------------------------------------------
+
+def write_binary(graph: CollocationGraph, path: Path) -> int:
+    """Write the binary file atomically (temp file + rename). Returns its size in bytes."""
+    data = encode(graph)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def read_binary(path: Path) -> CollocationGraph:
+    """Load a binary file as a CollocationGraph."""
+    with open(path, 'rb') as f:
+        return decode(f.read())
+
+
+def verify_round_trip(binary_path: Path, json_path: Path) -> Tuple[bool, str]:
+    """
+    Check that a binary file decodes to exactly the JSON file's content.
+
+    Returns:
+        (ok, message)
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    data = read_binary(binary_path).to_data()
+    if data != json.loads(text):
+        return False, "decoded data differs from the JSON"
+    if json.dumps(data, ensure_ascii=False, indent=2) != text:
+        return False, "decoded data is equal but does not serialize to identical JSON text"
+    return True, "decoded data serializes to identical JSON"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert collocations_complete.json to the compact binary format")
+    parser.add_argument('input', nargs='?', type=Path, default=DEFAULT_INPUT,
+                        help=f"collocations_complete.json (default: {DEFAULT_INPUT})")
+    parser.add_argument('output', nargs='?', type=Path, default=DEFAULT_OUTPUT,
+                        help=f"Binary output (default: {DEFAULT_OUTPUT})")
+    parser.add_argument('--verify', nargs=2, type=Path, metavar=('BINARY', 'JSON'),
+                        help="Check that BINARY decodes to JSON and exit")
+    args = parser.parse_args()
+
+    if args.verify:
+        ok, message = verify_round_trip(*args.verify)
+        print(f"{'OK' if ok else 'FAIL'}: {message}")
+        sys.exit(0 if ok else 1)
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        graph = CollocationGraph.from_data(json.load(f))
+    size = write_binary(graph, args.output)
+    print(f"Wrote {args.output}: {size:,} bytes ({size / args.input.stat().st_size:.0%} of {args.input.name}), "
+          f"{len(graph)} words, {graph.pair_count} pairs")
+
+
+if __name__ == '__main__':
+    main()
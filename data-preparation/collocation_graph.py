@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Shared in-memory collocation graph.
+
+Loads collocations_complete.json once into interned integer word IDs and
+compact adjacency arrays, instead of every script re-walking the nested
+{"words": {word: {"matches": {...}}}} dicts with its own loops.
+
+Layout (CSR - compressed sparse rows, one row per word ID):
+
+    forward  verb/adjective -> nouns            (file order of matches.nouns)
+    reverse  noun -> verbs, then adjectives      (file order of matches.verbs + matches.adjectives)
+
+Each direction is three flat arrays: row offsets, partner IDs and scores.
+Row order matches the JSON file, so pairs() and groups() reproduce the pair
+order every generator and validator has always used.
+
+Usage:
+    graph = load_graph()                      # cached per path + mtime
+    graph.neighbors('飲む')                   # ['水', 'お茶', ...]
+    graph.neighbors('水', kind='adjective')   # adjectives that pair with 水
+    graph.score('飲む', '水')                 # 3 (either argument order), None if no edge
+    graph.degree('水')
+    graph.matches('飲む')                     # [{'word', 'reading', 'english', 'score'}, ...]
+    for verb, noun, score in graph.pairs(): ...
+"""
+
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from json_stream import iter_entries
+
+DEFAULT_PATH = Path(__file__).resolve().parent / "input" / "collocations_complete.json"
+
+WORD_TYPES = ('noun', 'verb', 'adjective')
+NOUN, VERB, ADJECTIVE = range(3)
+# matches.* list name for each partner type
+MATCH_KEYS = {'noun': 'nouns', 'verb': 'verbs', 'adjective': 'adjectives'}
+
+
+class CollocationGraph:
+    """
+    Words with interned integer IDs and forward/reverse adjacency arrays.
+    """
+
+    def __init__(self):
+        self.words: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.readings: List[str] = []
+        self.english: List[str] = []
+        self.types = array('b')
+        self.metadata: Dict[str, object] = {}
+
+        self._forward = _Adjacency()
+        self._reverse = _Adjacency()
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    def _intern(self, word: str, reading: str, english: str, word_type: str) -> int:
+        """Return the ID of word, adding it if it is new."""
+        word_id = self.ids.get(word)
+        if word_id is None:
+            word = sys.intern(word)
+            word_id = len(self.words)
+            self.ids[word] = word_id
+            self.words.append(word)
+            self.readings.append(reading)
+            self.english.append(english)
+            self.types.append(WORD_TYPES.index(word_type))
+        return word_id
+
+    @classmethod
+    def from_data(cls, data: dict) -> 'CollocationGraph':
+        """
+        Build the graph from parsed collocations_complete.json data.
+
+        Matches pointing at words without their own entry are interned from
+        the match's reading/english.
+        """
+        return cls.from_entries(data['words'].items(), {key: value for key, value in data.items() if key != 'words'})
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Tuple[str, dict]],
+                     metadata: Optional[Dict[str, object]] = None) -> 'CollocationGraph':
+        """
+        Build the graph from the (word, entry) pairs of the "words" map, in one pass.
+
+        Entries may come straight from json_stream.iter_entries(); none is
+        kept once read. Word IDs come out exactly as from_data() assigns
+        them: entries first, in file order, then partners without an entry
+        in order of first mention. metadata is copied after the entries are
+        consumed, so it may be the header dict iter_entries() is filling.
+        """
+        graph = cls()
+
+        # Partners are resolved once every entry is interned: (word ID, is noun, [(partner, score)])
+        rows = []
+        # Reading/english/type of partners without an entry (yet), from their first match
+        mentioned: Dict[str, Tuple[str, str, str]] = {}
+        ids = graph.ids
+        for word, entry in entries:
+            word_id = graph._intern(word, entry.get('reading', ''), entry.get('english', ''), entry['type'])
+            matches = entry.get('matches', {})
+            partner_types = ('verb', 'adjective') if entry['type'] == 'noun' else ('noun',)
+            row = []
+            for partner_type in partner_types:
+                for match in matches.get(MATCH_KEYS[partner_type], []):
+                    partner = sys.intern(match['word'])
+                    if partner not in ids and partner not in mentioned:
+                        mentioned[partner] = (match.get('reading', ''), match.get('english', ''), partner_type)
+                    row.append((partner, match.get('score', 0)))
+            rows.append((word_id, entry['type'] == 'noun', row))
+
+        forward_rows = {}
+        reverse_rows = {}
+        for word_id, is_noun, row in rows:
+            resolved = []
+            for partner, score in row:
+                partner_id = ids.get(partner)
+                if partner_id is None:
+                    partner_id = graph._intern(partner, *mentioned[partner])
+                resolved.append((partner_id, score))
+            (reverse_rows if is_noun else forward_rows)[word_id] = resolved
+
+        graph._forward.build(len(graph.words), forward_rows)
+        graph._reverse.build(len(graph.words), reverse_rows)
+        graph.metadata = dict(metadata or {})
+        return graph
+
+    @classmethod
+    def from_collocations(cls, data: dict) -> 'CollocationGraph':
+        """
+        Build the graph from one-directional collocations.json data
+        ({"collocations": {word: {"matches": [noun, ...]}}}).
+
+        The reverse direction is derived the way raw/create_reverse_mappings.py
+        always has: nouns in order of first appearance, partners sorted by
+        score (highest first, stable), verbs before adjectives.
+        """
+        return cls.from_collocation_entries(data['collocations'].items(),
+                                            {key: value for key, value in data.items() if key != 'collocations'})
+
+    @classmethod
+    def from_collocation_entries(cls, entries: Iterable[Tuple[str, dict]],
+                                 metadata: Optional[Dict[str, object]] = None) -> 'CollocationGraph':
+        """Build the graph from the (word, entry) pairs of the "collocations" map, in one pass (see from_entries())."""
+        graph = cls()
+
+        forward_rows = {}
+        partners = {}
+        for word, entry in entries:
+            word_id = graph._intern(word, entry.get('reading', ''), entry.get('english', ''), entry['type'])
+            row = []
+            for match in entry['matches']:
+                noun_id = graph._intern(match['word'], match.get('reading', ''), match.get('english', ''), 'noun')
+                row.append((noun_id, match['score']))
+                partners.setdefault(noun_id, {VERB: [], ADJECTIVE: []})
+                if graph.types[word_id] in partners[noun_id]:
+                    partners[noun_id][graph.types[word_id]].append((word_id, match['score']))
+            forward_rows[word_id] = row
+
+        reverse_rows = {}
+        for noun_id, by_type in partners.items():
+            reverse_rows[noun_id] = (sorted(by_type[VERB], key=lambda item: item[1], reverse=True)
+                                     + sorted(by_type[ADJECTIVE], key=lambda item: item[1], reverse=True))
+
+        graph._forward.build(len(graph.words), forward_rows)
+        graph._reverse.build(len(graph.words), reverse_rows)
+        graph.metadata = dict(metadata or {})
+        return graph
+
+    def to_data(self) -> dict:
+        """
+        Inverse of from_data(): the collocations_complete.json structure,
+        with an entry for every word in the graph.
+        """
+        words = {}
+        for word_id, word in enumerate(self.words):
+            word_type = WORD_TYPES[self.types[word_id]]
+            if word_type == 'noun':
+                matches = {'verbs': self.matches(word, 'verb'), 'adjectives': self.matches(word, 'adjective')}
+            else:
+                matches = {'nouns': self.matches(word)}
+            words[word] = {
+                'word': word,
+                'reading': self.readings[word_id],
+                'english': self.english[word_id],
+                'type': word_type,
+                'matches': matches,
+            }
+        return dict(self.metadata, words=words)
+
+    # ------------------------------------------------------------------
+    # Words
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.ids
+
+    def type(self, word: str) -> str:
+        """'noun', 'verb' or 'adjective'."""
+        return WORD_TYPES[self.types[self.ids[word]]]
+
+    def info(self, word: str) -> Dict[str, str]:
+        """{word, reading, english, type} for a word (KeyError if unknown)."""
+        word_id = self.ids[word]
+        return {
+            'word': self.words[word_id],
+            'reading': self.readings[word_id],
+            'english': self.english[word_id],
+            'type': WORD_TYPES[self.types[word_id]],
+        }
+
+    def words_of_type(self, *word_types: str) -> List[str]:
+        """Words of the given types, in file order."""
+        codes = {WORD_TYPES.index(word_type) for word_type in word_types}
+        return [word for word, code in zip(self.words, self.types) if code in codes]
+
+    # ------------------------------------------------------------------
+    # Edges
+    # ------------------------------------------------------------------
+
+    def _row(self, word_id: int) -> Tuple['_Adjacency', int, int]:
+        adjacency = self._reverse if self.types[word_id] == NOUN else self._forward
+        return adjacency, adjacency.offsets[word_id], adjacency.offsets[word_id + 1]
+
+    def neighbor_ids(self, word_id: int) -> array:
+        """Partner IDs of a word ID (nouns for verbs/adjectives, verbs + adjectives for nouns)."""
+        adjacency, start, end = self._row(word_id)
+        return adjacency.targets[start:end]
+
+    def neighbors(self, word: str, kind: Optional[str] = None) -> List[str]:
+        """
+        Partners of a word in file order; [] for unknown words.
+
+        Args:
+            word: Any word in the graph
+            kind: Only partners of this type ('verb' or 'adjective' for nouns)
+        """
+        word_id = self.ids.get(word)
+        if word_id is None:
+            return []
+        adjacency, start, end = self._row(word_id)
+        words = self.words
+        if kind is None:
+            return [words[target] for target in adjacency.targets[start:end]]
+        code, types = WORD_TYPES.index(kind), self.types
+        return [words[target] for target in adjacency.targets[start:end] if types[target] == code]
+
+    def neighbor_scores(self, word: str, kind: Optional[str] = None) -> List[Tuple[str, int]]:
+        """(partner, score) tuples in file order; [] for unknown words."""
+        word_id = self.ids.get(word)
+        if word_id is None:
+            return []
+        adjacency, start, end = self._row(word_id)
+        words, types = self.words, self.types
+        code = None if kind is None else WORD_TYPES.index(kind)
+        return [(words[target], score)
+                for target, score in zip(adjacency.targets[start:end], adjacency.scores[start:end])
+                if code is None or types[target] == code]
+
+    def matches(self, word: str, kind: Optional[str] = None) -> List[Dict[str, object]]:
+        """
+        Partners as {word, reading, english, score} dicts - the shape of the
+        JSON matches lists - in file order; [] for unknown words.
+        """
+        word_id = self.ids.get(word)
+        if word_id is None:
+            return []
+        adjacency, start, end = self._row(word_id)
+        code = None if kind is None else WORD_TYPES.index(kind)
+        return [{'word': self.words[target], 'reading': self.readings[target],
+                 'english': self.english[target], 'score': score}
+                for target, score in zip(adjacency.targets[start:end], adjacency.scores[start:end])
+                if code is None or self.types[target] == code]
+
+    def degree(self, word: str, kind: Optional[str] = None) -> int:
+        """Number of partners of a word (0 for unknown words)."""
+        word_id = self.ids.get(word)
+        if word_id is None:
+            return 0
+        adjacency, start, end = self._row(word_id)
+        if kind is None:
+            return end - start
+        code, types = WORD_TYPES.index(kind), self.types
+        return sum(1 for target in adjacency.targets[start:end] if types[target] == code)
+
+    def score(self, word: str, other: str) -> Optional[int]:
+        """Score of the edge between two words in either order, or None if they do not pair."""
+        word_id = self.ids.get(word)
+        other_id = self.ids.get(other)
+        if word_id is None or other_id is None:
+            return None
+        if self.types[word_id] == NOUN:
+            word_id, other_id = other_id, word_id
+        edge = self._forward.edge(word_id, other_id)
+        return None if edge is None else self._forward.scores[edge]
+
+    def pairs(self, reverse: bool = False) -> Iterator[Tuple[str, str, int]]:
+        """
+        Yield every edge once, in file order.
+
+        Forward: (verb/adjective, noun, score) following the verb entries.
+        Reverse: (noun, verb/adjective, score) following the noun entries.
+        """
+        adjacency = self._reverse if reverse else self._forward
+        words, offsets, targets, scores = self.words, adjacency.offsets, adjacency.targets, adjacency.scores
+        for word_id, word in enumerate(words):
+            start, end = offsets[word_id], offsets[word_id + 1]
+            for target, score in zip(targets[start:end], scores[start:end]):
+                yield word, words[target], score
+
+    def groups(self, reverse: bool = False) -> Dict[str, List[str]]:
+        """
+        {verb/adjective: [nouns]} (or {noun: [verbs + adjectives]} with reverse),
+        skipping words without partners.
+        """
+        grouped = {}
+        for word, partner, _ in self.pairs(reverse):
+            grouped.setdefault(word, []).append(partner)
+        return grouped
+
+    @property
+    def pair_count(self) -> int:
+        """Number of distinct verb/adjective-noun edges."""
+        return len(self._forward.targets)
+
+
+class _Adjacency:
+    """One direction of edges as CSR arrays."""
+
+    def __init__(self):
+        self.offsets = array('i', [0])
+        self.targets = array('i')
+        self.scores = array('b')
+        # {word ID: {partner ID: edge index}}, built per row on first lookup;
+        # rows keep file order, so they cannot be bisected
+        self._index: Dict[int, Dict[int, int]] = {}
+
+    def edge(self, word_id: int, target: int) -> Optional[int]:
+        """Index of the edge from word_id to target in targets/scores, or None."""
+        row = self._index.get(word_id)
+        if row is None:
+            start, end = self.offsets[word_id], self.offsets[word_id + 1]
+            row = self._index[word_id] = {partner: start + position
+                                          for position, partner in enumerate(self.targets[start:end])}
+        return row.get(target)
+
+    def build(self, size: int, rows: Dict[int, List[Tuple[int, int]]]) -> None:
+        offsets = [0] * (size + 1)
+        targets = []
+        scores = []
+        for word_id in range(size):
+            for target, score in rows.get(word_id, ()):
+                targets.append(target)
+                scores.append(score)
+            offsets[word_id + 1] = len(targets)
+        self.offsets = array('i', offsets)
+        self.targets = array('i', targets)
+        self.scores = array('b', scores)
+        self._index = {}
+
+
+_loaded: Dict[str, Tuple[float, CollocationGraph]] = {}
+
+
+def load_graph(path: Path = DEFAULT_PATH) -> CollocationGraph:
+    """
+    Load collocations_complete.json as a CollocationGraph.
+
+    The graph is cached per resolved path and reloaded only if the file's
+    modification time changed, so scripts and helpers can call this freely.
+    """
+    key = str(Path(path).resolve())
+    mtime = os.path.getmtime(key)
+    cached = _loaded.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    # Streamed entry by entry: only the graph is ever held, never the parsed file
+    header = {}
+    graph = CollocationGraph.from_entries(iter_entries(key, 'words', header), header)
+    _loaded[key] = (mtime, graph)
+    return graph
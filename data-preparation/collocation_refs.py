@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Normalized collocation output that references vocabulary.json IDs.
+
+collocations_complete.json copies each partner's reading and English gloss
+into every match, so a noun like 人 carries its gloss once per verb that
+pairs with it and again in the reverse section. The normalized form keys
+every word and every edge by its vocabulary.json `id` and keeps only the
+score. Both files are written as compact JSON.
+
+    collocations_normalized.json
+    {"version": "2.0.0", "generatedAt": ..., "totalPairs": ..., "totalWords": ...,
+     "normalized": true, "vocabulary": {"version": ..., "generatedAt": ..., "totalWords": ...},
+     "words": {"<id>": {"type": "verb", "matches": {"nouns": [{"id": "<id>", "score": 3}, ...]}},
+               "<id>": {"type": "noun", "matches": {"verbs": [...], "adjectives": [...]}}}}
+
+    collocation_vocab_index.json
+    {"vocabulary": {...}, "positions": {"<id>": <index in vocabulary.json's list>},
+     "words": {"<japanese>": "<id>"}}
+
+The index lets consumers join an edge to its vocabulary entry with a list
+lookup, and map a surface form to its ID, without building their own maps.
+Word order and edge order follow collocations_complete.json, so
+denormalize() rebuilds that file exactly.
+
+A collocation word resolves to the vocabulary entry with the same japanese
+and type (the reading breaks ties between homographs). Words that do not
+resolve, or resolve to several entries, fail the build.
+
+Usage (from the repository root):
+    python data-preparation/collocation_refs.py            # write both files, then verify
+    python data-preparation/collocation_refs.py --verify   # verify existing files only
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from collocation_graph import WORD_TYPES, CollocationGraph
+
+PREP_DIR = Path(__file__).resolve().parent
+DEFAULT_COLLOCATIONS = PREP_DIR / "input" / "collocations_complete.json"
+DEFAULT_VOCABULARY = PREP_DIR / "input" / "vocabulary.json"
+DEFAULT_NORMALIZED = PREP_DIR / "input" / "collocations_normalized.json"
+DEFAULT_INDEX = PREP_DIR / "input" / "collocation_vocab_index.json"
+
+
+class UnresolvedReferenceError(ValueError):
+    """Collocation words that do not resolve to exactly one vocabulary entry."""
+
+    def __init__(self, problems: List[str]):
+        self.problems = problems
+        super().__init__(f"{len(problems)} unresolved vocabulary references: " + "; ".join(problems[:10]))
+
+
+def vocabulary_summary(vocabulary_data: dict) -> Dict[str, object]:
+    """The top-level vocabulary.json fields, recorded so stale references can be spotted."""
+    return {key: value for key, value in vocabulary_data.items() if key != 'vocabulary'}
+
+
+def resolve_ids(graph: CollocationGraph, vocabulary: List[dict]) -> Dict[str, Tuple[str, int]]:
+    """
+    Map every word in the graph to its vocabulary entry.
+
+    Returns:
+        {word: (vocabulary id, position in the vocabulary list)}
+
+    Raises:
+        UnresolvedReferenceError: if a word has no entry or an ambiguous one
+    """
+    candidates = {}
+    for position, entry in enumerate(vocabulary):
+        candidates.setdefault((entry['japanese'], entry['type']), []).append(position)
+
+    resolved = {}
+    problems = []
+    for word in graph.words:
+        info = graph.info(word)
+        positions = candidates.get((word, info['type']), [])
+        if len(positions) > 1:
+            positions = [position for position in positions if vocabulary[position]['reading'] == info['reading']]
+        if len(positions) == 1:
+            resolved[word] = (vocabulary[positions[0]]['id'], positions[0])
+        elif positions:
+            problems.append(f"{word} ({info['type']}, {info['reading']}) matches {len(positions)} entries")
+        else:
+            problems.append(f"{word} ({info['type']}) has no vocabulary entry")
+    if problems:
+        raise UnresolvedReferenceError(problems)
+    return resolved
+
+
+def normalize(graph: CollocationGraph, vocabulary_data: dict) -> Tuple[dict, dict]:
+    """
+    Build the normalized collocations and the vocabulary index.
+
+    Returns:
+        (normalized data, index data)
+    """
+    resolved = resolve_ids(graph, vocabulary_data['vocabulary'])
+    summary = vocabulary_summary(vocabulary_data)
+
+    words = {}
+    for word in graph.words:
+        word_type = graph.type(word)
+        kinds = ('verb', 'adjective') if word_type == 'noun' else ('noun',)
+        words[resolved[word][0]] = {
+            'type': word_type,
+            'matches': {
+                kind + 's': [{'id': resolved[partner][0], 'score': score}
+                             for partner, score in graph.neighbor_scores(word, kind)]
+                for kind in kinds
+            },
+        }
+
+    normalized = dict(graph.metadata, normalized=True, vocabulary=summary, words=words)
+    index = {
+        'vocabulary': summary,
+        'positions': {word_id: position for word_id, position in resolved.values()},
+        'words': {word: word_id for word, (word_id, _) in resolved.items()},
+    }
+    return normalized, index
+
+
+def denormalize(normalized: dict, vocabulary_data: dict) -> dict:
+    """Rebuild the collocations_complete.json structure from normalized data and the vocabulary."""
+    entries = {entry['id']: entry for entry in vocabulary_data['vocabulary']}
+
+    def match(edge):
+        entry = entries[edge['id']]
+        return {'word': entry['japanese'], 'reading': entry['reading'], 'english': entry['english'],
+                'score': edge['score']}
+
+    words = {}
+    for word_id, node in normalized['words'].items():
+        entry = entries[word_id]
+        words[entry['japanese']] = {
+            'word': entry['japanese'],
+            'reading': entry['reading'],
+            'english': entry['english'],
+            'type': node['type'],
+            'matches': {key: [match(edge) for edge in edges] for key, edges in node['matches'].items()},
+        }
+    metadata = {key: value for key, value in normalized.items()
+                if key not in ('normalized', 'vocabulary', 'words')}
+    return dict(metadata, words=words)
+
+
+def verify_references(normalized: dict, index: dict, vocabulary_data: dict) -> List[str]:
+    """
+    Check that every referenced ID resolves.
+
+    Every word key and edge ID must exist in the vocabulary with the recorded
+    type, every index position must point at the entry with that ID, and the
+    index's surface forms must map to those entries.
+
+    Returns:
+        Problems found (empty if the references are sound)
+    """
+    vocabulary = vocabulary_data['vocabulary']
+    entries = {entry['id']: entry for entry in vocabulary}
+    problems = []
+
+    if normalized.get('vocabulary') != vocabulary_summary(vocabulary_data):
+        problems.append("normalized output was built from a different vocabulary.json")
+
+    for word_id, node in normalized['words'].items():
+        entry = entries.get(word_id)
+        if entry is None:
+            problems.append(f"word {word_id} is not in the vocabulary")
+        elif entry['type'] != node['type']:
+            problems.append(f"word {word_id} ({entry['japanese']}) is a {entry['type']}, not a {node['type']}")
+        for key, edges in node['matches'].items():
+            for edge in edges:
+                partner = entries.get(edge['id'])
+                if partner is None:
+                    problems.append(f"{key} edge {word_id} -> {edge['id']} does not resolve")
+                elif key[:-1] in WORD_TYPES and partner['type'] != key[:-1]:
+                    problems.append(f"{key} edge {word_id} -> {edge['id']} points at a {partner['type']}")
+
+    for word_id, position in index['positions'].items():
+        if not 0 <= position < len(vocabulary) or vocabulary[position]['id'] != word_id:
+            problems.append(f"index position {position} does not hold {word_id}")
+    for word, word_id in index['words'].items():
+        entry = entries.get(word_id)
+        if entry is None or entry['japanese'] != word:
+            problems.append(f"index word {word} does not map to its vocabulary entry")
+    missing = set(normalized['words']) - set(index['positions'])
+    if missing:
+        problems.append(f"{len(missing)} words missing from the index")
+    return problems
+
+
+def write_json(data: dict, path: Path) -> int:
+    """Write compact JSON atomically (temp file + rename). Returns the file size in bytes."""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return path.stat().st_size
+
+
+def load_json(path: Path) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_normalized(graph: CollocationGraph, vocabulary_data: dict,
+                     normalized_path: Path = DEFAULT_NORMALIZED, index_path: Path = DEFAULT_INDEX) -> List[str]:
+    """
+    Write the normalized output and index, then verify them.
+
+    Returns:
+        Problems found by verify_references()
+    """
+    normalized, index = normalize(graph, vocabulary_data)
+    size = write_json(normalized, normalized_path)
+    index_size = write_json(index, index_path)
+    print(f"  Normalized: {normalized_path} ({size:,} bytes), index: {index_path} ({index_size:,} bytes)")
+    return verify_references(normalized, index, vocabulary_data)
+
+
+def print_problems(problems: List[str], limit: int = 20) -> None:
+    for problem in problems[:limit]:
+        print(f"  - {problem}")
+    if len(problems) > limit:
+        print(f"  ... and {len(problems) - limit} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write and verify vocabulary-ID normalized collocations")
+    parser.add_argument('--collocations', type=Path, default=DEFAULT_COLLOCATIONS)
+    parser.add_argument('--vocabulary', type=Path, default=DEFAULT_VOCABULARY)
+    parser.add_argument('--output', type=Path, default=DEFAULT_NORMALIZED)
+    parser.add_argument('--index', type=Path, default=DEFAULT_INDEX)
+    parser.add_argument('--verify', action='store_true',
+                        help="Only verify the existing output (IDs resolve and it rebuilds --collocations)")
+    args = parser.parse_args()
+
+    vocabulary_data = load_json(args.vocabulary)
+    complete = load_json(args.collocations)
+    if args.verify:
+        normalized = load_json(args.output)
+        problems = verify_references(normalized, load_json(args.index), vocabulary_data)
+        if not problems and denormalize(normalized, vocabulary_data) != complete:
+            problems.append(f"normalized output does not rebuild {args.collocations}")
+    else:
+        try:
+            problems = write_normalized(CollocationGraph.from_data(complete), vocabulary_data, args.output, args.index)
+        except UnresolvedReferenceError as e:
+            problems = e.problems
+
+    if problems:
+        print(f"FAIL: {len(problems)} reference problems")
+        print_problems(problems)
+        sys.exit(1)
+    print("OK: every referenced vocabulary ID resolves")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,9 +8,12 @@ This script identifies noun pairs that are synonyms or alternative writings, suc
 - Alternative kanji/hiragana writings
 """
 
+import argparse
 import json
 from pathlib import Path
-from difflib import SequenceMatcher
+
+from gloss_similarity import add_similarity_arguments, similarity_from_args
+from synonym_index import SynonymIndex, calculate_similarity, remove_honorific_prefix
 
 def load_vocabulary():
     """Load vocabulary from JSON file"""
@@ -19,22 +22,41 @@ def load_vocabulary():
         data = json.load(f)
     return data['vocabulary']
 
-def calculate_similarity(str1, str2):
-    """Calculate similarity ratio between two strings"""
-    return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
-
-def remove_honorific_prefix(word):
-    """Remove お or ご prefix"""
-    if word.startswith('お'):
-        return word[1:]
-    if word.startswith('ご'):
-        return word[1:]
-    return word
+def make_group(group, similarity):
+    """The synonym_groups.json entry for a group, similarity(w1, w2) giving each pair's English similarity"""
+    # Calculate all pairwise English similarities within group
+    similarities = []
+    for j, w1 in enumerate(group):
+        for w2 in group[j+1:]:
+            similarities.append(similarity(w1, w2))
+
+    avg_similarity = sum(similarities) / len(similarities) if similarities else 0
+
+    return {
+        'words': group,
+        'count': len(group),
+        'average_similarity': avg_similarity,
+        'examples': [
+            {
+                'japanese': w['japanese'],
+                'reading': w['reading'],
+                'english': w['english']
+            } for w in group
+        ]
+    }
 
-def find_synonym_groups(vocabulary):
+def find_synonym_groups(vocabulary, similarity=None):
     """
     Find groups of words that are synonyms or alternative writings.
 
+    Same groups as find_synonym_groups_naive(), but each noun is only tested
+    against the candidates SynonymIndex blocks for it.
+
+    Args:
+        vocabulary: vocabulary.json entries
+        similarity: Optional gloss_similarity.TfidfSimilarity to find English
+                    synonym candidates by TF-IDF nearest neighbours
+
     Returns:
         List of groups, where each group is a list of related words
     """
@@ -43,6 +65,40 @@ def find_synonym_groups(vocabulary):
 
     print(f"Analyzing {len(nouns)} nouns for synonym groups...")
 
+    index = SynonymIndex(nouns, similarity=similarity)
+    position = {id(w): i for i, w in enumerate(nouns)}
+    similarity = lambda w1, w2: index.similarity(position[id(w1)], position[id(w2)])
+
+    groups = []
+    used_words = set()
+
+    for i, word1 in enumerate(nouns):
+        if word1['japanese'] in used_words:
+            continue
+
+        group = [word1]
+        for j in index.candidates(i):
+            word2 = nouns[j]
+            if word2['japanese'] not in used_words and index.related(i, j):
+                group.append(word2)
+                used_words.add(word2['japanese'])
+
+        if len(group) > 1:
+            groups.append(make_group(group, similarity))
+            used_words.add(word1['japanese'])
+
+    return groups
+
+def find_synonym_groups_naive(vocabulary):
+    """
+    Find groups of words that are synonyms or alternative writings, testing every pair of nouns.
+
+    Returns:
+        List of groups, where each group is a list of related words
+    """
+    # Filter only nouns (since collocations involve nouns)
+    nouns = [w for w in vocabulary if w['type'] == 'noun']
+
     groups = []
     used_words = set()
 
@@ -93,36 +149,20 @@ def find_synonym_groups(vocabulary):
 
 
         if len(group) > 1:
-            # Calculate all pairwise English similarities within group
-            similarities = []
-            for j, w1 in enumerate(group):
-                for w2 in group[j+1:]:
-                    sim = calculate_similarity(w1['english'], w2['english'])
-                    similarities.append(sim)
-
-            avg_similarity = sum(similarities) / len(similarities) if similarities else 0
-
-            groups.append({
-                'words': group,
-                'count': len(group),
-                'average_similarity': avg_similarity,
-                'examples': [
-                    {
-                        'japanese': w['japanese'],
-                        'reading': w['reading'],
-                        'english': w['english']
-                    } for w in group
-                ]
-            })
+            groups.append(make_group(group, lambda w1, w2: calculate_similarity(w1['english'], w2['english'])))
             used_words.add(word1['japanese'])
 
     return groups
 
 def main():
     """Main function to find and save synonym groups"""
+    parser = argparse.ArgumentParser(description="Find groups of synonym and alternative-writing nouns")
+    add_similarity_arguments(parser)
+    args = parser.parse_args()
+
     vocabulary = load_vocabulary()
 
-    groups = find_synonym_groups(vocabulary)
+    groups = find_synonym_groups(vocabulary, similarity_from_args(args))
 
     # Sort by group size (largest first)
     groups.sort(key=lambda g: g['count'], reverse=True)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Frequency enrichment for the vocabulary lists, in one pass.
+
+Routledge ranks and wordfreq Zipf scores used to be two steps that each
+rewrote N5.csv, N4.csv and N54.csv, and the Zipf step called
+wordfreq.zipf_frequency() once per row of every file. N54 is the union of
+N5 and N4, so every word was tokenized and looked up at least twice. This
+stage (also behind raw/map_frequency_to_csvs.py and raw/add_wordfreq_data.py):
+
+- reads every list first and collects each distinct word once
+- looks the words up in a ZipfMemo (output/zipf_memo.json), so only words
+  never seen with this wordfreq version reach zipf_frequency()
+- merges the Routledge ranks (input/routledge_frequency.csv, when present)
+  into the same rows, ranked words first by rank, unranked words in their
+  original order
+- writes each CSV once, atomically
+
+The Zipf score goes to the "frequency" column that categorize_vocabulary.py
+and the other readers use (rounded to 2 decimals, empty for unknown words).
+An old "wordfreq_zipf" column is folded into it.
+
+wordfreq (pip install wordfreq[cjk]) is only needed for words the memo does
+not have yet.
+
+Usage (from data-preparation/):
+    python frequency_enrichment.py                 # N5, N4 and N54 in input/
+    python frequency_enrichment.py --lists input/N5.csv --routledge input/routledge_frequency.csv
+    python frequency_enrichment.py --no-memo       # look every word up again
+"""
+
+import argparse
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import wordfreq
+except ImportError:
+    wordfreq = None
+
+PREP = Path(__file__).resolve().parent
+INPUT_DIR = PREP / "input"
+DEFAULT_LISTS = [INPUT_DIR / "N5.csv", INPUT_DIR / "N4.csv", INPUT_DIR / "N54.csv"]
+ROUTLEDGE_FILE = INPUT_DIR / "routledge_frequency.csv"
+DEFAULT_MEMO = PREP / "output" / "zipf_memo.json"
+MEMO_VERSION = 1
+
+# Columns this stage owns; every other column of a list is kept in place
+RANK_FIELD = 'routledge_rank'
+ZIPF_FIELD = 'frequency'
+LEGACY_ZIPF_FIELD = 'wordfreq_zipf'
+
+
+def wordfreq_version() -> Optional[str]:
+    """The installed wordfreq release, or None without wordfreq."""
+    if wordfreq is None:
+        return None
+    return getattr(wordfreq, '__version__', 'unknown')
+
+
+class ZipfMemo:
+    """
+    JSON-backed word -> Zipf score memo.
+
+        {"version": 1, "lang": "ja", "wordfreq": "3.1.1", "zipf": {word: score}}
+
+    Scores are stored rounded to 2 decimals (0 for unknown words). A memo
+    written for another language, or for another wordfreq release than the
+    installed one, is ignored.
+    """
+
+    def __init__(self, path: Optional[Path], lang: str = 'ja'):
+        """
+        Args:
+            path: Memo file (None keeps the memo in memory only)
+            lang: wordfreq language code
+        """
+        self.path = Path(path) if path is not None else None
+        self.lang = lang
+        self.version = wordfreq_version()
+        self.scores: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None and self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data.get('version') == MEMO_VERSION and data.get('lang') == lang
+                    and self.version in (None, data.get('wordfreq'))):
+                self.version = data.get('wordfreq')
+                self.scores = data.get('zipf', {})
+
+    def lookup(self, words: Iterable[str]) -> Dict[str, float]:
+        """Zipf scores of the distinct words, computing only those not in the memo."""
+        scores = {}
+        for word in dict.fromkeys(words):
+            score = self.scores.get(word)
+            if score is None:
+                if wordfreq is None:
+                    raise ImportError("Looking up new words needs wordfreq: pip install wordfreq[cjk]")
+                score = self.scores[word] = round(wordfreq.zipf_frequency(word, self.lang), 2)
+                self.misses += 1
+            else:
+                self.hits += 1
+            scores[word] = score
+        return scores
+
+    def save(self) -> None:
+        """Write the memo atomically (only when new words were looked up)."""
+        if self.path is None or not self.misses:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MEMO_VERSION, 'lang': self.lang, 'wordfreq': self.version,
+                       'zipf': self.scores}, f, ensure_ascii=False, indent=0)
+        os.replace(tmp_path, self.path)
+
+    def summary(self) -> str:
+        return f"{self.misses} word(s) looked up, {self.hits} from the memo"
+
+
+def load_routledge(path: Path) -> Dict[str, int]:
+    """Japanese word -> Routledge rank, keeping the best (lowest) rank of duplicates."""
+    ranks = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            rank = int(row['routledge_rank'])
+            if row['japanese'] not in ranks or rank < ranks[row['japanese']]:
+                ranks[row['japanese']] = rank
+    print(f"Loaded {len(ranks)} unique words from {path.name}")
+    return ranks
+
+
+def read_list(path: Path) -> Tuple[List[str], List[dict]]:
+    """(field names, rows) of a vocabulary CSV."""
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        return list(reader.fieldnames or []), list(reader)
+
+
+def output_fields(fieldnames: List[str], with_ranks: bool) -> List[str]:
+    """The list's own columns, then routledge_rank (if any) and frequency."""
+    fields = [field for field in fieldnames if field not in (RANK_FIELD, ZIPF_FIELD, LEGACY_ZIPF_FIELD)]
+    if with_ranks or RANK_FIELD in fieldnames:
+        fields.append(RANK_FIELD)
+    return fields + [ZIPF_FIELD]
+
+
+def enrich_rows(rows: List[dict], zipf: Dict[str, float], ranks: Optional[Dict[str, int]]) -> List[dict]:
+    """
+    Rows with their Zipf score (and Routledge rank) set.
+
+    With ranks, ranked words come first in rank order and the others keep
+    their order.
+    """
+    enriched = []
+    for row in rows:
+        row = dict(row)
+        row.pop(LEGACY_ZIPF_FIELD, None)
+        score = zipf[row['japanese']]
+        row[ZIPF_FIELD] = score if score > 0 else ''
+        if ranks is not None:
+            row[RANK_FIELD] = ranks.get(row['japanese'], '')
+        enriched.append(row)
+    if ranks is not None:
+        ranked = sorted((row for row in enriched if row[RANK_FIELD] != ''), key=lambda row: row[RANK_FIELD])
+        enriched = ranked + [row for row in enriched if row[RANK_FIELD] == '']
+    return enriched
+
+
+def write_list(path: Path, fieldnames: List[str], rows: List[dict]) -> None:
+    """Write a vocabulary CSV atomically."""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, path)
+
+
+def print_list_stats(path: Path, rows: List[dict], ranks: Optional[Dict[str, int]]) -> None:
+    total = len(rows)
+    scores = [row[ZIPF_FIELD] for row in rows if row[ZIPF_FIELD] != '']
+    print(f"\n{path.name}")
+    print(f"  Total words: {total}")
+    if not total:
+        return
+    print(f"  Words with wordfreq data: {len(scores)} ({len(scores) / total * 100:.1f}%)")
+    if scores:
+        print(f"  Zipf score range: {min(scores):.2f} - {max(scores):.2f}")
+        print(f"  Average Zipf score: {sum(scores) / len(scores):.2f}")
+    if ranks is not None:
+        ranked = sum(1 for row in rows if row[RANK_FIELD] != '')
+        print(f"  Matched with Routledge rank: {ranked} ({ranked / total * 100:.1f}%)")
+    print(f"  Saved to: {path}")
+
+
+def enrich(paths: List[Path], memo: ZipfMemo, ranks: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """
+    Enrich every vocabulary list in place, looking each distinct word up once.
+
+    Args:
+        paths: Vocabulary CSVs (missing ones are skipped with a warning)
+        memo: Zipf memo to look words up through
+        ranks: Routledge ranks to merge, or None to leave routledge_rank as it is
+
+    Returns:
+        {'rows': total rows, 'words': distinct words}
+    """
+    lists = []
+    for path in paths:
+        if path.exists():
+            lists.append((path, *read_list(path)))
+        else:
+            print(f"Warning: {path} not found, skipping...")
+
+    words = [row['japanese'] for _, _, rows in lists for row in rows]
+    zipf = memo.lookup(words)
+
+    for path, fieldnames, rows in lists:
+        enriched = enrich_rows(rows, zipf, ranks)
+        write_list(path, output_fields(fieldnames, ranks is not None), enriched)
+        print_list_stats(path, enriched, ranks)
+    return {'rows': len(words), 'words': len(zipf)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add Zipf frequencies and Routledge ranks to the vocabulary lists")
+    parser.add_argument('--lists', type=Path, nargs='+', default=DEFAULT_LISTS,
+                        help="Vocabulary CSVs to enrich in place (default: input/N5.csv N4.csv N54.csv)")
+    parser.add_argument('--routledge', type=Path, default=ROUTLEDGE_FILE,
+                        help="Routledge frequency CSV to merge ranks from (skipped if missing)")
+    parser.add_argument('--memo', type=Path, default=DEFAULT_MEMO, help=f"Zipf memo file (default: {DEFAULT_MEMO})")
+    parser.add_argument('--no-memo', action='store_true', help="Look every word up again, leave the memo alone")
+    parser.add_argument('--lang', default='ja', help="wordfreq language code (default: ja)")
+    args = parser.parse_args()
+
+    ranks = None
+    if args.routledge.exists():
+        ranks = load_routledge(args.routledge)
+    else:
+        print(f"No Routledge file at {args.routledge}, keeping existing ranks")
+
+    memo = ZipfMemo(None if args.no_memo else args.memo, args.lang)
+    try:
+        counts = enrich(args.lists, memo, ranks)
+    except ImportError as e:
+        raise SystemExit(str(e))
+    memo.save()
+    print(f"\n{counts['rows']} rows, {counts['words']} distinct words: {memo.summary()}")
+
+
+if __name__ == '__main__':
+    main()
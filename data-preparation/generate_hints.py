@@ -9,6 +9,8 @@ import json
 from datetime import datetime
 from collections import defaultdict
 
+from collocation_graph import load_graph
+
 # Semantic categories mapping based on English meanings
 SEMANTIC_CATEGORIES = {
     # Beverages
@@ -134,24 +136,16 @@ def generate_hints(input_file, output_file):
     """
     print(f"Reading input file: {input_file}")
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    graph = load_graph(input_file)
 
     hints = {}
     total_words = 0
     total_nouns_with_hints = 0
 
     # Process each word (verb/adjective)
-    for word_key, word_data in data['words'].items():
-        word_type = word_data.get('type', '')
-
-        # Only process verbs and adjectives
-        if word_type not in ['verb', 'adjective']:
-            continue
-
+    for word_key in graph.words_of_type('verb', 'adjective'):
         # Check if this word has noun matches
-        matches = word_data.get('matches', {})
-        nouns = matches.get('nouns', [])
+        nouns = graph.matches(word_key)
 
         if not nouns:
             continue
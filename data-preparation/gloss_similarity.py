@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Vectorized gloss and hint similarity: TF-IDF vectors and cosine similarity.
+
+analyze_hint_similarity.py and find_synonym_groups.py compare strings with
+difflib one pair at a time. TfidfSimilarity turns a list of texts into a
+sparse TF-IDF matrix (character n-grams of the padded, lowercased text, or
+its words) with L2-normalized rows, so comparisons become matrix products:
+
+    similarity = TfidfSimilarity(analyzer='char', ngram=3)
+    similarity.paired(forward_hints, reverse_hints)   # cosine of each aligned pair
+    indices, scores = similarity.top_k(similarity.fit_transform(glosses))
+                                                       # k most similar other rows, per row
+
+top_k() multiplies one block of rows at a time and keeps the k best columns
+of each row, so memory stays under block_mb whatever the number of texts.
+
+Cosine similarity is a different measure from SequenceMatcher.ratio(): the
+hint analysis reports it as its similarity with --backend tfidf, and the
+synonym search only uses it to pick candidates, which still pass the exact
+difflib tests.
+
+Requires numpy and scipy (only with --backend tfidf).
+"""
+
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = sparse = None
+
+BACKENDS = ('difflib', 'tfidf')
+ANALYZERS = ('char', 'word')
+DEFAULT_BACKEND = 'difflib'
+DEFAULT_ANALYZER = 'char'
+DEFAULT_NGRAM = 3
+DEFAULT_TOP_K = 10
+DEFAULT_MIN_SIMILARITY = 0.3
+DEFAULT_BLOCK_MB = 64
+
+WORD = re.compile(r'\w+')
+
+# Dense copies of a block held at once: the products, their negation and argpartition's indices
+_BLOCK_COPIES = 3
+
+
+class TfidfSimilarity:
+    """
+    TF-IDF cosine similarity over character n-grams or words.
+
+    Args:
+        analyzer: 'char' (n-grams of ' text ') or 'word' (\\w+ tokens)
+        ngram: n-gram length for the char analyzer
+        top_k: Neighbours kept per row by top_k()
+        min_similarity: Lowest cosine top_k() keeps
+        block_mb: Memory ceiling for one block of top_k() products
+    """
+
+    def __init__(self, analyzer: str = DEFAULT_ANALYZER, ngram: int = DEFAULT_NGRAM, top_k: int = DEFAULT_TOP_K,
+                 min_similarity: float = DEFAULT_MIN_SIMILARITY, block_mb: float = DEFAULT_BLOCK_MB):
+        if np is None:
+            raise ImportError("The tfidf backend needs numpy and scipy: pip install numpy scipy")
+        if analyzer not in ANALYZERS:
+            raise ValueError(f"Unknown analyzer {analyzer!r} (expected one of {', '.join(ANALYZERS)})")
+        self.analyzer = analyzer
+        self.ngram = ngram
+        self.k = top_k
+        self.min_similarity = min_similarity
+        self.block_mb = block_mb
+        self.vocabulary: Dict[str, int] = {}
+        self.idf = None
+
+    def tokens(self, text: str) -> List[str]:
+        text = text.lower()
+        if self.analyzer == 'word':
+            return WORD.findall(text)
+        padded = f" {text} "
+        if len(padded) <= self.ngram:
+            return [padded]
+        return [padded[k:k + self.ngram] for k in range(len(padded) - self.ngram + 1)]
+
+    def fit(self, texts: Sequence[str]) -> 'TfidfSimilarity':
+        """Learn the vocabulary and smoothed inverse document frequencies, idf = ln((1 + n) / (1 + df)) + 1."""
+        document_frequency = Counter(token for text in texts for token in set(self.tokens(text)))
+        self.vocabulary = {token: column for column, token in enumerate(sorted(document_frequency))}
+        df = np.array([document_frequency[token] for token in sorted(document_frequency)], dtype=np.float64)
+        self.idf = np.log((1 + len(texts)) / (1 + df)) + 1
+        return self
+
+    def transform(self, texts: Sequence[str]):
+        """CSR matrix of L2-normalized TF-IDF rows, one per text (tokens outside the vocabulary are ignored)."""
+        rows, columns, values = [], [], []
+        for row, text in enumerate(texts):
+            counts = Counter(self.vocabulary[token] for token in self.tokens(text) if token in self.vocabulary)
+            rows.extend([row] * len(counts))
+            columns.extend(counts)
+            values.extend(counts.values())
+        matrix = sparse.csr_matrix((np.array(values, dtype=np.float64), (rows, columns)),
+                                   shape=(len(texts), len(self.vocabulary)))
+        matrix = matrix.multiply(self.idf).tocsr()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix)
+
+    def fit_transform(self, texts: Sequence[str]):
+        return self.fit(texts).transform(texts)
+
+    def paired(self, texts: Sequence[str], others: Sequence[str]):
+        """Cosine similarity of texts[i] and others[i] for every i, with one vocabulary fitted on both."""
+        self.fit(list(texts) + list(others))
+        return np.asarray(self.transform(texts).multiply(self.transform(others)).sum(axis=1)).ravel()
+
+    def block_rows(self, columns: int) -> int:
+        """Rows per top_k() block that keep its dense products under block_mb."""
+        return max(1, int(self.block_mb * 1024 * 1024 // (max(columns, 1) * 8 * _BLOCK_COPIES)))
+
+    def top_k(self, matrix, other=None) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        The k most similar rows of `other` (default: matrix itself, leaving out the row itself) for each row.
+
+        Returns:
+            (indices, scores), both (rows, k) arrays sorted by descending
+            score then index; slots below min_similarity (or beyond the
+            number of candidates) have index -1 and score 0
+        """
+        same = other is None
+        other_t = (matrix if same else other).T.tocsc()
+        columns = other_t.shape[1]
+        k = min(self.k, columns - (1 if same else 0))
+        indices = np.full((matrix.shape[0], max(k, 0)), -1, dtype=np.int64)
+        scores = np.zeros((matrix.shape[0], max(k, 0)), dtype=np.float64)
+        if k <= 0:
+            return indices, scores
+
+        step = self.block_rows(columns)
+        for start in range(0, matrix.shape[0], step):
+            block = (matrix[start:start + step] @ other_t).toarray()
+            rows = np.arange(block.shape[0])
+            if same:
+                block[rows, rows + start] = -np.inf
+            best = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            best_scores = np.take_along_axis(block, best, axis=1)
+            order = np.lexsort((best, -best_scores), axis=1)
+            best = np.take_along_axis(best, order, axis=1)
+            best_scores = np.take_along_axis(best_scores, order, axis=1)
+            kept = best_scores >= self.min_similarity
+            indices[start:start + len(rows)] = np.where(kept, best, -1)
+            scores[start:start + len(rows)] = np.where(kept, best_scores, 0.0)
+        return indices, scores
+
+    def neighbors(self, texts: Sequence[str]) -> List[List[int]]:
+        """For each text, the later texts (ascending) in its top k, or that have it in theirs."""
+        indices, _ = self.top_k(self.fit_transform(texts))
+        found: List[set] = [set() for _ in texts]
+        for i, row in enumerate(indices.tolist()):
+            for j in row:
+                if j >= 0:
+                    found[min(i, j)].add(max(i, j))
+        return [sorted(later) for later in found]
+
+
+def add_similarity_arguments(parser) -> None:
+    """Register the shared similarity backend options on an argparse parser."""
+    group = parser.add_argument_group('similarity backend')
+    group.add_argument('--backend', choices=BACKENDS, default=DEFAULT_BACKEND,
+                       help=f"difflib: compare pairs one at a time; tfidf: TF-IDF cosine in matrix blocks "
+                            f"(default: {DEFAULT_BACKEND})")
+    group.add_argument('--analyzer', choices=ANALYZERS, default=DEFAULT_ANALYZER,
+                       help=f"tfidf tokens: character n-grams or words (default: {DEFAULT_ANALYZER})")
+    group.add_argument('--ngram', type=int, default=DEFAULT_NGRAM,
+                       help=f"Character n-gram length (default: {DEFAULT_NGRAM})")
+    group.add_argument('--top-k', type=int, default=DEFAULT_TOP_K,
+                       help=f"Nearest neighbours kept per text (default: {DEFAULT_TOP_K})")
+    group.add_argument('--min-similarity', type=float, default=DEFAULT_MIN_SIMILARITY,
+                       help=f"Lowest cosine similarity for a neighbour (default: {DEFAULT_MIN_SIMILARITY})")
+    group.add_argument('--block-mb', type=float, default=DEFAULT_BLOCK_MB,
+                       help=f"Memory ceiling for one block of similarity products (default: {DEFAULT_BLOCK_MB})")
+
+
+def similarity_from_args(args) -> Optional[TfidfSimilarity]:
+    """Build a TfidfSimilarity from parsed add_similarity_arguments() options (None for the difflib backend)."""
+    if args.backend == 'difflib':
+        return None
+    try:
+        return TfidfSimilarity(args.analyzer, args.ngram, args.top_k, args.min_similarity, args.block_mb)
+    except ImportError as e:
+        raise SystemExit(str(e))
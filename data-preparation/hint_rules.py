@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Declarative hint rule tables shared by the hint generators.
+
+The keyword rules the generators classify nouns with live in JSON files
+under data-preparation/rules/, one rule set per script:
+
+    verb_specific_hints.json   scripts/regenerate_verb_specific_hints.py
+    hint_quality.json          scripts/fix_hint_quality_v7.py
+    category_scores.json       scripts/comprehensive_hint_fixer_v8.py
+    manual_hints.json          create_manual_hints.py
+
+Each file holds named tables:
+
+    {
+      "description": "...",
+      "tables": {
+        "のむ": {
+          "type": "verb",                        optional: only words of this type dispatch here
+          "words": ["のむ", "飲む"],              words that use this table (none for fallback tables)
+          "rules": [["common beverages", ["water", "tea"]], ...],   (category, keywords), in priority order
+          "default": "things you drink",         category when no rule matches; may name {fields}
+          "groups": {"hint": ["名詞", ...]}       optional explicit noun lists
+        }
+      }
+    }
+
+load_rules() parses a file into a RuleSet: a word -> table dispatch dict,
+with every table's keywords compiled once (keyword_classifier). Rule sets
+are cached by path and modification time, so calling load_rules() again
+picks up edited rules without re-importing anything, and watch() reruns a
+job whenever a rule file changes.
+
+Usage (from the repository root):
+    python data-preparation/hint_rules.py            # check every rule file
+    python data-preparation/hint_rules.py FILE ...   # check specific files
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from keyword_classifier import KeywordClassifier, compile_rules
+
+RULES_DIR = Path(__file__).resolve().parent / "rules"
+
+VERB_SPECIFIC_RULES = RULES_DIR / "verb_specific_hints.json"
+HINT_QUALITY_RULES = RULES_DIR / "hint_quality.json"
+CATEGORY_SCORE_RULES = RULES_DIR / "category_scores.json"
+MANUAL_HINT_RULES = RULES_DIR / "manual_hints.json"
+
+TABLE_FIELDS = {'type', 'words', 'rules', 'default', 'groups'}
+
+
+class RuleFileError(ValueError):
+    """A rule file that cannot be parsed or does not follow the format."""
+
+
+def _is_strings(value) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+class RuleTable:
+    """
+    One named table: dispatch words, ordered keyword rules, a default and explicit groups.
+
+    The rules are compiled when the table is loaded.
+    """
+
+    def __init__(self, name: str, spec: dict, source: str = '<rules>'):
+        where = f"{source}: table {name!r}"
+        if not isinstance(spec, dict):
+            raise RuleFileError(f"{where} is not an object")
+        unknown = set(spec) - TABLE_FIELDS
+        if unknown:
+            raise RuleFileError(f"{where} has unknown fields: {', '.join(sorted(unknown))}")
+        if not _is_strings(spec.get('words', [])):
+            raise RuleFileError(f"{where}: 'words' must be a list of strings")
+        for rule in spec.get('rules', []):
+            if not (isinstance(rule, list) and len(rule) == 2 and isinstance(rule[0], str) and _is_strings(rule[1])):
+                raise RuleFileError(f"{where}: rule {rule!r} is not [category, [keywords]]")
+        if not all(isinstance(hint, str) and _is_strings(nouns) for hint, nouns in spec.get('groups', {}).items()):
+            raise RuleFileError(f"{where}: 'groups' must map hints to lists of nouns")
+        for field in ('type', 'default'):
+            if spec.get(field) is not None and not isinstance(spec[field], str):
+                raise RuleFileError(f"{where}: '{field}' must be a string")
+
+        self.name = name
+        self.word_type: Optional[str] = spec.get('type')
+        self.words: List[str] = list(spec.get('words', []))
+        self.rules: List[Tuple[str, List[str]]] = [(category, list(keywords)) for category, keywords in spec.get('rules', [])]
+        self.default: Optional[str] = spec.get('default')
+        self.groups: Dict[str, List[str]] = {hint: list(nouns) for hint, nouns in spec.get('groups', {}).items()}
+        self.classifier: KeywordClassifier = compile_rules(self.rules)
+
+    def __repr__(self):
+        return f"RuleTable({self.name!r}, {len(self.rules)} rules)"
+
+    def _default(self, fields: dict) -> Optional[str]:
+        return self.default.format(**fields) if fields and self.default is not None else self.default
+
+    def first(self, text: str, **fields) -> Optional[str]:
+        """Category of the first rule with a keyword in text, else the default (formatted with fields)."""
+        rule = self.classifier.first_rule(text)
+        return self.rules[rule][0] if rule is not None else self._default(fields)
+
+    def best(self, text: str, **fields) -> Optional[str]:
+        """Highest-scoring category for text (see KeywordClassifier.best), else the default."""
+        category = self.classifier.best(text)
+        return category if category is not None else self._default(fields)
+
+    def group(self, items: Iterable[Tuple[str, str]], groups: Dict[str, list], **fields) -> Dict[str, list]:
+        """Append each (word, english) item to groups[first(english)], skipping items with no category."""
+        for item in items:
+            category = self.first(item[1], **fields)
+            if category is not None:
+                groups[category].append(item)
+        return groups
+
+
+class RuleSet:
+    """The tables of one rule file, with a word -> table dispatch dict."""
+
+    def __init__(self, data: dict, source: str = '<rules>'):
+        if not isinstance(data, dict) or not isinstance(data.get('tables'), dict):
+            raise RuleFileError(f"{source}: expected an object with a 'tables' object")
+        self.source = source
+        self.description: str = data.get('description', '')
+        self.tables: Dict[str, RuleTable] = {}
+        self._dispatch: Dict[Tuple[Optional[str], str], RuleTable] = {}
+        for name, spec in data['tables'].items():
+            table = RuleTable(name, spec, source)
+            self.tables[name] = table
+            for word in table.words:
+                key = (table.word_type, word)
+                if key in self._dispatch:
+                    raise RuleFileError(f"{source}: {word} is listed by both {self._dispatch[key].name!r} and {name!r}")
+                self._dispatch[key] = table
+
+    def __len__(self):
+        return len(self.tables)
+
+    def __getitem__(self, name: str) -> RuleTable:
+        try:
+            return self.tables[name]
+        except KeyError:
+            raise RuleFileError(f"{self.source}: no table named {name!r}") from None
+
+    def table_for(self, word: str, word_type: Optional[str] = None) -> Optional[RuleTable]:
+        """The table that lists word (restricted to tables of word_type or untyped ones), or None."""
+        table = self._dispatch.get((word_type, word))
+        if table is None and word_type is not None:
+            table = self._dispatch.get((None, word))
+        return table
+
+
+_cache: Dict[Path, Tuple[Tuple[int, int], RuleSet]] = {}
+
+
+def _stamp(path: Path) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_rules(path: Path) -> RuleSet:
+    """
+    Load a rule file, reusing the parsed RuleSet until the file changes.
+
+    Raises:
+        RuleFileError: if the file is not valid JSON or not a valid rule set
+    """
+    path = Path(path).resolve()
+    stamp = _stamp(path)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise RuleFileError(f"{path}: {e}") from None
+    rules = RuleSet(data, str(path))
+    _cache[path] = (stamp, rules)
+    return rules
+
+
+def rule_files() -> List[Path]:
+    return sorted(RULES_DIR.glob('*.json'))
+
+
+def format_rules(data: dict) -> str:
+    """
+    Serialize a rule set with one rule per line.
+
+    json.dumps(indent=2) would put every keyword on its own line; this keeps
+    each table readable as a list of [category, [keywords]] lines.
+    """
+    def dump(value):
+        return json.dumps(value, ensure_ascii=False)
+
+    lines = ['{']
+    for key, value in data.items():
+        if key != 'tables':
+            lines.append(f'  {dump(key)}: {dump(value)},')
+    lines.append('  "tables": {')
+    tables = list(data.get('tables', {}).items())
+    for index, (name, spec) in enumerate(tables):
+        lines.append(f'    {dump(name)}: {{')
+        fields = list(spec.items())
+        for field_index, (field, value) in enumerate(fields):
+            comma = ',' if field_index < len(fields) - 1 else ''
+            if field in ('rules', 'groups') and value:
+                items = [dump(rule) for rule in value] if field == 'rules' else \
+                    [f'{dump(hint)}: {dump(nouns)}' for hint, nouns in value.items()]
+                brackets = '[]' if field == 'rules' else '{}'
+                lines.append(f'      {dump(field)}: {brackets[0]}')
+                lines.extend(f'        {item}{"," if i < len(items) - 1 else ""}' for i, item in enumerate(items))
+                lines.append(f'      {brackets[1]}{comma}')
+            else:
+                lines.append(f'      {dump(field)}: {dump(value)}{comma}')
+        lines.append('    }' + (',' if index < len(tables) - 1 else ''))
+    lines.append('  }')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_rules(data: dict, path: Path) -> None:
+    """Validate and write a rule set atomically (temp file + rename)."""
+    text = format_rules(data)
+    RuleSet(json.loads(text), str(path))
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def watch(run: Callable[[], None], paths: Iterable[Path], interval: float = 1.0) -> None:
+    """
+    Call run(), then call it again whenever one of the files changes, until interrupted.
+
+    Rule errors from a half-finished edit are reported and the watch continues.
+    """
+    paths = [Path(path) for path in paths]
+
+    def stamps():
+        return [_stamp(path) if path.exists() else None for path in paths]
+
+    def attempt():
+        try:
+            run()
+        except RuleFileError as e:
+            print(f"\nRule error: {e}")
+
+    attempt()
+    seen = stamps()
+    print(f"\nWatching {', '.join(path.name for path in paths)} for changes (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(interval)
+            current = stamps()
+            if current != seen:
+                seen = current
+                print("\nRules changed, rerunning...")
+                attempt()
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+
+def add_watch_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running and regenerate whenever the rule file changes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the hint rule files")
+    parser.add_argument('files', nargs='*', type=Path, help="Rule files (default: every file in rules/)")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.files or rule_files():
+        try:
+            rules = load_rules(path)
+        except (RuleFileError, OSError) as e:
+            print(f"  [FAIL] {e}")
+            failures += 1
+            continue
+        rule_count = sum(len(table.rules) for table in rules.tables.values())
+        keyword_count = sum(len(keywords) for table in rules.tables.values() for _, keywords in table.rules)
+        print(f"  [OK] {path.name}: {len(rules)} tables, {rule_count} rules, {keyword_count} keywords")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Process-pool sharding shared by the rule-based hint generators.
+
+The generators (scripts/regenerate_verb_specific_hints.py,
+scripts/fix_hint_quality_v7.py, scripts/comprehensive_hint_fixer_v8.py)
+classify each verb's or adjective's nouns on their own, so the words can be
+split into shards and classified in parallel. Each generator has a shard
+method that takes a list of words and returns that shard's hints plus
+counters. The method does not touch the generator's own totals. map_shards()
+calls it once in process, or once per shard across a process pool, and the
+generator merges the returned shards in order. Shards are contiguous runs of
+words in file order with about the same number of nouns each, so merging in
+shard order gives the same hints, counters and key order as the serial path.
+
+Each worker gets its own copy of the generator (and its collocation graph)
+once, when the worker starts, not once per shard. Rule files are loaded by
+path in each worker. This works with both the fork and spawn start methods.
+
+Usage:
+    results = map_shards(generator, '_generate_shard', words, weights, workers)
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Sequence
+
+SHARDS_PER_WORKER = 4
+
+# The generator this worker process was started with
+_owner = None
+
+
+def shard_words(words: Sequence[str], weights: Sequence[int], count: int) -> List[List[str]]:
+    """Split words into at most `count` contiguous runs with about the same total weight each."""
+    target = sum(weights) / max(count, 1)
+    shards, current, weight = [], [], 0
+    for word, word_weight in zip(words, weights):
+        current.append(word)
+        weight += word_weight
+        if weight >= target * (len(shards) + 1) and len(shards) < count - 1:
+            shards.append(current)
+            current = []
+    if current or not shards:
+        shards.append(current)
+    return shards
+
+
+def _start_worker(owner) -> None:
+    global _owner
+    _owner = owner
+
+
+def _run_shard(method: str, words: List[str]):
+    return getattr(_owner, method)(words)
+
+
+def map_shards(owner, method: str, words: Sequence[str], weights: Sequence[int], workers: int = 1) -> list:
+    """
+    owner.<method>(shard) for each shard of words, in shard order.
+
+    Args:
+        owner: Generator with the shard method (pickled once per worker)
+        method: Name of the shard method
+        words: Words to classify, in output order
+        weights: Work per word (its noun count), for balancing the shards
+        workers: Worker processes; 1 runs a single shard in process
+
+    Returns:
+        The shard method's results, one per shard
+    """
+    words = list(words)
+    if workers <= 1 or not words:
+        return [getattr(owner, method)(words)]
+    shards = shard_words(words, [max(weight, 1) for weight in weights], workers * SHARDS_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_start_worker, initargs=(owner,)) as pool:
+        return list(pool.map(_run_shard, [method] * len(shards), shards))
+
+
+def add_workers_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes to classify words across (default: 1, in process)")
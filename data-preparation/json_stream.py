@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Streaming reader and writer for the large keyed JSON files.
+
+collocations_complete.json, collocations.json, the hint files and
+collocation_meanings.json all share one shape: a few metadata members and
+one big map keyed by word,
+
+    {"version": "...", ..., "words": {"する": {...}, "飲む": {...}, ...}}
+
+(the map is "words", "collocations", "hints", "verbs" or "meanings").
+json.load() materializes the whole tree; iter_entries() instead reads the
+file in chunks and yields the map's (word, entry) pairs one at a time, so
+memory is bounded by the largest single entry rather than the file:
+
+    for verb, noun_hints in iter_entries(path, 'hints'): ...
+    header = read_header(path)          # the metadata members, maps skipped unparsed
+
+    header = {}
+    for word, entry in iter_entries(path, 'words', header): ...   # both in one pass
+
+write_entries() is the inverse: it writes the header and a map from an
+iterator of (word, entry) pairs, byte-identical to
+json.dump(..., ensure_ascii=False, indent=2) of the whole document.
+
+Each entry is decoded with the stdlib decoder (json.JSONDecoder.raw_decode),
+so entries come back exactly as json.load would have produced them.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Top-level members that hold one entry per word
+STREAM_KEYS = ('words', 'collocations', 'hints', 'verbs', 'meanings')
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Everything up to the next bracket outside a string
+_SKIP = re.compile(r'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+_SCALAR_END = re.compile(r'[ \t\n\r,\]}]')
+
+
+class JSONStreamError(ValueError):
+    """Malformed JSON, reported with its character offset in the file."""
+
+
+class _Reader:
+    """A chunked text buffer with just enough of a JSON scanner to walk objects."""
+
+    def __init__(self, f, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.offset = 0  # characters dropped from the front of the buffer
+        self.eof = False
+
+    def fill(self, size: Optional[int] = None) -> bool:
+        """Drop the consumed text and append the next chunk; False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, message: str, pos: Optional[int] = None) -> 'JSONStreamError':
+        return JSONStreamError(f"{message} at character {self.offset + (self.pos if pos is None else pos)}")
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expecting {char!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next value."""
+        if self.peek() not in '{["':
+            # Numbers and literals have no closing character: make sure the buffer holds all of it
+            while _SCALAR_END.search(self.buffer, self.pos) is None and self.fill():
+                pass
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # Most likely cut off by the end of the buffer: read more (doubling, so long values stay linear)
+                if self.fill(max(self.chunk_size, len(self.buffer))):
+                    continue
+                raise self.error(e.msg, e.pos) from None
+            self.pos = end
+            return value
+
+    def skip(self) -> None:
+        """Move past the next value without building it."""
+        if self.peek() not in '{[':
+            self.value()
+            return
+        depth = 0
+        while True:
+            self.pos = _SKIP.match(self.buffer, self.pos).end()
+            if self.pos == len(self.buffer):
+                if not self.fill():
+                    raise self.error("Unterminated value")
+                continue
+            char = self.buffer[self.pos]
+            if char == '"':
+                # A string cut off by the end of the buffer
+                if not self.fill(max(self.chunk_size, len(self.buffer))):
+                    raise self.error("Unterminated string")
+                continue
+            self.pos += 1
+            depth += 1 if char in '{[' else -1
+            if depth == 0:
+                return
+
+    def names(self) -> Iterator[str]:
+        """
+        Walk the object starting here, yielding each member name.
+
+        The caller must consume the member's value (value() or skip())
+        before asking for the next name.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self.error("Expecting property name")
+            name = self.value()
+            self.expect(':')
+            yield name
+            char = self.peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise self.error("Expecting ',' delimiter", self.pos - 1)
+
+    def members(self) -> Iterator[Tuple[str, Any]]:
+        for name in self.names():
+            yield name, self.value()
+
+
+def iter_entries(path: Path, key: Optional[str] = 'words', header: Optional[Dict[str, Any]] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (name, value) for each member of the top-level object's `key` map, in file order.
+
+    With key=None, yields the top-level members themselves.
+
+    Args:
+        path: JSON file whose top level is an object
+        key: The map to stream
+        header: If given, the other top-level members are decoded into it
+                as the file is read (those after the map once the entries
+                are exhausted), saving a read_header() pass
+        chunk_size: Characters read at a time
+
+    Raises:
+        KeyError: if the file has no top-level `key` member
+        JSONStreamError: if the file is not valid JSON
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _Reader(f, chunk_size)
+        if key is None:
+            yield from reader.members()
+            return
+        found = False
+        for name in reader.names():
+            if name == key:
+                found = True
+                yield from reader.members()
+                if header is None:
+                    return
+            elif header is not None:
+                header[name] = reader.value()
+            else:
+                reader.skip()
+    if not found:
+        raise KeyError(key)
+
+
+def read_header(path: Path, skip: Iterable[str] = STREAM_KEYS,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """The top-level members of a file except the `skip` maps, which are scanned past unparsed."""
+    skip = set(skip)
+    header = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _Reader(f, chunk_size)
+        for name in reader.names():
+            if name in skip:
+                reader.skip()
+            else:
+                header[name] = reader.value()
+    return header
+
+
+def top_level_keys(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[str]:
+    """The top-level member names of a file, without parsing any values."""
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _Reader(f, chunk_size)
+        keys = []
+        for name in reader.names():
+            keys.append(name)
+            reader.skip()
+    return keys
+
+
+def iter_hints(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    (word, {noun: hint}) pairs of a hint file's "hints" map, or of its top
+    level for files that are the map itself.
+    """
+    key = 'hints' if 'hints' in top_level_keys(path, chunk_size) else None
+    return iter_entries(path, key, chunk_size=chunk_size)
+
+
+def _dumps(value: Any, level: int) -> str:
+    """json.dumps(indent=2) of value as it appears nested `level` objects deep."""
+    return json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n' + '  ' * level)
+
+
+def write_entries(path: Path, header: Dict[str, Any], key: str,
+                  entries: Iterable[Tuple[str, Any]]) -> int:
+    """
+    Write header's members followed by a `key` map of entries, one entry at a time.
+
+    The result is byte-identical to json.dump({**header, key: dict(entries)},
+    f, ensure_ascii=False, indent=2), written atomically (temp file + rename).
+
+    Returns:
+        Number of entries written
+    """
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    count = 0
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('{')
+        for name, value in header.items():
+            if name != key:
+                f.write(f'\n  {_dumps(name, 1)}: {_dumps(value, 1)},')
+        f.write(f'\n  {_dumps(key, 1)}: {{')
+        for name, value in entries:
+            f.write(f'{"," if count else ""}\n    {_dumps(name, 2)}: {_dumps(value, 2)}')
+            count += 1
+        f.write('\n  }\n}' if count else '}\n}')
+    os.replace(tmp_path, path)
+    return count
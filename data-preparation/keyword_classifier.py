@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Compiled keyword classification for the rule-based hint generators.
+
+The hint generators sort a noun into a category by its English gloss using
+ordered rule tables:
+
+    [('common beverages', ['water', 'tea', 'coffee']), ('medicine you swallow', ['medicine', 'pill']), ...]
+
+and either take the first rule with a matching keyword (the if/elif chains
+in regenerate_verb_specific_hints.py, the regex loop in refine_hints.py) or
+score every category (comprehensive_hint_fixer_v8.py). Evaluated directly,
+each noun costs one scan of its gloss per keyword. compile_rules() builds a
+table once and classifies a gloss in a single pass:
+
+- substring mode (`keyword in text`): all keywords go into one Aho-Corasick
+  automaton, flattened to a DFA, so the gloss is read once character by
+  character whatever the number of rules
+- word mode (`re.search(r'\\b(...)\\b', text)`): single-word keywords go into
+  a token -> rule inverted index; keywords with spaces or punctuation keep
+  one compiled pattern each, tried only while they could still win
+
+Both modes return exactly what the chains they replace returned.
+
+Usage:
+    classifier = compile_rules([('drinks', ['water', 'tea'])], default='other things')
+    classifier.first('green tea')       # 'drinks'
+    classifier.best('hot water')        # highest-scoring category
+    classifier.group(nouns, groups)     # append (noun, english) pairs to groups[category]
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+Rules = Sequence[Tuple[str, Sequence[str]]]
+
+WORD = re.compile(r'\w+')
+
+# Points per keyword in best(): found as a whole (space-delimited) word, or inside another word
+WHOLE_WORD_POINTS = 3
+SUBSTRING_POINTS = 1
+
+_compiled: Dict[tuple, 'KeywordClassifier'] = {}
+
+
+class KeywordClassifier:
+    """
+    An ordered rule table compiled for fast first-match and best-score lookups.
+
+    Args:
+        rules: (category, keywords) pairs in priority order. A category may
+               appear in several rules and a keyword in several categories.
+        default: Returned when no rule matches
+        words: Match keywords as whole words (regex \\b semantics) instead of substrings
+    """
+
+    def __init__(self, rules: Rules, default: Optional[str] = None, words: bool = False):
+        self.rules = [(category, list(keywords)) for category, keywords in rules]
+        self.categories = [category for category, _ in rules]
+        self.default = default
+        self.words = words
+
+        # Each distinct keyword once: the first rule it appears in, and its count per rule for best()
+        rule_counts: Dict[str, Dict[int, int]] = {}
+        for rule, (_, keywords) in enumerate(rules):
+            for keyword in keywords:
+                counts = rule_counts.setdefault(keyword, {})
+                counts[rule] = counts.get(rule, 0) + 1
+        self.keywords = list(rule_counts)
+        self._first_rule = [min(rule_counts[keyword]) for keyword in self.keywords]
+        self._rule_counts = [tuple(rule_counts[keyword].items()) for keyword in self.keywords]
+        self._no_rule = len(self.categories)
+
+        if words:
+            self._compile_index()
+        else:
+            self._compile_automaton()
+
+    def __len__(self):
+        return len(self.categories)
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def _compile_automaton(self) -> None:
+        """Build the Aho-Corasick DFA over every non-empty keyword."""
+        goto: List[Dict[str, int]] = [{}]
+        ends: List[List[int]] = [[]]
+        # '' is in every string, so empty keywords match unconditionally
+        self._empty = [keyword_id for keyword_id, keyword in enumerate(self.keywords) if not keyword]
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                following = goto[state].get(char)
+                if following is None:
+                    following = len(goto)
+                    goto[state][char] = following
+                    goto.append({})
+                    ends.append([])
+                state = following
+            if keyword:
+                ends[state].append(keyword_id)
+
+        # Breadth-first: failure links, outputs inherited along them, full transitions
+        fail = [0] * len(goto)
+        outputs: List[Tuple[int, ...]] = [()] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = tuple(ends[state]) + outputs[fail[state]]
+            transitions = dict(delta[fail[state]])
+            for char, following in goto[state].items():
+                fail[following] = delta[fail[state]].get(char, 0)
+                transitions[char] = following
+                queue.append(following)
+            delta[state] = transitions
+
+        # Transitions back to the root are the lookup default, so drop them
+        self._delta = [{char: following for char, following in transitions.items() if following}
+                       for transitions in delta]
+        self._outputs = outputs
+        self._lengths = [len(keyword) for keyword in self.keywords]
+        self._always = min((self._first_rule[keyword_id] for keyword_id in self._empty), default=self._no_rule)
+        self._state_rule = [min((self._first_rule[keyword_id] for keyword_id in output), default=self._no_rule)
+                            for output in outputs]
+
+    def _compile_index(self) -> None:
+        """Build the token -> first rule index and the patterns for multi-token keywords."""
+        self._token_rule: Dict[str, int] = {}
+        patterns = []
+        for keyword_id, keyword in enumerate(self.keywords):
+            rule = self._first_rule[keyword_id]
+            if WORD.fullmatch(keyword):
+                self._token_rule[keyword] = rule
+            else:
+                patterns.append((rule, re.compile(r'\b' + re.escape(keyword) + r'\b')))
+        self._patterns = sorted(patterns, key=lambda item: item[0])
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def first_rule(self, text: str) -> Optional[int]:
+        """Index of the first rule with a keyword in text, or None."""
+        if self.words:
+            best = self._no_rule
+            token_rule = self._token_rule
+            for token in WORD.findall(text):
+                rule = token_rule.get(token, best)
+                if rule < best:
+                    best = rule
+            for rule, pattern in self._patterns:
+                if rule >= best:
+                    break
+                if pattern.search(text):
+                    best = rule
+                    break
+        else:
+            best = self._always
+            delta, state_rule = self._delta, self._state_rule
+            state = 0
+            if best and delta[0]:
+                for char in text:
+                    state = delta[state].get(char, 0)
+                    if state_rule[state] < best:
+                        best = state_rule[state]
+                        if not best:
+                            break
+        return best if best < self._no_rule else None
+
+    def first(self, text: str) -> Optional[str]:
+        """
+        Category of the first rule with a keyword in text, else the default.
+
+        Same result as `if any(k in text for k in rule_1): ... elif ...: ... else: default`
+        (or the word-boundary regex equivalent in word mode).
+        """
+        rule = self.first_rule(text)
+        return self.categories[rule] if rule is not None else self.default
+
+    def best(self, text: str) -> Optional[str]:
+        """
+        Highest-scoring category for text, else the default.
+
+        Each occurrence of a keyword in a rule's list scores WHOLE_WORD_POINTS
+        if the keyword appears delimited by spaces or the ends of text
+        somewhere, SUBSTRING_POINTS if it only appears inside other words.
+        Ties go to the earlier rule. Substring mode only.
+        """
+        if self.words:
+            raise ValueError("best() scores substring matches; compile the rules with words=False")
+        if not self.keywords:
+            return self.default
+        # keyword id -> found as a whole word
+        found = {keyword_id: '  ' in f' {text} ' for keyword_id in self._empty}
+        delta, outputs, lengths = self._delta, self._outputs, self._lengths
+        last = len(text) - 1
+        state = 0
+        for position, char in enumerate(text if delta[0] else ()):
+            state = delta[state].get(char, 0)
+            for keyword_id in outputs[state]:
+                if found.get(keyword_id):
+                    continue
+                start = position - lengths[keyword_id] + 1
+                found[keyword_id] = ((start == 0 or text[start - 1] == ' ')
+                                     and (position == last or text[position + 1] == ' '))
+
+        if not found:
+            return self.default
+        scores = [0] * len(self.categories)
+        for keyword_id, whole in found.items():
+            points = WHOLE_WORD_POINTS if whole else SUBSTRING_POINTS
+            for rule, count in self._rule_counts[keyword_id]:
+                scores[rule] += points * count
+        best_rule, best_score = None, 0
+        for rule, score in enumerate(scores):
+            if score > best_score:
+                best_rule, best_score = rule, score
+        return self.categories[best_rule] if best_rule is not None else self.default
+
+    def group(self, items: Iterable[Tuple[str, str]], groups: Dict[str, list]) -> Dict[str, list]:
+        """
+        Append each (word, english) item to groups[first(english)].
+
+        Items whose category is None (no match and no default) are skipped.
+        """
+        for item in items:
+            category = self.first(item[1])
+            if category is not None:
+                groups[category].append(item)
+        return groups
+
+
+def compile_rules(rules: Rules, default: Optional[str] = None, words: bool = False) -> KeywordClassifier:
+    """
+    Compile a rule table, reusing the classifier for a table already compiled.
+
+    Args:
+        rules: (category, keywords) pairs in priority order
+        default: Returned when no rule matches
+        words: Match whole words instead of substrings
+    """
+    key = (tuple((category, tuple(keywords)) for category, keywords in rules), default, words)
+    classifier = _compiled.get(key)
+    if classifier is None:
+        classifier = _compiled[key] = KeywordClassifier(rules, default, words)
+    return classifier
+
+
+# ----------------------------------------------------------------------
+# Reference semantics (what the compiled lookups must reproduce)
+# ----------------------------------------------------------------------
+
+def naive_first(rules: Rules, text: str, default: Optional[str] = None, words: bool = False) -> Optional[str]:
+    """First-match classification evaluated rule by rule, keyword by keyword."""
+    for category, keywords in rules:
+        if words:
+            if keywords and re.search(r'\b(' + '|'.join(map(re.escape, keywords)) + r')\b', text):
+                return category
+        elif any(keyword in text for keyword in keywords):
+            return category
+    return default
+
+
+def naive_best(rules: Rules, text: str, default: Optional[str] = None) -> Optional[str]:
+    """Best-score classification evaluated category by category, keyword by keyword."""
+    best_category, best_score = default, 0
+    for category, keywords in rules:
+        score = 0
+        for keyword in keywords:
+            if keyword in text:
+                whole = f' {keyword} ' in f' {text} ' or text.startswith(keyword + ' ') or text.endswith(' ' + keyword)
+                score += WHOLE_WORD_POINTS if whole else SUBSTRING_POINTS
+        if score > best_score:
+            best_category, best_score = category, score
+    return best_category
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Per-level data bundles built from the study lists.
+
+The app downloads the full N5+N4 vocabulary, collocation graph and meanings
+even for N5 learners, who only ever practice the words in studylist_n5.json.
+This step splits the published artifacts (release_patches.ARTIFACTS) by
+study list level. The lists are convert_studylists.py's outputs; each one
+must contain the one before it.
+
+Like artifact_manifest.py, it runs in the deploy build on dist/data (after
+vite has copied public/ there, before the manifest is written), so the
+shards always match the files being deployed. They are not committed.
+
+    shard_n5.json    base: the N5 dataset, in the artifacts' own schemas
+    shard_n54.json   increment: what N54 adds on top of N5
+
+The dataset of a level holds:
+
+    vocabulary        entries whose japanese is in the list
+    collocations      words in the list, with only the matches whose partner is in the list
+    meanings          forward/reverse meanings whose word and partner are both in the list
+    reverse_meanings
+
+Matches, meanings and words left with nothing are dropped, unless they were
+already empty in the full data. Header fields (version, generatedAt,
+totalPairs, ...) are kept as they are, since they describe the release;
+each shard records its own counts instead.
+
+The base shard holds its dataset whole. An increment holds a
+release_patches diff from the previous level's dataset to its own (mostly
+"+" inserts at final positions), so the client applies it with the same
+code as a release patch. Applying every shard in order reproduces the
+published artifacts exactly, key and list order included. If the last
+list does not cover every word, an "all" increment adds the rest.
+
+    {"version": 1, "level": "n5", "base": null, "counts": {...}, "data": {artifact: ...}}
+    {"version": 1, "level": "n54", "base": "n5", "counts": {...}, "diff": {artifact: diff}}
+
+Usage (from the repository root, after npm run build):
+    python data-preparation/level_shards.py            # write the shards into dist/data, then verify
+    python data-preparation/level_shards.py --verify   # verify existing shards only
+    python data-preparation/level_shards.py --data public/data   # write next to the source files instead
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from release_patches import ARTIFACTS, REPO_ROOT, apply, canonical, diff, load_artifacts, write_json
+
+# public/data as copied by vite build
+DATA_DIR = REPO_ROOT / "dist" / "data"
+SOURCE_DIR = REPO_ROOT / "public" / "data"
+STUDY_LISTS = ['studylist_n5.json', 'studylist_n54.json']
+SHARD_VERSION = 1
+ALL_LEVEL = 'all'
+
+Level = Tuple[str, Optional[Set[str]]]
+
+
+def shard_name(level: str) -> str:
+    return f"shard_{level}.json"
+
+
+def load_levels(data_dir: Path = DATA_DIR, names: List[str] = STUDY_LISTS) -> List[Level]:
+    """
+    (level, words) of every study list, smallest first.
+
+    Raises:
+        ValueError: if a list does not contain the one before it
+    """
+    levels = []
+    for name in names:
+        with open(data_dir / name, 'r', encoding='utf-8') as f:
+            words = set(json.load(f)['words'])
+        levels.append((Path(name).stem.replace('studylist_', ''), words))
+    levels.sort(key=lambda level: len(level[1]))
+    for (smaller, smaller_words), (larger, larger_words) in zip(levels, levels[1:]):
+        if not smaller_words <= larger_words:
+            missing = sorted(smaller_words - larger_words)
+            raise ValueError(f"study list {larger} lacks {len(missing)} {smaller} word(s): "
+                             f"{', '.join(missing[:10])}")
+    return levels
+
+
+def _restrict_vocabulary(data: dict, words: Set[str]) -> dict:
+    return {**data, 'vocabulary': [entry for entry in data['vocabulary'] if entry['japanese'] in words]}
+
+
+def _restrict_collocations(data: dict, words: Set[str]) -> dict:
+    restricted = {}
+    for word, entry in data['words'].items():
+        if word not in words:
+            continue
+        matches = {}
+        for category, partners in entry['matches'].items():
+            kept = [partner for partner in partners if partner['word'] in words]
+            if kept or not partners:
+                matches[category] = kept
+        if any(matches.values()) or not any(entry['matches'].values()):
+            restricted[word] = {**entry, 'matches': matches}
+    return {**data, 'words': restricted}
+
+
+def _restrict_meanings(data: dict, words: Set[str]) -> dict:
+    restricted = {}
+    for word, partners in data['meanings'].items():
+        if word not in words:
+            continue
+        kept = {partner: meaning for partner, meaning in partners.items() if partner in words}
+        if kept or not partners:
+            restricted[word] = kept
+    return {**data, 'meanings': restricted}
+
+
+RESTRICTIONS = {
+    'vocabulary': _restrict_vocabulary,
+    'collocations': _restrict_collocations,
+    'meanings': _restrict_meanings,
+    'reverse_meanings': _restrict_meanings,
+}
+
+
+def restrict(artifacts: Dict[str, object], words: Optional[Set[str]]) -> Dict[str, object]:
+    """The artifacts limited to a level's words (None: every word)."""
+    if words is None:
+        return dict(artifacts)
+    return {name: RESTRICTIONS[name](data, words) for name, data in artifacts.items()}
+
+
+def dataset_counts(dataset: Dict[str, object]) -> Dict[str, int]:
+    """Vocabulary entries, collocation words, forward pairs and meanings of a dataset."""
+    words = dataset['collocations']['words']
+    return {
+        'vocabulary': len(dataset['vocabulary']['vocabulary']),
+        'words': len(words),
+        'pairs': sum(len(entry['matches'].get('nouns', [])) for entry in words.values()
+                     if entry['type'] in ('verb', 'adjective')),
+        'meanings': sum(len(partners) for partners in dataset['meanings']['meanings'].values()),
+        'reverse_meanings': sum(len(partners) for partners in dataset['reverse_meanings']['meanings'].values()),
+    }
+
+
+def shard_levels(artifacts: Dict[str, object], levels: List[Level]) -> List[Level]:
+    """The study list levels, plus "all" if the last one does not cover the whole dataset."""
+    if canonical(restrict(artifacts, levels[-1][1])) != canonical(artifacts):
+        return levels + [(ALL_LEVEL, None)]
+    return list(levels)
+
+
+def build_shards(artifacts: Dict[str, object], levels: List[Level]) -> List[dict]:
+    """The base shard and one increment per later level."""
+    shards = []
+    previous = None
+    for level, words in shard_levels(artifacts, levels):
+        dataset = restrict(artifacts, words)
+        shard = {'version': SHARD_VERSION, 'level': level, 'base': shards[-1]['level'] if shards else None,
+                 'counts': dataset_counts(dataset)}
+        if previous is None:
+            shard['data'] = dataset
+        else:
+            changes = {name: diff(previous[name], dataset[name]) for name in dataset}
+            shard['diff'] = {name: change for name, change in changes.items() if change is not None}
+        shards.append(shard)
+        previous = dataset
+    return shards
+
+
+def merge_shards(shards: List[dict]) -> Dict[str, object]:
+    """
+    The dataset of the last shard's level: the base shard with every increment applied.
+
+    Raises:
+        ValueError: if the shards are not a chain starting at a base shard
+    """
+    if not shards or shards[0]['base'] is not None:
+        raise ValueError("the first shard must be a base shard")
+    dataset = dict(shards[0]['data'])
+    for previous, shard in zip(shards, shards[1:]):
+        if shard['base'] != previous['level']:
+            raise ValueError(f"shard {shard['level']} extends {shard['base']}, not {previous['level']}")
+        for name, change in shard['diff'].items():
+            dataset[name] = apply(dataset[name], change)
+    return dataset
+
+
+def write_shards(data_dir: Path = DATA_DIR) -> List[Path]:
+    """Write one shard file per level into data_dir; returns their paths."""
+    shards = build_shards(load_artifacts(data_dir), load_levels(data_dir))
+    paths = []
+    for shard in shards:
+        path = data_dir / shard_name(shard['level'])
+        write_json(path, shard)
+        paths.append(path)
+    return paths
+
+
+def verify_shards(data_dir: Path = DATA_DIR) -> List[str]:
+    """
+    Check the shard files against the published artifacts.
+
+    Returns:
+        Problems found (empty if every level and the union are exact)
+    """
+    artifacts = load_artifacts(data_dir)
+    problems = []
+    shards = []
+    for level, words in shard_levels(artifacts, load_levels(data_dir)):
+        path = data_dir / shard_name(level)
+        if not path.exists():
+            problems.append(f"{path.name} is missing")
+            return problems
+        with open(path, 'r', encoding='utf-8') as f:
+            shards.append(json.load(f))
+        if canonical(merge_shards(shards)) != canonical(restrict(artifacts, words)):
+            problems.append(f"shards up to {level} do not reproduce the {level} dataset")
+    if canonical(merge_shards(shards)) != canonical(artifacts):
+        problems.append("the union of the shards is not the full dataset")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split the published data into per-study-list shards")
+    parser.add_argument('--data', type=Path, default=DATA_DIR, help=f"Built data directory (default: {DATA_DIR})")
+    parser.add_argument('--verify', action='store_true', help="Only verify the existing shards")
+    args = parser.parse_args()
+
+    if not args.verify:
+        try:
+            paths = write_shards(args.data)
+        except ValueError as e:
+            raise SystemExit(f"ERROR: {e}")
+        full = sum((args.data / filename).stat().st_size for filename in ARTIFACTS.values())
+        for path in paths:
+            print(f"  {path.name}: {path.stat().st_size:,} bytes")
+        print(f"  full artifacts: {full:,} bytes")
+
+    problems = verify_shards(args.data)
+    for problem in problems:
+        print(f"  {problem}")
+    if problems:
+        sys.exit(1)
+    print("OK: each level and the union of the shards reproduce the published data")
+
+
+if __name__ == '__main__':
+    main()
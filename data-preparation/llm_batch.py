@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Message Batches API runner for bulk hint/meaning generation.
+
+Instead of one request/response round-trip per pair, all pending prompts are
+packed into a single batch submission (split only when the API's per-batch
+limit is reached), the batch is polled until processing ends, and the JSONL
+results are streamed back and matched to their jobs by custom_id.
+
+BatchRunner.run() takes the same (key, prompt, fallback) jobs and returns the
+same {key: text} mapping as HintEngine.run_sync(), so generators can switch
+modes with a --batch flag. Cached responses (llm_cache) are resolved locally
+and never submitted.
+
+Point the runner at the local mock with --base-url, see
+benchmarks/fake_anthropic_server.py.
+"""
+
+import os
+import time
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+from llm_cache import CacheMiss, ResponseCache, cache_from_args, cache_key
+from llm_engine import DEFAULT_MODEL, Job, clean_hint
+
+DEFAULT_POLL_INTERVAL = 30.0
+MAX_REQUESTS_PER_BATCH = 100000
+
+
+class BatchRunner:
+    """
+    Submit jobs through the Message Batches API and collect their results.
+    """
+
+    def __init__(self, client=None, model: str = DEFAULT_MODEL, max_tokens: int = 50,
+                 temperature: Optional[float] = None, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 max_requests_per_batch: int = MAX_REQUESTS_PER_BATCH,
+                 base_url: Optional[str] = None, cache: Optional[ResponseCache] = None):
+        """
+        Args:
+            client: Optional Anthropic-compatible client (created lazily otherwise)
+            model: Claude model name
+            max_tokens: max_tokens for every request in the batch
+            temperature: Temperature for every request (None = API default)
+            poll_interval: Seconds between batch status checks
+            max_requests_per_batch: Split submissions larger than this
+            base_url: API base URL override (e.g. the local mock server)
+            cache: Response cache; cached prompts are not submitted
+        """
+        self.client = client
+        self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.poll_interval = poll_interval
+        self.max_requests_per_batch = max_requests_per_batch
+        self.base_url = base_url
+        self.cache = cache
+
+        self.stats = {'submitted': 0, 'succeeded': 0, 'failed': 0, 'cached': 0, 'batches': 0}
+
+    def describe(self) -> str:
+        """One-line description of the request mode, for logs."""
+        return f"Batch mode: one Message Batch submission, polling every {self.poll_interval}s"
+
+    def summary(self) -> str:
+        """One-line summary of the batch work done so far, for logs."""
+        return (f"Batched requests: {self.stats['submitted']} in {self.stats['batches']} batch(es) "
+                f"({self.stats['cached']} cached, {self.stats['failed']} failed)")
+
+    def _make_client(self):
+        """Create the synchronous Anthropic client used for batch calls."""
+        from anthropic import Anthropic
+
+        return Anthropic(
+            api_key=os.environ.get("ANTHROPIC_API_KEY"),
+            base_url=self.base_url or os.environ.get("ANTHROPIC_BASE_URL"),
+        )
+
+    def _request_params(self, prompt: str, max_tokens: int) -> dict:
+        params = {
+            'model': self.model,
+            'max_tokens': max_tokens,
+            'messages': [{"role": "user", "content": prompt}],
+        }
+        if self.temperature is not None:
+            params['temperature'] = self.temperature
+        return params
+
+    def submit(self, requests: List[dict]) -> str:
+        """Create one batch from prepared {custom_id, params} requests and return its id."""
+        batch = self.client.messages.batches.create(requests=requests)
+        self.stats['batches'] += 1
+        self.stats['submitted'] += len(requests)
+        print(f"Submitted batch {batch.id} with {len(requests)} requests")
+        return batch.id
+
+    def wait(self, batch_id: str):
+        """Poll a batch until processing has ended and return the final batch object."""
+        while True:
+            batch = self.client.messages.batches.retrieve(batch_id)
+            counts = batch.request_counts
+            print(f"  Batch {batch_id}: {batch.processing_status} "
+                  f"(processing {counts.processing}, succeeded {counts.succeeded}, "
+                  f"errored {counts.errored}, expired {counts.expired})")
+            if batch.processing_status == 'ended':
+                return batch
+            time.sleep(self.poll_interval)
+
+    def run(self, jobs: Iterable[Job],
+            on_result: Optional[Callable[[Hashable, str, bool], None]] = None,
+            postprocess: Callable[[str], str] = clean_hint) -> Dict[Hashable, str]:
+        """
+        Run all jobs through the Message Batches API.
+
+        Args:
+            jobs: Iterable of (key, prompt, fallback[, max_tokens])
+            on_result: Called as on_result(key, text, ok) as results stream back
+                       (with ok False the text is the fallback)
+            postprocess: Applied to successful response text
+
+        Returns:
+            Dictionary mapping each job key to its text (fallback on failure)
+
+        Raises:
+            CacheMiss: In cache-only mode if any prompt was not cached (nothing is submitted)
+        """
+        results = {}
+        pending = {}
+        requests = []
+        misses = []
+
+        def finish(key, text, ok):
+            results[key] = text
+            if on_result:
+                on_result(key, text, ok)
+
+        for key, prompt, fallback, *options in jobs:
+            max_tokens = options[0] if options and options[0] else self.max_tokens
+            cache_id = cache_key(self.model, self.temperature, max_tokens, prompt) if self.cache else None
+            if self.cache:
+                cached = self.cache.get(cache_id)
+                if cached is not None:
+                    self.stats['cached'] += 1
+                    finish(key, postprocess(cached), True)
+                    continue
+                if self.cache.cache_only:
+                    misses.append(key)
+                    continue
+
+            # custom_id must match ^[a-zA-Z0-9_-]{1,64}$, so map an index back to the key
+            custom_id = f"req-{len(requests):06d}"
+            pending[custom_id] = (key, fallback, cache_id)
+            requests.append({'custom_id': custom_id, 'params': self._request_params(prompt, max_tokens)})
+
+        if misses:
+            raise CacheMiss(f"{len(misses)} prompt(s) not in the cache (cache-only mode), first: {misses[0]}")
+        if not requests:
+            return results
+
+        if self.client is None:
+            self.client = self._make_client()
+
+        for start in range(0, len(requests), self.max_requests_per_batch):
+            batch_id = self.submit(requests[start:start + self.max_requests_per_batch])
+            self.wait(batch_id)
+
+            for entry in self.client.messages.batches.results(batch_id):
+                key, fallback, cache_id = pending.pop(entry.custom_id)
+                if entry.result.type == 'succeeded':
+                    text = entry.result.message.content[0].text
+                    if self.cache:
+                        self.cache.put(cache_id, self.model, text)
+                    self.stats['succeeded'] += 1
+                    finish(key, postprocess(text), True)
+                else:
+                    error = getattr(entry.result, 'error', None)
+                    print(f"Error generating hint for {key}: batch result {entry.result.type} {error or ''}")
+                    self.stats['failed'] += 1
+                    finish(key, fallback, False)
+
+        # Anything the API never reported back is treated as failed
+        for key, fallback, _ in pending.values():
+            self.stats['failed'] += 1
+            finish(key, fallback, False)
+
+        return results
+
+    # Drop-in replacement for HintEngine.run_sync() in the generators
+    run_sync = run
+
+
+def add_batch_arguments(parser) -> None:
+    """Register the --batch options on an argparse parser (alongside add_engine_arguments)."""
+    group = parser.add_argument_group('Message Batches API')
+    group.add_argument('--batch', action='store_true',
+                       help="Submit all pending pairs as one Message Batch instead of individual requests")
+    group.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                       help=f"Seconds between batch status checks (default: {DEFAULT_POLL_INTERVAL})")
+
+
+def batch_runner_from_args(args, cache=None, **kwargs) -> BatchRunner:
+    """Build a BatchRunner from parsed add_engine_arguments()/add_batch_arguments() options."""
+    return BatchRunner(
+        poll_interval=args.poll_interval,
+        base_url=args.base_url,
+        cache=cache if cache is not None else cache_from_args(args),
+        **kwargs,
+    )
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache for Claude API responses.
+
+Every response is stored in a SQLite file under a key derived from
+sha256(model, temperature, max_tokens, prompt), so re-running a generator
+only pays for prompts that actually changed. The cache keeps hit/miss
+counters, evicts least-recently-used entries once it grows past a size
+limit, and supports a --cache-only mode that replays stored responses
+without touching the network.
+
+Usage:
+    cache = ResponseCache()
+    text = call_llm(client, prompt, model=MODEL, max_tokens=100, cache=cache)
+    data = call_llm(client, prompt, model=MODEL, max_tokens=100, cache=cache, validate=json.loads)
+    print_cache_stats(cache)
+
+Pass validate= for responses the caller parses: a response it rejects is
+never stored, and a stored one it rejects is evicted and requested again.
+
+HintEngine (llm_engine.py) consults the same cache for its async calls.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent / "output" / "llm_cache.sqlite"
+DEFAULT_CACHE_MAX_MB = 200
+
+
+class CacheMiss(Exception):
+    """Raised in cache-only mode when a prompt has no stored response."""
+
+
+def cache_key(model: str, temperature: Optional[float], max_tokens: int, prompt: str) -> str:
+    """
+    Compute the content address of a request.
+
+    Args:
+        model: Claude model name
+        temperature: Sampling temperature (None = API default)
+        max_tokens: Response token limit
+        prompt: Full prompt text
+
+    Returns:
+        Hex sha256 digest identifying the request
+    """
+    payload = json.dumps([model, temperature, max_tokens, prompt], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed response store with LRU size eviction.
+
+    Each row keeps the response text, its size in bytes and the time it was
+    last read or written; eviction drops the oldest rows until the total
+    size fits under max_bytes.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, max_mb: float = DEFAULT_CACHE_MAX_MB,
+                 cache_only: bool = False):
+        """
+        Args:
+            path: SQLite file location (parent directory is created if needed)
+            max_mb: Size limit for stored responses in megabytes
+            cache_only: Never call the API; missing entries raise CacheMiss
+        """
+        self.path = Path(path)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.cache_only = cache_only
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # API requests call_llm() made through this cache (misses that reached the client)
+        self.requests = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON responses(last_used)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored response for key (marking it recently used), or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """Store a response and evict old entries if the cache is over its size limit."""
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Drop a stored response (e.g. one the caller could not parse)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Delete least-recently-used rows until the total size fits (caller holds the lock)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_used ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """Hit/miss counters plus current entry count and size."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': entries,
+            'size_bytes': size,
+        }
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def call_llm(client, prompt: str, model: str, max_tokens: int,
+             temperature: Optional[float] = None, cache: Optional[ResponseCache] = None,
+             validate: Optional[Callable[[str], object]] = None):
+    """
+    Send one prompt through the cache and return the raw response text.
+
+    Args:
+        client: Synchronous Anthropic client (may be None in cache-only mode)
+        prompt: Full prompt text
+        model: Claude model name
+        max_tokens: Response token limit
+        temperature: Sampling temperature (None = API default)
+        cache: Response cache; None disables caching
+        validate: Parser for the response text; its result is returned instead
+            of the text. A fresh response it raises on is not cached (the error
+            propagates); a cached one it raises on is evicted and treated as a miss.
+
+    Returns:
+        Response text (unstripped, as returned by the API), or validate(text)
+
+    Raises:
+        CacheMiss: In cache-only mode when the prompt is not cached
+    """
+    key = cache_key(model, temperature, max_tokens, prompt) if cache else None
+    if cache:
+        cached = cache.get(key)
+        if cached is not None:
+            if validate is None:
+                return cached
+            try:
+                return validate(cached)
+            except Exception:
+                cache.delete(key)
+        if cache.cache_only:
+            raise CacheMiss(f"No cached response for prompt {key[:12]}")
+
+    params = {
+        'model': model,
+        'max_tokens': max_tokens,
+        'messages': [{"role": "user", "content": prompt}],
+    }
+    if temperature is not None:
+        # Sent as a raw body field: newer SDK releases dropped the keyword argument
+        params['extra_body'] = {'temperature': temperature}
+
+    if cache:
+        cache.requests += 1
+    response = client.messages.create(**params)
+    text = response.content[0].text
+    result = validate(text) if validate is not None else text
+
+    if cache:
+        cache.put(key, model, text)
+    return result
+
+
+def add_cache_arguments(parser) -> None:
+    """Register the shared cache options on an argparse parser."""
+    group = parser.add_argument_group('response cache')
+    group.add_argument('--cache-path', type=Path, default=DEFAULT_CACHE_PATH,
+                       help=f"SQLite cache file (default: {DEFAULT_CACHE_PATH})")
+    group.add_argument('--cache-max-mb', type=float, default=DEFAULT_CACHE_MAX_MB,
+                       help=f"Evict least-recently-used responses beyond this size (default: {DEFAULT_CACHE_MAX_MB})")
+    group.add_argument('--no-cache', action='store_true',
+                       help="Always call the API and do not store responses")
+    group.add_argument('--cache-only', action='store_true',
+                       help="Offline replay: never call the API, fail on prompts missing from the cache")
+
+
+def cache_from_args(args) -> Optional[ResponseCache]:
+    """Build a ResponseCache from parsed add_cache_arguments() options (None with --no-cache)."""
+    if args.no_cache:
+        if args.cache_only:
+            raise SystemExit("--cache-only and --no-cache are mutually exclusive")
+        return None
+    return ResponseCache(args.cache_path, args.cache_max_mb, cache_only=args.cache_only)
+
+
+def print_cache_stats(cache: Optional[ResponseCache]) -> None:
+    """Print a one-line cache summary (no-op when caching is disabled)."""
+    if cache is None:
+        return
+    stats = cache.stats()
+    print(f"Cache: {stats['hits']} hits, {stats['misses']} misses "
+          f"({stats['hit_rate']:.0%} hit rate), {stats['evictions']} evicted, "
+          f"{stats['entries']} entries / {stats['size_bytes'] / 1024:.1f} KB")
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Claude API engine shared by the hint/meaning generators.
+
+Replaces the serial `client.messages.create()` + `time.sleep()` loops with:
+- an AsyncAnthropic client
+- a semaphore capping the number of in-flight requests
+- a token-bucket rate limiter (requests per second)
+- exponential-backoff retries on 429 / 5xx / connection errors
+- an optional content-addressed response cache (llm_cache.ResponseCache)
+
+Usage:
+    engine = HintEngine(concurrency=8, requests_per_second=5)
+    jobs = [((verb, noun), prompt, fallback), ...]
+    hints = engine.run_sync(jobs, on_result=callback)
+
+Point the engine at a local stub server with --base-url (or ANTHROPIC_BASE_URL),
+see benchmarks/fake_anthropic_server.py.
+"""
+
+import asyncio
+import os
+import random
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from llm_cache import CacheMiss, ResponseCache, add_cache_arguments, cache_from_args, cache_key
+
+DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+DEFAULT_MAX_RETRIES = 5
+
+# Status codes worth retrying: timeouts, conflicts, rate limits and server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+RETRYABLE_ERROR_NAMES = {'APIConnectionError', 'APITimeoutError'}
+
+# (key, prompt, fallback[, max_tokens]) - key identifies the result, fallback is used
+# on failure, and the optional max_tokens overrides the engine default for that job
+Job = Tuple[Hashable, str, str]
+
+
+def clean_hint(text: str) -> str:
+    """Strip whitespace and surrounding quotes from a model response."""
+    return text.strip().strip('"\'')
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Decide whether a failed request should be retried.
+
+    Args:
+        error: Exception raised by the Anthropic client
+
+    Returns:
+        True for rate limits (429), server errors (5xx) and connection problems
+    """
+    status_code = getattr(error, 'status_code', None)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the `retry-after` header from an API error response, if any."""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for asyncio.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Each request consumes one token; callers wait when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second (i.e. sustained requests per second)
+            capacity: Maximum burst size (defaults to max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class HintEngine:
+    """
+    Concurrent, rate-limited generator for single-prompt Claude API calls.
+
+    Every call goes through the same semaphore, token bucket and retry policy,
+    so the generators only need to build prompts and consume results.
+    """
+
+    def __init__(self, client=None, model: str = DEFAULT_MODEL, max_tokens: int = 50,
+                 temperature: Optional[float] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+                 max_retries: int = DEFAULT_MAX_RETRIES, base_delay: float = 1.0,
+                 max_delay: float = 30.0, base_url: Optional[str] = None,
+                 cache: Optional[ResponseCache] = None):
+        """
+        Args:
+            client: Optional AsyncAnthropic-compatible client (created lazily otherwise)
+            model: Claude model name
+            max_tokens: Default max_tokens per request
+            temperature: Default temperature (None = API default)
+            concurrency: Maximum number of in-flight requests
+            requests_per_second: Sustained request rate allowed by the token bucket
+            max_retries: Retries per request on 429/5xx/connection errors
+            base_delay: First backoff delay in seconds (doubles every retry)
+            max_delay: Upper bound for a single backoff delay
+            base_url: API base URL override (e.g. a local stub server)
+            cache: Response cache consulted before every API call (None = no caching)
+        """
+        self.client = client
+        self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.base_url = base_url
+        self.cache = cache
+
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0}
+
+        # asyncio primitives (and a client we created) belong to one event loop;
+        # each run_sync() call starts a new loop, so they are rebuilt per loop
+        self._loop = None
+        self._owns_client = client is None
+        self._semaphore = None
+        self._bucket = None
+
+    def describe(self) -> str:
+        """One-line description of the request mode, for logs."""
+        return f"Concurrency: {self.concurrency} in-flight requests, {self.requests_per_second} requests/sec"
+
+    def summary(self) -> str:
+        """One-line summary of the API calls made so far, for logs."""
+        return (f"API calls made: {self.stats['requests']} "
+                f"({self.stats['retries']} retries, {self.stats['failures']} failures)")
+
+    def _make_client(self):
+        """Create the AsyncAnthropic client (SDK retries disabled - we retry ourselves)."""
+        from anthropic import AsyncAnthropic
+
+        return AsyncAnthropic(
+            api_key=os.environ.get("ANTHROPIC_API_KEY"),
+            base_url=self.base_url or os.environ.get("ANTHROPIC_BASE_URL"),
+            max_retries=0,
+        )
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """Exponential backoff with jitter, honoring retry-after when present."""
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay *= random.uniform(0.5, 1.0)
+        server_delay = retry_after_seconds(error)
+        if server_delay is not None:
+            delay = max(delay, min(server_delay, self.max_delay))
+        return delay
+
+    async def generate(self, prompt: str, max_tokens: Optional[int] = None,
+                       temperature: Optional[float] = None) -> str:
+        """
+        Send one prompt and return the raw response text.
+
+        Raises the last error once retries are exhausted or the error is not retryable,
+        or CacheMiss in cache-only mode.
+        """
+        max_tokens = max_tokens or self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+
+        key = cache_key(self.model, temperature, max_tokens, prompt) if self.cache else None
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            if self.cache.cache_only:
+                raise CacheMiss(f"No cached response for prompt {key[:12]}")
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._bucket = TokenBucket(self.requests_per_second)
+            if self._owns_client:
+                self.client = None
+        if self.client is None:
+            self.client = self._make_client()
+
+        params = {
+            'model': self.model,
+            'max_tokens': max_tokens,
+            'messages': [{"role": "user", "content": prompt}],
+        }
+        if temperature is not None:
+            # Sent as a raw body field: newer SDK releases dropped the keyword argument
+            params['extra_body'] = {'temperature': temperature}
+
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                await self._bucket.acquire()
+                self.stats['requests'] += 1
+                try:
+                    response = await self.client.messages.create(**params)
+                    text = response.content[0].text
+                    break
+                except Exception as e:
+                    if attempt >= self.max_retries or not is_retryable(e):
+                        raise
+                    self.stats['retries'] += 1
+                    await asyncio.sleep(self._backoff_delay(attempt, e))
+                    attempt += 1
+
+        if self.cache:
+            self.cache.put(key, self.model, text)
+        return text
+
+    async def run(self, jobs: Iterable[Job],
+                  on_result: Optional[Callable[[Hashable, str, bool], None]] = None,
+                  postprocess: Callable[[str], str] = clean_hint) -> Dict[Hashable, str]:
+        """
+        Run all jobs concurrently.
+
+        Args:
+            jobs: Iterable of (key, prompt, fallback[, max_tokens])
+            on_result: Called as on_result(key, text, ok) when each job finishes
+                       (in completion order - use it for logging/checkpointing).
+                       With ok False the text is the fallback: keep an existing
+                       text for the key rather than overwrite it
+            postprocess: Applied to successful response text
+
+        Returns:
+            Dictionary mapping each job key to its text (fallback on failure)
+
+        Raises:
+            CacheMiss: In cache-only mode, after every job has finished, if any
+                prompt was not cached (those jobs get no result or on_result call)
+        """
+        results = {}
+        misses = []
+
+        async def run_job(key, prompt, fallback, max_tokens=None):
+            try:
+                text = postprocess(await self.generate(prompt, max_tokens=max_tokens))
+                ok = True
+            except CacheMiss:
+                # Not a failed request: the run is aborted below so no fallback gets saved
+                misses.append(key)
+                return
+            except Exception as e:
+                print(f"Error generating hint for {key}: {e}")
+                self.stats['failures'] += 1
+                text = fallback
+                ok = False
+            results[key] = text
+            if on_result:
+                on_result(key, text, ok)
+
+        await asyncio.gather(*(run_job(*job) for job in jobs))
+        if misses:
+            raise CacheMiss(f"{len(misses)} prompt(s) not in the cache (cache-only mode), first: {misses[0]}")
+        return results
+
+    def run_sync(self, jobs: Iterable[Job],
+                 on_result: Optional[Callable[[Hashable, str, bool], None]] = None,
+                 postprocess: Callable[[str], str] = clean_hint) -> Dict[Hashable, str]:
+        """Blocking wrapper around run() for the command-line scripts."""
+        return asyncio.run(self.run(jobs, on_result=on_result, postprocess=postprocess))
+
+
+def nest_results(groups: Dict[str, Dict[str, Any]],
+                 results: Dict[Tuple[str, str], str]) -> Dict[str, Dict[str, str]]:
+    """
+    Rebuild a nested {outer: {inner: text}} map from (outer, inner)-keyed results.
+
+    Args:
+        groups: Original nested map, used only for its key order
+        results: Completed results keyed by (outer, inner)
+
+    Returns:
+        Nested map in the original order, containing only completed pairs
+    """
+    nested = {}
+    for outer, inner_map in groups.items():
+        for inner in inner_map:
+            if (outer, inner) in results:
+                nested.setdefault(outer, {})[inner] = results[(outer, inner)]
+    return nested
+
+
+def merge_groups(pairs: Dict[str, List[str]], old_groups: Dict[str, Dict[str, str]],
+                 new_groups: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """
+    Merge regenerated groups into an existing output, following the current pair list.
+
+    Pairs present in new_groups replace their old text; other pairs keep
+    their old text. Pairs no longer in `pairs` are dropped.
+
+    Args:
+        pairs: Current {outer: [inner, ...]} pairs (defines order and membership)
+        old_groups: Previously generated {outer: {inner: text}}
+        new_groups: Freshly generated {outer: {inner: text}}, possibly partial
+
+    Returns:
+        Merged {outer: {inner: text}} in pair order
+    """
+    merged = {}
+    for outer, inners in pairs.items():
+        new_map = new_groups.get(outer, {})
+        old_map = old_groups.get(outer, {})
+        group = {}
+        for inner in inners:
+            if inner in new_map:
+                group[inner] = new_map[inner]
+            elif inner in old_map:
+                group[inner] = old_map[inner]
+            else:
+                print(f"Warning: no text for {outer} + {inner} (not regenerated and not in the existing output)")
+        if group:
+            merged[outer] = group
+    return merged
+
+
+def add_engine_arguments(parser) -> None:
+    """Register the shared engine (and response cache) options on an argparse parser."""
+    group = parser.add_argument_group('API engine')
+    group.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                       help=f"Maximum in-flight API requests (default: {DEFAULT_CONCURRENCY})")
+    group.add_argument('--rps', type=float, default=DEFAULT_REQUESTS_PER_SECOND,
+                       help=f"Sustained requests per second (default: {DEFAULT_REQUESTS_PER_SECOND})")
+    group.add_argument('--max-retries', type=int, default=DEFAULT_MAX_RETRIES,
+                       help=f"Retries on 429/5xx errors (default: {DEFAULT_MAX_RETRIES})")
+    group.add_argument('--base-url', default=None,
+                       help="API base URL override, e.g. http://127.0.0.1:8765 for the stub server")
+    add_cache_arguments(parser)
+
+
+def engine_from_args(args, **kwargs: Any) -> HintEngine:
+    """Build a HintEngine from parsed add_engine_arguments() options."""
+    return HintEngine(
+        concurrency=args.concurrency,
+        requests_per_second=args.rps,
+        max_retries=args.max_retries,
+        base_url=args.base_url,
+        cache=cache_from_args(args),
+        **kwargs,
+    )
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Pair-level manifest for generated hints and meanings.
+
+Every generated text is recorded with the pair it belongs to, the hash of
+the per-pair prompt that produced it and the model used:
+
+    {"version": 1, "pairs": [{"outer": "飲む", "inner": "水", "promptHash": "...",
+                              "model": "...", "ok": true, "output": "to drink water"}, ...]}
+
+Diffing the manifest against the pairs currently in collocations_complete.json
+(and the prompts they would get today) yields exactly which pairs were
+added, removed or changed, so a generator run with --changed-only only
+sends those pairs and merges the results back into the existing output.
+
+A pair counts as changed when its prompt hash differs (e.g. a translation
+or the prompt template changed), the model differs, or its last attempt
+fell back to the template text.
+
+Usage:
+    manifest = PairManifest(path)
+    diff = manifest.diff(prompt_hashes, model)
+    ... generate diff.added + diff.changed ...
+    manifest.record(outer, inner, prompt_hash(prompt), model, text, ok)
+    manifest.save()
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_MANIFEST_DIR = Path(__file__).resolve().parent / "output"
+
+Pair = Tuple[str, str]
+
+
+def prompt_hash(prompt: str) -> str:
+    """Hex sha256 of a prompt's text."""
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+
+def pair_record(outer: str, inner: str, prompt_digest: str, model: str, output: str, ok: bool = True) -> dict:
+    """Build a manifest (and checkpoint journal) record for one generated pair."""
+    return {
+        'outer': outer,
+        'inner': inner,
+        'promptHash': prompt_digest,
+        'model': model,
+        'ok': ok,
+        'output': output,
+    }
+
+
+class PairDiff:
+    """Result of comparing a manifest with the current pairs."""
+
+    def __init__(self, added: List[Pair], removed: List[Pair], changed: List[Pair], unchanged: List[Pair]):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+        self.unchanged = unchanged
+
+    @property
+    def dirty(self) -> List[Pair]:
+        """Pairs that need (re)generation: added and changed."""
+        return self.added + self.changed
+
+    def summary(self) -> str:
+        return (f"{len(self.added)} added, {len(self.removed)} removed, "
+                f"{len(self.changed)} changed, {len(self.unchanged)} unchanged")
+
+
+class PairManifest:
+    """
+    JSON-backed record of (outer, inner) -> prompt hash, model and output.
+
+    "outer" is the group a prompt belongs to (the verb/adjective in forward
+    mode, the noun in reverse mode) and "inner" the other word of the pair.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.records: Dict[Pair, dict] = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for record in json.load(f)['pairs']:
+                    self.records[(record['outer'], record['inner'])] = record
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def record(self, outer: str, inner: str, prompt_digest: str, model: str, output: str,
+               ok: bool = True) -> dict:
+        """Store the latest generation for a pair and return its record."""
+        record = self.records[(outer, inner)] = pair_record(outer, inner, prompt_digest, model, output, ok)
+        return record
+
+    def update(self, records: Iterable[dict]) -> None:
+        """Store records produced elsewhere (e.g. replayed from a checkpoint journal)."""
+        for record in records:
+            self.records[(record['outer'], record['inner'])] = record
+
+    def discard(self, pairs: Iterable[Pair]) -> None:
+        """Forget pairs that no longer exist."""
+        for pair in pairs:
+            self.records.pop(pair, None)
+
+    def seed(self, groups: Dict[str, Dict[str, str]], prompt_hashes: Dict[Pair, str], model: str) -> int:
+        """
+        Record an existing output as up to date with the current prompts.
+
+        Used the first time a manifest is created for an output that was
+        generated before manifests existed. Pairs without a current prompt
+        (i.e. removed from the collocation database) are not recorded.
+
+        Returns:
+            Number of pairs recorded
+        """
+        count = 0
+        for outer, inner_map in groups.items():
+            for inner, text in inner_map.items():
+                digest = prompt_hashes.get((outer, inner))
+                if digest is not None:
+                    self.record(outer, inner, digest, model, text)
+                    count += 1
+        return count
+
+    def diff(self, prompt_hashes: Dict[Pair, str], model: str) -> PairDiff:
+        """
+        Compare the manifest with the current pairs.
+
+        Args:
+            prompt_hashes: Current {(outer, inner): prompt hash}, in pair order
+            model: Model the generator would use now
+
+        Returns:
+            PairDiff; added/changed/unchanged follow prompt_hashes order
+        """
+        added, changed, unchanged = [], [], []
+        for pair, digest in prompt_hashes.items():
+            record = self.records.get(pair)
+            if record is None:
+                added.append(pair)
+            elif record['promptHash'] != digest or record['model'] != model or not record.get('ok', True):
+                changed.append(pair)
+            else:
+                unchanged.append(pair)
+        removed = [pair for pair in self.records if pair not in prompt_hashes]
+        return PairDiff(added, removed, changed, unchanged)
+
+    def save(self) -> None:
+        """Write the manifest atomically (temp file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'pairs': list(self.records.values())}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def select_pairs(groups: Dict[str, List[str]], pairs: Iterable[Pair]) -> Dict[str, List[str]]:
+    """
+    Restrict {outer: [inner, ...]} to the given pairs, keeping group and pair order.
+    """
+    wanted = set(pairs)
+    selected = {}
+    for outer, inners in groups.items():
+        kept = [inner for inner in inners if (outer, inner) in wanted]
+        if kept:
+            selected[outer] = kept
+    return selected
+
+
+def print_pair_diff(diff: PairDiff, log_print: Callable[[str], None] = print, limit: int = 20) -> None:
+    """Print the diff summary followed by up to `limit` pairs of each kind."""
+    log_print(f"Pair diff: {diff.summary()}")
+    for label, pairs in (('+', diff.added), ('-', diff.removed), ('~', diff.changed)):
+        for outer, inner in pairs[:limit]:
+            log_print(f"  {label} {outer} + {inner}")
+        if len(pairs) > limit:
+            log_print(f"  {label} ... and {len(pairs) - limit} more")
+
+
+def add_manifest_arguments(parser, default_path: Optional[Path] = None, always_incremental: bool = False) -> None:
+    """
+    Register the pair-manifest options on an argparse parser.
+
+    Scripts that always resume from the manifest (always_incremental) get no
+    --changed-only flag.
+    """
+    group = parser.add_argument_group('pair manifest')
+    group.add_argument('--manifest', type=Path, default=default_path,
+                       help=f"Pair manifest file (default: {default_path})")
+    if not always_incremental:
+        group.add_argument('--changed-only', action='store_true',
+                           help="Only generate pairs added or changed since the manifest was written")
+    group.add_argument('--show-diff', action='store_true',
+                       help="Print the pair diff against collocations_complete.json and exit")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Multi-pair prompt packing: one Claude call per verb/adjective instead of one per pair.
+
+The per-pair generators repeat a ~40-line instruction preamble for every
+noun. In packed mode each group (a verb with all of its nouns, or a noun
+with all of its verbs in reverse mode) is sent as one prompt that asks for a
+JSON object mapping every listed key to its text - the same approach
+raw/generate_collocation_hints.py uses. Responses are validated: any
+requested key that is missing or empty is re-requested in a smaller follow-up
+prompt containing only those keys, and keys still missing after the last
+round get the per-pair fallback.
+
+Works with both HintEngine and BatchRunner (anything with run_sync()).
+
+Usage:
+    results, report = run_packed(engine, {verb: [noun, ...]}, build_prompt, fallback)
+    print_packing_report(report)
+"""
+
+import json
+from typing import Callable, Dict, List, Optional, Tuple
+
+from llm_engine import clean_hint
+
+DEFAULT_MAX_ROUNDS = 3
+
+# Response budget per requested key, plus headroom for the JSON braces
+TOKENS_PER_KEY = 30
+BASE_RESPONSE_TOKENS = 100
+MAX_RESPONSE_TOKENS = 8192
+
+
+def parse_json_object(text: str) -> Dict[str, str]:
+    """
+    Extract the JSON object from a model response.
+
+    Tolerates markdown code fences and text around the object.
+
+    Raises:
+        ValueError: If no JSON object can be parsed
+    """
+    text = text.strip()
+    start = text.find('{')
+    end = text.rfind('}')
+    if start == -1 or end == -1:
+        raise ValueError("No JSON object in response")
+    data = json.loads(text[start:end + 1])
+    if not isinstance(data, dict):
+        raise ValueError("Response JSON is not an object")
+    return data
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough input-token estimate: ~4 ASCII characters per token, one token per
+    non-ASCII (kana/kanji) character.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars)
+
+
+def response_budget(key_count: int) -> int:
+    """max_tokens for a packed request asking for key_count values."""
+    return min(MAX_RESPONSE_TOKENS, BASE_RESPONSE_TOKENS + TOKENS_PER_KEY * key_count)
+
+
+def run_packed(engine, groups: Dict[str, List[str]],
+               build_prompt: Callable[[str, List[str]], str],
+               fallback: Callable[[str, str], str],
+               on_result: Optional[Callable[[Tuple[str, str], str, bool], None]] = None,
+               max_rounds: int = DEFAULT_MAX_ROUNDS,
+               postprocess: Callable[[str], str] = clean_hint,
+               unpacked_prompt: Optional[Callable[[str, str], str]] = None
+               ) -> Tuple[Dict[Tuple[str, str], str], dict]:
+    """
+    Generate one text per (group, key) pair using one packed prompt per group.
+
+    Args:
+        engine: HintEngine or BatchRunner
+        groups: Mapping of group name (verb, or noun in reverse mode) to the keys it needs
+        build_prompt: build_prompt(group, keys) -> prompt asking for a JSON object over keys
+        fallback: fallback(group, key) -> text used when a key is never returned
+        on_result: Called as on_result((group, key), text, ok) as each pair resolves
+        max_rounds: Total attempts per key (first request + repair requests)
+        postprocess: Applied to every returned value
+        unpacked_prompt: unpacked_prompt(group, key) -> the per-pair prompt, used
+                         only to report the token savings of packing
+
+    Returns:
+        (results keyed by (group, key), report dict)
+    """
+    results = {}
+    report = {
+        'groups': len(groups),
+        'pairs': sum(len(keys) for keys in groups.values()),
+        'requests': 0,
+        'rounds': 0,
+        'repaired': 0,
+        'fallbacks': 0,
+        'packed_tokens': 0,
+        'unpacked_tokens': 0,
+    }
+
+    if unpacked_prompt:
+        report['unpacked_tokens'] = sum(estimate_tokens(unpacked_prompt(group, key))
+                                        for group, keys in groups.items() for key in keys)
+
+    def resolve(group, key, text, ok):
+        results[(group, key)] = text
+        if on_result:
+            on_result((group, key), text, ok)
+
+    pending = {group: list(keys) for group, keys in groups.items() if keys}
+    for round_number in range(1, max_rounds + 1):
+        if not pending:
+            break
+        report['rounds'] = round_number
+
+        jobs = []
+        for group, keys in pending.items():
+            prompt = build_prompt(group, keys)
+            report['packed_tokens'] += estimate_tokens(prompt)
+            # An empty fallback marks a failed request; the keys stay pending
+            jobs.append((group, prompt, '', response_budget(len(keys))))
+        report['requests'] += len(jobs)
+
+        responses = engine.run_sync(jobs, postprocess=lambda text: text)
+
+        still_missing = {}
+        for group, keys in pending.items():
+            try:
+                values = parse_json_object(responses.get(group, ''))
+            except ValueError as e:
+                if responses.get(group):
+                    print(f"Error parsing packed response for {group}: {e}")
+                values = {}
+
+            missing = []
+            for key in keys:
+                value = values.get(key)
+                if isinstance(value, str) and value.strip():
+                    if round_number > 1:
+                        report['repaired'] += 1
+                    resolve(group, key, postprocess(value), True)
+                else:
+                    missing.append(key)
+            if missing:
+                still_missing[group] = missing
+
+        if still_missing and round_number < max_rounds:
+            count = sum(len(keys) for keys in still_missing.values())
+            print(f"Round {round_number}: {count} keys missing in {len(still_missing)} groups, re-requesting")
+        pending = still_missing
+
+    for group, keys in pending.items():
+        for key in keys:
+            report['fallbacks'] += 1
+            resolve(group, key, fallback(group, key), False)
+
+    return results, report
+
+
+def print_packing_report(report: dict, log_print: Callable[[str], None] = print) -> None:
+    """Print request counts and the estimated input-token savings of packing."""
+    log_print(f"  Packed requests: {report['requests']} for {report['pairs']} pairs "
+              f"in {report['groups']} groups ({report['rounds']} rounds)")
+    log_print(f"  Repaired keys: {report['repaired']}, fallbacks: {report['fallbacks']}")
+    if report['unpacked_tokens']:
+        saved = report['unpacked_tokens'] - report['packed_tokens']
+        log_print(f"  Input tokens (est.): {report['packed_tokens']:,} packed vs "
+                  f"{report['unpacked_tokens']:,} per-pair "
+                  f"({saved:,} saved, {saved / report['unpacked_tokens']:.0%})")
+
+
+def add_packing_arguments(parser) -> None:
+    """Register the --packed options on an argparse parser."""
+    group = parser.add_argument_group('prompt packing')
+    group.add_argument('--packed', action='store_true',
+                       help="Send one JSON prompt per group instead of one prompt per pair")
+    group.add_argument('--max-rounds', type=int, default=DEFAULT_MAX_ROUNDS,
+                       help=f"Attempts per key, including re-requests for missing keys (default: {DEFAULT_MAX_ROUNDS})")
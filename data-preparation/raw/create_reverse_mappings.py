@@ -1,207 +1,226 @@
-#!/usr/bin/env python3
-"""
-Create reverse collocation mappings.
-
-This script takes the existing verb->noun and adjective->noun mappings
-and creates the reverse: noun->verbs and noun->adjectives.
-
-This allows the game to work in both directions:
-- "What verbs/adjectives go with this noun?"
-- "What nouns go with this verb/adjective?"
-"""
-
-import json
-from pathlib import Path
-
-INPUT_FILE = Path(__file__).parent.parent / "input" / "collocations.json"
-OUTPUT_FILE = Path(__file__).parent.parent / "input" / "collocations_complete.json"
-
-
-def load_collocations():
-    """Load existing collocation data."""
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-
-def create_reverse_mappings(collocations_data):
-    """
-    Create reverse mappings: noun -> [verbs/adjectives that pair with it].
-
-    Args:
-        collocations_data: The original collocation data
-
-    Returns:
-        dict of noun -> {verbs: [], adjectives: []}
-    """
-
-    reverse_map = {}
-
-    # Process each word in the collocation database
-    for word_jp, word_data in collocations_data['collocations'].items():
-        word_type = word_data['type']
-
-        # For each match (noun) this word pairs with
-        for match in word_data['matches']:
-            noun_jp = match['word']
-
-            # Initialize noun entry if not exists
-            if noun_jp not in reverse_map:
-                reverse_map[noun_jp] = {
-                    'word': noun_jp,
-                    'reading': match['reading'],
-                    'english': match['english'],
-                    'type': 'noun',
-                    'verbs': [],
-                    'adjectives': []
-                }
-
-            # Add this word to the appropriate list
-            pairing = {
-                'word': word_jp,
-                'reading': word_data['reading'],
-                'english': word_data['english'],
-                'score': match['score']
-            }
-
-            if word_type == 'verb':
-                reverse_map[noun_jp]['verbs'].append(pairing)
-            elif word_type == 'adjective':
-                reverse_map[noun_jp]['adjectives'].append(pairing)
-
-    # Sort each noun's verb/adjective lists by score (highest first)
-    for noun_data in reverse_map.values():
-        noun_data['verbs'].sort(key=lambda x: x['score'], reverse=True)
-        noun_data['adjectives'].sort(key=lambda x: x['score'], reverse=True)
-
-    return reverse_map
-
-
-def merge_bidirectional_data(original_data, reverse_map):
-    """
-    Merge original and reverse mappings into a complete bidirectional structure.
-
-    Structure:
-    {
-      "words": {
-        "verb_or_adj": {
-          "word": "...",
-          "type": "verb",
-          "matches": {
-            "nouns": [...]  // nouns that pair with this verb/adj
-          }
-        },
-        "noun": {
-          "word": "...",
-          "type": "noun",
-          "matches": {
-            "verbs": [...],      // verbs that pair with this noun
-            "adjectives": [...]  // adjectives that pair with this noun
-          }
-        }
-      }
-    }
-    """
-
-    merged = {
-        "version": "2.0.0",
-        "generatedAt": original_data['generatedAt'],
-        "totalPairs": original_data['totalPairs'],
-        "totalWords": original_data['totalWords'] + len(reverse_map),
-        "words": {}
-    }
-
-    # Add all original verbs and adjectives
-    for word_jp, word_data in original_data['collocations'].items():
-        merged['words'][word_jp] = {
-            'word': word_data['word'],
-            'reading': word_data['reading'],
-            'english': word_data['english'],
-            'type': word_data['type'],
-            'matches': {
-                'nouns': word_data['matches']
-            }
-        }
-
-    # Add all reverse-mapped nouns
-    for noun_jp, noun_data in reverse_map.items():
-        merged['words'][noun_jp] = {
-            'word': noun_data['word'],
-            'reading': noun_data['reading'],
-            'english': noun_data['english'],
-            'type': 'noun',
-            'matches': {
-                'verbs': noun_data['verbs'],
-                'adjectives': noun_data['adjectives']
-            }
-        }
-
-    return merged
-
-
-def save_complete_collocations(data):
-    """Save the complete bidirectional collocation data."""
-
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-    print(f"\nSaved complete collocation database")
-    print(f"Output: {OUTPUT_FILE}")
-
-
-def main():
-    """Main function."""
-    print("=" * 60)
-    print("Creating Reverse Collocation Mappings")
-    print("=" * 60)
-
-    # Load original data
-    print("\nLoading original collocation data...")
-    original_data = load_collocations()
-    print(f"  Original: {original_data['totalWords']} words, {original_data['totalPairs']} pairs")
-
-    # Create reverse mappings
-    print("\nCreating reverse mappings (noun -> verbs/adjectives)...")
-    reverse_map = create_reverse_mappings(original_data)
-    print(f"  Reverse: {len(reverse_map)} nouns")
-
-    # Calculate statistics
-    total_verb_links = sum(len(n['verbs']) for n in reverse_map.values())
-    total_adj_links = sum(len(n['adjectives']) for n in reverse_map.values())
-
-    print(f"\nReverse mapping statistics:")
-    print(f"  Nouns with verb pairings: {sum(1 for n in reverse_map.values() if n['verbs'])}")
-    print(f"  Nouns with adjective pairings: {sum(1 for n in reverse_map.values() if n['adjectives'])}")
-    print(f"  Total noun->verb links: {total_verb_links}")
-    print(f"  Total noun->adjective links: {total_adj_links}")
-
-    # Show example (skip if encoding issues)
-    try:
-        sample_noun = list(reverse_map.keys())[0]
-        sample_data = reverse_map[sample_noun]
-        print(f"\nExample: {sample_noun}")
-        print(f"  Verbs: {', '.join(v['word'] for v in sample_data['verbs'][:5])}")
-        print(f"  Adjectives: {', '.join(a['word'] for a in sample_data['adjectives'][:5])}")
-    except UnicodeEncodeError:
-        print("\nExample: [Japanese text - encoding not supported in console]")
-
-    # Merge into bidirectional structure
-    print("\nMerging into complete bidirectional structure...")
-    complete_data = merge_bidirectional_data(original_data, reverse_map)
-    print(f"  Total words in complete database: {complete_data['totalWords']}")
-
-    # Save
-    save_complete_collocations(complete_data)
-
-    print("\n" + "=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    print(f"Complete bidirectional collocation database created")
-    print(f"{complete_data['totalWords']} total words")
-    print(f"{original_data['totalWords']} verbs/adjectives -> nouns")
-    print(f"{len(reverse_map)} nouns -> verbs/adjectives")
-    print(f"Game can now work in both directions!")
-    print("=" * 60)
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Create reverse collocation mappings.
+
+This script takes the existing verb->noun and adjective->noun mappings
+and creates the reverse: noun->verbs and noun->adjectives.
+
+This allows the game to work in both directions:
+- "What verbs/adjectives go with this noun?"
+- "What nouns go with this verb/adjective?"
+
+The input is streamed one word at a time and the output written the same
+way, so apart from the graph itself nothing holds the whole data set.
+
+With --normalized it also writes collocations_normalized.json, where every
+word and edge references its vocabulary.json ID instead of repeating the
+reading and gloss (see collocation_refs.py), and fails if any ID does not
+resolve.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from collocation_graph import CollocationGraph, load_graph
+from collocation_refs import UnresolvedReferenceError, load_json, print_problems, write_normalized
+from json_stream import iter_entries, write_entries
+
+INPUT_FILE = Path(__file__).parent.parent / "input" / "collocations.json"
+OUTPUT_FILE = Path(__file__).parent.parent / "input" / "collocations_complete.json"
+VOCABULARY_FILE = Path(__file__).parent.parent / "input" / "vocabulary.json"
+
+
+def load_collocations():
+    """Stream the existing collocation data into a graph (the parsed file is never held whole)."""
+    header = {}
+    graph = CollocationGraph.from_collocation_entries(iter_entries(INPUT_FILE, 'collocations', header), header)
+    return header, graph
+
+
+def create_reverse_mappings(graph):
+    """
+    Create reverse mappings: noun -> [verbs/adjectives that pair with it].
+
+    Args:
+        graph: The collocation graph built from the original data
+
+    Yields:
+        (noun, {word, reading, english, type, verbs: [], adjectives: []}) one noun at a time
+    """
+
+    # The graph derives the reverse edges, each noun's verbs/adjectives sorted by score (highest first)
+    for noun_jp in graph.words_of_type('noun'):
+        noun_info = graph.info(noun_jp)
+        noun_data = {
+            'word': noun_jp,
+            'reading': noun_info['reading'],
+            'english': noun_info['english'],
+            'type': 'noun',
+        }
+        for kind, key in (('verb', 'verbs'), ('adjective', 'adjectives')):
+            noun_data[key] = [
+                {
+                    'word': word_jp,
+                    'reading': graph.info(word_jp)['reading'],
+                    'english': graph.info(word_jp)['english'],
+                    'score': score
+                }
+                for word_jp, score in graph.neighbor_scores(noun_jp, kind)
+            ]
+        yield noun_jp, noun_data
+
+
+def merge_bidirectional_data(original_header, graph):
+    """
+    Merge original and reverse mappings into a complete bidirectional structure.
+
+    Returns the header and a generator of the "words" entries: the original
+    verbs and adjectives, re-read from the input file one at a time, then
+    the reverse-mapped nouns.
+
+    Structure:
+    {
+      "words": {
+        "verb_or_adj": {
+          "word": "...",
+          "type": "verb",
+          "matches": {
+            "nouns": [...]  // nouns that pair with this verb/adj
+          }
+        },
+        "noun": {
+          "word": "...",
+          "type": "noun",
+          "matches": {
+            "verbs": [...],      // verbs that pair with this noun
+            "adjectives": [...]  // adjectives that pair with this noun
+          }
+        }
+      }
+    }
+    """
+
+    header = {
+        "version": "2.0.0",
+        "generatedAt": original_header['generatedAt'],
+        "totalPairs": original_header['totalPairs'],
+        "totalWords": original_header['totalWords'] + len(graph.words_of_type('noun')),
+    }
+
+    def entries():
+        # Add all original verbs and adjectives
+        for word_jp, word_data in iter_entries(INPUT_FILE, 'collocations'):
+            yield word_jp, {
+                'word': word_data['word'],
+                'reading': word_data['reading'],
+                'english': word_data['english'],
+                'type': word_data['type'],
+                'matches': {
+                    'nouns': word_data['matches']
+                }
+            }
+
+        # Add all reverse-mapped nouns
+        for noun_jp, noun_data in create_reverse_mappings(graph):
+            yield noun_jp, {
+                'word': noun_data['word'],
+                'reading': noun_data['reading'],
+                'english': noun_data['english'],
+                'type': 'noun',
+                'matches': {
+                    'verbs': noun_data['verbs'],
+                    'adjectives': noun_data['adjectives']
+                }
+            }
+
+    return header, entries()
+
+
+def save_complete_collocations(header, entries):
+    """Save the complete bidirectional collocation data, writing one word at a time."""
+
+    write_entries(OUTPUT_FILE, header, 'words', entries)
+
+    print(f"\nSaved complete collocation database")
+    print(f"Output: {OUTPUT_FILE}")
+
+
+def save_normalized_collocations():
+    """Save the vocabulary-ID normalized output and verify every reference resolves."""
+    print("\nWriting normalized output (vocabulary ID references)...")
+    try:
+        problems = write_normalized(load_graph(OUTPUT_FILE), load_json(VOCABULARY_FILE))
+    except UnresolvedReferenceError as e:
+        problems = e.problems
+    if problems:
+        print(f"  {len(problems)} unresolved vocabulary references:")
+        print_problems(problems)
+        sys.exit(1)
+    print("  Every referenced vocabulary ID resolves")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Create reverse collocation mappings")
+    parser.add_argument('--normalized', action='store_true',
+                        help="Also write collocations_normalized.json with vocabulary ID references")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Creating Reverse Collocation Mappings")
+    print("=" * 60)
+
+    # Load original data
+    print("\nLoading original collocation data...")
+    original_header, graph = load_collocations()
+    print(f"  Original: {original_header['totalWords']} words, {original_header['totalPairs']} pairs")
+
+    # Create reverse mappings
+    print("\nCreating reverse mappings (noun -> verbs/adjectives)...")
+    nouns = graph.words_of_type('noun')
+    print(f"  Reverse: {len(nouns)} nouns")
+
+    # Calculate statistics
+    total_verb_links = sum(graph.degree(noun, 'verb') for noun in nouns)
+    total_adj_links = sum(graph.degree(noun, 'adjective') for noun in nouns)
+
+    print(f"\nReverse mapping statistics:")
+    print(f"  Nouns with verb pairings: {sum(1 for noun in nouns if graph.degree(noun, 'verb'))}")
+    print(f"  Nouns with adjective pairings: {sum(1 for noun in nouns if graph.degree(noun, 'adjective'))}")
+    print(f"  Total noun->verb links: {total_verb_links}")
+    print(f"  Total noun->adjective links: {total_adj_links}")
+
+    # Show example (skip if encoding issues)
+    try:
+        sample_noun, sample_data = next(create_reverse_mappings(graph))
+        print(f"\nExample: {sample_noun}")
+        print(f"  Verbs: {', '.join(v['word'] for v in sample_data['verbs'][:5])}")
+        print(f"  Adjectives: {', '.join(a['word'] for a in sample_data['adjectives'][:5])}")
+    except UnicodeEncodeError:
+        print("\nExample: [Japanese text - encoding not supported in console]")
+
+    # Merge into bidirectional structure
+    print("\nMerging into complete bidirectional structure...")
+    header, entries = merge_bidirectional_data(original_header, graph)
+    print(f"  Total words in complete database: {header['totalWords']}")
+
+    # Save
+    save_complete_collocations(header, entries)
+    if args.normalized:
+        save_normalized_collocations()
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    print(f"Complete bidirectional collocation database created")
+    print(f"{header['totalWords']} total words")
+    print(f"{original_header['totalWords']} verbs/adjectives -> nouns")
+    print(f"{len(nouns)} nouns -> verbs/adjectives")
+    print(f"Game can now work in both directions!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,38 @@
 #!/usr/bin/env python3
-"""Convert vocabulary_by_type.json to a flat array with UUIDs for React app."""
+"""Convert vocabulary_by_type.json to a flat array with stable IDs for React app.
+
+IDs come from vocabulary_ids.word_id(), so a rebuild keeps the ID of every
+word whose japanese, reading and type are unchanged. When an earlier
+vocabulary.json is being replaced, the old -> new ID map is written next to
+it (vocabulary_id_migration.json). The map is chained onto the one already
+there, so it covers every earlier build. build.py publishes it to
+public/data, where the app applies it to progress stored under old IDs.
+"""
 
 import json
-import uuid
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from vocabulary_ids import MIGRATION_VERSION, assign_ids, compose_migrations, migration_map
+
 INPUT_FILE = Path(__file__).parent / "vocabulary_by_type.json"
 OUTPUT_FILE = Path(__file__).parent.parent / "input" / "vocabulary.json"
+MIGRATION_FILE = Path(__file__).parent.parent / "input" / "vocabulary_id_migration.json"
 
 def main():
     # Load vocabulary by type
     with open(INPUT_FILE, 'r', encoding='utf-8') as f:
         vocab_data = json.load(f)
 
-    # Flatten to array with UUIDs
+    # Flatten to array
     vocabulary = []
 
     for category, words in vocab_data['categories'].items():
         for word in words:
             vocabulary.append({
-                "id": str(uuid.uuid4()),
+                "id": None,
                 "japanese": word['japanese'],
                 "reading": word['reading'],
                 "english": word['english'],
@@ -29,6 +42,7 @@ def main():
 
     # Sort by frequency (descending) for better user experience
     vocabulary.sort(key=lambda x: x['frequency'], reverse=True)
+    assign_ids(vocabulary)
 
     # Create output structure
     output = {
@@ -38,6 +52,23 @@ def main():
         "vocabulary": vocabulary
     }
 
+    # Map the IDs of the vocabulary.json being replaced (a first build maps from nothing)
+    if OUTPUT_FILE.exists() or not MIGRATION_FILE.exists():
+        previous = {}
+        if OUTPUT_FILE.exists():
+            with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+        migration = migration_map(previous, output)
+        if MIGRATION_FILE.exists():
+            with open(MIGRATION_FILE, 'r', encoding='utf-8') as f:
+                earlier = json.load(f)
+            if earlier.get('version') == MIGRATION_VERSION:
+                migration = compose_migrations(earlier, migration)
+        with open(MIGRATION_FILE, 'w', encoding='utf-8') as f:
+            json.dump(migration, f, ensure_ascii=False, indent=2)
+        print(f"ID migration: {len(migration['ids'])} renumbered, {len(migration['removed'])} removed, "
+              f"{len(migration['added'])} added -> {MIGRATION_FILE}")
+
     # Write output
     with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
         json.dump(output, f, ensure_ascii=False, indent=2)
@@ -7,9 +7,13 @@ to guide learners without giving away direct answers.
 
 import json
 import os
+import sys
 from pathlib import Path
 from anthropic import Anthropic
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from collocation_graph import load_graph
+
 # Configuration
 INPUT_FILE = Path(__file__).parent.parent / "input" / "collocations_complete.json"
 OUTPUT_FILE = Path(__file__).parent.parent / "input" / "collocation_hints.json"
@@ -126,22 +130,13 @@ def main():
 
     # Load collocation data
     print("Loading collocation data...")
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    graph = load_graph(INPUT_FILE)
 
     # Get words to process (verbs and adjectives with noun matches)
     words_to_process = []
-    for word_jp, word_data in data['words'].items():
-        if word_data['type'] in ['verb', 'adjective']:
-            noun_matches = word_data.get('matches', {}).get('nouns', [])
-            if noun_matches and word_jp not in processed_words:
-                words_to_process.append({
-                    'word': word_jp,
-                    'reading': word_data['reading'],
-                    'english': word_data['english'],
-                    'type': word_data['type'],
-                    'matches': word_data['matches']
-                })
+    for word_jp in graph.words_of_type('verb', 'adjective'):
+        if graph.degree(word_jp) and word_jp not in processed_words:
+            words_to_process.append(dict(graph.info(word_jp), matches={'nouns': graph.matches(word_jp)}))
 
     total_words = len(words_to_process)
     print(f"\nTotal words to process: {total_words}")
@@ -10,13 +10,21 @@ Example hints:
 - 仕事 + する → "action of performing work"
 """
 
+import argparse
 import json
 import os
+import sys
 import time
 from pathlib import Path
-import anthropic
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from checkpoint_journal import CheckpointJournal
+from collocation_graph import load_graph
+from llm_cache import print_cache_stats
+from llm_engine import add_engine_arguments, engine_from_args, merge_groups, nest_results
+from pair_manifest import PairManifest, add_manifest_arguments, print_pair_diff, prompt_hash, select_pairs
+
 # Load environment variables from .env file
 load_dotenv(Path('../../.env'))
 
@@ -24,20 +32,17 @@ load_dotenv(Path('../../.env'))
 INPUT_FILE = Path('../input/collocations_complete.json')
 VOCAB_FILE = Path('../input/vocabulary.json')
 OUTPUT_FILE = Path('../output/reverse_hints.json')
-CHECKPOINT_FILE = Path('../output/reverse_hints_checkpoint.json')
+JOURNAL_FILE = Path('../output/reverse_hints.journal.jsonl')
+MANIFEST_FILE = Path('../output/reverse_hints.manifest.json')
 API_KEY = os.environ.get('ANTHROPIC_API_KEY')
 
 # API settings
 MODEL = 'claude-sonnet-4-5-20250929'  # Claude Sonnet 4.5
 MAX_TOKENS = 100
-BATCH_SIZE = 50  # Save checkpoint every 50 pairs
-RATE_LIMIT_DELAY = 0.5  # 500ms between requests
 
 def load_collocations():
-    """Load collocation data from JSON file."""
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data['words']
+    """Load the collocation graph."""
+    return load_graph(INPUT_FILE)
 
 def load_vocabulary():
     """Load vocabulary data from JSON file."""
@@ -49,40 +54,32 @@ def load_vocabulary():
         vocab_dict[entry['japanese']] = entry
     return vocab_dict
 
-def build_reverse_index(collocations, vocabulary):
+def build_reverse_index(graph, vocabulary):
     """
     Build reverse index: noun → list of (verb/adjective, score)
     """
     reverse_index = {}
 
-    for word, word_data in collocations.items():
-        word_type = word_data.get('type')
-        if word_type not in ['verb', 'adjective']:
+    for noun in graph.words_of_type('noun'):
+        if not graph.degree(noun):
             continue
 
-        matches = word_data.get('matches', {}).get('nouns', [])
-
-        for match in matches:
-            noun = match['word']
-            score = match.get('score', 0)
-
-            if noun not in reverse_index:
-                # Get noun data from vocabulary
-                noun_vocab = vocabulary.get(noun, {})
-                reverse_index[noun] = {
-                    'reading': noun_vocab.get('reading', ''),
-                    'english': noun_vocab.get('english', ''),
-                    'verbs': [],
-                    'adjectives': []
+        # Get noun data from vocabulary
+        noun_vocab = vocabulary.get(noun, {})
+        reverse_index[noun] = {
+            'reading': noun_vocab.get('reading', ''),
+            'english': noun_vocab.get('english', ''),
+        }
+        for kind, match_type in (('verb', 'verbs'), ('adjective', 'adjectives')):
+            reverse_index[noun][match_type] = [
+                {
+                    'word': word,
+                    'reading': graph.info(word)['reading'],
+                    'english': graph.info(word)['english'],
+                    'score': score
                 }
-
-            match_type = 'verbs' if word_type == 'verb' else 'adjectives'
-            reverse_index[noun][match_type].append({
-                'word': word,
-                'reading': word_data.get('reading', ''),
-                'english': word_data.get('english', ''),
-                'score': score
-            })
+                for word, score in graph.neighbor_scores(noun, kind)
+            ]
 
     # Sort by score (descending)
     for noun_data in reverse_index.values():
@@ -91,19 +88,13 @@ def build_reverse_index(collocations, vocabulary):
 
     return reverse_index
 
-def load_checkpoint():
-    """Load existing checkpoint if it exists."""
-    if CHECKPOINT_FILE.exists():
-        with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+def load_existing_hints():
+    """Load previously generated hints (empty if there is no output yet)."""
+    if OUTPUT_FILE.exists():
+        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)['hints']
     return {}
 
-def save_checkpoint(hints):
-    """Save checkpoint to avoid losing progress."""
-    with open(CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(hints, f, ensure_ascii=False, indent=2)
-    print(f"Checkpoint saved: {len(hints)} nouns processed")
-
 def generate_hint_prompt(noun_data, verb_adj_data, word_type):
     """
     Generate a prompt for Claude to create a VERB/ADJECTIVE-SPECIFIC hint.
@@ -157,33 +148,13 @@ Noun: {noun} ({noun_reading}) - {noun_english}
 
 Provide ONLY the hint phrase (2-8 words), nothing else."""
 
-def generate_hint_with_claude(client, noun_data, verb_adj_data, word_type):
-    """Generate a single hint using Claude API."""
-    prompt = generate_hint_prompt(noun_data, verb_adj_data, word_type)
-
-    try:
-        message = client.messages.create(
-            model=MODEL,
-            max_tokens=MAX_TOKENS,
-            messages=[{
-                "role": "user",
-                "content": prompt
-            }]
-        )
-
-        hint = message.content[0].text.strip()
-
-        # Remove quotes if present
-        hint = hint.strip('"').strip("'")
-
-        return hint
-
-    except Exception as e:
-        print(f"Error generating hint: {e}")
-        return f"{word_type} related to {noun_data['english']}"
-
 def main():
-    if not API_KEY:
+    parser = argparse.ArgumentParser(description="Generate reverse collocation hints using Claude API")
+    add_engine_arguments(parser)
+    add_manifest_arguments(parser, MANIFEST_FILE, always_incremental=True)
+    args = parser.parse_args()
+
+    if not API_KEY and not args.base_url and not args.cache_only and not args.show_diff:
         print("Error: ANTHROPIC_API_KEY not found in environment variables")
         print("Please set it in your .env file")
         return
@@ -199,58 +170,79 @@ def main():
 
     print(f"Found {len(reverse_index)} nouns with reverse collocations")
 
-    # Load existing checkpoint
-    hints = load_checkpoint()
-    print(f"Loaded checkpoint: {len(hints)} nouns already processed")
-
-    # Initialize Claude client
-    client = anthropic.Anthropic(api_key=API_KEY)
-
-    # Generate hints for each noun
-    total_nouns = len(reverse_index)
-    processed = len(hints)
-
-    for idx, (noun, noun_data) in enumerate(reverse_index.items(), 1):
-        if noun in hints:
-            continue
-
-        print(f"\n[{idx}/{total_nouns}] Processing noun: {noun}")
-
-        hints[noun] = {}
-
-        # Process verbs
-        for verb_data in noun_data['verbs']:
-            verb = verb_data['word']
-            print(f"  Generating hint for verb: {verb}")
+    engine = engine_from_args(args, model=MODEL, max_tokens=MAX_TOKENS)
+
+    # One prompt per (noun, verb/adjective) pair, in verb-then-adjective order
+    pairs = {}
+    prompts = {}
+    fallbacks = {}
+    for noun, noun_data in reverse_index.items():
+        noun_info = {
+            'word': noun,
+            'reading': noun_data['reading'],
+            'english': noun_data['english']
+        }
+        targets = [(verb_data, 'verb') for verb_data in noun_data['verbs']]
+        targets += [(adj_data, 'adjective') for adj_data in noun_data['adjectives']]
+
+        pairs[noun] = [target_data['word'] for target_data, _ in targets]
+        for target_data, word_type in targets:
+            key = (noun, target_data['word'])
+            prompts[key] = generate_hint_prompt(noun_info, target_data, word_type)
+            fallbacks[key] = f"{word_type} related to {noun_data['english']}"
+    prompt_hashes = {key: prompt_hash(prompt) for key, prompt in prompts.items()}
+
+    hints = load_existing_hints()
+    print(f"Loaded existing hints: {len(hints)} nouns")
+
+    # Hints from before manifests existed are taken as up to date
+    manifest = PairManifest(args.manifest)
+    if not len(manifest) and hints:
+        print(f"Seeded pair manifest from existing hints ({manifest.seed(hints, prompt_hashes, MODEL)} pairs)")
+
+    # Pairs finished by an interrupted run are replayed from the journal
+    journal = CheckpointJournal(JOURNAL_FILE)
+    resumed = journal.resume(prompt_hashes, engine.model)
+    manifest.update(resumed.values())
+    results = {pair: record['output'] for pair, record in resumed.items()}
+
+    diff = manifest.diff(prompt_hashes, engine.model)
+    print_pair_diff(diff)
+    if args.show_diff:
+        return
 
-            hint = generate_hint_with_claude(client, {
-                'word': noun,
-                'reading': noun_data['reading'],
-                'english': noun_data['english']
-            }, verb_data, 'verb')
+    # Only pairs that are new, changed or previously fell back are generated
+    pending = select_pairs(pairs, diff.dirty)
+    jobs = [((noun, target), prompts[(noun, target)], fallbacks[(noun, target)])
+            for noun, targets in pending.items() for target in targets]
 
-            hints[noun][verb] = hint
-            time.sleep(RATE_LIMIT_DELAY)
+    print(f"Generating {len(jobs)} hints for {len(pending)} nouns "
+          f"(concurrency {engine.concurrency}, {engine.requests_per_second} req/s)")
 
-        # Process adjectives
-        for adj_data in noun_data['adjectives']:
-            adj = adj_data['word']
-            print(f"  Generating hint for adjective: {adj}")
+    total_nouns = len(pending)
+    remaining = {noun: len(targets) for noun, targets in pending.items()}
+    progress = {'processed': 0}
 
-            hint = generate_hint_with_claude(client, {
-                'word': noun,
-                'reading': noun_data['reading'],
-                'english': noun_data['english']
-            }, adj_data, 'adjective')
+    def on_result(key, hint, ok):
+        """Record and journal each hint as it completes."""
+        noun, target = key
+        # A failed pair keeps its existing hint; the fallback only fills new pairs
+        if ok or target not in hints.get(noun, {}):
+            results[key] = hint
+        journal.append(manifest.record(noun, target, prompt_hashes[key], engine.model, hint, ok))
+        remaining[noun] -= 1
+        if remaining[noun]:
+            return
 
-            hints[noun][adj] = hint
-            time.sleep(RATE_LIMIT_DELAY)
+        progress['processed'] += 1
+        print(f"[{progress['processed']}/{total_nouns}] Finished noun: {noun}")
 
-        processed += 1
+    engine.run_sync(jobs, on_result=on_result, postprocess=lambda text: text.strip().strip('"').strip("'"))
 
-        # Save checkpoint periodically
-        if processed % BATCH_SIZE == 0:
-            save_checkpoint(hints)
+    # Merge into the existing hints, in reverse-index order, dropping removed pairs
+    hints = merge_groups(pairs, hints, nest_results(pairs, results))
+    hints.update({noun: {} for noun, targets in pairs.items() if not targets})
+    hints = {noun: hints[noun] for noun in reverse_index if noun in hints}
 
     # Save final output
     output_data = {
@@ -263,13 +255,16 @@ def main():
     with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
         json.dump(output_data, f, ensure_ascii=False, indent=2)
 
+    manifest.discard(diff.removed)
+    manifest.save()
+    journal.discard()
+
     print(f"\n✅ Complete! Generated hints for {len(hints)} nouns")
+    print(f"API requests: {engine.stats['requests']} ({engine.stats['retries']} retries, "
+          f"{engine.stats['failures']} failures)")
+    print_cache_stats(engine.cache)
     print(f"Output saved to: {OUTPUT_FILE}")
-
-    # Clean up checkpoint
-    if CHECKPOINT_FILE.exists():
-        CHECKPOINT_FILE.unlink()
-        print("Checkpoint file removed")
+    print(f"Pair manifest: {args.manifest} ({len(manifest)} pairs)")
 
 if __name__ == '__main__':
     main()
@@ -10,13 +10,19 @@ Example hints:
 - する + 仕事 → "activities you perform"
 """
 
+import argparse
 import json
 import os
+import sys
 import time
 from pathlib import Path
 import anthropic
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from collocation_graph import load_graph
+from llm_cache import add_cache_arguments, cache_from_args, call_llm, print_cache_stats
+
 # Load environment variables from .env file
 load_dotenv(Path('../../.env'))
 
@@ -33,10 +39,8 @@ BATCH_SIZE = 50  # Save checkpoint every 50 pairs
 RATE_LIMIT_DELAY = 0.5  # 500ms between requests to respect rate limits
 
 def load_collocations():
-    """Load collocation data from JSON file."""
-    with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data['words']
+    """Load collocation data as a CollocationGraph."""
+    return load_graph(INPUT_FILE)
 
 def load_checkpoint():
     """Load existing checkpoint if it exists."""
@@ -100,22 +104,17 @@ BAD EXAMPLES (these just describe the verb):
 
 Your hint for {noun} ({noun_english}) when paired with {verb} ({verb_english}):"""
 
-def generate_hint(client, verb_data, noun_data):
+def generate_hint(client, verb_data, noun_data, cache=None):
     """
     Generate a specialized hint for a single verb-noun pair using Claude API.
+
+    Cached responses are reused; returns (hint, from_api).
     """
     prompt = generate_hint_prompt(verb_data, noun_data)
+    misses = cache.misses if cache else None
 
     try:
-        message = client.messages.create(
-            model=MODEL,
-            max_tokens=MAX_TOKENS,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-
-        hint = message.content[0].text.strip()
+        hint = call_llm(client, prompt, model=MODEL, max_tokens=MAX_TOKENS, cache=cache).strip()
 
         # Clean up the hint (remove only outer quotes and leading/trailing punctuation)
         # Remove outer quotes if present
@@ -132,32 +131,37 @@ def generate_hint(client, verb_data, noun_data):
             # Truncate at 8 words
             hint = ' '.join(hint.split()[:8])
 
-        return hint
+        return hint, cache is None or cache.misses != misses
 
     except Exception as e:
         print(f"Error generating hint for {verb_data['word']} + {noun_data['word']}: {e}")
-        return "related items"  # Fallback
+        return "related items", False  # Fallback
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Generate specialized collocation hints using Claude API")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+    cache = cache_from_args(args)
+
     print("=" * 80)
     print("SPECIALIZED HINT GENERATION")
     print("=" * 80)
     print()
 
     # Check for API key
-    if not API_KEY:
+    if not API_KEY and not args.cache_only:
         print("ERROR: ANTHROPIC_API_KEY environment variable not set!")
         print("Please set it with: export ANTHROPIC_API_KEY='your-key-here'")
         return
 
     # Initialize Claude client
-    client = anthropic.Anthropic(api_key=API_KEY)
+    client = None if args.cache_only else anthropic.Anthropic(api_key=API_KEY)
 
     # Load data
     print("Loading collocation data...")
-    collocations = load_collocations()
-    print(f"Loaded {len(collocations)} verbs/adjectives")
+    graph = load_collocations()
+    print(f"Loaded {len(graph.words_of_type('verb', 'adjective'))} verbs/adjectives")
     print()
 
     # Load checkpoint if exists
@@ -167,10 +171,7 @@ def main():
         print()
 
     # Calculate total pairs (skip entries without matches)
-    total_pairs = 0
-    for data in collocations.values():
-        if 'matches' in data and 'nouns' in data['matches']:
-            total_pairs += len(data['matches']['nouns'])
+    total_pairs = graph.pair_count
 
     processed_pairs = sum(len(noun_hints) for noun_hints in hints.values())
     print(f"Total pairs to process: {total_pairs}")
@@ -189,23 +190,20 @@ def main():
     batch_counter = 0
 
     # Process each verb
-    for verb, verb_data in collocations.items():
+    for verb in graph.words_of_type('verb', 'adjective'):
         # Skip if already processed
         if verb in hints:
             continue
 
-        # Skip if no noun matches
-        if 'matches' not in verb_data or 'nouns' not in verb_data['matches']:
-            continue
-
+        verb_data = graph.info(verb)
         hints[verb] = {}
 
         # Process each noun for this verb
-        for noun_data in verb_data['matches']['nouns']:
+        for noun_data in graph.matches(verb):
             noun = noun_data['word']
 
             # Generate hint using Claude
-            hint = generate_hint(client, verb_data, noun_data)
+            hint, from_api = generate_hint(client, verb_data, noun_data, cache)
             hints[verb][noun] = hint
 
             batch_counter += 1
@@ -228,8 +226,9 @@ def main():
             if batch_counter % BATCH_SIZE == 0:
                 save_checkpoint(hints)
 
-            # Rate limiting
-            time.sleep(RATE_LIMIT_DELAY)
+            # Rate limiting (cached responses need no delay)
+            if from_api:
+                time.sleep(RATE_LIMIT_DELAY)
 
         # Save checkpoint after each verb
         save_checkpoint(hints)
@@ -263,6 +262,7 @@ def main():
     print(f"  Time elapsed: {elapsed/60:.1f} minutes")
     print(f"  Average rate: {total_pairs/elapsed:.1f} pairs/second")
     print(f"  Verbs processed: {len(hints)}")
+    print_cache_stats(cache)
     print()
 
     # Clean up checkpoint
@@ -5,12 +5,18 @@ This script analyzes the actual collocations and creates specific, meaningful hi
 that are tailored to each verb/adjective's actual usage patterns.
 """
 
+import argparse
 import json
 import os
+import sys
 from pathlib import Path
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from collocation_graph import load_graph
+from llm_cache import add_cache_arguments, cache_from_args, call_llm, print_cache_stats
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -33,13 +39,34 @@ def save_checkpoint(checkpoint):
     with open(CHECKPOINT_FILE, 'w', encoding='utf-8') as f:
         json.dump(checkpoint, f, ensure_ascii=False, indent=2)
 
-def refine_hints_for_word(client, word_data, old_hints):
+def parse_hints_response(response_text):
+    """Parse Claude's JSON object of noun -> hint (markdown code fences allowed)."""
+    response_text = response_text.strip()
+
+    # Remove markdown code blocks if present
+    if response_text.startswith('```'):
+        # Find the first { and last }
+        start = response_text.find('{')
+        end = response_text.rfind('}')
+        if start != -1 and end != -1:
+            response_text = response_text[start:end+1]
+
+    try:
+        hints = json.loads(response_text)
+    except ValueError as e:
+        raise ValueError(f"{e} in response: {response_text[:200]}") from e
+    if not isinstance(hints, dict):
+        raise ValueError(f"expected a JSON object, got: {response_text[:200]}")
+    return hints
+
+def refine_hints_for_word(client, word_data, old_hints, cache=None):
     """Refine contextual hints for a word's collocations using Claude API.
 
     Args:
         client: Anthropic client
         word_data: Dictionary with word, reading, english, type, and noun matches
         old_hints: Previously generated hints for comparison
+        cache: Optional llm_cache.ResponseCache for replaying earlier responses
 
     Returns:
         Dictionary mapping noun words to refined hint text
@@ -126,43 +153,29 @@ Example format:
 Return ONLY the JSON object, no other text."""
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=3000,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        # Extract JSON from response
-        response_text = response.content[0].text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith('```'):
-            # Find the first { and last }
-            start = response_text.find('{')
-            end = response_text.rfind('}')
-            if start != -1 and end != -1:
-                response_text = response_text[start:end+1]
-
-        # Try to parse JSON
-        hints = json.loads(response_text)
-
-        return hints
+        # Parsed inside call_llm so a malformed response is never cached
+        return call_llm(client, prompt, model="claude-sonnet-4-20250514",
+                        max_tokens=3000, cache=cache, validate=parse_hints_response)
 
     except Exception as e:
         print(f"Error refining hints for {word_jp}: {e}")
-        print(f"Response: {response_text[:200] if 'response_text' in locals() else 'No response'}")
         return {}
 
 def main():
     """Main function to refine hints in batches."""
+    parser = argparse.ArgumentParser(description="Refine collocation hints using Claude API")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+    cache = cache_from_args(args)
+
     # Check for API key
     api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
+    if not api_key and not args.cache_only:
         print("Error: ANTHROPIC_API_KEY environment variable not set")
         return
 
     # Initialize client
-    client = Anthropic(api_key=api_key)
+    client = None if args.cache_only else Anthropic(api_key=api_key)
 
     # Load checkpoint
     checkpoint = load_checkpoint()
@@ -171,8 +184,7 @@ def main():
 
     # Load collocation data
     print("Loading collocation data...")
-    with open(COLLOCATIONS_FILE, 'r', encoding='utf-8') as f:
-        collocation_data = json.load(f)
+    graph = load_graph(COLLOCATIONS_FILE)
 
     # Load old hints
     print("Loading old hints...")
@@ -182,17 +194,9 @@ def main():
 
     # Get words to process (verbs and adjectives with noun matches)
     words_to_process = []
-    for word_jp, word_data in collocation_data['words'].items():
-        if word_data['type'] in ['verb', 'adjective']:
-            noun_matches = word_data.get('matches', {}).get('nouns', [])
-            if noun_matches and word_jp not in processed_words:
-                words_to_process.append({
-                    'word': word_jp,
-                    'reading': word_data['reading'],
-                    'english': word_data['english'],
-                    'type': word_data['type'],
-                    'matches': word_data['matches']
-                })
+    for word_jp in graph.words_of_type('verb', 'adjective'):
+        if graph.degree(word_jp) and word_jp not in processed_words:
+            words_to_process.append(dict(graph.info(word_jp), matches={'nouns': graph.matches(word_jp)}))
 
     total_words = len(words_to_process)
     print(f"\nTotal words to process: {total_words}")
@@ -219,7 +223,7 @@ def main():
                 print(f"  Noun collocations: {len(word_data['matches']['nouns'])}")
 
                 # Refine hints
-                hints = refine_hints_for_word(client, word_data, old_hints)
+                hints = refine_hints_for_word(client, word_data, old_hints, cache)
 
                 if hints:
                     # Store hints for this word's collocations
@@ -236,10 +240,11 @@ def main():
                 save_checkpoint(checkpoint)
 
             print(f"\nBatch {batch_count} complete!")
+            print_cache_stats(cache)
             print(f"Total progress: {len(processed_words)}/{len(old_hints)} words")
 
             # Ask user to continue
-            if i + BATCH_SIZE < total_words:
+            if i + BATCH_SIZE < total_words and not args.cache_only:
                 response = input("\nPress Enter to continue to next batch, or 'q' to quit: ").strip().lower()
                 if response == 'q':
                     print("\nStopping. Progress saved.")
@@ -9,9 +9,14 @@ Checks:
 """
 
 import json
+import sys
 from pathlib import Path
 from collections import Counter
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from collocation_graph import load_graph
+
 # Load the generated hints
 HINTS_FILE = Path('../output/specialized_hints.json')
 COLLOCATIONS_FILE = Path('../input/collocations_complete.json')
@@ -21,12 +26,9 @@ def load_data():
     with open(HINTS_FILE, 'r', encoding='utf-8') as f:
         hints_data = json.load(f)
 
-    with open(COLLOCATIONS_FILE, 'r', encoding='utf-8') as f:
-        collocations_data = json.load(f)
-
-    return hints_data['hints'], collocations_data['words']
+    return hints_data['hints'], load_graph(COLLOCATIONS_FILE)
 
-def validate_coverage(hints, collocations):
+def validate_coverage(hints, graph):
     """Check that every collocation pair has a hint."""
     print("=" * 80)
     print("COVERAGE VALIDATION")
@@ -38,21 +40,16 @@ def validate_coverage(hints, collocations):
     total_pairs = 0
     covered_pairs = 0
 
-    for verb, verb_data in collocations.items():
-        if 'matches' not in verb_data or 'nouns' not in verb_data['matches']:
-            continue
+    for verb, noun, _ in graph.pairs():
+        total_pairs += 1
 
-        for noun_data in verb_data['matches']['nouns']:
-            noun = noun_data['word']
-            total_pairs += 1
-
-            if verb not in hints:
-                missing_verbs.append(verb)
-                missing_pairs.append(f"{verb} + {noun}")
-            elif noun not in hints[verb]:
-                missing_pairs.append(f"{verb} + {noun}")
-            else:
-                covered_pairs += 1
+        if verb not in hints:
+            missing_verbs.append(verb)
+            missing_pairs.append(f"{verb} + {noun}")
+        elif noun not in hints[verb]:
+            missing_pairs.append(f"{verb} + {noun}")
+        else:
+            covered_pairs += 1
 
     coverage_pct = (covered_pairs / total_pairs * 100) if total_pairs > 0 else 0
 
@@ -270,10 +267,10 @@ def main():
     print()
 
     # Load data
-    hints, collocations = load_data()
+    hints, graph = load_data()
 
     # Run validations
-    coverage_ok = validate_coverage(hints, collocations)
+    coverage_ok = validate_coverage(hints, graph)
     specificity_quality = validate_specificity(hints)
     length_pct = validate_length(hints)
     validate_diversity(hints)
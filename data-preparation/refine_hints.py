@@ -11,6 +11,8 @@ from typing import Dict, List, Tuple
 import re
 import sys
 
+from keyword_classifier import compile_rules
+
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
     import io
@@ -18,6 +20,217 @@ if sys.platform == 'win32':
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 
+# Semantic patterns - map keywords (matched as whole words in the lowercased meaning) to category hints.
+# The first rule with a matching keyword wins.
+SEMANTIC_PATTERNS = [
+    # Time and temporal
+    ('time and temporal expressions', ['time', 'hour', 'minute', 'second', 'day', 'week', 'month', 'year', 'morning', 'afternoon', 'evening', 'night', 'today', 'tomorrow', 'yesterday', 'date', 'schedule', 'deadline', 'period', 'era', 'season', 'age']),
+    ('seasons and months', ['spring', 'summer', 'fall', 'autumn', 'winter', 'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october', 'november', 'december']),
+
+    # People and relationships
+    ('people', ['person', 'people', 'human', 'someone', 'man', 'woman', 'boy', 'girl', 'child', 'children', 'kid', 'baby', 'adult']),
+    ('family members', ['family', 'mother', 'father', 'parent', 'son', 'daughter', 'sibling', 'brother', 'sister', 'grandfather', 'grandmother', 'uncle', 'aunt', 'cousin', 'relative', 'husband', 'wife', 'spouse']),
+    ('friends and associates', ['friend', 'companion', 'colleague', 'coworker', 'partner', 'acquaintance', 'classmate', 'teammate', 'roommate']),
+    ('education roles', ['teacher', 'professor', 'instructor', 'student', 'pupil', 'learner', 'principal', 'tutor']),
+    ('medical professionals and patients', ['doctor', 'nurse', 'patient', 'dentist', 'physician', 'surgeon', 'therapist', 'medical']),
+    ('occupations and workplace roles', ['employee', 'employer', 'worker', 'staff', 'boss', 'manager', 'director', 'president', 'ceo', 'executive', 'officer', 'secretary', 'assistant', 'clerk']),
+    ('service and transportation roles', ['driver', 'pilot', 'captain', 'conductor', 'operator', 'chef', 'cook', 'waiter', 'server', 'customer', 'client', 'guest']),
+    ('artists and creators', ['artist', 'musician', 'singer', 'actor', 'actress', 'writer', 'author', 'painter', 'photographer', 'designer']),
+    ('public service and legal roles', ['police', 'officer', 'detective', 'guard', 'soldier', 'firefighter', 'lawyer', 'attorney', 'judge']),
+
+    # Places and locations
+    ('places and locations', ['place', 'location', 'area', 'region', 'spot', 'site', 'position']),
+    ('buildings and rooms', ['house', 'home', 'apartment', 'room', 'bedroom', 'bathroom', 'kitchen', 'living room', 'dining room', 'office', 'building', 'floor', 'ceiling', 'wall', 'door', 'window', 'roof', 'garage']),
+    ('educational facilities', ['school', 'university', 'college', 'classroom', 'library', 'laboratory', 'campus', 'dormitory', 'gym', 'gymnasium']),
+    ('medical facilities', ['hospital', 'clinic', 'pharmacy', "doctor's office"]),
+    ('commercial and public facilities', ['store', 'shop', 'market', 'supermarket', 'mall', 'department store', 'restaurant', 'cafe', 'bar', 'hotel', 'bank', 'post office', 'station', 'airport', 'port']),
+    ('recreational and natural places', ['park', 'garden', 'zoo', 'museum', 'theater', 'cinema', 'stadium', 'temple', 'shrine', 'church', 'beach', 'mountain', 'forest', 'river', 'lake', 'sea', 'ocean']),
+    ('geographic locations', ['city', 'town', 'village', 'country', 'nation', 'prefecture', 'capital', 'downtown', 'suburb', 'neighborhood', 'street', 'road', 'avenue']),
+    ('specific places', ['tokyo', 'osaka', 'kyoto', 'japan', 'america', 'china', 'korea', 'europe', 'asia']),
+
+    # Things and objects
+    ('things and objects', ['thing', 'object', 'item', 'stuff', 'matter', 'material', 'substance']),
+    ('reading materials and documents', ['book', 'magazine', 'newspaper', 'journal', 'novel', 'textbook', 'dictionary', 'document', 'paper', 'letter', 'mail', 'card', 'note', 'report', 'article', 'story', 'text']),
+    ('stationery and office items', ['pen', 'pencil', 'notebook', 'eraser', 'ruler', 'scissors', 'tape', 'desk', 'chair', 'table', 'shelf', 'box', 'bag', 'briefcase', 'backpack']),
+    ('technology and electronics', ['computer', 'laptop', 'phone', 'smartphone', 'tablet', 'camera', 'television', 'tv', 'radio', 'video', 'cd', 'dvd', 'recorder', 'printer', 'keyboard', 'mouse', 'screen', 'internet', 'email', 'website', 'software', 'app', 'program']),
+    ('vehicles and transportation', ['car', 'vehicle', 'automobile', 'bus', 'train', 'subway', 'taxi', 'bicycle', 'bike', 'motorcycle', 'truck', 'ship', 'boat', 'airplane', 'plane']),
+    ('clothing and accessories', ['clothes', 'clothing', 'shirt', 't-shirt', 'pants', 'trousers', 'skirt', 'dress', 'suit', 'coat', 'jacket', 'sweater', 'shoes', 'hat', 'cap', 'glasses', 'watch', 'jewelry', 'ring', 'necklace']),
+    ('food and meals', ['food', 'meal', 'breakfast', 'lunch', 'dinner', 'dish', 'rice', 'bread', 'meat', 'fish', 'chicken', 'beef', 'pork', 'vegetable', 'fruit', 'egg', 'cheese', 'butter', 'sugar', 'salt', 'pepper', 'sauce']),
+    ('beverages', ['water', 'tea', 'coffee', 'juice', 'milk', 'beer', 'wine', 'alcohol', 'drink', 'beverage', 'soda', 'cola']),
+    ('medicine and supplements', ['medicine', 'drug', 'pill', 'tablet', 'vitamin', 'supplement', 'injection', 'vaccine']),
+    ('money and finances', ['money', 'cash', 'coin', 'bill', 'dollar', 'yen', 'price', 'cost', 'fee', 'salary', 'wage', 'income', 'payment', 'deposit', 'debt', 'loan', 'tax', 'budget']),
+    ('furniture and household items', ['furniture', 'sofa', 'couch', 'bed', 'mattress', 'pillow', 'blanket', 'sheet', 'towel', 'curtain', 'lamp', 'light', 'clock']),
+    ('kitchenware and utensils', ['dish', 'plate', 'bowl', 'cup', 'glass', 'mug', 'fork', 'knife', 'spoon', 'chopsticks', 'pot', 'pan', 'kettle']),
+    ('toys and games', ['ball', 'game', 'toy', 'doll', 'cards', 'puzzle']),
+    ('tools and equipment', ['tool', 'equipment', 'machine', 'device', 'instrument', 'engine', 'motor']),
+    ('small objects and parts', ['key', 'lock', 'battery', 'wire', 'cable', 'switch', 'button', 'handle']),
+
+    # Activities and events
+    ('work and employment', ['work', 'job', 'task', 'duty', 'business', 'occupation', 'career', 'profession', 'labor', 'employment']),
+    ('academic and study activities', ['study', 'learning', 'education', 'training', 'practice', 'lesson', 'course', 'class', 'lecture', 'exam', 'test', 'quiz', 'homework', 'assignment', 'research']),
+    ('meetings and discussions', ['meeting', 'conference', 'discussion', 'talk', 'conversation', 'chat', 'debate', 'interview', 'presentation', 'speech']),
+    ('celebrations and events', ['party', 'celebration', 'festival', 'event', 'ceremony', 'wedding', 'funeral', 'birthday', 'anniversary']),
+    ('sports and physical activities', ['sport', 'exercise', 'training', 'practice', 'game', 'match', 'competition', 'race', 'running', 'swimming', 'tennis', 'soccer', 'baseball', 'basketball', 'golf']),
+    ('hobbies and leisure', ['hobby', 'leisure', 'recreation', 'entertainment', 'fun', 'amusement', 'play']),
+    ('travel and tourism', ['travel', 'trip', 'journey', 'tour', 'vacation', 'holiday', 'visit', 'sightseeing']),
+    ('shopping and commerce', ['shopping', 'purchase', 'buying', 'selling', 'sale', 'trade', 'order']),
+    ('cooking and food preparation', ['cooking', 'baking', 'preparing', 'meal preparation']),
+    ('cleaning and housework', ['cleaning', 'washing', 'sweeping', 'wiping', 'tidying', 'organizing', 'laundry']),
+    ('movement and transportation', ['driving', 'riding', 'walking', 'running', 'moving', 'going', 'coming', 'arriving', 'departing', 'leaving', 'entering', 'exiting']),
+    ('cultural and creative activities', ['reading', 'writing', 'drawing', 'painting', 'singing', 'playing', 'listening', 'watching', 'seeing', 'looking', 'hearing']),
+    ('rest and posture', ['sleeping', 'waking', 'resting', 'relaxing', 'lying', 'sitting', 'standing']),
+    ('eating and drinking', ['eating', 'drinking', 'consuming', 'tasting']),
+    ('wearing and clothing', ['wearing', 'putting on', 'taking off', 'dressing']),
+    ('opening and closing', ['opening', 'closing', 'shutting', 'locking', 'unlocking']),
+    ('beginning and ending', ['starting', 'beginning', 'ending', 'finishing', 'completing', 'stopping', 'continuing']),
+    ('creation and production', ['making', 'creating', 'building', 'constructing', 'producing', 'manufacturing']),
+    ('damage and repair', ['breaking', 'destroying', 'damaging', 'ruining', 'fixing', 'repairing', 'mending']),
+    ('giving and receiving', ['giving', 'providing', 'offering', 'presenting', 'handing', 'delivering', 'sending', 'receiving', 'getting', 'obtaining', 'acquiring']),
+    ('showing and explaining', ['showing', 'displaying', 'exhibiting', 'demonstrating', 'explaining', 'teaching', 'telling', 'informing', 'notifying']),
+    ('helping and support', ['helping', 'assisting', 'supporting', 'aiding', 'serving', 'caring']),
+    ('using and operating', ['using', 'utilizing', 'employing', 'applying', 'operating', 'handling']),
+    ('choosing and deciding', ['choosing', 'selecting', 'deciding', 'determining', 'picking']),
+    ('mental activities', ['thinking', 'considering', 'pondering', 'reflecting', 'remembering', 'forgetting', 'knowing', 'understanding', 'believing', 'imagining']),
+    ('emotions and feelings', ['feeling', 'emotion', 'mood', 'happiness', 'joy', 'sadness', 'anger', 'fear', 'worry', 'anxiety', 'excitement', 'surprise', 'interest', 'love', 'hate', 'like', 'dislike']),
+    ('desires and needs', ['wanting', 'desiring', 'wishing', 'hoping', 'needing', 'requiring']),
+
+    # Abstract concepts
+    ('ideas and concepts', ['idea', 'concept', 'thought', 'opinion', 'view', 'belief', 'theory', 'principle', 'rule', 'law', 'regulation', 'policy']),
+    ('problems and issues', ['problem', 'issue', 'matter', 'question', 'difficulty', 'trouble', 'challenge', 'concern']),
+    ('results and solutions', ['solution', 'answer', 'result', 'outcome', 'consequence', 'effect', 'impact', 'influence']),
+    ('planning and preparation', ['plan', 'planning', 'preparation', 'arrangement', 'organization', 'scheme', 'project', 'program']),
+    ('goals and objectives', ['goal', 'aim', 'objective', 'purpose', 'target', 'intention']),
+    ('reasons and causes', ['reason', 'cause', 'factor', 'basis', 'ground', 'motive']),
+    ('methods and processes', ['way', 'method', 'means', 'manner', 'style', 'approach', 'technique', 'system', 'process', 'procedure']),
+    ('information and knowledge', ['information', 'data', 'fact', 'detail', 'knowledge', 'news', 'story', 'rumor']),
+    ('language and linguistics', ['language', 'word', 'vocabulary', 'grammar', 'pronunciation', 'accent', 'translation', 'interpretation']),
+    ('culture and customs', ['culture', 'custom', 'tradition', 'habit', 'manner', 'etiquette', 'courtesy', 'politeness']),
+    ('social groups and organizations', ['society', 'community', 'public', 'social', 'group', 'team', 'club', 'organization', 'company', 'corporation', 'firm', 'business']),
+    ('government and politics', ['government', 'politics', 'political', 'administration', 'policy', 'law', 'legislation']),
+    ('economics and business', ['economy', 'economic', 'finance', 'financial', 'market', 'industry', 'trade', 'commerce', 'business']),
+    ('science and technology', ['science', 'scientific', 'technology', 'technical', 'research', 'study', 'experiment', 'discovery', 'invention']),
+    ('arts and culture', ['art', 'artistic', 'music', 'musical', 'literature', 'literary', 'culture', 'cultural']),
+    ('history and time periods', ['history', 'historical', 'past', 'ancient', 'modern', 'traditional', 'contemporary']),
+    ('nature and environment', ['nature', 'natural', 'environment', 'environmental', 'ecology', 'ecological', 'weather', 'climate', 'temperature']),
+    ('health and medical', ['health', 'healthy', 'medical', 'medicine', 'illness', 'disease', 'sickness', 'injury', 'pain', 'symptom', 'treatment', 'cure', 'care']),
+    ('life and existence', ['life', 'living', 'birth', 'death', 'growth', 'development', 'change', 'evolution']),
+    ('qualities and characteristics', ['quality', 'characteristic', 'feature', 'property', 'attribute', 'trait', 'nature']),
+    ('quantities and measurements', ['size', 'amount', 'quantity', 'number', 'degree', 'level', 'extent', 'measure', 'measurement']),
+    ('appearance and design', ['color', 'shape', 'form', 'appearance', 'look', 'design', 'pattern', 'style']),
+    ('sounds', ['sound', 'noise', 'voice', 'volume', 'tone', 'pitch']),
+    ('smells and scents', ['smell', 'scent', 'odor', 'fragrance', 'aroma']),
+    ('tastes', ['taste', 'flavor']),
+    ('touch and texture', ['touch', 'feel', 'texture', 'surface']),
+    ('light and darkness', ['light', 'brightness', 'darkness', 'shadow', 'shine', 'glow']),
+    ('abilities and powers', ['power', 'energy', 'force', 'strength', 'ability', 'capability', 'skill', 'talent', 'gift']),
+    ('importance and meaning', ['importance', 'significance', 'value', 'worth', 'meaning', 'sense', 'implication']),
+    ('comparisons and differences', ['difference', 'distinction', 'contrast', 'comparison', 'similarity', 'likeness']),
+    ('relationships and connections', ['relationship', 'relation', 'connection', 'link', 'association', 'bond', 'tie']),
+    ('states and conditions', ['state', 'status', 'situation', 'condition', 'circumstance', 'case', 'position']),
+    ('changes and transformations', ['change', 'transformation', 'conversion', 'shift', 'transition', 'alteration', 'modification', 'adjustment']),
+    ('increases and decreases', ['increase', 'growth', 'rise', 'expansion', 'decrease', 'reduction', 'decline', 'fall']),
+    ('success and failure', ['success', 'achievement', 'accomplishment', 'victory', 'win', 'failure', 'defeat', 'loss', 'mistake', 'error']),
+    ('beginnings and endings', ['beginning', 'start', 'origin', 'source', 'end', 'ending', 'finish', 'conclusion', 'termination']),
+    ('parts and wholes', ['part', 'portion', 'section', 'segment', 'piece', 'fragment', 'component', 'element', 'unit', 'whole', 'entirety', 'total']),
+    ('spatial positions', ['inside', 'interior', 'inner', 'outside', 'exterior', 'outer', 'surface', 'top', 'bottom', 'front', 'back', 'side', 'left', 'right', 'center', 'middle', 'edge', 'corner']),
+    ('directions and routes', ['direction', 'course', 'route', 'path', 'way']),
+    ('dimensions and distances', ['distance', 'length', 'width', 'height', 'depth', 'thickness']),
+    ('speed and pace', ['speed', 'pace', 'rate', 'velocity']),
+    ('order and structure', ['order', 'sequence', 'series', 'arrangement', 'organization', 'structure', 'system']),
+    ('permission and opposition', ['permission', 'approval', 'consent', 'agreement', 'acceptance', 'refusal', 'rejection', 'denial', 'opposition', 'objection']),
+    ('promises and commitments', ['promise', 'commitment', 'pledge', 'vow', 'oath', 'guarantee', 'assurance']),
+    ('requests and demands', ['request', 'demand', 'requirement', 'claim', 'appeal', 'petition']),
+    ('offers and instructions', ['offer', 'proposal', 'suggestion', 'recommendation', 'advice', 'guidance', 'instruction', 'direction', 'command', 'order']),
+    ('gratitude and apologies', ['thanks', 'gratitude', 'appreciation', 'apology', 'excuse', 'forgiveness']),
+    ('greetings and farewells', ['greeting', 'welcome', 'introduction', 'farewell', 'goodbye']),
+    ('praise and criticism', ['praise', 'compliment', 'criticism', 'complaint', 'accusation', 'blame']),
+    ('invitations and hospitality', ['invitation', 'welcome', 'hospitality', 'entertainment', 'treat']),
+    ('bookings and arrangements', ['reservation', 'booking', 'appointment', 'schedule', 'registration', 'application']),
+    ('communication and announcements', ['contact', 'communication', 'message', 'notice', 'notification', 'announcement', 'declaration', 'statement']),
+    ('questions and answers', ['question', 'inquiry', 'query', 'answer', 'reply', 'response', 'explanation', 'description', 'account']),
+    ('stories and reports', ['story', 'tale', 'narrative', 'account', 'description', 'report', 'news', 'article']),
+    ('examples and models', ['example', 'instance', 'case', 'sample', 'model', 'pattern']),
+    ('experiences and attempts', ['experience', 'practice', 'trial', 'attempt', 'effort', 'endeavor']),
+    ('habits and rituals', ['habit', 'custom', 'routine', 'ritual', 'ceremony']),
+    ('rules and standards', ['rule', 'regulation', 'law', 'principle', 'standard', 'norm', 'criterion']),
+    ('rights and duties', ['right', 'privilege', 'freedom', 'liberty', 'duty', 'obligation', 'responsibility']),
+    ('interest and attention', ['interest', 'concern', 'attention', 'care', 'regard', 'consideration']),
+    ('safety and danger', ['safety', 'security', 'danger', 'risk', 'threat', 'hazard', 'protection', 'defense']),
+    ('advantages and disadvantages', ['advantage', 'benefit', 'merit', 'disadvantage', 'drawback', 'defect', 'fault', 'weakness']),
+    ('possibilities and chances', ['possibility', 'potential', 'chance', 'opportunity', 'probability', 'likelihood', 'impossibility']),
+    ('necessity and importance', ['necessity', 'need', 'requirement', 'importance', 'urgency']),
+    ('convenience and difficulty', ['convenience', 'ease', 'comfort', 'inconvenience', 'difficulty', 'hardship', 'trouble']),
+]
+
+# Additional manual categorization for common patterns not caught by SEMANTIC_PATTERNS
+MANUAL_CATEGORIES = [
+    # Foods
+    ('food and meals', ['candy', 'cake', 'jam', 'steak', 'hamburg', 'sandwich', 'salad', 'pizza', 'pasta', 'noodles', 'soup', 'rice', 'bread', 'meat', 'fish', 'egg', 'cheese', 'butter', 'milk', 'cream', 'yogurt', 'ice cream', 'chocolate', 'cookie', 'biscuit', 'fruit', 'apple', 'banana', 'orange', 'grape', 'strawberry', 'vegetable', 'carrot', 'potato', 'tomato', 'onion', 'cabbage', 'lettuce', 'spinach']),
+    # Drinks
+    ('beverages', ['tea', 'coffee', 'juice', 'water', 'milk', 'beer', 'wine', 'sake', 'soda', 'cola', 'drink']),
+    # Days of week
+    ('days of the week', ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']),
+    # Numbers and counting
+    ('numbers and quantities', ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten', 'hundred', 'thousand', 'million', 'billion', 'dozen', 'pair', 'couple', 'zero', 'double', 'triple', 'half', 'quarter']),
+    # Directions
+    ('directions', ['north', 'south', 'east', 'west', 'left', 'right', 'up', 'down', 'front', 'back', 'forward', 'backward', 'upward', 'downward']),
+    # Body parts
+    ('body parts', ['head', 'face', 'eye', 'nose', 'mouth', 'ear', 'neck', 'shoulder', 'arm', 'hand', 'finger', 'chest', 'back', 'stomach', 'leg', 'foot', 'toe', 'skin', 'hair', 'tooth', 'teeth', 'bone', 'muscle', 'heart', 'brain', 'blood']),
+    # Clothing and accessories
+    ('clothing and accessories', ['clothes', 'shirt', 'pants', 'dress', 'skirt', 'coat', 'jacket', 'sweater', 'hat', 'cap', 'shoes', 'boots', 'socks', 'gloves', 'scarf', 'tie', 'belt', 'glasses', 'watch', 'ring', 'necklace', 'earrings', 'bracelet']),
+    # Colors
+    ('colors', ['red', 'blue', 'green', 'yellow', 'orange', 'purple', 'pink', 'brown', 'black', 'white', 'gray', 'grey']),
+    # Weather
+    ('weather and climate', ['weather', 'sunny', 'cloudy', 'rainy', 'snowy', 'windy', 'stormy', 'hot', 'cold', 'warm', 'cool', 'humid', 'dry', 'temperature', 'cloud', 'rain', 'snow', 'wind', 'storm', 'thunder', 'lightning', 'fog', 'mist']),
+    # Animals
+    ('animals', ['animal', 'dog', 'cat', 'bird', 'fish', 'horse', 'cow', 'pig', 'chicken', 'duck', 'rabbit', 'mouse', 'rat', 'lion', 'tiger', 'bear', 'elephant', 'monkey', 'snake', 'frog', 'insect', 'ant', 'bee', 'butterfly', 'spider']),
+    # Plants
+    ('plants and vegetation', ['plant', 'tree', 'flower', 'grass', 'leaf', 'root', 'branch', 'seed', 'fruit', 'vegetable', 'bush', 'shrub', 'vine']),
+    # Materials
+    ('materials and substances', ['wood', 'wooden', 'stone', 'rock', 'metal', 'iron', 'steel', 'gold', 'silver', 'copper', 'glass', 'plastic', 'rubber', 'leather', 'cloth', 'fabric', 'paper', 'cardboard', 'sand', 'soil', 'dirt', 'mud', 'water', 'oil', 'gas']),
+    # Shapes
+    ('shapes and forms', ['circle', 'square', 'triangle', 'rectangle', 'oval', 'round', 'flat', 'straight', 'curved', 'sharp', 'pointed']),
+    # Academic subjects
+    ('academic subjects', ['mathematics', 'math', 'science', 'physics', 'chemistry', 'biology', 'history', 'geography', 'literature', 'language', 'music', 'art', 'physical education', 'pe']),
+    # Occupations not caught
+    ('occupations and workplace roles', ['farmer', 'fisherman', 'sailor', 'soldier', 'chef', 'cook', 'waiter', 'waitress', 'cashier', 'salesperson', 'clerk', 'secretary', 'receptionist']),
+    # Family
+    ('family members', ['family', 'relatives', 'relationship', 'papa', 'mama', 'daddy', 'mommy', 'grandpa', 'grandma', 'grandson', 'granddaughter', 'nephew', 'niece', 'stepfather', 'stepmother', 'stepson', 'stepdaughter']),
+    # Household items
+    ('household items', ['telephone', 'phone', 'clock', 'mirror', 'picture', 'photo', 'lamp', 'candle', 'vase', 'ashtray', 'trash', 'garbage', 'dustbin']),
+    # Documents
+    ('documents and papers', ['passport', 'license', 'certificate', 'diploma', 'form', 'application', 'contract', 'agreement', 'receipt', 'invoice', 'bill', 'ticket', 'stamp', 'postcard', 'envelope', 'package']),
+    # Activities
+    ('cultural and creative activities', ['dance', 'song', 'music', 'singing', 'dancing', 'playing', 'drawing', 'painting', 'writing', 'reading']),
+    # Natural features
+    ('natural features', ['mountain', 'hill', 'valley', 'cliff', 'cave', 'island', 'peninsula', 'continent', 'ocean', 'sea', 'lake', 'river', 'stream', 'pond', 'waterfall', 'beach', 'coast', 'shore', 'desert', 'plain', 'field', 'meadow', 'forest', 'woods', 'jungle']),
+    # Urban features
+    ('urban features', ['city', 'town', 'village', 'street', 'road', 'avenue', 'boulevard', 'highway', 'bridge', 'tunnel', 'building', 'tower', 'skyscraper', 'apartment', 'condominium']),
+    # Abstract concepts
+    ('abstract concepts and emotions', ['dream', 'hope', 'wish', 'desire', 'fear', 'worry', 'anxiety', 'happiness', 'joy', 'sadness', 'anger', 'love', 'hate', 'peace', 'war', 'freedom', 'justice', 'truth', 'lie', 'beauty', 'ugliness']),
+    # Positions/locations
+    ('spatial positions', ['top', 'bottom', 'middle', 'center', 'corner', 'edge', 'side', 'inside', 'outside', 'above', 'below', 'over', 'under', 'between', 'among', 'near', 'far', 'here', 'there']),
+    # Proper nouns - Countries
+    ('countries and regions', ['japan', 'china', 'korea', 'america', 'usa', 'canada', 'mexico', 'brazil', 'england', 'britain', 'france', 'germany', 'italy', 'spain', 'russia', 'india', 'australia', 'africa', 'asia', 'europe']),
+    # Cities
+    ('cities', ['tokyo', 'osaka', 'kyoto', 'yokohama', 'nagoya', 'sapporo', 'kobe', 'fukuoka', 'sendai', 'hiroshima', 'london', 'paris', 'berlin', 'rome', 'madrid', 'moscow', 'beijing', 'shanghai', 'seoul', 'bangkok', 'singapore', 'sydney', 'new york', 'los angeles', 'chicago']),
+    # Miscellaneous specific items
+    ('types and categories', ['name', 'type', 'kind', 'sort', 'brand', 'model', 'size', 'shape', 'color', 'pattern', 'design', 'style', 'fashion', 'trend']),
+    ('time periods', ['century', 'decade', 'era', 'period', 'age', 'epoch', 'generation']),
+    ('text elements', ['page', 'chapter', 'section', 'paragraph', 'line', 'sentence', 'word', 'character', 'letter']),
+    ('cultural events', ['concert', 'performance', 'show', 'exhibition', 'display', 'festival', 'fair', 'carnival']),
+    ('scenery and views', ['scenery', 'landscape', 'view', 'sight', 'scene']),
+    ('reference materials', ['map', 'atlas', 'globe', 'chart', 'diagram', 'graph', 'table', 'list']),
+    ('government offices', ['embassy', 'consulate', 'ministry', 'department', 'bureau', 'agency', 'administration']),
+    ('islands', ['island', 'isle']),
+    ('architectural elements', ['hall', 'corridor', 'hallway', 'passage', 'passageway', 'lobby', 'entrance', 'exit', 'gate', 'door', 'doorway', 'window']),
+]
+
+# Compiled once into token -> category indexes (see keyword_classifier.py)
+SEMANTIC_CLASSIFIER = compile_rules(SEMANTIC_PATTERNS, words=True)
+MANUAL_CLASSIFIER = compile_rules(MANUAL_CATEGORIES, words=True)
+
+
 def analyze_noun_meanings(nouns_data: List[Dict]) -> Dict[str, List[Tuple[str, str]]]:
     """
     Analyze noun collocations and group them by semantic similarity.
@@ -33,241 +246,24 @@ def analyze_noun_meanings(nouns_data: List[Dict]) -> Dict[str, List[Tuple[str, s
     # Extract all noun-meaning pairs
     noun_meanings = [(item['word'], item['english']) for item in nouns_data]
 
-    # Semantic patterns - map keywords to category hints
-    patterns = {
-        # Time and temporal
-        r'\b(time|hour|minute|second|day|week|month|year|morning|afternoon|evening|night|today|tomorrow|yesterday|date|schedule|deadline|period|era|season|age)\b': 'time and temporal expressions',
-        r'\b(spring|summer|fall|autumn|winter|january|february|march|april|may|june|july|august|september|october|november|december)\b': 'seasons and months',
-
-        # People and relationships
-        r'\b(person|people|human|someone|man|woman|boy|girl|child|children|kid|baby|adult)\b': 'people',
-        r'\b(family|mother|father|parent|son|daughter|sibling|brother|sister|grandfather|grandmother|uncle|aunt|cousin|relative|husband|wife|spouse)\b': 'family members',
-        r'\b(friend|companion|colleague|coworker|partner|acquaintance|classmate|teammate|roommate)\b': 'friends and associates',
-        r'\b(teacher|professor|instructor|student|pupil|learner|principal|tutor)\b': 'education roles',
-        r'\b(doctor|nurse|patient|dentist|physician|surgeon|therapist|medical)\b': 'medical professionals and patients',
-        r'\b(employee|employer|worker|staff|boss|manager|director|president|ceo|executive|officer|secretary|assistant|clerk)\b': 'occupations and workplace roles',
-        r'\b(driver|pilot|captain|conductor|operator|chef|cook|waiter|server|customer|client|guest)\b': 'service and transportation roles',
-        r'\b(artist|musician|singer|actor|actress|writer|author|painter|photographer|designer)\b': 'artists and creators',
-        r'\b(police|officer|detective|guard|soldier|firefighter|lawyer|attorney|judge)\b': 'public service and legal roles',
-
-        # Places and locations
-        r'\b(place|location|area|region|spot|site|position)\b': 'places and locations',
-        r'\b(house|home|apartment|room|bedroom|bathroom|kitchen|living room|dining room|office|building|floor|ceiling|wall|door|window|roof|garage)\b': 'buildings and rooms',
-        r'\b(school|university|college|classroom|library|laboratory|campus|dormitory|gym|gymnasium)\b': 'educational facilities',
-        r'\b(hospital|clinic|pharmacy|doctor\'s office)\b': 'medical facilities',
-        r'\b(store|shop|market|supermarket|mall|department store|restaurant|cafe|bar|hotel|bank|post office|station|airport|port)\b': 'commercial and public facilities',
-        r'\b(park|garden|zoo|museum|theater|cinema|stadium|temple|shrine|church|beach|mountain|forest|river|lake|sea|ocean)\b': 'recreational and natural places',
-        r'\b(city|town|village|country|nation|prefecture|capital|downtown|suburb|neighborhood|street|road|avenue)\b': 'geographic locations',
-        r'\b(tokyo|osaka|kyoto|japan|america|china|korea|europe|asia)\b': 'specific places',
-
-        # Things and objects
-        r'\b(thing|object|item|stuff|matter|material|substance)\b': 'things and objects',
-        r'\b(book|magazine|newspaper|journal|novel|textbook|dictionary|document|paper|letter|mail|card|note|report|article|story|text)\b': 'reading materials and documents',
-        r'\b(pen|pencil|notebook|eraser|ruler|scissors|tape|desk|chair|table|shelf|box|bag|briefcase|backpack)\b': 'stationery and office items',
-        r'\b(computer|laptop|phone|smartphone|tablet|camera|television|tv|radio|video|cd|dvd|recorder|printer|keyboard|mouse|screen|internet|email|website|software|app|program)\b': 'technology and electronics',
-        r'\b(car|vehicle|automobile|bus|train|subway|taxi|bicycle|bike|motorcycle|truck|ship|boat|airplane|plane)\b': 'vehicles and transportation',
-        r'\b(clothes|clothing|shirt|t-shirt|pants|trousers|skirt|dress|suit|coat|jacket|sweater|shoes|hat|cap|glasses|watch|jewelry|ring|necklace)\b': 'clothing and accessories',
-        r'\b(food|meal|breakfast|lunch|dinner|dish|rice|bread|meat|fish|chicken|beef|pork|vegetable|fruit|egg|cheese|butter|sugar|salt|pepper|sauce)\b': 'food and meals',
-        r'\b(water|tea|coffee|juice|milk|beer|wine|alcohol|drink|beverage|soda|cola)\b': 'beverages',
-        r'\b(medicine|drug|pill|tablet|vitamin|supplement|injection|vaccine)\b': 'medicine and supplements',
-        r'\b(money|cash|coin|bill|dollar|yen|price|cost|fee|salary|wage|income|payment|deposit|debt|loan|tax|budget)\b': 'money and finances',
-        r'\b(furniture|sofa|couch|bed|mattress|pillow|blanket|sheet|towel|curtain|lamp|light|clock)\b': 'furniture and household items',
-        r'\b(dish|plate|bowl|cup|glass|mug|fork|knife|spoon|chopsticks|pot|pan|kettle)\b': 'kitchenware and utensils',
-        r'\b(ball|game|toy|doll|cards|puzzle)\b': 'toys and games',
-        r'\b(tool|equipment|machine|device|instrument|engine|motor)\b': 'tools and equipment',
-        r'\b(key|lock|battery|wire|cable|switch|button|handle)\b': 'small objects and parts',
-
-        # Activities and events
-        r'\b(work|job|task|duty|business|occupation|career|profession|labor|employment)\b': 'work and employment',
-        r'\b(study|learning|education|training|practice|lesson|course|class|lecture|exam|test|quiz|homework|assignment|research)\b': 'academic and study activities',
-        r'\b(meeting|conference|discussion|talk|conversation|chat|debate|interview|presentation|speech)\b': 'meetings and discussions',
-        r'\b(party|celebration|festival|event|ceremony|wedding|funeral|birthday|anniversary)\b': 'celebrations and events',
-        r'\b(sport|exercise|training|practice|game|match|competition|race|running|swimming|tennis|soccer|baseball|basketball|golf)\b': 'sports and physical activities',
-        r'\b(hobby|leisure|recreation|entertainment|fun|amusement|play)\b': 'hobbies and leisure',
-        r'\b(travel|trip|journey|tour|vacation|holiday|visit|sightseeing)\b': 'travel and tourism',
-        r'\b(shopping|purchase|buying|selling|sale|trade|order)\b': 'shopping and commerce',
-        r'\b(cooking|baking|preparing|meal preparation)\b': 'cooking and food preparation',
-        r'\b(cleaning|washing|sweeping|wiping|tidying|organizing|laundry)\b': 'cleaning and housework',
-        r'\b(driving|riding|walking|running|moving|going|coming|arriving|departing|leaving|entering|exiting)\b': 'movement and transportation',
-        r'\b(reading|writing|drawing|painting|singing|playing|listening|watching|seeing|looking|hearing)\b': 'cultural and creative activities',
-        r'\b(sleeping|waking|resting|relaxing|lying|sitting|standing)\b': 'rest and posture',
-        r'\b(eating|drinking|consuming|tasting)\b': 'eating and drinking',
-        r'\b(wearing|putting on|taking off|dressing)\b': 'wearing and clothing',
-        r'\b(opening|closing|shutting|locking|unlocking)\b': 'opening and closing',
-        r'\b(starting|beginning|ending|finishing|completing|stopping|continuing)\b': 'beginning and ending',
-        r'\b(making|creating|building|constructing|producing|manufacturing)\b': 'creation and production',
-        r'\b(breaking|destroying|damaging|ruining|fixing|repairing|mending)\b': 'damage and repair',
-        r'\b(giving|providing|offering|presenting|handing|delivering|sending|receiving|getting|obtaining|acquiring)\b': 'giving and receiving',
-        r'\b(showing|displaying|exhibiting|demonstrating|explaining|teaching|telling|informing|notifying)\b': 'showing and explaining',
-        r'\b(helping|assisting|supporting|aiding|serving|caring)\b': 'helping and support',
-        r'\b(using|utilizing|employing|applying|operating|handling)\b': 'using and operating',
-        r'\b(choosing|selecting|deciding|determining|picking)\b': 'choosing and deciding',
-        r'\b(thinking|considering|pondering|reflecting|remembering|forgetting|knowing|understanding|believing|imagining)\b': 'mental activities',
-        r'\b(feeling|emotion|mood|happiness|joy|sadness|anger|fear|worry|anxiety|excitement|surprise|interest|love|hate|like|dislike)\b': 'emotions and feelings',
-        r'\b(wanting|desiring|wishing|hoping|needing|requiring)\b': 'desires and needs',
-
-        # Abstract concepts
-        r'\b(idea|concept|thought|opinion|view|belief|theory|principle|rule|law|regulation|policy)\b': 'ideas and concepts',
-        r'\b(problem|issue|matter|question|difficulty|trouble|challenge|concern)\b': 'problems and issues',
-        r'\b(solution|answer|result|outcome|consequence|effect|impact|influence)\b': 'results and solutions',
-        r'\b(plan|planning|preparation|arrangement|organization|scheme|project|program)\b': 'planning and preparation',
-        r'\b(goal|aim|objective|purpose|target|intention)\b': 'goals and objectives',
-        r'\b(reason|cause|factor|basis|ground|motive)\b': 'reasons and causes',
-        r'\b(way|method|means|manner|style|approach|technique|system|process|procedure)\b': 'methods and processes',
-        r'\b(information|data|fact|detail|knowledge|news|story|rumor)\b': 'information and knowledge',
-        r'\b(language|word|vocabulary|grammar|pronunciation|accent|translation|interpretation)\b': 'language and linguistics',
-        r'\b(culture|custom|tradition|habit|manner|etiquette|courtesy|politeness)\b': 'culture and customs',
-        r'\b(society|community|public|social|group|team|club|organization|company|corporation|firm|business)\b': 'social groups and organizations',
-        r'\b(government|politics|political|administration|policy|law|legislation)\b': 'government and politics',
-        r'\b(economy|economic|finance|financial|market|industry|trade|commerce|business)\b': 'economics and business',
-        r'\b(science|scientific|technology|technical|research|study|experiment|discovery|invention)\b': 'science and technology',
-        r'\b(art|artistic|music|musical|literature|literary|culture|cultural)\b': 'arts and culture',
-        r'\b(history|historical|past|ancient|modern|traditional|contemporary)\b': 'history and time periods',
-        r'\b(nature|natural|environment|environmental|ecology|ecological|weather|climate|temperature)\b': 'nature and environment',
-        r'\b(health|healthy|medical|medicine|illness|disease|sickness|injury|pain|symptom|treatment|cure|care)\b': 'health and medical',
-        r'\b(life|living|birth|death|growth|development|change|evolution)\b': 'life and existence',
-        r'\b(quality|characteristic|feature|property|attribute|trait|nature)\b': 'qualities and characteristics',
-        r'\b(size|amount|quantity|number|degree|level|extent|measure|measurement)\b': 'quantities and measurements',
-        r'\b(color|shape|form|appearance|look|design|pattern|style)\b': 'appearance and design',
-        r'\b(sound|noise|voice|volume|tone|pitch)\b': 'sounds',
-        r'\b(smell|scent|odor|fragrance|aroma)\b': 'smells and scents',
-        r'\b(taste|flavor)\b': 'tastes',
-        r'\b(touch|feel|texture|surface)\b': 'touch and texture',
-        r'\b(light|brightness|darkness|shadow|shine|glow)\b': 'light and darkness',
-        r'\b(power|energy|force|strength|ability|capability|skill|talent|gift)\b': 'abilities and powers',
-        r'\b(importance|significance|value|worth|meaning|sense|implication)\b': 'importance and meaning',
-        r'\b(difference|distinction|contrast|comparison|similarity|likeness)\b': 'comparisons and differences',
-        r'\b(relationship|relation|connection|link|association|bond|tie)\b': 'relationships and connections',
-        r'\b(state|status|situation|condition|circumstance|case|position)\b': 'states and conditions',
-        r'\b(change|transformation|conversion|shift|transition|alteration|modification|adjustment)\b': 'changes and transformations',
-        r'\b(increase|growth|rise|expansion|decrease|reduction|decline|fall)\b': 'increases and decreases',
-        r'\b(success|achievement|accomplishment|victory|win|failure|defeat|loss|mistake|error)\b': 'success and failure',
-        r'\b(beginning|start|origin|source|end|ending|finish|conclusion|termination)\b': 'beginnings and endings',
-        r'\b(part|portion|section|segment|piece|fragment|component|element|unit|whole|entirety|total)\b': 'parts and wholes',
-        r'\b(inside|interior|inner|outside|exterior|outer|surface|top|bottom|front|back|side|left|right|center|middle|edge|corner)\b': 'spatial positions',
-        r'\b(direction|course|route|path|way)\b': 'directions and routes',
-        r'\b(distance|length|width|height|depth|thickness)\b': 'dimensions and distances',
-        r'\b(speed|pace|rate|velocity)\b': 'speed and pace',
-        r'\b(order|sequence|series|arrangement|organization|structure|system)\b': 'order and structure',
-        r'\b(permission|approval|consent|agreement|acceptance|refusal|rejection|denial|opposition|objection)\b': 'permission and opposition',
-        r'\b(promise|commitment|pledge|vow|oath|guarantee|assurance)\b': 'promises and commitments',
-        r'\b(request|demand|requirement|claim|appeal|petition)\b': 'requests and demands',
-        r'\b(offer|proposal|suggestion|recommendation|advice|guidance|instruction|direction|command|order)\b': 'offers and instructions',
-        r'\b(thanks|gratitude|appreciation|apology|excuse|forgiveness)\b': 'gratitude and apologies',
-        r'\b(greeting|welcome|introduction|farewell|goodbye)\b': 'greetings and farewells',
-        r'\b(praise|compliment|criticism|complaint|accusation|blame)\b': 'praise and criticism',
-        r'\b(invitation|welcome|hospitality|entertainment|treat)\b': 'invitations and hospitality',
-        r'\b(reservation|booking|appointment|schedule|registration|application)\b': 'bookings and arrangements',
-        r'\b(contact|communication|message|notice|notification|announcement|declaration|statement)\b': 'communication and announcements',
-        r'\b(question|inquiry|query|answer|reply|response|explanation|description|account)\b': 'questions and answers',
-        r'\b(story|tale|narrative|account|description|report|news|article)\b': 'stories and reports',
-        r'\b(example|instance|case|sample|model|pattern)\b': 'examples and models',
-        r'\b(experience|practice|trial|attempt|effort|endeavor)\b': 'experiences and attempts',
-        r'\b(habit|custom|routine|ritual|ceremony)\b': 'habits and rituals',
-        r'\b(rule|regulation|law|principle|standard|norm|criterion)\b': 'rules and standards',
-        r'\b(right|privilege|freedom|liberty|duty|obligation|responsibility)\b': 'rights and duties',
-        r'\b(interest|concern|attention|care|regard|consideration)\b': 'interest and attention',
-        r'\b(safety|security|danger|risk|threat|hazard|protection|defense)\b': 'safety and danger',
-        r'\b(advantage|benefit|merit|disadvantage|drawback|defect|fault|weakness)\b': 'advantages and disadvantages',
-        r'\b(possibility|potential|chance|opportunity|probability|likelihood|impossibility)\b': 'possibilities and chances',
-        r'\b(necessity|need|requirement|importance|urgency)\b': 'necessity and importance',
-        r'\b(convenience|ease|comfort|inconvenience|difficulty|hardship|trouble)\b': 'convenience and difficulty',
-    }
-
     # First pass: try to match patterns
     unmatched = []
     for noun, meaning in noun_meanings:
-        matched = False
-        meaning_lower = meaning.lower()
-
-        for pattern, hint in patterns.items():
-            if re.search(pattern, meaning_lower):
-                groups[hint].append((noun, meaning))
-                matched = True
-                break
-
-        if not matched:
+        hint = SEMANTIC_CLASSIFIER.first(meaning.lower())
+        if hint is not None:
+            groups[hint].append((noun, meaning))
+        else:
             unmatched.append((noun, meaning))
 
     # Second pass: create better semantic hints for unmatched items
     if unmatched:
-        # Additional manual categorization for common patterns not caught
-        manual_categories = {
-            # Foods
-            r'\b(candy|cake|jam|steak|hamburg|sandwich|salad|pizza|pasta|noodles|soup|rice|bread|meat|fish|egg|cheese|butter|milk|cream|yogurt|ice cream|chocolate|cookie|biscuit|fruit|apple|banana|orange|grape|strawberry|vegetable|carrot|potato|tomato|onion|cabbage|lettuce|spinach)\b': 'food and meals',
-            # Drinks
-            r'\b(tea|coffee|juice|water|milk|beer|wine|sake|soda|cola|drink)\b': 'beverages',
-            # Days of week
-            r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b': 'days of the week',
-            # Numbers and counting
-            r'\b(one|two|three|four|five|six|seven|eight|nine|ten|hundred|thousand|million|billion|dozen|pair|couple|zero|double|triple|half|quarter)\b': 'numbers and quantities',
-            # Directions
-            r'\b(north|south|east|west|left|right|up|down|front|back|forward|backward|upward|downward)\b': 'directions',
-            # Body parts
-            r'\b(head|face|eye|nose|mouth|ear|neck|shoulder|arm|hand|finger|chest|back|stomach|leg|foot|toe|skin|hair|tooth|teeth|bone|muscle|heart|brain|blood)\b': 'body parts',
-            # Clothing and accessories
-            r'\b(clothes|shirt|pants|dress|skirt|coat|jacket|sweater|hat|cap|shoes|boots|socks|gloves|scarf|tie|belt|glasses|watch|ring|necklace|earrings|bracelet)\b': 'clothing and accessories',
-            # Colors
-            r'\b(red|blue|green|yellow|orange|purple|pink|brown|black|white|gray|grey)\b': 'colors',
-            # Weather
-            r'\b(weather|sunny|cloudy|rainy|snowy|windy|stormy|hot|cold|warm|cool|humid|dry|temperature|cloud|rain|snow|wind|storm|thunder|lightning|fog|mist)\b': 'weather and climate',
-            # Animals
-            r'\b(animal|dog|cat|bird|fish|horse|cow|pig|chicken|duck|rabbit|mouse|rat|lion|tiger|bear|elephant|monkey|snake|frog|insect|ant|bee|butterfly|spider)\b': 'animals',
-            # Plants
-            r'\b(plant|tree|flower|grass|leaf|root|branch|seed|fruit|vegetable|bush|shrub|vine)\b': 'plants and vegetation',
-            # Materials
-            r'\b(wood|wooden|stone|rock|metal|iron|steel|gold|silver|copper|glass|plastic|rubber|leather|cloth|fabric|paper|cardboard|sand|soil|dirt|mud|water|oil|gas)\b': 'materials and substances',
-            # Shapes
-            r'\b(circle|square|triangle|rectangle|oval|round|flat|straight|curved|sharp|pointed)\b': 'shapes and forms',
-            # Academic subjects
-            r'\b(mathematics|math|science|physics|chemistry|biology|history|geography|literature|language|music|art|physical education|pe)\b': 'academic subjects',
-            # Occupations not caught
-            r'\b(farmer|fisherman|sailor|soldier|chef|cook|waiter|waitress|cashier|salesperson|clerk|secretary|receptionist)\b': 'occupations and workplace roles',
-            # Family
-            r'\b(family|relatives|relationship|papa|mama|daddy|mommy|grandpa|grandma|grandson|granddaughter|nephew|niece|stepfather|stepmother|stepson|stepdaughter)\b': 'family members',
-            # Household items
-            r'\b(telephone|phone|clock|mirror|picture|photo|lamp|candle|vase|ashtray|trash|garbage|dustbin)\b': 'household items',
-            # Documents
-            r'\b(passport|license|certificate|diploma|form|application|contract|agreement|receipt|invoice|bill|ticket|stamp|postcard|envelope|package)\b': 'documents and papers',
-            # Activities
-            r'\b(dance|song|music|singing|dancing|playing|drawing|painting|writing|reading)\b': 'cultural and creative activities',
-            # Natural features
-            r'\b(mountain|hill|valley|cliff|cave|island|peninsula|continent|ocean|sea|lake|river|stream|pond|waterfall|beach|coast|shore|desert|plain|field|meadow|forest|woods|jungle)\b': 'natural features',
-            # Urban features
-            r'\b(city|town|village|street|road|avenue|boulevard|highway|bridge|tunnel|building|tower|skyscraper|apartment|condominium)\b': 'urban features',
-            # Abstract concepts
-            r'\b(dream|hope|wish|desire|fear|worry|anxiety|happiness|joy|sadness|anger|love|hate|peace|war|freedom|justice|truth|lie|beauty|ugliness)\b': 'abstract concepts and emotions',
-            # Positions/locations
-            r'\b(top|bottom|middle|center|corner|edge|side|inside|outside|above|below|over|under|between|among|near|far|here|there)\b': 'spatial positions',
-            # Proper nouns - Countries
-            r'\b(japan|china|korea|america|usa|canada|mexico|brazil|england|britain|france|germany|italy|spain|russia|india|australia|africa|asia|europe)\b': 'countries and regions',
-            # Cities
-            r'\b(tokyo|osaka|kyoto|yokohama|nagoya|sapporo|kobe|fukuoka|sendai|hiroshima|london|paris|berlin|rome|madrid|moscow|beijing|shanghai|seoul|bangkok|singapore|sydney|new york|los angeles|chicago)\b': 'cities',
-            # Miscellaneous specific items
-            r'\b(name|type|kind|sort|brand|model|size|shape|color|pattern|design|style|fashion|trend)\b': 'types and categories',
-            r'\b(century|decade|era|period|age|epoch|generation)\b': 'time periods',
-            r'\b(page|chapter|section|paragraph|line|sentence|word|character|letter)\b': 'text elements',
-            r'\b(concert|performance|show|exhibition|display|festival|fair|carnival)\b': 'cultural events',
-            r'\b(scenery|landscape|view|sight|scene)\b': 'scenery and views',
-            r'\b(map|atlas|globe|chart|diagram|graph|table|list)\b': 'reference materials',
-            r'\b(embassy|consulate|ministry|department|bureau|agency|administration)\b': 'government offices',
-            r'\b(island|isle)\b': 'islands',
-            r'\b(hall|corridor|hallway|passage|passageway|lobby|entrance|exit|gate|door|doorway|window)\b': 'architectural elements',
-        }
-
         # Try manual categories first
         still_unmatched = []
         for noun, meaning in unmatched:
-            matched = False
-            meaning_lower = meaning.lower()
-
-            for pattern, hint in manual_categories.items():
-                if re.search(pattern, meaning_lower):
-                    groups[hint].append((noun, meaning))
-                    matched = True
-                    break
-
-            if not matched:
+            hint = MANUAL_CLASSIFIER.first(meaning.lower())
+            if hint is not None:
+                groups[hint].append((noun, meaning))
+            else:
                 still_unmatched.append((noun, meaning))
 
         # For remaining unmatched, use a cleaned-up version of the meaning
@@ -11,11 +11,18 @@ Example transformations:
 - NEW: "to do work/one's job"
 """
 
+import argparse
 import json
-import os
-import time
 from pathlib import Path
-from anthropic import Anthropic
+
+from checkpoint_journal import CheckpointJournal
+from collocation_graph import load_graph
+from llm_cache import print_cache_stats
+from llm_batch import add_batch_arguments, batch_runner_from_args
+from llm_engine import add_engine_arguments, engine_from_args, merge_groups, nest_results
+from pair_manifest import (DEFAULT_MANIFEST_DIR, PairManifest, add_manifest_arguments, print_pair_diff,
+                           prompt_hash, select_pairs)
+from prompt_packing import DEFAULT_MAX_ROUNDS, add_packing_arguments, print_packing_report, run_packed
 
 # Load environment variables from .env file
 try:
@@ -24,9 +31,6 @@ try:
 except ImportError:
     print("Warning: python-dotenv not installed. Install with: pip install python-dotenv")
 
-# Initialize Claude API
-client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-
 def load_vocabulary():
     """Load vocabulary to get English translations"""
     vocab_path = Path("public/data/vocabulary.json")
@@ -41,18 +45,24 @@ def load_vocabulary():
     return vocab_dict
 
 def load_current_hints():
-    """Load current hints file"""
-    hints_path = Path("public/data/collocation_hints.json")
+    """Load current meanings file (empty if it does not exist yet)"""
+    hints_path = Path("public/data/collocation_meanings.json")
+    if not hints_path.exists():
+        return {'meanings': {}}
     with open(hints_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def generate_clear_hint(verb_japanese, verb_english, noun_japanese, noun_english):
+def load_collocation_pairs():
+    """Load verb/adjective -> [nouns] pairs from the collocation database"""
+    return load_graph(Path("public/data/collocations_complete.json")).groups()
+
+def clear_hint_prompt(verb_japanese, verb_english, noun_japanese, noun_english):
     """
-    Generate a clear, direct hint for a verb+noun collocation using Claude API.
+    Build the prompt for a clear, direct hint for a verb+noun collocation.
 
-    Returns a string like: "to hear/listen to a conversation"
+    The model should answer with a string like: "to hear/listen to a conversation"
     """
-    prompt = f"""Create a clear, natural English hint for this Japanese collocation:
+    return f"""Create a clear, natural English hint for this Japanese collocation:
 
 Verb: {verb_japanese} ({verb_english})
 Noun: {noun_japanese} ({noun_english})
@@ -75,26 +85,65 @@ Examples of GOOD hints:
 
 Return ONLY the hint text, nothing else."""
 
-    try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=50,
-            temperature=0.3,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        hint = response.content[0].text.strip()
-        # Remove quotes if present
-        hint = hint.strip('"\'')
-        return hint
+def packed_clear_hint_prompt(verb_japanese, verb_english, nouns):
+    """
+    Build one prompt covering every noun of a verb/adjective (packed mode).
 
-    except Exception as e:
-        print(f"Error generating hint for {verb_japanese}+{noun_japanese}: {e}")
-        # Fallback: simple template
-        return f"to {verb_english} {noun_english}"
+    Args:
+        verb_japanese: Verb/adjective in Japanese
+        verb_english: English translation of the verb/adjective
+        nouns: List of (noun_japanese, noun_english) tuples
+
+    The model should answer with a JSON object mapping each noun to its hint.
+    """
+    noun_lines = "\n".join(f"- {noun_japanese} ({noun_english})" for noun_japanese, noun_english in nouns)
+    return f"""Create clear, natural English hints for these Japanese collocations:
+
+Verb: {verb_japanese} ({verb_english})
+Nouns:
+{noun_lines}
+
+Each hint should describe what the verb+noun combination means in natural English.
+
+Requirements:
+- Be clear and direct (no cryptic descriptions)
+- Use format: "to [verb] [specific object]" or similar natural phrasing
+- You can mention the verb in English for clarity
+- Be specific about what the combination means
+- Keep it short (under 10 words)
+
+Examples of GOOD hints:
+- 話 + 聞く → "to hear/listen to a conversation"
+- 仕事 + する → "to do work/one's job"
+- 音楽 + 聞く → "to listen to music"
+- 質問 + する → "to ask a question"
+- 手紙 + 書く → "to write a letter"
+
+Return ONLY a JSON object mapping each noun (Japanese, exactly as listed) to its hint text.
+
+Example format:
+{{
+  "話": "to hear/listen to a conversation",
+  "音楽": "to listen to music"
+}}
+
+Return ONLY the JSON object, no other text."""
 
-def regenerate_all_hints():
-    """Regenerate all collocation hints with clear descriptions"""
+MANIFEST_PATH = DEFAULT_MANIFEST_DIR / "collocation_meanings.manifest.json"
+JOURNAL_PATH = DEFAULT_MANIFEST_DIR / "collocation_meanings.journal.jsonl"
+
+def regenerate_all_hints(engine, packed=False, max_rounds=DEFAULT_MAX_ROUNDS, words=None,
+                         manifest_path=MANIFEST_PATH, changed_only=False, show_diff=False,
+                         journal_path=JOURNAL_PATH):
+    """Regenerate all collocation hints with clear descriptions
+
+    Pairs come from collocations_complete.json. With `words`, only those
+    verbs are regenerated and merged into the existing meanings. With
+    `changed_only`, only pairs added or changed since the pair manifest was
+    written are regenerated; removed pairs are dropped from the output.
+    Completed pairs are journaled as they arrive, so an interrupted run
+    resumes where it stopped.
+    """
     # Open log file for writing
     log_path = Path("hint_regeneration_detailed.log")
     with open(log_path, 'w', encoding='utf-8') as log:
@@ -109,89 +158,130 @@ def regenerate_all_hints():
 
         log_print("Loading current hints...")
         hints_data = load_current_hints()
+        old_hints = hints_data['meanings']
 
-        total_verbs = len(hints_data['hints'])
-        total_pairs = hints_data.get('totalPairs', 0)
+        log_print("Loading collocation pairs...")
+        pairs = load_collocation_pairs()
 
-        log_print(f"\nRegenerating hints for {total_verbs} verbs/adjectives ({total_pairs} total pairs)...")
-        log_print("This will take some time due to API rate limits.\n")
-
-        new_hints = {}
-        processed = 0
-        errors = 0
-
-        for verb_japanese, noun_hints in hints_data['hints'].items():
+        # The per-pair prompt identifies a pair's inputs, also in packed mode
+        prompts = {}
+        for verb_japanese, nouns in pairs.items():
             verb_english = vocab.get(verb_japanese, verb_japanese)
-            log.write(f"\n[{processed+1}/{total_verbs}] Processing: {verb_japanese} ({verb_english})\n")
-            log.flush()
-            print(f"[{processed+1}/{total_verbs}] Processing verb/adj {processed+1}/{total_verbs}")
-
-            new_hints[verb_japanese] = {}
-
-            for noun_japanese, old_hint in noun_hints.items():
+            for noun_japanese in nouns:
                 noun_english = vocab.get(noun_japanese, noun_japanese)
+                prompts[(verb_japanese, noun_japanese)] = clear_hint_prompt(
+                    verb_japanese, verb_english, noun_japanese, noun_english)
+        prompt_hashes = {pair: prompt_hash(prompt) for pair, prompt in prompts.items()}
+
+        manifest = PairManifest(manifest_path)
+        if not len(manifest) and old_hints:
+            seeded = manifest.seed(old_hints, prompt_hashes, hints_data.get('model', engine.model))
+            log_print(f"Seeded pair manifest from the existing meanings ({seeded} pairs)")
+        diff = manifest.diff(prompt_hashes, engine.model)
+        print_pair_diff(diff, log_print)
+        if show_diff:
+            return
+
+        # Pairs finished by an interrupted run are replayed from the journal
+        journal = CheckpointJournal(journal_path)
+        resumed = journal.resume(prompt_hashes, engine.model)
+        manifest.update(resumed.values())
+        results = {pair: record['output'] for pair, record in resumed.items()}
+
+        wanted = diff.dirty if changed_only else prompt_hashes
+        targets = select_pairs(pairs, [pair for pair in wanted if pair not in resumed])
+        if words is not None:
+            targets = {verb: nouns for verb, nouns in targets.items() if verb in set(words)}
+
+        total_verbs = len(targets)
+        total_pairs = sum(len(nouns) for nouns in targets.values())
 
-                log.write(f"  - {noun_japanese} ({noun_english})\n")
-                log.write(f"    OLD: {old_hint}\n")
-
-                # Generate new hint
-                new_hint = generate_clear_hint(verb_japanese, verb_english, noun_japanese, noun_english)
-                new_hints[verb_japanese][noun_japanese] = new_hint
-
-                log.write(f"    NEW: {new_hint}\n")
-                log.flush()
-
-                # Rate limiting: ~3 requests per second
-                time.sleep(0.35)
+        log_print(f"\nRegenerating hints for {total_verbs} verbs/adjectives ({total_pairs} total pairs)...")
+        log_print(f"{engine.describe()}\n")
 
-            processed += 1
+        # Build one job per pair; the engine runs them concurrently
+        jobs = []
+        remaining = {}
+        for verb_japanese, noun_hints in targets.items():
+            verb_english = vocab.get(verb_japanese, verb_japanese)
+            remaining[verb_japanese] = len(noun_hints)
+            for noun_japanese in noun_hints:
+                noun_english = vocab.get(noun_japanese, noun_japanese)
+                # Fallback: simple template
+                jobs.append(((verb_japanese, noun_japanese), prompts[(verb_japanese, noun_japanese)],
+                             f"to {verb_english} {noun_english}"))
+
+        progress = {'processed': 0, 'errors': 0}
+
+        def on_result(key, new_hint, ok):
+            """Log and journal each pair as it completes"""
+            verb_japanese, noun_japanese = key
+            # A failed pair keeps its existing hint; the fallback only fills new pairs
+            if ok or noun_japanese not in old_hints.get(verb_japanese, {}):
+                results[key] = new_hint
+            journal.append(manifest.record(verb_japanese, noun_japanese, prompt_hashes[key],
+                                           engine.model, new_hint, ok))
+            if not ok:
+                progress['errors'] += 1
+
+            log.write(f"  - {verb_japanese} + {noun_japanese}\n")
+            log.write(f"    OLD: {old_hints.get(verb_japanese, {}).get(noun_japanese, '(new pair)')}\n")
+            log.write(f"    NEW: {new_hint}\n")
+            log.flush()
 
-            # Save progress every 10 verbs
-            if processed % 10 == 0:
-                log_print(f"\n[OK] Progress checkpoint: {processed}/{total_verbs} verbs processed")
-                save_hints_checkpoint(new_hints, processed, total_verbs, log)
+            remaining[verb_japanese] -= 1
+            if remaining[verb_japanese] == 0:
+                progress['processed'] += 1
+                processed = progress['processed']
+                print(f"[{processed}/{total_verbs}] Finished verb/adj {verb_japanese}")
+
+        report = None
+        if packed:
+            # One JSON prompt per verb/adjective listing all of its nouns
+            _, report = run_packed(
+                engine,
+                targets,
+                lambda verb, nouns: packed_clear_hint_prompt(
+                    verb, vocab.get(verb, verb), [(noun, vocab.get(noun, noun)) for noun in nouns]),
+                lambda verb, noun: f"to {vocab.get(verb, verb)} {vocab.get(noun, noun)}",
+                on_result=on_result,
+                max_rounds=max_rounds,
+                unpacked_prompt=lambda verb, noun: clear_hint_prompt(
+                    verb, vocab.get(verb, verb), noun, vocab.get(noun, noun)),
+            )
+        else:
+            engine.run_sync(jobs, on_result=on_result)
+        new_hints = merge_groups(pairs, old_hints, nest_results(pairs, results))
 
         # Save final result
         log_print("\n\nSaving final hints...")
-        save_final_hints(new_hints, total_pairs, log)
-
-        log_print(f"\n[OK] Complete! Regenerated {processed} verbs with {total_pairs} total pairs")
-        log_print(f"  Errors: {errors}")
-
-def save_hints_checkpoint(hints, processed, total, log=None):
-    """Save intermediate checkpoint"""
-    checkpoint_path = Path("public/data/collocation_hints_NEW_checkpoint.json")
-    data = {
-        "version": "10.0.0",
-        "generator": "claude-api-clear-hints",
-        "model": "claude-sonnet-4-5-20250929",
-        "status": f"In progress: {processed}/{total}",
-        "hints": hints
-    }
-
-    with open(checkpoint_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-    msg = f"  Checkpoint saved to {checkpoint_path}"
-    print(msg)
-    if log:
-        log.write(msg + '\n')
-        log.flush()
+        save_final_hints(new_hints, sum(len(nouns) for nouns in new_hints.values()), log)
+        manifest.discard(diff.removed)
+        manifest.save()
+        log_print(f"  Pair manifest saved to {manifest_path} ({len(manifest)} pairs)")
+        journal.discard()
+
+        log_print(f"\n[OK] Complete! Regenerated {progress['processed']} verbs with {total_pairs} total pairs")
+        log_print(f"  {engine.summary()}")
+        log_print(f"  Errors: {progress['errors']}")
+        if report:
+            print_packing_report(report, log_print)
+        print_cache_stats(engine.cache)
 
 def save_final_hints(hints, total_pairs, log=None):
     """Save final regenerated hints"""
     from datetime import datetime
 
-    output_path = Path("public/data/collocation_hints_NEW.json")
+    output_path = Path("public/data/collocation_meanings_NEW.json")
 
     data = {
         "version": "10.0.0",
-        "generator": "claude-api-clear-hints",
+        "generator": "claude-api-clear-meanings",
         "model": "claude-sonnet-4-5-20250929",
         "generatedAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "totalPairs": total_pairs,
-        "description": "Clear, direct hints for collocation meanings",
-        "hints": hints
+        "description": "Clear, direct meanings for collocation pairs",
+        "meanings": hints
     }
 
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -199,7 +289,7 @@ def save_final_hints(hints, total_pairs, log=None):
 
     msg1 = f"[OK] Final hints saved to {output_path}"
     msg2 = "\nTo use the new hints, rename:"
-    msg3 = f"  {output_path} -> public/data/collocation_hints.json"
+    msg3 = f"  {output_path} -> public/data/collocation_meanings.json"
 
     print(msg1)
     print(msg2)
@@ -211,10 +301,25 @@ def save_final_hints(hints, total_pairs, log=None):
         log.flush()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate collocation hints with clear descriptions")
+    add_engine_arguments(parser)
+    add_batch_arguments(parser)
+    add_packing_arguments(parser)
+    add_manifest_arguments(parser, MANIFEST_PATH)
+    parser.add_argument('--words', nargs='*', default=None,
+                        help="Only regenerate these verbs/adjectives; the rest is kept from the existing meanings")
+    args = parser.parse_args()
+
+    engine = engine_from_args(args, max_tokens=50, temperature=0.3)
+    if args.batch:
+        engine = batch_runner_from_args(args, cache=engine.cache, max_tokens=50, temperature=0.3)
+
     try:
-        regenerate_all_hints()
+        regenerate_all_hints(engine, packed=args.packed, max_rounds=args.max_rounds, words=args.words,
+                             manifest_path=args.manifest, changed_only=args.changed_only,
+                             show_diff=args.show_diff)
     except KeyboardInterrupt:
-        print("\n\nInterrupted by user. Progress has been saved to checkpoint file.")
+        print("\n\nInterrupted by user. Completed pairs are in the checkpoint journal; rerun to resume.")
     except Exception as e:
         print(f"\n\nError: {e}")
         import traceback
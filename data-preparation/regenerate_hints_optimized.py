@@ -4,13 +4,22 @@ Optimized hint regeneration: Generate forward hints via API, derive reverse hint
 This saves ~50% of API calls since forward and reverse hints are semantically identical.
 
 Instead of 4,492 API calls (2,246 forward + 2,246 reverse), we only need 2,246 calls.
+Calls are issued concurrently through llm_engine.HintEngine (semaphore + token bucket
++ retries) instead of one blocking request every 0.35s. Each finished pair is appended
+to a checkpoint journal, so an interrupted run resumes without repeating calls.
 """
 
+import argparse
 import json
-import os
-import time
 from pathlib import Path
-from anthropic import Anthropic
+
+from checkpoint_journal import CheckpointJournal
+from llm_cache import print_cache_stats
+from llm_batch import add_batch_arguments, batch_runner_from_args
+from llm_engine import add_engine_arguments, engine_from_args
+from pair_manifest import DEFAULT_MANIFEST_DIR, pair_record, prompt_hash
+
+JOURNAL_PATH = DEFAULT_MANIFEST_DIR / "collocation_hints.journal.jsonl"
 
 # Load environment variables from .env file
 try:
@@ -19,9 +28,6 @@ try:
 except ImportError:
     print("Warning: python-dotenv not installed. Install with: pip install python-dotenv")
 
-# Initialize Claude API
-client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-
 def load_vocabulary():
     """Load vocabulary to get English translations"""
     vocab_path = Path("public/data/vocabulary.json")
@@ -41,12 +47,12 @@ def load_current_hints():
     with open(hints_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def generate_forward_hint(verb_japanese, verb_english, noun_japanese, noun_english):
+def forward_hint_prompt(verb_japanese, verb_english, noun_japanese, noun_english):
     """
-    Generate a clear, direct hint for a verb+noun collocation using Claude API.
+    Build the prompt for a clear, direct hint for a verb+noun collocation.
     This is the ONLY API call - reverse hint will be derived from this.
     """
-    prompt = f"""Create a clear, natural English hint for this Japanese collocation:
+    return f"""Create a clear, natural English hint for this Japanese collocation:
 
 Verb/Adjective: {verb_japanese} ({verb_english})
 Noun: {noun_japanese} ({noun_english})
@@ -69,24 +75,6 @@ Examples of GOOD hints:
 
 Return ONLY the hint text, nothing else."""
 
-    try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=50,
-            temperature=0.3,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        hint = response.content[0].text.strip()
-        # Remove quotes if present
-        hint = hint.strip('"\'')
-        return hint
-
-    except Exception as e:
-        print(f"Error generating hint for {verb_japanese}+{noun_japanese}: {e}")
-        # Fallback: simple template
-        return f"to {verb_english} {noun_english}"
-
 def derive_reverse_hint(forward_hint):
     """
     Derive reverse hint from forward hint WITHOUT calling the API.
@@ -99,7 +87,7 @@ def derive_reverse_hint(forward_hint):
     # Simply return the same hint - it works for both directions
     return forward_hint
 
-def regenerate_all_hints_optimized():
+def regenerate_all_hints_optimized(engine):
     """Regenerate all hints with optimized approach: generate forward, derive reverse"""
     # Open log file for writing
     log_path = Path("hint_regeneration_optimized.log")
@@ -122,96 +110,88 @@ def regenerate_all_hints_optimized():
         log_print(f"\nRegenerating hints for {total_verbs} verbs/adjectives ({total_pairs} total pairs)...")
         log_print("OPTIMIZED: Generating forward hints via API, deriving reverse hints automatically")
         log_print(f"API calls: {total_pairs} (50% reduction from previous {total_pairs * 2} calls)")
-        log_print("This will take some time due to API rate limits.\n")
-
-        forward_hints = {}
-        reverse_hints = {}
-        processed = 0
-        errors = 0
+        log_print(f"{engine.describe()}\n")
 
+        prompts = {}
         for verb_japanese, noun_hints in hints_data['hints'].items():
             verb_english = vocab.get(verb_japanese, verb_japanese)
-            log.write(f"\n[{processed+1}/{total_verbs}] Processing: {verb_japanese} ({verb_english})\n")
-            log.flush()
-            print(f"[{processed+1}/{total_verbs}] Processing verb/adj {processed+1}/{total_verbs}")
-
-            forward_hints[verb_japanese] = {}
-
-            for noun_japanese, old_hint in noun_hints.items():
+            for noun_japanese in noun_hints:
                 noun_english = vocab.get(noun_japanese, noun_japanese)
+                prompts[(verb_japanese, noun_japanese)] = forward_hint_prompt(
+                    verb_japanese, verb_english, noun_japanese, noun_english)
+        prompt_hashes = {pair: prompt_hash(prompt) for pair, prompt in prompts.items()}
+
+        # Pairs finished by an interrupted run are replayed from the journal
+        journal = CheckpointJournal(JOURNAL_PATH)
+        resumed = journal.resume(prompt_hashes, engine.model)
+        results = {pair: record['output'] for pair, record in resumed.items()}
+
+        # Build one job per pair; the engine runs them concurrently
+        jobs = []
+        remaining = {}
+        for (verb_japanese, noun_japanese), prompt in prompts.items():
+            if (verb_japanese, noun_japanese) in resumed:
+                continue
+            remaining[verb_japanese] = remaining.get(verb_japanese, 0) + 1
+            # Fallback: simple template
+            fallback = f"to {vocab.get(verb_japanese, verb_japanese)} {vocab.get(noun_japanese, noun_japanese)}"
+            jobs.append(((verb_japanese, noun_japanese), prompt, fallback))
+
+        progress = {'processed': 0, 'errors': 0}
+
+        def on_result(key, forward_hint, ok):
+            """Log and journal each pair as it completes"""
+            verb_japanese, noun_japanese = key
+            # A failed pair keeps its current hint instead of the fallback
+            results[key] = forward_hint if ok else hints_data['hints'][verb_japanese][noun_japanese]
+            journal.append(pair_record(verb_japanese, noun_japanese, prompt_hashes[key],
+                                       engine.model, forward_hint, ok))
+            if not ok:
+                progress['errors'] += 1
+
+            log.write(f"  - {verb_japanese} + {noun_japanese}\n")
+            log.write(f"    OLD: {hints_data['hints'][verb_japanese][noun_japanese]}\n")
+            log.write(f"    FORWARD: {forward_hint}\n")
+            log.write(f"    REVERSE: {derive_reverse_hint(forward_hint)} (derived, no API call)\n")
+            log.flush()
 
-                log.write(f"  - {noun_japanese} ({noun_english})\n")
-                log.write(f"    OLD: {old_hint}\n")
-
-                # Generate forward hint via API
-                forward_hint = generate_forward_hint(verb_japanese, verb_english, noun_japanese, noun_english)
-                forward_hints[verb_japanese][noun_japanese] = forward_hint
-
-                # Derive reverse hint (NO API CALL)
-                reverse_hint = derive_reverse_hint(forward_hint)
-
-                # Build reverse hints structure
-                if noun_japanese not in reverse_hints:
-                    reverse_hints[noun_japanese] = {}
-                reverse_hints[noun_japanese][verb_japanese] = reverse_hint
-
-                log.write(f"    FORWARD: {forward_hint}\n")
-                log.write(f"    REVERSE: {reverse_hint} (derived, no API call)\n")
-                log.flush()
-
-                # Rate limiting: ~3 requests per second
-                time.sleep(0.35)
-
-            processed += 1
+            remaining[verb_japanese] -= 1
+            if remaining[verb_japanese] == 0:
+                progress['processed'] += 1
+                processed = progress['processed']
+                print(f"[{processed}/{len(remaining)}] Finished verb/adj {verb_japanese}")
 
-            # Save progress every 10 verbs
-            if processed % 10 == 0:
-                log_print(f"\n[OK] Progress checkpoint: {processed}/{total_verbs} verbs processed")
-                save_hints_checkpoint(forward_hints, reverse_hints, processed, total_verbs, total_pairs, log)
+        engine.run_sync(jobs, on_result=on_result)
+        forward_hints, reverse_hints = build_hint_maps(hints_data['hints'], results)
 
         # Save final results
         log_print("\n\nSaving final hints...")
         save_final_hints(forward_hints, reverse_hints, total_pairs, log)
+        journal.discard()
 
-        log_print(f"\n[OK] Complete! Regenerated {processed} verbs with {total_pairs} total pairs")
-        log_print(f"  API calls made: {total_pairs}")
+        log_print(f"\n[OK] Complete! Regenerated {progress['processed']} verbs with {total_pairs} total pairs")
+        log_print(f"  {engine.summary()}")
         log_print(f"  API calls saved: {total_pairs} (50% reduction)")
-        log_print(f"  Errors: {errors}")
-
-def save_hints_checkpoint(forward_hints, reverse_hints, processed, total, total_pairs, log=None):
-    """Save intermediate checkpoint for both forward and reverse hints"""
-    from datetime import datetime
+        log_print(f"  Errors: {progress['errors']}")
+        print_cache_stats(engine.cache)
 
-    # Save forward hints checkpoint
-    forward_checkpoint_path = Path("public/data/collocation_hints_NEW_checkpoint.json")
-    forward_data = {
-        "version": "10.0.0",
-        "generator": "claude-api-optimized",
-        "model": "claude-sonnet-4-5-20250929",
-        "status": f"In progress: {processed}/{total}",
-        "hints": forward_hints
-    }
-    with open(forward_checkpoint_path, 'w', encoding='utf-8') as f:
-        json.dump(forward_data, f, ensure_ascii=False, indent=2)
-
-    # Save reverse hints checkpoint
-    reverse_checkpoint_path = Path("public/data/reverse_hints_NEW_checkpoint.json")
-    reverse_data = {
-        "version": "10.0.0",
-        "generator": "claude-api-optimized-derived",
-        "model": "claude-sonnet-4-5-20250929",
-        "mode": "reverse",
-        "status": f"In progress: {processed}/{total}",
-        "hints": reverse_hints
-    }
-    with open(reverse_checkpoint_path, 'w', encoding='utf-8') as f:
-        json.dump(reverse_data, f, ensure_ascii=False, indent=2)
-
-    msg = f"  Checkpoints saved (forward + reverse)"
-    print(msg)
-    if log:
-        log.write(msg + '\n')
-        log.flush()
+def build_hint_maps(old_hints, results):
+    """
+    Assemble forward (verb -> noun) and derived reverse (noun -> verb) hint maps
+    from completed results, keeping the original verb/noun order.
+    """
+    forward_hints = {}
+    reverse_hints = {}
+    for verb_japanese, noun_hints in old_hints.items():
+        for noun_japanese in noun_hints:
+            if (verb_japanese, noun_japanese) not in results:
+                continue
+            forward_hint = results[(verb_japanese, noun_japanese)]
+            forward_hints.setdefault(verb_japanese, {})[noun_japanese] = forward_hint
+
+            # Derive reverse hint (NO API CALL)
+            reverse_hints.setdefault(noun_japanese, {})[verb_japanese] = derive_reverse_hint(forward_hint)
+    return forward_hints, reverse_hints
 
 def save_final_hints(forward_hints, reverse_hints, total_pairs, log=None):
     """Save final regenerated hints for both forward and reverse"""
@@ -260,10 +240,19 @@ def save_final_hints(forward_hints, reverse_hints, total_pairs, log=None):
         log.flush()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate forward hints via API and derive reverse hints")
+    add_engine_arguments(parser)
+    add_batch_arguments(parser)
+    args = parser.parse_args()
+
+    engine = engine_from_args(args, max_tokens=50, temperature=0.3)
+    if args.batch:
+        engine = batch_runner_from_args(args, cache=engine.cache, max_tokens=50, temperature=0.3)
+
     try:
-        regenerate_all_hints_optimized()
+        regenerate_all_hints_optimized(engine)
     except KeyboardInterrupt:
-        print("\n\nInterrupted by user. Progress has been saved to checkpoint files.")
+        print("\n\nInterrupted by user. Completed pairs are in the checkpoint journal; rerun to resume.")
     except Exception as e:
         print(f"\n\nError: {e}")
         import traceback
@@ -6,11 +6,18 @@ Reverse mode: noun + verb/adjective (e.g., 仕事 + する → "to do work")
 Instead of cryptic rephrasing, use simple, natural format.
 """
 
+import argparse
 import json
-import os
-import time
 from pathlib import Path
-from anthropic import Anthropic
+
+from checkpoint_journal import CheckpointJournal
+from collocation_graph import load_graph
+from llm_cache import print_cache_stats
+from llm_batch import add_batch_arguments, batch_runner_from_args
+from llm_engine import add_engine_arguments, engine_from_args, merge_groups, nest_results
+from pair_manifest import (DEFAULT_MANIFEST_DIR, PairManifest, add_manifest_arguments, print_pair_diff,
+                           prompt_hash, select_pairs)
+from prompt_packing import DEFAULT_MAX_ROUNDS, add_packing_arguments, print_packing_report, run_packed
 
 # Load environment variables from .env file
 try:
@@ -19,9 +26,6 @@ try:
 except ImportError:
     print("Warning: python-dotenv not installed. Install with: pip install python-dotenv")
 
-# Initialize Claude API
-client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-
 def load_vocabulary():
     """Load vocabulary to get English translations"""
     vocab_path = Path("public/data/vocabulary.json")
@@ -36,18 +40,24 @@ def load_vocabulary():
     return vocab_dict
 
 def load_current_reverse_hints():
-    """Load current reverse hints file"""
-    hints_path = Path("public/data/reverse_hints.json")
+    """Load current reverse meanings file (empty if it does not exist yet)"""
+    hints_path = Path("public/data/reverse_meanings.json")
+    if not hints_path.exists():
+        return {'meanings': {}}
     with open(hints_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def generate_clear_reverse_hint(noun_japanese, noun_english, verb_japanese, verb_english):
+def load_collocation_pairs():
+    """Load noun -> [verbs/adjectives] pairs from the collocation database"""
+    return load_graph(Path("public/data/collocations_complete.json")).groups(reverse=True)
+
+def clear_reverse_hint_prompt(noun_japanese, noun_english, verb_japanese, verb_english):
     """
-    Generate a clear, direct hint for a noun+verb/adjective collocation using Claude API.
+    Build the prompt for a clear, direct hint for a noun+verb/adjective collocation.
 
-    Returns a string like: "to do work" or "easy work"
+    The model should answer with a string like: "to do work" or "easy work"
     """
-    prompt = f"""Create a clear, natural English hint for this Japanese collocation:
+    return f"""Create a clear, natural English hint for this Japanese collocation:
 
 Noun: {noun_japanese} ({noun_english})
 Verb/Adjective: {verb_japanese} ({verb_english})
@@ -70,26 +80,65 @@ Examples of GOOD hints:
 
 Return ONLY the hint text, nothing else."""
 
-    try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=50,
-            temperature=0.3,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        hint = response.content[0].text.strip()
-        # Remove quotes if present
-        hint = hint.strip('"\'')
-        return hint
+def packed_clear_reverse_hint_prompt(noun_japanese, noun_english, verbs):
+    """
+    Build one prompt covering every verb/adjective of a noun (packed mode).
 
-    except Exception as e:
-        print(f"Error generating hint for {noun_japanese}+{verb_japanese}: {e}")
-        # Fallback: simple template
-        return f"{noun_english} {verb_english}"
+    Args:
+        noun_japanese: Noun in Japanese
+        noun_english: English translation of the noun
+        verbs: List of (verb_japanese, verb_english) tuples
+
+    The model should answer with a JSON object mapping each verb/adjective to its hint.
+    """
+    verb_lines = "\n".join(f"- {verb_japanese} ({verb_english})" for verb_japanese, verb_english in verbs)
+    return f"""Create clear, natural English hints for these Japanese collocations:
+
+Noun: {noun_japanese} ({noun_english})
+Verbs/Adjectives:
+{verb_lines}
+
+Each hint should describe what the noun+verb/adjective combination means in natural English.
+
+Requirements:
+- Be clear and direct (no cryptic descriptions)
+- Use natural phrasing that makes the meaning obvious
+- You can mention the verb/adjective in English for clarity
+- Be specific about what the combination means
+- Keep it short (under 10 words)
+
+Examples of GOOD hints:
+- 仕事 + する → "to do work/one's job"
+- 勉強 + 続ける → "to continue studying"
+- 仕事 + 多い → "to have a lot of work"
+- 人 + いい → "to be a good/nice person"
+- 天気 + 悪い → "bad weather; poor weather conditions"
+
+Return ONLY a JSON object mapping each verb/adjective (Japanese, exactly as listed) to its hint text.
+
+Example format:
+{{
+  "する": "to do work/one's job",
+  "多い": "to have a lot of work"
+}}
+
+Return ONLY the JSON object, no other text."""
+
+MANIFEST_PATH = DEFAULT_MANIFEST_DIR / "reverse_meanings.manifest.json"
+JOURNAL_PATH = DEFAULT_MANIFEST_DIR / "reverse_meanings.journal.jsonl"
 
-def regenerate_all_reverse_hints():
-    """Regenerate all reverse collocation hints with clear descriptions"""
+def regenerate_all_reverse_hints(engine, packed=False, max_rounds=DEFAULT_MAX_ROUNDS, words=None,
+                                 manifest_path=MANIFEST_PATH, changed_only=False, show_diff=False,
+                                 journal_path=JOURNAL_PATH):
+    """Regenerate all reverse collocation hints with clear descriptions
+
+    Pairs come from collocations_complete.json. With `words`, only those
+    nouns are regenerated and merged into the existing meanings. With
+    `changed_only`, only pairs added or changed since the pair manifest was
+    written are regenerated; removed pairs are dropped from the output.
+    Completed pairs are journaled as they arrive, so an interrupted run
+    resumes where it stopped.
+    """
     # Open log file for writing
     log_path = Path("reverse_hint_regeneration_detailed.log")
     with open(log_path, 'w', encoding='utf-8') as log:
@@ -104,92 +153,132 @@ def regenerate_all_reverse_hints():
 
         log_print("Loading current reverse hints...")
         hints_data = load_current_reverse_hints()
+        old_hints = hints_data['meanings']
 
-        total_nouns = len(hints_data['hints'])
+        log_print("Loading collocation pairs...")
+        pairs = load_collocation_pairs()
+
+        # The per-pair prompt identifies a pair's inputs, also in packed mode
+        prompts = {}
+        for noun_japanese, verbs in pairs.items():
+            noun_english = vocab.get(noun_japanese, noun_japanese)
+            for verb_japanese in verbs:
+                verb_english = vocab.get(verb_japanese, verb_japanese)
+                prompts[(noun_japanese, verb_japanese)] = clear_reverse_hint_prompt(
+                    noun_japanese, noun_english, verb_japanese, verb_english)
+        prompt_hashes = {pair: prompt_hash(prompt) for pair, prompt in prompts.items()}
+
+        manifest = PairManifest(manifest_path)
+        if not len(manifest) and old_hints:
+            seeded = manifest.seed(old_hints, prompt_hashes, hints_data.get('model', engine.model))
+            log_print(f"Seeded pair manifest from the existing meanings ({seeded} pairs)")
+        diff = manifest.diff(prompt_hashes, engine.model)
+        print_pair_diff(diff, log_print)
+        if show_diff:
+            return
+
+        # Pairs finished by an interrupted run are replayed from the journal
+        journal = CheckpointJournal(journal_path)
+        resumed = journal.resume(prompt_hashes, engine.model)
+        manifest.update(resumed.values())
+        results = {pair: record['output'] for pair, record in resumed.items()}
+
+        wanted = diff.dirty if changed_only else prompt_hashes
+        targets = select_pairs(pairs, [pair for pair in wanted if pair not in resumed])
+        if words is not None:
+            targets = {noun: verbs for noun, verbs in targets.items() if noun in set(words)}
+
+        total_nouns = len(targets)
         # Count total pairs
-        total_pairs = sum(len(verbs) for verbs in hints_data['hints'].values())
+        total_pairs = sum(len(verbs) for verbs in targets.values())
 
         log_print(f"\nRegenerating reverse hints for {total_nouns} nouns ({total_pairs} total pairs)...")
-        log_print("This will take some time due to API rate limits.\n")
-
-        new_hints = {}
-        processed = 0
-        errors = 0
+        log_print(f"{engine.describe()}\n")
 
-        for noun_japanese, verb_hints in hints_data['hints'].items():
+        # Build one job per pair; the engine runs them concurrently
+        jobs = []
+        remaining = {}
+        for noun_japanese, verb_hints in targets.items():
             noun_english = vocab.get(noun_japanese, noun_japanese)
-            log.write(f"\n[{processed+1}/{total_nouns}] Processing: {noun_japanese} ({noun_english})\n")
-            log.flush()
-            print(f"[{processed+1}/{total_nouns}] Processing noun {processed+1}/{total_nouns}")
-
-            new_hints[noun_japanese] = {}
-
-            for verb_japanese, old_hint in verb_hints.items():
+            remaining[noun_japanese] = len(verb_hints)
+            for verb_japanese in verb_hints:
                 verb_english = vocab.get(verb_japanese, verb_japanese)
+                # Fallback: simple template
+                jobs.append(((noun_japanese, verb_japanese), prompts[(noun_japanese, verb_japanese)],
+                             f"{noun_english} {verb_english}"))
+
+        progress = {'processed': 0, 'errors': 0}
+
+        def on_result(key, new_hint, ok):
+            """Log and journal each pair as it completes"""
+            noun_japanese, verb_japanese = key
+            # A failed pair keeps its existing hint; the fallback only fills new pairs
+            if ok or verb_japanese not in old_hints.get(noun_japanese, {}):
+                results[key] = new_hint
+            journal.append(manifest.record(noun_japanese, verb_japanese, prompt_hashes[key],
+                                           engine.model, new_hint, ok))
+            if not ok:
+                progress['errors'] += 1
+
+            log.write(f"  - {noun_japanese} + {verb_japanese}\n")
+            log.write(f"    OLD: {old_hints.get(noun_japanese, {}).get(verb_japanese, '(new pair)')}\n")
+            log.write(f"    NEW: {new_hint}\n")
+            log.flush()
 
-                log.write(f"  - {verb_japanese} ({verb_english})\n")
-                log.write(f"    OLD: {old_hint}\n")
-
-                # Generate new hint
-                new_hint = generate_clear_reverse_hint(noun_japanese, noun_english, verb_japanese, verb_english)
-                new_hints[noun_japanese][verb_japanese] = new_hint
-
-                log.write(f"    NEW: {new_hint}\n")
-                log.flush()
-
-                # Rate limiting: ~3 requests per second
-                time.sleep(0.35)
-
-            processed += 1
-
-            # Save progress every 10 nouns
-            if processed % 10 == 0:
-                log_print(f"\n[OK] Progress checkpoint: {processed}/{total_nouns} nouns processed")
-                save_hints_checkpoint(new_hints, processed, total_nouns, log)
+            remaining[noun_japanese] -= 1
+            if remaining[noun_japanese] == 0:
+                progress['processed'] += 1
+                processed = progress['processed']
+                print(f"[{processed}/{total_nouns}] Finished noun {noun_japanese}")
+
+        report = None
+        if packed:
+            # One JSON prompt per noun listing all of its verbs/adjectives
+            _, report = run_packed(
+                engine,
+                targets,
+                lambda noun, verbs: packed_clear_reverse_hint_prompt(
+                    noun, vocab.get(noun, noun), [(verb, vocab.get(verb, verb)) for verb in verbs]),
+                lambda noun, verb: f"{vocab.get(noun, noun)} {vocab.get(verb, verb)}",
+                on_result=on_result,
+                max_rounds=max_rounds,
+                unpacked_prompt=lambda noun, verb: clear_reverse_hint_prompt(
+                    noun, vocab.get(noun, noun), verb, vocab.get(verb, verb)),
+            )
+        else:
+            engine.run_sync(jobs, on_result=on_result)
+        new_hints = merge_groups(pairs, old_hints, nest_results(pairs, results))
 
         # Save final result
         log_print("\n\nSaving final reverse hints...")
-        save_final_hints(new_hints, total_pairs, log)
-
-        log_print(f"\n[OK] Complete! Regenerated {processed} nouns with {total_pairs} total pairs")
-        log_print(f"  Errors: {errors}")
-
-def save_hints_checkpoint(hints, processed, total, log=None):
-    """Save intermediate checkpoint"""
-    checkpoint_path = Path("public/data/reverse_hints_NEW_checkpoint.json")
-    data = {
-        "version": "10.0.0",
-        "generator": "claude-api-clear-hints-reverse",
-        "model": "claude-sonnet-4-5-20250929",
-        "mode": "reverse",
-        "status": f"In progress: {processed}/{total}",
-        "hints": hints
-    }
-
-    with open(checkpoint_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-    msg = f"  Checkpoint saved to {checkpoint_path}"
-    print(msg)
-    if log:
-        log.write(msg + '\n')
-        log.flush()
+        save_final_hints(new_hints, sum(len(verbs) for verbs in new_hints.values()), log)
+        manifest.discard(diff.removed)
+        manifest.save()
+        log_print(f"  Pair manifest saved to {manifest_path} ({len(manifest)} pairs)")
+        journal.discard()
+
+        log_print(f"\n[OK] Complete! Regenerated {progress['processed']} nouns with {total_pairs} total pairs")
+        log_print(f"  {engine.summary()}")
+        log_print(f"  Errors: {progress['errors']}")
+        if report:
+            print_packing_report(report, log_print)
+        print_cache_stats(engine.cache)
 
 def save_final_hints(hints, total_pairs, log=None):
     """Save final regenerated reverse hints"""
     from datetime import datetime
 
-    output_path = Path("public/data/reverse_hints_NEW.json")
+    output_path = Path("public/data/reverse_meanings_NEW.json")
 
     data = {
         "version": "10.0.0",
-        "generator": "claude-api-clear-hints-reverse",
+        "generator": "claude-api-clear-meanings-reverse",
         "model": "claude-sonnet-4-5-20250929",
         "mode": "reverse",
         "generatedAt": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "totalPairs": total_pairs,
-        "description": "Clear, direct hints for reverse collocation meanings (noun -> verb/adjective)",
-        "hints": hints
+        "description": "Clear, direct meanings for reverse collocation meanings (noun -> verb/adjective)",
+        "meanings": hints
     }
 
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -197,7 +286,7 @@ def save_final_hints(hints, total_pairs, log=None):
 
     msg1 = f"[OK] Final reverse hints saved to {output_path}"
     msg2 = "\nTo use the new hints, rename:"
-    msg3 = f"  {output_path} -> public/data/reverse_hints.json"
+    msg3 = f"  {output_path} -> public/data/reverse_meanings.json"
 
     print(msg1)
     print(msg2)
@@ -209,10 +298,25 @@ def save_final_hints(hints, total_pairs, log=None):
         log.flush()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate reverse collocation hints with clear descriptions")
+    add_engine_arguments(parser)
+    add_batch_arguments(parser)
+    add_packing_arguments(parser)
+    add_manifest_arguments(parser, MANIFEST_PATH)
+    parser.add_argument('--words', nargs='*', default=None,
+                        help="Only regenerate these nouns; the rest is kept from the existing meanings")
+    args = parser.parse_args()
+
+    engine = engine_from_args(args, max_tokens=50, temperature=0.3)
+    if args.batch:
+        engine = batch_runner_from_args(args, cache=engine.cache, max_tokens=50, temperature=0.3)
+
     try:
-        regenerate_all_reverse_hints()
+        regenerate_all_reverse_hints(engine, packed=args.packed, max_rounds=args.max_rounds, words=args.words,
+                                     manifest_path=args.manifest, changed_only=args.changed_only,
+                                     show_diff=args.show_diff)
     except KeyboardInterrupt:
-        print("\n\nInterrupted by user. Progress has been saved to checkpoint file.")
+        print("\n\nInterrupted by user. Completed pairs are in the checkpoint journal; rerun to resume.")
     except Exception as e:
         print(f"\n\nError: {e}")
         import traceback
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Versioned delta patches between published data releases.
+
+The app seeds IndexedDB once and never refreshes it, so shipping new
+collocations or meanings leaves clients stale unless they download all of
+public/data again (about 1.6 MB). Each export records the published
+artifacts as a numbered release. It also writes a patch from the previous
+release, so a client on release N applies a few kilobytes instead.
+
+    vocabulary        public/data/vocabulary.json
+    collocations      public/data/collocations_complete.json
+    meanings          public/data/collocation_meanings.json
+    reverse_meanings  public/data/reverse_meanings.json
+
+Patches are structural, so a changed gloss is sent as one string, not the
+whole file. Objects are diffed key by key. Lists of objects that all have a
+unique "id" (vocabulary entries) or "word" (collocation matches) are diffed
+item by item on that key. Anything else is replaced whole. A diff is one
+operation dict per changed container:
+
+    {"=": value}                      replace the value
+    {"-": [key, ...],                 drop these keys (removed, or moved)
+     "~": {key: diff, ...},           change these kept values in place
+     "+": [[index, key, value], ...]} insert at final index (lists: [index, value])
+    keyed lists also carry "key": "id" or "word"
+
+Kept items whose relative order did not change (the longest increasing run
+of their old positions) stay in place. Items that moved are dropped and
+inserted again, so applying the diff reproduces key and list order exactly.
+
+public/data/releases/ holds the published side:
+
+    manifest.json    {"version": 1, "current": 3, "releases": [
+                        {"release": 3, "previous": 2, "createdAt": ...,
+                         "artifacts": {"vocabulary": {"file": "vocabulary.json", "sha256": ..., "bytes": ...}, ...},
+                         "patch": {"file": "patch_2_3.json", "sha256": ..., "bytes": ...}}, ...]}
+    patch_2_3.json   {"version": 1, "from": 2, "to": 3,
+                      "artifacts": {name: {"from": sha256, "to": sha256, "diff": diff}}}
+
+Artifact hashes are the sha256 of the parsed content in compact JSON with
+key order kept (content_hash()), so they do not depend on indentation. A
+patch lists only the artifacts that changed, and "from" lets a client check
+that it is patching the right base. The first release, and any release
+whose previous content is no longer available, has "previous": null and no
+patch. Clients on such a chain restart load the full files.
+
+Diffing needs the previous release's content, checked against the
+manifest's hashes. The export keeps a local copy of it in
+output/release_snapshot/. Without a matching copy (a fresh clone, another
+machine, CI) the content comes from git: each artifact is looked up in the
+commits that changed its file, newest first, so a release whose files were
+committed can always be patched from. --previous names a directory to use
+instead. Every patch is applied to the base and compared with the new
+release before anything is written.
+
+Usage (from the repository root):
+    python data-preparation/release_patches.py              # record public/data as a new release if it changed
+    python data-preparation/release_patches.py --previous old/public/data   # diff against another copy
+                                                   # (default: output/release_snapshot/, then git history)
+    python data-preparation/release_patches.py --verify     # replay every stored patch check
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = REPO_ROOT / "public" / "data"
+RELEASES_DIR = DATA_DIR / "releases"
+SNAPSHOT_DIR = Path(__file__).resolve().parent / "output" / "release_snapshot"
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+ARTIFACTS = {
+    'vocabulary': 'vocabulary.json',
+    'collocations': 'collocations_complete.json',
+    'meanings': 'collocation_meanings.json',
+    'reverse_meanings': 'reverse_meanings.json',
+}
+
+# Fields that identify the items of a list that is diffed item by item
+LIST_KEYS = ('id', 'word')
+
+
+class PatchError(ValueError):
+    """A patch that does not apply to, or does not reproduce, a release."""
+
+
+def canonical(value) -> str:
+    """Compact JSON with key order kept: equal strings mean equal content and order."""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def content_hash(value) -> str:
+    return hashlib.sha256(canonical(value).encode('utf-8')).hexdigest()
+
+
+def list_key(old: list, new: list) -> Optional[str]:
+    """The field both lists' items are unique on, or None to replace the list whole."""
+    items = old + new
+    if not items or not all(isinstance(item, dict) for item in items):
+        return None
+    for field in LIST_KEYS:
+        if all(isinstance(item.get(field), str) for item in items):
+            if len({item[field] for item in old}) == len(old) and len({item[field] for item in new}) == len(new):
+                return field
+    return None
+
+
+def stable_keys(old_keys: List[str], new_keys: List[str]) -> set:
+    """Keys kept in both whose relative order is unchanged (longest increasing run of old positions)."""
+    old_positions = {key: position for position, key in enumerate(old_keys)}
+    kept = [key for key in new_keys if key in old_positions]
+    # Patience sorting: tails[i] is the smallest last position of a run of length i + 1
+    tails: List[int] = []
+    tail_index: List[int] = []
+    parents: List[int] = []
+    for index, key in enumerate(kept):
+        position = old_positions[key]
+        length = bisect_left(tails, position)
+        if length == len(tails):
+            tails.append(position)
+            tail_index.append(index)
+        else:
+            tails[length] = position
+            tail_index[length] = index
+        parents.append(tail_index[length - 1] if length else -1)
+    stable = set()
+    index = tail_index[-1] if tail_index else -1
+    while index >= 0:
+        stable.add(kept[index])
+        index = parents[index]
+    return stable
+
+
+def diff(old, new) -> Optional[dict]:
+    """The patch that turns old into new, or None if they are equal."""
+    if type(old) is type(new) and canonical(old) == canonical(new):
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        return _diff_items(list(old.items()), list(new.items()), None)
+    if isinstance(old, list) and isinstance(new, list):
+        field = list_key(old, new)
+        if field is not None:
+            return _diff_items([(item[field], item) for item in old], [(item[field], item) for item in new], field)
+    return {'=': new}
+
+
+def _diff_items(old_items: list, new_items: list, field: Optional[str]) -> dict:
+    old_values = dict(old_items)
+    stable = stable_keys([key for key, _ in old_items], [key for key, _ in new_items])
+    patch = {}
+    if field is not None:
+        patch['key'] = field
+    removed = [key for key, _ in old_items if key not in stable]
+    changed = {}
+    inserted = []
+    for index, (key, value) in enumerate(new_items):
+        if key not in stable:
+            inserted.append([index, value] if field is not None else [index, key, value])
+            continue
+        change = diff(old_values[key], value)
+        if change is not None:
+            changed[key] = change
+    if removed:
+        patch['-'] = removed
+    if changed:
+        patch['~'] = changed
+    if inserted:
+        patch['+'] = inserted
+    return patch
+
+
+def apply(old, patch: Optional[dict]):
+    """
+    old with the patch applied (old itself is not modified; unchanged values are shared).
+
+    Raises:
+        PatchError: if the patch does not fit old
+    """
+    if patch is None:
+        return old
+    if '=' in patch:
+        return patch['=']
+    field = patch.get('key')
+    if field is None:
+        if not isinstance(old, dict):
+            raise PatchError(f"object patch applied to {type(old).__name__}")
+        items = list(old.items())
+    else:
+        if not isinstance(old, list):
+            raise PatchError(f"list patch applied to {type(old).__name__}")
+        items = [(item[field], item) for item in old]
+
+    removed = set(patch.get('-', []))
+    values = {key: value for key, value in items if key not in removed}
+    if len(values) != len(items) - len(removed):
+        raise PatchError(f"patch removes keys that are missing: {sorted(removed - {key for key, _ in items})[:5]}")
+    for key, change in patch.get('~', {}).items():
+        if key not in values:
+            raise PatchError(f"patch changes missing key {key!r}")
+        values[key] = apply(values[key], change)
+
+    keys = [key for key, _ in items if key not in removed]
+    inserted = {}
+    for entry in patch.get('+', []):
+        if field is None:
+            index, key, value = entry
+        else:
+            index, value = entry
+            key = value[field]
+        inserted[index] = key
+        values[key] = value
+    for index in sorted(inserted):
+        if index > len(keys):
+            raise PatchError(f"insert at {index} past the end ({len(keys)})")
+        keys.insert(index, inserted[index])
+
+    if field is None:
+        return {key: values[key] for key in keys}
+    return [values[key] for key in keys]
+
+
+def load_artifacts(directory: Path) -> Dict[str, object]:
+    """Every artifact in a data directory, parsed."""
+    artifacts = {}
+    for name, filename in ARTIFACTS.items():
+        with open(directory / filename, 'r', encoding='utf-8') as f:
+            artifacts[name] = json.load(f)
+    return artifacts
+
+
+def make_patch(old: Dict[str, object], new: Dict[str, object], from_release: int, to_release: int) -> dict:
+    """The patch document between two releases' artifacts (only changed artifacts are listed)."""
+    changes = {}
+    for name in ARTIFACTS:
+        change = diff(old[name], new[name])
+        if change is not None:
+            changes[name] = {'from': content_hash(old[name]), 'to': content_hash(new[name]), 'diff': change}
+    return {'version': FORMAT_VERSION, 'from': from_release, 'to': to_release, 'artifacts': changes}
+
+
+def apply_patch(artifacts: Dict[str, object], patch: dict) -> Dict[str, object]:
+    """
+    A release's artifacts with a patch document applied.
+
+    Raises:
+        PatchError: if an artifact is not the one the patch was made from,
+            or the result is not the one it was made for
+    """
+    result = dict(artifacts)
+    for name, change in patch['artifacts'].items():
+        if content_hash(artifacts[name]) != change['from']:
+            raise PatchError(f"{name}: base content does not match the patch")
+        result[name] = apply(artifacts[name], change['diff'])
+        if content_hash(result[name]) != change['to']:
+            raise PatchError(f"{name}: patched content does not match the target release")
+    return result
+
+
+def write_json(path: Path, data, indent: Optional[int] = None) -> None:
+    """Write JSON atomically (compact unless indent is given)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    # json.dumps() encodes in C; json.dump() streams through the pure-Python encoder
+    if indent is None:
+        payload = canonical(data)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=indent)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def file_record(path: Path, content) -> dict:
+    return {'file': path.name, 'sha256': content_hash(content), 'bytes': path.stat().st_size}
+
+
+def load_manifest(releases_dir: Path) -> dict:
+    path = releases_dir / MANIFEST_NAME
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'version': FORMAT_VERSION, 'current': None, 'releases': []}
+
+
+def artifact_hashes(release: dict) -> Dict[str, str]:
+    return {name: record['sha256'] for name, record in release['artifacts'].items()}
+
+
+def _matching_artifacts(directory: Path, expected: Dict[str, str]) -> Optional[Dict[str, object]]:
+    """The artifacts in a directory if all are there with the expected content hashes."""
+    if not all((directory / filename).exists() for filename in ARTIFACTS.values()):
+        return None
+    artifacts = load_artifacts(directory)
+    return artifacts if {name: content_hash(value) for name, value in artifacts.items()} == expected else None
+
+
+def _git(cwd: Path, *args: str) -> bytes:
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True).stdout
+
+
+def git_artifacts(data_dir: Path, expected: Dict[str, str]) -> Optional[Dict[str, object]]:
+    """
+    Artifacts with the expected content hashes, from the git history of data_dir.
+
+    Each artifact is looked for in the commits that changed its file, newest first.
+
+    Returns:
+        The artifacts, or None if data_dir is not in a git repository or a
+        version is not in its history
+    """
+    try:
+        root = Path(_git(data_dir, 'rev-parse', '--show-toplevel').decode('utf-8').strip())
+        artifacts = {}
+        for name, filename in ARTIFACTS.items():
+            path = (data_dir / filename).resolve().relative_to(root.resolve()).as_posix()
+            for revision in _git(root, 'log', '--format=%H', '--', path).decode('ascii').split():
+                value = json.loads(_git(root, 'show', f"{revision}:{path}"))
+                if content_hash(value) == expected[name]:
+                    artifacts[name] = value
+                    break
+            else:
+                return None
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
+    return artifacts
+
+
+def release_base(current: dict, data_dir: Path = DATA_DIR, snapshot_dir: Path = SNAPSHOT_DIR,
+                 previous_dir: Optional[Path] = None) -> Optional[Dict[str, object]]:
+    """
+    The artifacts of the current release, to diff the next one against.
+
+    From previous_dir if given; otherwise from the snapshot, or else from the
+    git history of data_dir. None if none of them has that content.
+    """
+    expected = artifact_hashes(current)
+    if previous_dir is not None:
+        base = _matching_artifacts(previous_dir, expected)
+        if base is None:
+            print(f"Warning: {previous_dir} is not release {current['release']}")
+        return base
+    base = _matching_artifacts(snapshot_dir, expected)
+    if base is None:
+        base = git_artifacts(data_dir, expected)
+        if base is not None:
+            print(f"Release {current['release']} taken from the git history of {data_dir}")
+    return base
+
+
+def export_release(data_dir: Path = DATA_DIR, releases_dir: Path = RELEASES_DIR,
+                   snapshot_dir: Path = SNAPSHOT_DIR, previous_dir: Optional[Path] = None) -> Optional[dict]:
+    """
+    Record the artifacts in data_dir as a new release, with a patch from the current one.
+
+    Args:
+        data_dir: Directory holding the published artifacts
+        releases_dir: Where the manifest and patches go
+        snapshot_dir: Copy of the current release's artifacts, for the next diff
+        previous_dir: Diff against the artifacts here instead of the snapshot or git history
+
+    Returns:
+        The new release entry, or None if nothing changed since the current release
+    """
+    manifest = load_manifest(releases_dir)
+    current = manifest['releases'][-1] if manifest['releases'] else None
+    artifacts = load_artifacts(data_dir)
+    hashes = {name: content_hash(value) for name, value in artifacts.items()}
+    if current is not None and artifact_hashes(current) == hashes:
+        print(f"Release {current['release']} is current, nothing to export")
+        return None
+
+    number = current['release'] + 1 if current else 1
+    release = {'release': number, 'previous': None, 'createdAt': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+               'artifacts': {name: file_record(data_dir / filename, artifacts[name])
+                             for name, filename in ARTIFACTS.items()},
+               'patch': None}
+
+    base = release_base(current, data_dir, snapshot_dir, previous_dir) if current is not None else None
+    if base is not None:
+        patch = make_patch(base, artifacts, current['release'], number)
+        if canonical(apply_patch(base, patch)) != canonical(artifacts):
+            raise PatchError(f"patch {current['release']} -> {number} does not reproduce the release")
+        patch_path = releases_dir / f"patch_{current['release']}_{number}.json"
+        write_json(patch_path, patch)
+        release['previous'] = current['release']
+        release['patch'] = file_record(patch_path, patch)
+    elif current is not None:
+        print(f"Warning: no copy of release {current['release']} found, starting a new chain")
+
+    manifest['releases'].append(release)
+    manifest['current'] = number
+    write_json(releases_dir / MANIFEST_NAME, manifest, indent=2)
+
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    for filename in ARTIFACTS.values():
+        shutil.copyfile(data_dir / filename, snapshot_dir / filename)
+    return release
+
+
+def verify_patches(releases_dir: Path = RELEASES_DIR) -> List[str]:
+    """
+    Check every stored patch against the manifest's hashes.
+
+    Returns:
+        Problems found (empty if every patch is consistent)
+    """
+    manifest = load_manifest(releases_dir)
+    by_number = {release['release']: release for release in manifest['releases']}
+    problems = []
+    for release in manifest['releases']:
+        if release['patch'] is None:
+            continue
+        with open(releases_dir / release['patch']['file'], 'r', encoding='utf-8') as f:
+            patch = json.load(f)
+        if content_hash(patch) != release['patch']['sha256']:
+            problems.append(f"{release['patch']['file']}: hash does not match the manifest")
+        previous = artifact_hashes(by_number[release['previous']])
+        target = artifact_hashes(release)
+        for name in ARTIFACTS:
+            change = patch['artifacts'].get(name)
+            expected = (previous[name], target[name])
+            if change is None and expected[0] != expected[1]:
+                problems.append(f"{release['patch']['file']}: {name} changed but has no diff")
+            elif change is not None and (change['from'], change['to']) != expected:
+                problems.append(f"{release['patch']['file']}: {name} hashes do not match the manifest")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record public/data as a release with a delta patch")
+    parser.add_argument('--data', type=Path, default=DATA_DIR, help="Published data directory")
+    parser.add_argument('--releases', type=Path, default=RELEASES_DIR, help="Manifest and patch directory")
+    parser.add_argument('--previous', type=Path, help="Copy of the current release to diff against "
+                                                      "(default: the snapshot in output/, then git history)")
+    parser.add_argument('--verify', action='store_true', help="Only check the stored patches against the manifest")
+    args = parser.parse_args()
+
+    if not args.verify:
+        release = export_release(args.data, args.releases, previous_dir=args.previous)
+        if release is not None:
+            total = sum(record['bytes'] for record in release['artifacts'].values())
+            if release['patch']:
+                print(f"Release {release['release']}: patch from {release['previous']} is "
+                      f"{release['patch']['bytes']:,} bytes ({total:,} bytes of artifacts)")
+            else:
+                print(f"Release {release['release']}: base release ({total:,} bytes of artifacts)")
+
+    problems = verify_patches(args.releases)
+    for problem in problems:
+        print(f"  {problem}")
+    if problems:
+        sys.exit(1)
+    print("OK: every patch matches the manifest")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,287 +2,60 @@
 """
 Comprehensive hint quality fixer with detailed semantic analysis.
 Eliminates ALL generic hints and creates specific, meaningful categories.
+
+The categories and keywords for each verb and adjective live in
+rules/category_scores.json (see hint_rules.py); --watch regenerates whenever
+that file changes.
 """
 
+import argparse
 import json
 import re
 from collections import defaultdict, Counter
 from typing import Dict, List, Tuple
 import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collocation_graph import CollocationGraph, load_graph
+from hint_rules import CATEGORY_SCORE_RULES, RuleSet, add_watch_argument, load_rules, watch
+from hint_workers import add_workers_argument, map_shards
+from keyword_classifier import KeywordClassifier, compile_rules
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Comprehensive verb-specific categorization rules
-VERB_CATEGORIES = {
-    'する': {
-        'professional activities': ['work', 'job', 'business', 'research', 'study', 'part-time'],
-        'daily routines': ['shopping', 'cleaning', 'laundry', 'cooking', 'housework'],
-        'sports and exercise': ['exercise', 'sport', 'training', 'swim', 'judo', 'tennis', 'match'],
-        'communication activities': ['talk', 'speech', 'conversation', 'contact', 'greeting', 'chat'],
-        'planning tasks': ['plan', 'preparation', 'reservation', 'arrangement', 'preview', 'review'],
-        'major life events': ['marriage', 'graduation', 'enrollment', 'admission', 'birth'],
-        'business operations': ['import', 'export', 'trade', 'production', 'broadcast'],
-        'social interactions': ['introduction', 'invitation', 'consultation', 'care'],
-        'leisure activities': ['travel', 'tour', 'sightseeing', 'flower viewing'],
-        'helpful services': ['translation', 'guidance', 'help', 'assistance'],
-        'problems encountered': ['failure', 'mistake', 'quarrel', 'trouble', 'breakdown', 'fight'],
-        'medical procedures': ['injection', 'hospitalization', 'discharge', 'surgery'],
-        'study activities': ['review', 'practice', 'check', 'drill', 'preparation'],
-        'competitive events': ['competition', 'match', 'game', 'contest', 'exam', 'test'],
-        'mental processes': ['worry', 'relief', 'attention', 'care', 'peace of mind'],
-        'formal actions': ['bow', 'thanks', 'excuse', 'rudeness', 'celebration'],
-        'daily activities': ['walk', 'departure', 'attendance', 'opposition', 'sleep'],
-    },
-    '買う': {
-        'clothing items': ['clothes', 'shirt', 'shoe', 'hat', 'coat', 'jacket', 'underwear', 'socks', 'gloves', 'sweater', 'suit', 'dress'],
-        'food and groceries': ['vegetable', 'meat', 'fish', 'egg', 'bread', 'milk', 'rice', 'food', 'butter', 'jam'],
-        'reading materials': ['book', 'magazine', 'newspaper', 'dictionary', 'notebook', 'map'],
-        'expensive purchases': ['car', 'house', 'land', 'apartment', 'automobile', 'refrigerator'],
-        'gifts and souvenirs': ['present', 'gift', 'souvenir', 'flower', 'doll', 'toy'],
-        'tickets and passes': ['ticket', 'pass', 'postcard', 'stamp'],
-        'personal care': ['medicine', 'cosmetic', 'soap', 'cigarette', 'tobacco'],
-        'electronic devices': ['computer', 'camera', 'television', 'tape', 'film', 'record', 'fax'],
-        'household items': ['furniture', 'dish', 'cup', 'bowl', 'knife', 'fork', 'spoon', 'stove'],
-        'stationery items': ['pen', 'pencil', 'notebook', 'paper', 'envelope', 'calendar'],
-        'beverages': ['alcohol', 'beer', 'wine', 'sake', 'tea', 'coffee'],
-        'accessories': ['ring', 'watch', 'accessory', 'bag', 'suitcase', 'handkerchief'],
-        'pet supplies': ['pet', 'animal'],
-        'fabric materials': ['silk', 'thread', 'cloth'],
-    },
-    '来る': {
-        'people arriving': ['person', 'friend', 'guest', 'visitor', 'customer', 'student'],
-        'family visits': ['mother', 'father', 'parent', 'brother', 'sister', 'son', 'daughter', 'uncle', 'aunt'],
-        'seasonal arrivals': ['season', 'spring', 'summer', 'autumn', 'winter', 'fall'],
-        'time periods': ['tomorrow', 'today', 'week', 'month', 'year', 'morning', 'evening'],
-        'scheduled events': ['birthday', 'exam', 'meeting', 'party', 'festival'],
-        'arriving messages': ['letter', 'mail', 'email', 'message', 'call', 'phone'],
-        'transport arrivals': ['bus', 'train', 'taxi', 'car', 'airplane', 'ship'],
-        'weather arrivals': ['rain', 'snow', 'typhoon', 'storm', 'wind'],
-        'officials arriving': ['police', 'doctor', 'teacher', 'official'],
-        'time references': ['next', 'after', 'later', 'soon'],
-    },
-    'ある': {
-        'abstract concepts': ['thing', 'matter', 'problem', 'reason', 'cause', 'way', 'meaning'],
-        'nearby facilities': ['store', 'shop', 'bank', 'station', 'hospital', 'school', 'park'],
-        'building features': ['house', 'room', 'entrance', 'window', 'door', 'floor', 'wall'],
-        'available time': ['time', 'leisure', 'spare', 'margin', 'free time', 'break'],
-        'financial resources': ['money', 'budget', 'fund', 'capital'],
-        'opportunities present': ['chance', 'opportunity', 'possibility'],
-        'scheduled events': ['meeting', 'party', 'class', 'lesson', 'appointment'],
-        'physical objects': ['desk', 'chair', 'table', 'book', 'pen'],
-        'existing plans': ['plan', 'schedule', 'appointment', 'arrangement'],
-        'possessed qualities': ['experience', 'knowledge', 'skill', 'interest', 'confidence'],
-        'relationships present': ['relation', 'connection', 'relationship', 'tie'],
-        'emotional states': ['interest', 'confidence', 'hope', 'enjoyment'],
-        'available documents': ['document', 'paper', 'report', 'file'],
-        'established rules': ['rule', 'law', 'regulation', 'custom'],
-        'locations': ['place', 'spot', 'position', 'side', 'direction'],
-    },
-    '行く': {
-        'educational places': ['school', 'university', 'class', 'library', 'college'],
-        'work destinations': ['company', 'office', 'work', 'factory', 'shop'],
-        'shopping venues': ['store', 'shop', 'restaurant', 'market', 'department store'],
-        'leisure spots': ['park', 'beach', 'mountain', 'sea', 'cinema', 'pool'],
-        'travel locations': ['country', 'city', 'town', 'abroad', 'overseas'],
-        'public services': ['hospital', 'bank', 'post', 'station', 'airport'],
-        'social events': ['party', 'meeting', 'wedding', 'funeral', 'ceremony'],
-        'home destinations': ['home', 'house', 'room', 'apartment'],
-        'directional movement': ['outside', 'inside', 'upstairs', 'downstairs'],
-    },
-    '見る': {
-        'visual media': ['television', 'movie', 'film', 'video', 'news', 'program'],
-        'reading materials': ['book', 'newspaper', 'magazine', 'map', 'menu'],
-        'natural views': ['sky', 'star', 'moon', 'mountain', 'sea', 'scenery'],
-        'people observed': ['face', 'person', 'child', 'friend', 'baby'],
-        'visual artwork': ['picture', 'photo', 'painting', 'art', 'exhibition'],
-        'documents checked': ['document', 'paper', 'letter', 'email', 'report'],
-        'dreams and visions': ['dream', 'future', 'vision'],
-        'performances': ['play', 'show', 'concert', 'dance'],
-    },
-    '読む': {
-        'books to read': ['book', 'novel', 'story', 'tale'],
-        'news sources': ['newspaper', 'news', 'article', 'report'],
-        'periodicals': ['magazine', 'journal', 'review'],
-        'correspondence': ['letter', 'email', 'message', 'card'],
-        'reference books': ['dictionary', 'encyclopedia', 'textbook'],
-        'academic texts': ['paper', 'thesis', 'dissertation', 'essay'],
-        'instructions': ['manual', 'guide', 'directions'],
-    },
-    '書く': {
-        'correspondence': ['letter', 'email', 'message', 'card', 'postcard'],
-        'academic writing': ['paper', 'report', 'essay', 'thesis', 'assignment'],
-        'creative works': ['story', 'novel', 'poem', 'diary', 'journal'],
-        'official forms': ['application', 'resume', 'form', 'document'],
-        'quick notes': ['note', 'memo', 'list', 'reminder'],
-        'text elements': ['character', 'kanji', 'word', 'name', 'address'],
-    },
-    '話す': {
-        'languages spoken': ['japanese', 'english', 'language', 'chinese', 'french'],
-        'discussion topics': ['story', 'news', 'topic', 'matter', 'subject'],
-        'personal sharing': ['secret', 'truth', 'lie', 'opinion', 'feeling'],
-        'verbal elements': ['word', 'phrase', 'sentence', 'expression'],
-    },
-    '聞く': {
-        'audio content': ['music', 'song', 'radio', 'cd', 'concert'],
-        'news and info': ['news', 'story', 'rumor', 'information', 'report'],
-        'audible sounds': ['sound', 'voice', 'noise', 'bell'],
-        'spoken words': ['talk', 'speech', 'lecture', 'explanation', 'conversation'],
-        'requests heard': ['question', 'request', 'opinion', 'advice', 'suggestion'],
-    },
-    '食べる': {
-        'main meals': ['breakfast', 'lunch', 'dinner', 'meal', 'supper'],
-        'staple foods': ['rice', 'bread', 'noodle', 'pasta', 'soup'],
-        'protein sources': ['meat', 'fish', 'egg', 'chicken', 'beef', 'pork'],
-        'produce items': ['vegetable', 'fruit', 'salad', 'apple', 'orange'],
-        'sweet treats': ['snack', 'candy', 'cake', 'chocolate', 'ice cream'],
-        'Japanese dishes': ['sushi', 'tempura', 'ramen', 'udon', 'soba'],
-    },
-    '飲む': {
-        'hot drinks': ['coffee', 'tea', 'cocoa', 'green tea'],
-        'cold drinks': ['water', 'juice', 'soda', 'cola', 'milk'],
-        'alcoholic drinks': ['alcohol', 'beer', 'wine', 'sake', 'whiskey'],
-        'medicine liquids': ['medicine', 'syrup', 'supplement'],
-    },
-    '作る': {
-        'meals prepared': ['food', 'dish', 'meal', 'cooking', 'cuisine'],
-        'items created': ['product', 'machine', 'device', 'toy', 'furniture'],
-        'plans drafted': ['document', 'plan', 'schedule', 'list', 'report'],
-        'bonds formed': ['friend', 'relationship', 'connection', 'partnership'],
-        'groups established': ['company', 'group', 'team', 'club', 'organization'],
-        'art produced': ['art', 'music', 'song', 'poem', 'painting'],
-    },
-    '使う': {
-        'tools employed': ['tool', 'pen', 'pencil', 'scissors', 'knife'],
-        'tech utilized': ['computer', 'phone', 'internet', 'app', 'software'],
-        'resources spent': ['money', 'time', 'energy', 'effort'],
-        'words applied': ['word', 'language', 'expression', 'phrase'],
-        'vehicles used': ['car', 'train', 'bus', 'bicycle', 'taxi'],
-        'rooms accessed': ['room', 'bathroom', 'kitchen', 'toilet'],
-    },
-    '持つ': {
-        'items carried': ['bag', 'umbrella', 'key', 'wallet', 'purse'],
-        'documents held': ['passport', 'license', 'ticket', 'card', 'visa'],
-        'qualities possessed': ['interest', 'opinion', 'confidence', 'dream', 'hope'],
-        'duties borne': ['responsibility', 'job', 'duty', 'role'],
-        'relations kept': ['child', 'family', 'friend', 'pet'],
-    },
-    '知る': {
-        'people known': ['person', 'friend', 'teacher', 'neighbor'],
-        'facts learned': ['fact', 'truth', 'news', 'information', 'detail'],
-        'places familiar': ['place', 'address', 'location', 'area'],
-        'methods understood': ['method', 'way', 'rule', 'technique'],
-        'secrets discovered': ['secret', 'reason', 'cause', 'mystery'],
-    },
-    '思う': {
-        'thoughts held': ['opinion', 'idea', 'belief', 'view', 'thought'],
-    },
-    '言う': {
-        'words expressed': ['word', 'phrase', 'sentence', 'expression'],
-        'info stated': ['name', 'address', 'number', 'date'],
-        'views voiced': ['opinion', 'idea', 'thought', 'belief'],
-        'courtesy phrases': ['greeting', 'thanks', 'apology', 'excuse'],
-    },
-    '出る': {
-        'places exited': ['house', 'home', 'room', 'building', 'office'],
-        'events attended': ['meeting', 'party', 'competition', 'contest', 'conference'],
-        'results appearing': ['result', 'answer', 'conclusion', 'outcome'],
-        'items released': ['book', 'magazine', 'newspaper', 'album'],
-    },
-    '入る': {
-        'spaces entered': ['room', 'building', 'store', 'restaurant', 'house'],
-        'groups joined': ['company', 'school', 'university', 'club', 'team'],
-        'water entered': ['bath', 'shower', 'pool', 'hot spring'],
-        'systems entered': ['hospital', 'prison', 'army'],
-    },
-}
-
-# Adjective-specific categorization rules
-ADJECTIVE_CATEGORIES = {
-    'いい': {
-        'favorable conditions': ['weather', 'climate', 'condition', 'situation'],
-        'positive outcomes': ['result', 'grade', 'score', 'performance', 'achievement'],
-        'good people': ['person', 'child', 'friend', 'teacher', 'student'],
-        'smart solutions': ['idea', 'thought', 'plan', 'method', 'way'],
-        'positive feelings': ['health', 'feeling', 'mood', 'atmosphere'],
-        'good timing': ['chance', 'opportunity', 'timing', 'moment'],
-        'quality relationships': ['relationship', 'friendship', 'partnership'],
-    },
-    'おいしい': {
-        'tasty dishes': ['food', 'meal', 'dish', 'cuisine', 'cooking'],
-    },
-    '大きい': {
-        'large structures': ['building', 'house', 'room', 'tree', 'mountain'],
-        'prominent features': ['hand', 'eye', 'mouth', 'voice', 'sound'],
-        'major issues': ['problem', 'difference', 'change', 'impact'],
-    },
-    '小さい': {
-        'little ones': ['child', 'baby', 'animal', 'insect'],
-        'compact spaces': ['room', 'house', 'apartment', 'office'],
-        'quiet sounds': ['voice', 'sound', 'noise'],
-    },
-    '新しい': {
-        'latest products': ['car', 'house', 'computer', 'phone', 'model'],
-        'fresh ideas': ['idea', 'information', 'news', 'method', 'approach'],
-        'new beginnings': ['life', 'job', 'school', 'year', 'start'],
-    },
-    '古い': {
-        'historic items': ['building', 'house', 'temple', 'book', 'document'],
-        'traditions kept': ['custom', 'tradition', 'story', 'legend'],
-        'longtime connections': ['friend', 'relationship', 'memory'],
-    },
-    '難しい': {
-        'tough problems': ['problem', 'question', 'exam', 'test', 'puzzle'],
-        'complex language': ['word', 'kanji', 'language', 'grammar', 'expression'],
-        'challenging work': ['work', 'job', 'task', 'project'],
-    },
-    '簡単': {
-        'easy problems': ['problem', 'question', 'test', 'task'],
-        'simple tasks': ['work', 'job', 'cooking', 'operation'],
-        'clear methods': ['method', 'way', 'explanation', 'process'],
-    },
-}
-
 class ComprehensiveHintFixer:
     """Fix hint quality with comprehensive semantic analysis."""
 
-    def __init__(self):
+    def __init__(self, rules_path: str = CATEGORY_SCORE_RULES):
         """Initialize the fixer."""
-        self.collocations = {}
+        self.rules_path = rules_path
+        self.graph: CollocationGraph = None
         self.hints = {}
         self.stats = defaultdict(int)
 
+    @property
+    def rules(self) -> RuleSet:
+        """The category tables, reloaded when the rule file changes."""
+        return load_rules(self.rules_path)
+
     def load_data(self, path: str) -> None:
         """Load collocation data."""
         logger.info(f"Loading data from {path}")
-        with open(path, 'r', encoding='utf-8') as f:
-            self.collocations = json.load(f)
-        logger.info(f"Loaded {len(self.collocations['words'])} words")
+        self.graph = load_graph(path)
+        logger.info(f"Loaded {len(self.graph)} words")
 
     def _find_best_category(self, word_type: str, word: str, noun: Dict,
-                           categories: Dict[str, List[str]]) -> str:
+                           categories: KeywordClassifier) -> str:
         """Find the best category for a noun based on its English meaning."""
         noun_english = noun['english'].lower()
-        noun_word = noun['word']
-
-        # Check each category's keywords
-        best_match = None
-        best_score = 0
-
-        for category, keywords in categories.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in noun_english:
-                    # Exact word match scores higher
-                    if f' {keyword} ' in f' {noun_english} ' or noun_english.startswith(f'{keyword} ') or noun_english.endswith(f' {keyword}'):
-                        score += 3
-                    else:
-                        score += 1
 
-            if score > best_score:
-                best_score = score
-                best_match = category
+        # Highest keyword score wins (exact word matches score higher), ties keep the earlier category
+        best_match = categories.best(noun_english)
 
         # If no match found, determine a fallback based on word type
         if not best_match:
@@ -315,42 +88,64 @@ class ComprehensiveHintFixer:
 
         return best_match
 
-    def generate_hints(self) -> Dict:
-        """Generate comprehensive hints for all collocations."""
+    def generate_hints(self, workers: int = 1) -> Dict:
+        """
+        Generate comprehensive hints for all collocations.
+
+        Args:
+            workers: Worker processes to shard the words across (1 = in process);
+                the hints and stats are the same for any count
+        """
         logger.info("Generating comprehensive hints")
 
         all_hints = {}
+        words = self.graph.words_of_type('verb', 'adjective')
+        weights = [self.graph.degree(word) for word in words]
+        for shard_hints, shard_stats in map_shards(self, '_generate_shard', words, weights, workers):
+            all_hints.update(shard_hints)
+            for key, count in shard_stats.items():
+                self.stats[key] += count
 
-        # Process each word
-        for word, data in self.collocations['words'].items():
-            word_type = data['type']
+        logger.info(f"Generated {self.stats['hints_created']} hints")
+        return all_hints
+
+    def _generate_shard(self, words: List[str]) -> Tuple[Dict[str, Dict[str, str]], Counter]:
+        """
+        Generate the hints of one shard of verbs and adjectives (see hint_workers.py).
+
+        Returns:
+            ({word: {noun: hint}}, stats counter)
+        """
+        all_hints = {}
+        stats = Counter()
+        rules = self.rules
 
-            if word_type not in ['verb', 'adjective']:
-                continue
+        # Process each word
+        for word in words:
+            word_type = self.graph.type(word)
 
             word_hints = {}
 
-            # Get the appropriate categories for this word
+            # Get the appropriate categories for this word (rules/category_scores.json)
             if word_type == 'verb':
-                categories = VERB_CATEGORIES.get(word, {})
-                self.stats['verbs_processed'] += 1
+                table = rules.table_for(word, 'verb')
+                stats['verbs_processed'] += 1
             else:
                 # Check various forms of the adjective
-                categories = None
+                table = None
                 for adj_form in [word, word.replace('い', ''), word + 'い']:
-                    if adj_form in ADJECTIVE_CATEGORIES:
-                        categories = ADJECTIVE_CATEGORIES[adj_form]
+                    table = rules.table_for(adj_form, 'adjective')
+                    if table is not None:
                         break
-                if not categories:
-                    categories = {}
-                self.stats['adjectives_processed'] += 1
+                stats['adjectives_processed'] += 1
+            classifier = table.classifier if table is not None else compile_rules([])
 
             # Process each noun
-            for noun in data['matches'].get('nouns', []):
+            for noun in self.graph.matches(word):
                 noun_word = noun['word']
 
                 # Find the best category for this noun
-                category = self._find_best_category(word_type, word, noun, categories)
+                category = self._find_best_category(word_type, word, noun, classifier)
 
                 # Clean up the category name (remove underscores, make it readable)
                 hint = category.replace('_', ' ')
@@ -362,7 +157,7 @@ class ComprehensiveHintFixer:
                 generic_terms = ['things', 'actions', 'concepts', 'stuff']
                 for term in generic_terms:
                     if term in hint.lower():
-                        self.stats['generic_eliminated'] += 1
+                        stats['generic_eliminated'] += 1
                         # Replace with more specific hint
                         if word_type == 'verb':
                             hint = category.replace('things', 'items').replace('actions', 'activities')
@@ -370,13 +165,12 @@ class ComprehensiveHintFixer:
                             hint = category.replace('things', 'items')
 
                 word_hints[noun_word] = hint
-                self.stats['hints_created'] += 1
+                stats['hints_created'] += 1
 
             if word_hints:
                 all_hints[word] = word_hints
 
-        logger.info(f"Generated {self.stats['hints_created']} hints")
-        return all_hints
+        return all_hints, stats
 
     def validate_coverage(self, hints: Dict) -> Dict:
         """Validate hint coverage and quality."""
@@ -392,34 +186,33 @@ class ComprehensiveHintFixer:
         total_expected = 0
         total_found = 0
 
-        for word, data in self.collocations['words'].items():
-            if data['type'] in ['verb', 'adjective']:
-                nouns = data['matches'].get('nouns', [])
-                total_expected += len(nouns)
+        for word in self.graph.words_of_type('verb', 'adjective'):
+            nouns = self.graph.matches(word)
+            total_expected += len(nouns)
 
-                if word in hints:
-                    found = len(hints[word])
-                    total_found += found
+            if word in hints:
+                found = len(hints[word])
+                total_found += found
 
-                    # Check for quality issues
-                    hint_counts = Counter(hints[word].values())
+                # Check for quality issues
+                hint_counts = Counter(hints[word].values())
 
-                    for noun, hint in hints[word].items():
-                        # Check for generic terms
-                        if any(term in hint.lower() for term in ['things', 'actions', 'concepts', 'related items']):
-                            validation['generic_hints'].append(f"{word}-{noun}: {hint}")
+                for noun, hint in hints[word].items():
+                    # Check for generic terms
+                    if any(term in hint.lower() for term in ['things', 'actions', 'concepts', 'related items']):
+                        validation['generic_hints'].append(f"{word}-{noun}: {hint}")
 
-                        # Check for markers
-                        if '[' in hint and ']' in hint:
-                            validation['quality_issues'].append(f"Marker in {word}-{noun}: {hint}")
+                    # Check for markers
+                    if '[' in hint and ']' in hint:
+                        validation['quality_issues'].append(f"Marker in {word}-{noun}: {hint}")
 
-                    # Check specificity
-                    if nouns:
-                        max_usage = max(hint_counts.values()) if hint_counts else 0
-                        specificity_pct = (max_usage / len(nouns)) * 100
-                        if specificity_pct > 70:
-                            most_common_hint = hint_counts.most_common(1)[0][0]
-                            validation['verb_specificity'][word] = f"{specificity_pct:.1f}% use '{most_common_hint}'"
+                # Check specificity
+                if nouns:
+                    max_usage = max(hint_counts.values()) if hint_counts else 0
+                    specificity_pct = (max_usage / len(nouns)) * 100
+                    if specificity_pct > 70:
+                        most_common_hint = hint_counts.most_common(1)[0][0]
+                        validation['verb_specificity'][word] = f"{specificity_pct:.1f}% use '{most_common_hint}'"
 
         validation['coverage']['total_expected'] = total_expected
         validation['coverage']['total_found'] = total_found
@@ -457,19 +250,15 @@ class ComprehensiveHintFixer:
         return validation
 
 
-def main():
-    """Main execution."""
+def fix_hints(input_path: str, output_path: str, workers: int = 1) -> None:
+    """Generate (across `workers` processes), save and validate the hints, then print a report."""
     fixer = ComprehensiveHintFixer()
 
-    # File paths
-    input_path = r'C:\Users\aless\PycharmProjects\SmartNihongoLearner\data-preparation\input\collocations_complete.json'
-    output_path = r'C:\Users\aless\PycharmProjects\SmartNihongoLearner\data-preparation\output\collocation_hints_v8.json'
-
     # Load data
     fixer.load_data(input_path)
 
     # Generate hints
-    hints = fixer.generate_hints()
+    hints = fixer.generate_hints(workers)
 
     # Save and validate
     validation = fixer.save_hints(hints, output_path)
@@ -508,5 +297,22 @@ def main():
     print(f"\n✅ Output saved to: {output_path}")
 
 
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Generate comprehensive hints for all collocations")
+    add_watch_argument(parser)
+    add_workers_argument(parser)
+    args = parser.parse_args()
+
+    # File paths
+    input_path = r'C:\Users\aless\PycharmProjects\SmartNihongoLearner\data-preparation\input\collocations_complete.json'
+    output_path = r'C:\Users\aless\PycharmProjects\SmartNihongoLearner\data-preparation\output\collocation_hints_v8.json'
+
+    if args.watch:
+        watch(lambda: fix_hints(input_path, output_path, args.workers), [CATEGORY_SCORE_RULES])
+    else:
+        fix_hints(input_path, output_path, args.workers)
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
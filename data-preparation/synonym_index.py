@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Candidate index for synonym detection.
+
+find_synonym_groups.py relates two nouns when one of three tests passes:
+
+1. honorific vs plain: remove_honorific_prefix() makes their surface forms
+   equal (お弁当 / 弁当, お茶 / ご茶)
+2. English synonym: SequenceMatcher ratio of the lowercased glosses >= 0.85
+3. same reading, different surface form, and gloss ratio >= 0.6
+
+Running the tests on every pair is O(n^2) string alignments. SynonymIndex
+instead answers "which nouns could pass a test with this one" from blocks,
+so the exact tests only run on those candidates:
+
+- surface form and honorific-stripped form -> test 1
+- reading -> test 3
+- identical glosses, and the WORD_PREFIX rarest words of each sense -> test 2
+  (or, given a gloss_similarity.TfidfSimilarity, each gloss's TF-IDF
+  nearest neighbours)
+
+The first two blocks are exact. Glosses with a ratio of 0.85 or more are
+near copies, which in practice share a sense and so its rarest words, but
+not when they are a word or two long ("son" / "song"); glosses of up to SHORT_GLOSS characters are
+therefore also blocked by character bigrams, with prefix filtering: a ratio
+of at least t means M >= t*T/2 matched characters (T = both lengths) in at
+most 1 + T - 2M contiguous blocks, and a block of L characters gives L - 1
+bigrams the glosses share, so they share at least (1.5t - 1)*T - 1 bigrams
+(counted with multiplicity). Two bags sharing k bigrams share one among the
+first |bag| - k + 1 of each when sorted in one global order, so only that
+prefix (rarest bigrams first) is indexed.
+
+On the real vocabulary the groups are identical to the all-pairs scan;
+benchmarks/verify_synonym_index.py also checks the recall on synthetic data.
+
+Usage:
+    index = SynonymIndex(nouns)
+    for j in index.candidates(i):       # nouns after i that may be related to it
+        if index.related(i, j): ...
+"""
+
+import math
+import re
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Sequence, Set, Tuple
+
+ENGLISH_THRESHOLD = 0.85
+READING_THRESHOLD = 0.6
+
+# Rarest words of each sense ("; "-separated) put in the word index
+WORD_PREFIX = 3
+# Longest gloss also indexed by character bigrams
+SHORT_GLOSS = 12
+
+WORD = re.compile(r'\w+')
+
+Bigram = Tuple[str, int]
+
+
+def calculate_similarity(str1, str2):
+    """Calculate similarity ratio between two strings"""
+    return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
+
+
+def remove_honorific_prefix(word):
+    """Remove お or ご prefix"""
+    if word.startswith('お'):
+        return word[1:]
+    if word.startswith('ご'):
+        return word[1:]
+    return word
+
+
+def min_shared_bigrams(length: int, threshold: float = ENGLISH_THRESHOLD) -> int:
+    """
+    Fewest bigrams a gloss of `length` characters shares with any gloss
+    whose SequenceMatcher ratio to it reaches threshold (> 2/3).
+    """
+    # The partner is at least this long, or the ratio could not reach threshold
+    shortest = math.ceil(length * threshold / (2 - threshold) - 1e-9)
+    return math.ceil((1.5 * threshold - 1) * (length + shortest) - 1 - 1e-9)
+
+
+def bigrams(text: str) -> List[Bigram]:
+    """The text's bigrams, each numbered by occurrence so repeats stay distinct."""
+    seen: Dict[str, int] = {}
+    bag = []
+    for k in range(len(text) - 1):
+        gram = text[k:k + 2]
+        count = seen.get(gram, 0)
+        seen[gram] = count + 1
+        bag.append((gram, count))
+    return bag
+
+
+class SynonymIndex:
+    """
+    Blocks over a noun list (vocabulary.json entries) for synonym candidates.
+
+    Args:
+        nouns: Entries with 'japanese', 'reading' and 'english'
+        threshold: Gloss ratio for the English synonym test
+        similarity: If given (a gloss_similarity.TfidfSimilarity), English
+                    synonym candidates are each gloss's TF-IDF nearest
+                    neighbours instead of the word and bigram blocks
+    """
+
+    def __init__(self, nouns: Sequence[dict], threshold: float = ENGLISH_THRESHOLD, similarity=None):
+        self.nouns = nouns
+        self.threshold = threshold
+        self.glosses = [noun['english'].lower() for noun in nouns]
+        self._ratios: Dict[Tuple[str, str], float] = {}
+        self._counts: Dict[int, Counter] = {}
+
+        self.by_surface: Dict[str, List[int]] = defaultdict(list)
+        self.by_stripped: Dict[str, List[int]] = defaultdict(list)
+        self.by_reading: Dict[str, List[int]] = defaultdict(list)
+        for i, noun in enumerate(nouns):
+            self.by_surface[noun['japanese']].append(i)
+            self.by_stripped[remove_honorific_prefix(noun['japanese'])].append(i)
+            self.by_reading[noun['reading']].append(i)
+
+        self.by_gloss: Dict[str, List[int]] = defaultdict(list)
+        for i, gloss in enumerate(self.glosses):
+            self.by_gloss[gloss].append(i)
+
+        self.word_prefixes: List[List[str]] = [[] for _ in nouns]
+        self.by_word: Dict[str, List[int]] = defaultdict(list)
+        self.bigram_prefixes: Dict[int, List[Bigram]] = {}
+        self.by_bigram: Dict[Bigram, List[int]] = defaultdict(list)
+        self.shortest: List[int] = []
+        self.neighbors: List[List[int]] = [[] for _ in nouns]
+        if similarity is not None:
+            self.neighbors = similarity.neighbors(self.glosses)
+        else:
+            self._index_glosses()
+        self._shortest = set(self.shortest)
+
+    def _index_glosses(self) -> None:
+        """The word and short-gloss bigram blocks."""
+        senses = [[set(WORD.findall(sense)) for sense in gloss.split(';')] for gloss in self.glosses]
+        frequency = Counter(word for gloss in senses for word in set().union(*gloss))
+        self.word_prefixes = [sorted(set().union(*(sorted(words, key=lambda word: (frequency[word], word))[:WORD_PREFIX]
+                                                   for words in gloss)))
+                              for gloss in senses]
+        for i, prefix in enumerate(self.word_prefixes):
+            for word in prefix:
+                self.by_word[word].append(i)
+
+        bags = {i: bigrams(gloss) for i, gloss in enumerate(self.glosses) if len(gloss) <= SHORT_GLOSS}
+        frequency = Counter(bigram for bag in bags.values() for bigram in bag)
+        for i, bag in bags.items():
+            shared = min_shared_bigrams(len(self.glosses[i]), self.threshold)
+            if shared < 1:
+                # Too short to share a bigram: compared with each other
+                self.shortest.append(i)
+                continue
+            bag.sort(key=lambda bigram: (frequency[bigram], bigram))
+            self.bigram_prefixes[i] = bag[:max(0, len(bag) - shared + 1)]
+            for bigram in self.bigram_prefixes[i]:
+                self.by_bigram[bigram].append(i)
+
+    @staticmethod
+    def _after(indices: List[int], i: int) -> List[int]:
+        return indices[bisect_right(indices, i):]
+
+    def candidates(self, i: int) -> List[int]:
+        """Nouns after i (ascending) that may pass one of the tests with it."""
+        noun = self.nouns[i]
+        japanese = noun['japanese']
+        stripped = remove_honorific_prefix(japanese)
+        found: Set[int] = set()
+        for block in (self.by_surface.get(stripped), self.by_stripped.get(japanese),
+                      self.by_stripped.get(stripped), self.by_reading.get(noun['reading'])):
+            if block:
+                found.update(self._after(block, i))
+        for block in [self.by_gloss[self.glosses[i]]] + [self.by_word[word] for word in self.word_prefixes[i]]:
+            found.update(self._after(block, i))
+        for bigram in self.bigram_prefixes.get(i, ()):
+            found.update(self._after(self.by_bigram[bigram], i))
+        if i in self._shortest:
+            found.update(self._after(self.shortest, i))
+        found.update(self.neighbors[i])
+        return sorted(found)
+
+    def similarity(self, i: int, j: int) -> float:
+        """calculate_similarity() of the two glosses, computed once per distinct pair."""
+        a, b = self.glosses[i], self.glosses[j]
+        if a == b:
+            return 1.0
+        key = (a, b)
+        ratio = self._ratios.get(key)
+        if ratio is None:
+            ratio = self._ratios[key] = SequenceMatcher(None, a, b).ratio()
+        return ratio
+
+    def _characters(self, i: int) -> Counter:
+        characters = self._counts.get(i)
+        if characters is None:
+            characters = self._counts[i] = Counter(self.glosses[i])
+        return characters
+
+    def _similar(self, i: int, j: int, threshold: float) -> bool:
+        a, b = self.glosses[i], self.glosses[j]
+        # real_quick_ratio(): the ratio if every character of the shorter gloss matched
+        if a == b:
+            return True
+        total = len(a) + len(b)
+        if 2.0 * min(len(a), len(b)) / total < threshold:
+            return False
+        # quick_ratio(): the ratio if every character the glosses have in common matched
+        if (a, b) not in self._ratios and 2.0 * sum((self._characters(i) & self._characters(j)).values()) / total < threshold:
+            return False
+        return self.similarity(i, j) >= threshold
+
+    def related(self, i: int, j: int) -> bool:
+        """The honorific, English synonym and same-reading tests, as find_synonym_groups applies them."""
+        word1, word2 = self.nouns[i], self.nouns[j]
+        w1_no_hon = remove_honorific_prefix(word1['japanese'])
+        w2_no_hon = remove_honorific_prefix(word2['japanese'])
+        if w1_no_hon == w2_no_hon and w1_no_hon != word1['japanese'] and w2_no_hon != word2['japanese']:
+            return True
+        if w1_no_hon == word2['japanese'] or w2_no_hon == word1['japanese']:
+            return True
+        if self._similar(i, j, self.threshold):
+            return True
+        return (word1['reading'] == word2['reading'] and word1['japanese'] != word2['japanese']
+                and self._similar(i, j, READING_THRESHOLD))
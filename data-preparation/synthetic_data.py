@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Synthetic large-scale pipeline inputs.
+
+The real data (~1,342 words, ~2,246 pairs) is too small for quadratic steps
+to show up. generate() scales it up by `scale` while keeping its statistics:
+
+- N54.csv: every row copied `scale` times (copy 0 is the real row, copy c
+  is suffixed "#c", the convention of benchmarks/replicate()). Copies keep
+  the word type and sense count but draw their English senses after the
+  first from the senses of that type across the whole list, and jitter the
+  frequency, so glosses overlap as much as real ones do instead of being
+  exact repeats.
+- collocation mappings (raw/collocation_mappings.py's shape,
+  {word: [[noun, score], ...]}): every verb/adjective copy keeps its real
+  partner list and scores, each noun redirected to a random copy of that
+  noun, so per-word degrees, scores and noun popularity match the real
+  mappings (including references to nouns missing from the vocabulary).
+- collocation_hints.json: the real hint phrase for each pair, for every copy
+  of the pair.
+
+Output is deterministic for a given scale and seed.
+
+Usage (from data-preparation/):
+    python synthetic_data.py --scale 100 --output /tmp/synthetic-100
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PREP = Path(__file__).resolve().parent
+sys.path.insert(0, str(PREP / "raw"))
+
+from collocation_mappings import get_adjective_noun_collocations, get_verb_noun_collocations
+
+N54_FILE = PREP / "input" / "N54.csv"
+HINTS_FILE = PREP / "input" / "collocation_hints.json"
+
+CSV_FIELDS = ['japanese', 'reading', 'english', 'type', 'frequency']
+FREQUENCY_JITTER = 0.3
+
+Mappings = Dict[str, List[Tuple[str, int]]]
+
+
+def copy_name(word: str, copy: int) -> str:
+    return f"{word}#{copy}" if copy else word
+
+
+class SyntheticDataset:
+    """The generated vocabulary rows, collocation mappings and hints."""
+
+    def __init__(self, scale: int, rows: List[dict], verb_mappings: Mappings,
+                 adjective_mappings: Mappings, hints: Dict[str, Dict[str, str]]):
+        self.scale = scale
+        self.rows = rows
+        self.verb_mappings = verb_mappings
+        self.adjective_mappings = adjective_mappings
+        self.hints = hints
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            'scale': self.scale,
+            'words': len(self.rows),
+            'mapped_words': len(self.verb_mappings) + len(self.adjective_mappings),
+            'mapped_pairs': sum(len(nouns) for mappings in (self.verb_mappings, self.adjective_mappings)
+                                for nouns in mappings.values()),
+            'hinted_pairs': sum(len(nouns) for nouns in self.hints.values()),
+        }
+
+    def collocations_data(self) -> dict:
+        """
+        The mappings as collocations.json data ({"collocations": {word: {type,
+        reading, english, matches}}}), with readings and glosses from the rows
+        (empty for mapped words missing from the vocabulary).
+        """
+        info = {}
+        for row in self.rows:
+            info.setdefault(row['japanese'], {'reading': row['reading'], 'english': row['english']})
+        missing = {'reading': '', 'english': ''}
+        collocations = {}
+        for word_type, mappings in (('verb', self.verb_mappings), ('adjective', self.adjective_mappings)):
+            for word, nouns in mappings.items():
+                collocations[word] = {'type': word_type, **info.get(word, missing),
+                                      'matches': [{'word': noun, 'score': score, **info.get(noun, missing)}
+                                                  for noun, score in nouns]}
+        return {'collocations': collocations}
+
+    def write(self, directory: Path) -> Dict[str, Path]:
+        """
+        Write N54.csv, collocation_mappings.json and collocation_hints.json.
+
+        Returns:
+            {file name: path}
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = {name: directory / name for name in ('N54.csv', 'collocation_mappings.json', 'collocation_hints.json')}
+
+        with open(paths['N54.csv'], 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.rows)
+
+        with open(paths['collocation_mappings.json'], 'w', encoding='utf-8') as f:
+            json.dump({'verb_noun': self.verb_mappings, 'adjective_noun': self.adjective_mappings},
+                      f, ensure_ascii=False, indent=2)
+
+        with open(paths['collocation_hints.json'], 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': '1.0.0',
+                'generated_date': 'synthetic',
+                'total_words': len(self.hints),
+                'total_nouns_with_hints': sum(len(nouns) for nouns in self.hints.values()),
+                'hints': self.hints,
+            }, f, ensure_ascii=False, indent=2)
+        return paths
+
+
+def load_mappings(path: Path) -> Tuple[Mappings, Mappings]:
+    """(verb_noun, adjective_noun) mappings from a written collocation_mappings.json."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    to_pairs = lambda mappings: {word: [tuple(pair) for pair in nouns] for word, nouns in mappings.items()}
+    return to_pairs(data['verb_noun']), to_pairs(data['adjective_noun'])
+
+
+def _senses(english: str) -> List[str]:
+    return [sense.strip() for sense in english.split(';') if sense.strip()]
+
+
+def _synthetic_rows(real_rows: List[dict], scale: int, rng: random.Random) -> List[dict]:
+    # Sense pool per word type, with repeats, so common senses stay common
+    pools: Dict[str, List[str]] = {}
+    for row in real_rows:
+        pools.setdefault(row['type'], []).extend(_senses(row['english']))
+
+    rows = []
+    for copy in range(scale):
+        for row in real_rows:
+            if not copy:
+                rows.append(dict(row))
+                continue
+            senses = _senses(row['english'])
+            pool = pools[row['type']]
+            english = senses[:1] + [rng.choice(pool) for _ in senses[1:]]
+            frequency = float(row['frequency']) if row['frequency'] else 0.0
+            rows.append({
+                'japanese': copy_name(row['japanese'], copy),
+                'reading': row['reading'],
+                'english': '; '.join(dict.fromkeys(english)),
+                'type': row['type'],
+                'frequency': f"{max(0.0, frequency + rng.gauss(0, FREQUENCY_JITTER)):.2f}",
+            })
+    return rows
+
+
+def _synthetic_mappings(real: Mappings, real_hints: Dict[str, Dict[str, str]], scale: int,
+                        rng: random.Random, hints: Dict[str, Dict[str, str]]) -> Mappings:
+    mappings = {}
+    for copy in range(scale):
+        for word, nouns in real.items():
+            name = copy_name(word, copy)
+            word_hints = real_hints.get(word, {})
+            pairs = []
+            for noun, score in nouns:
+                noun_name = copy_name(noun, rng.randrange(scale) if copy else 0)
+                pairs.append((noun_name, score))
+                if noun in word_hints:
+                    hints.setdefault(name, {})[noun_name] = word_hints[noun]
+            mappings[name] = pairs
+    return mappings
+
+
+def generate(scale: int, seed: int = 0) -> SyntheticDataset:
+    """Scale the real N54 vocabulary, collocation mappings and hints `scale` times."""
+    with open(N54_FILE, 'r', encoding='utf-8') as f:
+        real_rows = list(csv.DictReader(f))
+    with open(HINTS_FILE, 'r', encoding='utf-8') as f:
+        real_hints = json.load(f)['hints']
+
+    rng = random.Random(seed)
+    rows = _synthetic_rows(real_rows, scale, rng)
+    hints: Dict[str, Dict[str, str]] = {}
+    verb_mappings = _synthetic_mappings(get_verb_noun_collocations(), real_hints, scale, rng, hints)
+    adjective_mappings = _synthetic_mappings(get_adjective_noun_collocations(), real_hints, scale, rng, hints)
+    return SyntheticDataset(scale, rows, verb_mappings, adjective_mappings, hints)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic large-scale pipeline inputs")
+    parser.add_argument('--scale', type=int, default=10, help="Copies of the real data set (default: 10)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument('--output', type=Path, required=True, help="Directory to write the files to")
+    args = parser.parse_args()
+
+    dataset = generate(args.scale, args.seed)
+    for name, path in dataset.write(args.output).items():
+        print(f"  {name:<28} {path.stat().st_size / 1024 / 1024:>8.1f} MB")
+    print(', '.join(f"{key}: {value:,}" for key, value in dataset.summary().items()))
+
+
+if __name__ == '__main__':
+    main()
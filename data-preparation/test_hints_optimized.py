@@ -4,12 +4,15 @@ Test optimized hint regeneration on 10 samples.
 Shows how reverse hints are derived from forward hints without API calls.
 """
 
+import argparse
 import json
 import os
 import time
 from pathlib import Path
 from anthropic import Anthropic
 
+from llm_cache import add_cache_arguments, cache_from_args, call_llm, print_cache_stats
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -17,8 +20,7 @@ try:
 except ImportError:
     print("Warning: python-dotenv not installed.")
 
-# Initialize Claude API
-client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+MODEL = "claude-sonnet-4-5-20250929"
 
 def load_vocabulary():
     """Load vocabulary to get English translations"""
@@ -36,8 +38,8 @@ def load_current_hints():
     with open(hints_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def generate_forward_hint(verb_japanese, verb_english, noun_japanese, noun_english):
-    """Generate forward hint via API"""
+def generate_forward_hint(client, cache, verb_japanese, verb_english, noun_japanese, noun_english):
+    """Generate forward hint via API (or the response cache)"""
     prompt = f"""Create a clear, natural English hint for this Japanese collocation:
 
 Verb/Adjective: {verb_japanese} ({verb_english})
@@ -51,13 +53,9 @@ Requirements:
 Return ONLY the hint text, nothing else."""
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=50,
-            temperature=0.3,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        hint = response.content[0].text.strip().strip('"\'')
+        response_text = call_llm(client, prompt, model=MODEL, max_tokens=50,
+                                 temperature=0.3, cache=cache)
+        hint = response_text.strip().strip('"\'')
         return hint
     except Exception as e:
         print(f"Error: {e}")
@@ -68,8 +66,12 @@ def derive_reverse_hint(forward_hint):
     # Since hints are semantically identical, just reuse the forward hint
     return forward_hint
 
-def test_optimized_regeneration():
+def test_optimized_regeneration(cache=None):
     """Test on 10 samples to show the optimization"""
+    client = None
+    if not (cache and cache.cache_only):
+        client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+
     print("Loading vocabulary...")
     vocab = load_vocabulary()
 
@@ -105,8 +107,10 @@ def test_optimized_regeneration():
             print(f"  Verb: {verb_english}")
 
             # Generate forward hint (API CALL)
-            forward_hint = generate_forward_hint(verb_japanese, verb_english, noun_japanese, noun_english)
-            api_calls += 1
+            requests = cache.requests if cache else 0
+            forward_hint = generate_forward_hint(client, cache, verb_japanese, verb_english, noun_japanese, noun_english)
+            from_api = cache is None or cache.requests != requests
+            api_calls += 1 if from_api else 0
             print(f"  FORWARD (API):   {forward_hint}")
 
             # Derive reverse hint (NO API CALL)
@@ -124,7 +128,8 @@ def test_optimized_regeneration():
             })
 
             count += 1
-            time.sleep(0.35)  # Rate limiting
+            if from_api:
+                time.sleep(0.35)  # Rate limiting
 
         if count >= max_samples:
             break
@@ -137,6 +142,7 @@ def test_optimized_regeneration():
     print(f"API calls made: {api_calls}")
     print(f"Hints generated: {count * 2} (forward + reverse)")
     print(f"API savings: {count} calls (50% reduction)")
+    print_cache_stats(cache)
     print(f"\nCost comparison for full regeneration (2,246 pairs):")
     print(f"  Old approach: 4,492 API calls")
     print(f"  New approach: 2,246 API calls")
@@ -152,8 +158,12 @@ def test_optimized_regeneration():
     print("  python data-preparation/regenerate_hints_optimized.py")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test optimized hint regeneration on 10 samples")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+
     try:
-        test_optimized_regeneration()
+        test_optimized_regeneration(cache_from_args(args))
     except Exception as e:
         print(f"\n\nError: {e}")
         import traceback
@@ -4,10 +4,12 @@ Comprehensive validation script for collocation hints.
 Validates coverage, specificity, and quality of hints.
 """
 
-import json
 from pathlib import Path
 from collections import defaultdict, Counter
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Set, Tuple
+
+from collocation_graph import load_graph
+from json_stream import iter_entries, read_header, top_level_keys
 
 
 class HintValidator:
@@ -24,32 +26,23 @@ class HintValidator:
         self.collocations_path = Path(collocations_path)
         self.hints_path = Path(hints_path)
 
-        # Load data
-        with open(self.collocations_path, 'r', encoding='utf-8') as f:
-            collocations_raw = json.load(f)
-
-        # Extract words structure
-        if 'words' in collocations_raw:
-            # New format with nested structure
-            self.collocations_data = {}
-            for verb, verb_data in collocations_raw['words'].items():
-                if 'matches' in verb_data and 'nouns' in verb_data['matches']:
-                    # Extract just the noun words
-                    self.collocations_data[verb] = [noun['word'] for noun in verb_data['matches']['nouns']]
-        else:
-            # Old format - direct verb to noun list mapping
-            self.collocations_data = collocations_raw
-
-        with open(self.hints_path, 'r', encoding='utf-8') as f:
-            self.hints_data = json.load(f)
+        # Load data: verb -> [nouns] in file order
+        self.graph = load_graph(self.collocations_path)
+        self.collocations_data = self.graph.groups()
 
-        self.hints = self.hints_data.get('hints', {})
+        # Hints are streamed verb by verb on every pass rather than held in memory
+        self.hints_data = read_header(self.hints_path)
+        self.has_hints = 'hints' in top_level_keys(self.hints_path)
 
         # Validation results
         self.coverage_stats = {}
         self.specificity_stats = {}
         self.quality_issues = []
 
+    def iter_hints(self) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """(verb, {noun: hint}) pairs from the hints file, read one verb at a time."""
+        return iter_entries(self.hints_path, 'hints') if self.has_hints else iter(())
+
     def validate_coverage(self) -> Dict:
         """
         Validate coverage of hints for all verbs and nouns.
@@ -65,11 +58,17 @@ class HintValidator:
 
         verb_coverage = {}
 
+        # Each verb's collocation nouns that have a hint
+        hinted = {}
+        for verb, noun_hints in self.iter_hints():
+            if verb in self.collocations_data:
+                hinted[verb] = {noun for noun in self.collocations_data[verb] if noun in noun_hints}
+
         for verb, noun_list in self.collocations_data.items():
             total_verbs += 1
 
             # Get hints for this verb
-            verb_hints = self.hints.get(verb, {})
+            verb_hints = hinted.get(verb, set())
 
             # Count nouns
             total_nouns = len(noun_list)
@@ -126,7 +125,7 @@ class HintValidator:
         # Track which verbs use each hint phrase
         hint_to_verbs = defaultdict(set)
 
-        for verb, noun_hints in self.hints.items():
+        for verb, noun_hints in self.iter_hints():
             for noun, hint_phrase in noun_hints.items():
                 hint_to_verbs[hint_phrase].add(verb)
 
@@ -151,7 +150,7 @@ class HintValidator:
 
         # Calculate specificity by verb
         verb_specificity = {}
-        for verb, noun_hints in self.hints.items():
+        for verb, noun_hints in self.iter_hints():
             hint_phrases = list(noun_hints.values())
             unique_hints = sum(1 for phrase in set(hint_phrases) if len(hint_to_verbs[phrase]) == 1)
             shared_hints = len(set(hint_phrases)) - unique_hints
@@ -198,7 +197,7 @@ class HintValidator:
         # Short hints that might be too vague
         min_hint_length = 5
 
-        for verb, noun_hints in self.hints.items():
+        for verb, noun_hints in self.iter_hints():
             for noun, hint_phrase in noun_hints.items():
                 # Check for generic terms
                 for generic_term in generic_terms:
@@ -6,26 +6,29 @@ This script analyzes hint quality by detecting generic/overused hints
 and calculating quality scores for each verb/adjective.
 """
 
-import json
 from collections import defaultdict, Counter
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
 from pathlib import Path
 
+from json_stream import iter_hints
 
-def load_hints(filepath: str) -> Dict:
-    """Load the hints JSON file and extract the hints section."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-        # Handle both direct hints dict and nested structure
-        if 'hints' in data:
-            return data['hints']
-        return data
 
+def load_hints(filepath: str) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """
+    Stream the hints section of the hints JSON file, one verb at a time.
 
-def analyze_hint_distribution(hints_data: Dict) -> Dict:
+    Handles both a direct hints dict and the nested structure.
+    """
+    return iter_hints(filepath)
+
+
+def analyze_hint_distribution(hints_data: Iterable[Tuple[str, Dict[str, str]]]) -> Dict:
     """
     Analyze hint distribution for each verb/adjective.
 
+    Args:
+        hints_data: (verb, {noun: hint}) pairs, e.g. load_hints() or hints.items()
+
     Returns:
         Dict with structure:
         {
@@ -43,7 +46,7 @@ def analyze_hint_distribution(hints_data: Dict) -> Dict:
     """
     analysis = {}
 
-    for verb, nouns_data in hints_data.items():
+    for verb, nouns_data in hints_data:
         hint_distribution = Counter()
         nouns_by_hint = defaultdict(list)
 
@@ -248,8 +251,9 @@ def main():
     print("Loading hints file...")
     hints_data = load_hints(hints_file)
 
-    print(f"Analyzing {len(hints_data)} verbs/adjectives...")
+    print("Analyzing verbs/adjectives...")
     analysis = analyze_hint_distribution(hints_data)
+    print(f"Analyzed {len(analysis)} verbs/adjectives")
 
     print("Generating comprehensive report...")
     generate_report(analysis, output_file)
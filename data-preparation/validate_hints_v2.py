@@ -10,9 +10,12 @@ This script performs:
 
 import json
 from collections import defaultdict
-from typing import Dict, List, Tuple, Set
+from typing import Dict, Iterable, List, Tuple, Set, Union
 import re
 
+from collocation_graph import CollocationGraph, load_graph
+from json_stream import iter_hints
+
 
 def load_json(filepath: str) -> dict:
     """
@@ -42,41 +45,28 @@ def create_pair_key(verb: str, noun: str) -> str:
     return f"{verb}||{noun}"
 
 
-def extract_all_pairs_from_collocations(colloc_data: dict) -> Set[str]:
+def extract_all_pairs_from_collocations(graph: CollocationGraph) -> Set[str]:
     """
-    Extract all verb-noun pairs from collocations_complete.json.
+    Extract all verb-noun pairs from the collocation graph.
 
     Args:
-        colloc_data: Parsed collocations data with structure:
-                    words -> {verb} -> matches -> nouns -> list of noun objects
+        graph: Collocation graph loaded from collocations_complete.json
 
     Returns:
         Set of pair keys
     """
-    pairs = set()
-
-    # Handle nested 'words' key structure
-    words_data = colloc_data.get('words', {})
+    return {create_pair_key(verb, noun) for verb, noun, _ in graph.pairs()}
 
-    for verb, verb_data in words_data.items():
-        if isinstance(verb_data, dict) and 'matches' in verb_data:
-            matches = verb_data['matches']
-            if isinstance(matches, dict) and 'nouns' in matches:
-                nouns_list = matches['nouns']
-                if isinstance(nouns_list, list):
-                    for noun_obj in nouns_list:
-                        if isinstance(noun_obj, dict) and 'word' in noun_obj:
-                            noun = noun_obj['word']
-                            pairs.add(create_pair_key(verb, noun))
-    return pairs
 
-
-def extract_all_pairs_from_hints(hints_data: dict) -> Tuple[Set[str], Dict[str, str], Dict[str, List[Tuple[str, str]]]]:
+def extract_all_pairs_from_hints(
+    hints_data: Union[dict, Iterable[Tuple[str, dict]]]
+) -> Tuple[Set[str], Dict[str, str], Dict[str, List[Tuple[str, str]]]]:
     """
     Extract all verb-noun pairs from collocation_hints.json.
 
     Args:
-        hints_data: Parsed hints data (may have 'hints' key with nested structure)
+        hints_data: Parsed hints data (may have 'hints' key with nested structure),
+                    or (verb, verb_data) pairs streamed with json_stream.iter_hints()
 
     Returns:
         Tuple of:
@@ -89,9 +79,10 @@ def extract_all_pairs_from_hints(hints_data: dict) -> Tuple[Set[str], Dict[str,
     hint_to_pairs = defaultdict(list)
 
     # Handle both direct structure and nested 'hints' key
-    verb_hints = hints_data.get('hints', hints_data)
+    if isinstance(hints_data, dict):
+        hints_data = hints_data.get('hints', hints_data).items()
 
-    for verb, verb_data in verb_hints.items():
+    for verb, verb_data in hints_data:
         if isinstance(verb_data, dict):
             for noun, hint_phrase in verb_data.items():
                 # Skip if hint_phrase is not a string (metadata fields)
@@ -177,7 +168,7 @@ def generate_report(
     pair_to_hint: Dict[str, str],
     hint_to_pairs: Dict[str, List[Tuple[str, str]]],
     hint_to_verbs: Dict[str, Set[str]],
-    colloc_data: dict,
+    graph: CollocationGraph,
     output_path: str
 ) -> None:
     """
@@ -189,7 +180,7 @@ def generate_report(
         pair_to_hint: Mapping of pair keys to hint phrases
         hint_to_pairs: Mapping of hint phrases to pairs
         hint_to_verbs: Mapping of hint phrases to verb sets
-        colloc_data: Original collocations data
+        graph: Collocation graph
         output_path: Path to write report
     """
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -286,46 +277,35 @@ def generate_report(
 
         # Get verb statistics
         verb_stats = {}
-        # Handle nested 'words' key structure
-        words_data = colloc_data.get('words', {})
-
-        for verb, verb_data in words_data.items():
-            if isinstance(verb_data, dict) and 'matches' in verb_data:
-                matches = verb_data['matches']
-                if isinstance(matches, dict) and 'nouns' in matches:
-                    nouns_list = matches['nouns']
-                    if isinstance(nouns_list, list):
-                        # Extract noun words
-                        nouns = [noun_obj['word'] for noun_obj in nouns_list
-                                if isinstance(noun_obj, dict) and 'word' in noun_obj]
-                        total_pairs = len(nouns)
-
-                        # Count hints for this verb
-                        hints_for_verb = []
-                        for noun in nouns:
-                            pair_key = create_pair_key(verb, noun)
-                            if pair_key in pair_to_hint:
-                                hints_for_verb.append(pair_to_hint[pair_key])
-
-                        unique_hints = len(set(hints_for_verb))
-                        hint_counts = defaultdict(int)
-                        for hint in hints_for_verb:
-                            hint_counts[hint] += 1
-
-                        most_common_hint = None
-                        most_common_count = 0
-                        if hint_counts:
-                            most_common_hint = max(hint_counts.items(), key=lambda x: x[1])
-                            most_common_count = most_common_hint[1]
-                            most_common_hint = most_common_hint[0]
-
-                        verb_stats[verb] = {
-                            'total_pairs': total_pairs,
-                            'total_hints': len(hints_for_verb),
-                            'unique_hints': unique_hints,
-                            'most_common_hint': most_common_hint,
-                            'most_common_count': most_common_count
-                        }
+        for verb, nouns in graph.groups().items():
+            total_pairs = len(nouns)
+
+            # Count hints for this verb
+            hints_for_verb = []
+            for noun in nouns:
+                pair_key = create_pair_key(verb, noun)
+                if pair_key in pair_to_hint:
+                    hints_for_verb.append(pair_to_hint[pair_key])
+
+            unique_hints = len(set(hints_for_verb))
+            hint_counts = defaultdict(int)
+            for hint in hints_for_verb:
+                hint_counts[hint] += 1
+
+            most_common_hint = None
+            most_common_count = 0
+            if hint_counts:
+                most_common_hint = max(hint_counts.items(), key=lambda x: x[1])
+                most_common_count = most_common_hint[1]
+                most_common_hint = most_common_hint[0]
+
+            verb_stats[verb] = {
+                'total_pairs': total_pairs,
+                'total_hints': len(hints_for_verb),
+                'unique_hints': unique_hints,
+                'most_common_hint': most_common_hint,
+                'most_common_count': most_common_count
+            }
 
         # Sort by total pairs
         top_verbs = sorted(verb_stats.items(), key=lambda x: x[1]['total_pairs'], reverse=True)[:20]
@@ -424,13 +404,13 @@ def main():
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
     print("Loading collocations data...")
-    colloc_data = load_json(r"C:\Users\aless\PycharmProjects\SmartNihongoLearner\data-preparation\input\collocations_complete.json")
+    graph = load_graph(r"C:\Users\aless\PycharmProjects\SmartNihongoLearner\data-preparation\input\collocations_complete.json")
 
-    print("Loading hints data...")
-    hints_data = load_json(r"C:\Users\aless\PycharmProjects\SmartNihongoLearner\public\data\collocation_hints.json")
+    print("Streaming hints data...")
+    hints_data = iter_hints(r"C:\Users\aless\PycharmProjects\SmartNihongoLearner\public\data\collocation_hints.json")
 
     print("Extracting pairs from collocations...")
-    colloc_pairs = extract_all_pairs_from_collocations(colloc_data)
+    colloc_pairs = extract_all_pairs_from_collocations(graph)
 
     print("Extracting pairs from hints...")
     hint_pairs, pair_to_hint, hint_to_pairs = extract_all_pairs_from_hints(hints_data)
@@ -440,7 +420,7 @@ def main():
 
     print("Generating comprehensive report...")
     output_path = r"C:\Users\aless\PycharmProjects\SmartNihongoLearner\data-preparation\VALIDATION_REPORT_V2.md"
-    generate_report(colloc_pairs, hint_pairs, pair_to_hint, hint_to_pairs, hint_to_verbs, colloc_data, output_path)
+    generate_report(colloc_pairs, hint_pairs, pair_to_hint, hint_to_pairs, hint_to_verbs, graph, output_path)
 
     print(f"\nReport generated: {output_path}")
 
@@ -0,0 +1,885 @@
+#!/usr/bin/env python3
+"""
+Single-pass hint validation engine.
+
+validate_hints.py, validate_hints_v2.py, validate_hints_final.py,
+verify_hint_coverage.py, raw/validate_hints_quality.py and
+final_validation.py each load collocations_complete.json and the hints
+file again and walk the same pairs with their own loops. This engine loads
+both once into a PairIndex (every verb's collocation nouns and
+{noun: hint} map) and runs the checks as rules over it. Hints files come in
+two formats (see load_hints()): the flat collocation_hints.json and the
+per-verb hint groups of collocation_hints_refined.json.
+
+    coverage      every collocation pair has a hint; header counts match the hints
+    specificity   hints reused across verbs; generic wording ("things", "various")
+    length        hints of 2-8 words and at least 5 characters
+    diversity     hint repetition overall and per verb (validate_hints_final quality score)
+    quotes        stray quotes, [verb] template markers and truncated model output
+
+A rule checks one partition of verbs at a time (Rule.check) and folds the
+partial results into its final result afterwards (Rule.merge), so with
+--workers N the partitions - contiguous runs of verbs with about the same
+number of pairs - are checked across a process pool. Partials are merged
+in verb order, so the report is the same for any worker count.
+
+Rules are pluggable: subclass Rule, give it a name and add it to RULES (or
+pass instances to ValidationEngine directly).
+
+The merged report is written as Markdown and JSON.
+
+Runs are incremental: ValidationCache keeps every verb's rule partials in
+output/validation_cache.json, keyed by a sha256 of the verb, its
+collocation nouns and its hints. The next run only checks verbs whose hash
+changed and merges their fresh partials with the cached ones, so editing
+one verb's hints re-checks that verb only. The cache also keeps the verb ->
+nouns groups under the sha256 of collocations_complete.json, so an
+unchanged collocations file is not parsed again. Cached partials are only
+reused with the same rules, rule settings and version of this file.
+
+Usage (from data-preparation/):
+    python validation_engine.py [--hints input/collocation_hints.json] [--workers 4]
+    python validation_engine.py --hints input/collocation_hints_refined.json
+    python validation_engine.py --rules coverage length --report output/validation_report.md
+    python validation_engine.py --no-cache            # check every verb, leave the cache alone
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from collocation_graph import DEFAULT_PATH as DEFAULT_COLLOCATIONS, load_graph
+from json_stream import iter_entries, iter_hints, read_header, top_level_keys
+
+PREP = Path(__file__).resolve().parent
+DEFAULT_HINTS = PREP / "input" / "collocation_hints.json"
+DEFAULT_REPORT = PREP / "output" / "validation_report.md"
+DEFAULT_CACHE = PREP / "output" / "validation_cache.json"
+CACHE_VERSION = 1
+
+# Partitions per worker: enough that one heavy verb does not leave the other workers idle
+PARTITIONS_PER_WORKER = 4
+# Examples kept per issue kind in the report
+MAX_EXAMPLES = 20
+
+# (verb, collocation nouns in file order, {noun: hint}) - one verb's share of the pair index
+VerbPairs = Tuple[str, List[str], Dict[str, str]]
+
+
+class HintFormatError(ValueError):
+    """Hints file entries in neither the flat nor the grouped format."""
+
+    def __init__(self, problems: List[str]):
+        self.problems = problems
+        super().__init__(f"{len(problems)} hints file entries of unknown shape: " + "; ".join(problems[:10]))
+
+
+def _flat_hints(data) -> Optional[Dict[str, str]]:
+    """A {noun: hint} entry as it is, or None if it is not one."""
+    if isinstance(data, dict) and all(isinstance(hint, str) for hint in data.values()):
+        return data
+    return None
+
+
+def _grouped_hints(data) -> Optional[Dict[str, str]]:
+    """{noun: hint} of a {"hints": [{"hint", "all_nouns"}, ...]} entry, or None if it is not one."""
+    groups = data.get('hints') if isinstance(data, dict) else None
+    if not isinstance(groups, list):
+        return None
+    noun_hints = {}
+    for group in groups:
+        if not (isinstance(group, dict) and isinstance(group.get('hint'), str)
+                and isinstance(group.get('all_nouns'), list)
+                and all(isinstance(noun, str) for noun in group['all_nouns'])):
+            return None
+        for noun in group['all_nouns']:
+            noun_hints[noun] = group['hint']
+    return noun_hints
+
+
+def load_hints(path: Path) -> Dict[str, Dict[str, str]]:
+    """
+    {verb: {noun: hint}} of a hints file, streamed.
+
+    Two formats are understood:
+
+        flat     {"hints": {verb: {noun: hint}}} or the bare map (collocation_hints.json)
+        grouped  {"verbs": {verb: {"hints": [{"hint": ..., "all_nouns": [noun, ...]}, ...]}}}
+                 (collocation_hints_refined.json)
+
+    A grouped verb gives every noun in all_nouns its group's hint; a noun
+    listed in two groups keeps the later one, as the refine step's
+    noun_assignments does.
+
+    Raises:
+        HintFormatError: if any verb's entry has another shape
+    """
+    keys = top_level_keys(path)
+    if 'verbs' in keys and 'hints' not in keys:
+        entries, expand = iter_entries(path, 'verbs'), _grouped_hints
+    else:
+        entries, expand = iter_hints(path), _flat_hints
+    hints, problems = {}, []
+    for verb, data in entries:
+        noun_hints = expand(data)
+        if noun_hints is None:
+            problems.append(f"{verb}: {json.dumps(data, ensure_ascii=False)[:80]}")
+        else:
+            hints[verb] = noun_hints
+    if problems:
+        raise HintFormatError(problems)
+    return hints
+
+
+class PairIndex:
+    """
+    Every verb's collocation nouns and hints, loaded once.
+
+    Verbs come in collocation file order, then verbs that only appear in
+    the hints file, in hints file order.
+    """
+
+    def __init__(self, groups: Dict[str, List[str]], hints: Dict[str, Dict[str, str]],
+                 header: Optional[Dict[str, object]] = None):
+        self.groups = groups
+        self.hints = hints
+        self.header = header or {}
+        self.verbs = list(groups) + [verb for verb in hints if verb not in groups]
+
+    @classmethod
+    def load(cls, collocations_path: Path = DEFAULT_COLLOCATIONS, hints_path: Path = DEFAULT_HINTS,
+             cache: Optional['ValidationCache'] = None) -> 'PairIndex':
+        """
+        Load the collocation graph and stream the hints file (see load_hints()).
+
+        With a cache, the verb -> nouns groups come from it when
+        collocations_complete.json has not changed since they were stored.
+        """
+        if cache is not None:
+            groups = cache.groups(Path(collocations_path))
+        else:
+            groups = load_graph(Path(collocations_path)).groups()
+        return cls(groups, load_hints(Path(hints_path)), read_header(Path(hints_path)))
+
+    def rows(self) -> List[VerbPairs]:
+        return [(verb, self.groups.get(verb, []), self.hints.get(verb, {})) for verb in self.verbs]
+
+    def partitions(self, count: int) -> List[List[VerbPairs]]:
+        return partition(self.rows(), count)
+
+    @property
+    def pair_count(self) -> int:
+        return sum(len(nouns) for nouns in self.groups.values())
+
+    @property
+    def hint_count(self) -> int:
+        return sum(len(noun_hints) for noun_hints in self.hints.values())
+
+
+def partition(rows: List[VerbPairs], count: int) -> List[List[VerbPairs]]:
+    """Split rows into at most `count` contiguous runs with about the same number of pairs each."""
+    weights = [max(len(nouns), len(noun_hints), 1) for _, nouns, noun_hints in rows]
+    target = sum(weights) / max(count, 1)
+    partitions, current, weight = [], [], 0
+    for row, row_weight in zip(rows, weights):
+        current.append(row)
+        weight += row_weight
+        if weight >= target * (len(partitions) + 1) and len(partitions) < count - 1:
+            partitions.append(current)
+            current = []
+    if current or not partitions:
+        partitions.append(current)
+    return partitions
+
+
+def _flagged_pairs(index: 'PairIndex', partials: Iterable[dict]) -> Iterator[Tuple[str, str, str]]:
+    """
+    (verb, noun, hint) of the verbs the partials flagged, in verb order.
+
+    Partials only name the verbs with issues, so they stay small enough to
+    cache per verb; merge() finds its report examples among those verbs'
+    hints and stops once it has enough.
+    """
+    for partial in partials:
+        for verb in partial['flagged']:
+            for noun, hint in index.hints[verb].items():
+                yield verb, noun, hint
+
+
+def _pct(count: int, total: int) -> float:
+    return count / total * 100 if total > 0 else 0
+
+
+class Rule:
+    """
+    A validation check over the pair index.
+
+    check() runs in a worker process on one partition of verbs and returns
+    a picklable partial result; merge() folds the partials (in verb order)
+    into the rule's result, whose 'summary' and 'passed' entries go in the
+    report's overview; markdown() renders the result as report lines.
+    """
+
+    name = ''
+    title = ''
+
+    def check(self, rows: List[VerbPairs]) -> dict:
+        raise NotImplementedError
+
+    def merge(self, partials: List[dict], index: PairIndex) -> dict:
+        raise NotImplementedError
+
+    def markdown(self, result: dict) -> List[str]:
+        return [f"- **{key.replace('_', ' ')}**: {value}" for key, value in result['summary'].items()]
+
+    def settings(self) -> dict:
+        """The options the rule was built with (cached partials are only reused with the same ones)."""
+        return {key: value for key, value in vars(self).items() if isinstance(value, (int, float, str, tuple, list))}
+
+
+class CoverageRule(Rule):
+    """Every collocation pair has a hint, and the hints file header counts match its contents."""
+
+    name = 'coverage'
+    title = 'Coverage'
+
+    def check(self, rows: List[VerbPairs]) -> dict:
+        verbs, missing, extra = {}, [], 0
+        for verb, nouns, noun_hints in rows:
+            absent = [noun for noun in nouns if noun not in noun_hints]
+            if nouns:
+                verbs[verb] = (len(nouns), len(nouns) - len(absent))
+            if absent:
+                missing.append((verb, absent))
+            extra += len(noun_hints.keys() - set(nouns))
+        return {'verbs': verbs, 'missing': missing, 'extra': extra}
+
+    def merge(self, partials: List[dict], index: PairIndex) -> dict:
+        verbs = {verb: counts for partial in partials for verb, counts in partial['verbs'].items()}
+        missing = {verb: nouns for partial in partials for verb, nouns in partial['missing']}
+        total_pairs = sum(total for total, _ in verbs.values())
+        pairs_with_hints = sum(hinted for _, hinted in verbs.values())
+        verbs_without_hints = [verb for verb, (_, hinted) in verbs.items() if hinted == 0]
+
+        header = {}
+        for key, actual in (('total_words', len(index.hints)), ('total_nouns_with_hints', index.hint_count)):
+            if key in index.header:
+                header[key] = {'expected': index.header[key], 'actual': actual}
+        header_ok = all(counts['expected'] == counts['actual'] for counts in header.values())
+
+        return {
+            'passed': pairs_with_hints == total_pairs and header_ok,
+            'summary': {
+                'total_verbs': len(verbs),
+                'verbs_with_hints': len(verbs) - len(verbs_without_hints),
+                'total_pairs': total_pairs,
+                'pairs_with_hints': pairs_with_hints,
+                'pairs_missing_hints': total_pairs - pairs_with_hints,
+                'coverage_pct': round(_pct(pairs_with_hints, total_pairs), 2),
+                'hints_without_collocation': sum(partial['extra'] for partial in partials),
+            },
+            'verbs_without_hints': verbs_without_hints,
+            'header': header,
+            'missing': missing,
+        }
+
+    def markdown(self, result: dict) -> List[str]:
+        lines = super().markdown(result)
+        if result['verbs_without_hints']:
+            lines.append(f"- **verbs without hints**: {', '.join(result['verbs_without_hints'])}")
+        for key, counts in result['header'].items():
+            status = 'OK' if counts['expected'] == counts['actual'] else 'MISMATCH'
+            lines.append(f"- **header {key}**: {counts['expected']} (actual {counts['actual']}) {status}")
+        if result['missing']:
+            lines += ["", "### Missing Hints (Top 10 Verbs)", ""]
+            for verb, nouns in sorted(result['missing'].items(), key=lambda x: len(x[1]), reverse=True)[:10]:
+                more = f", ... and {len(nouns) - 20} more" if len(nouns) > 20 else ""
+                lines.append(f"- **{verb}** ({len(nouns)} missing): {', '.join(nouns[:20])}{more}")
+        return lines
+
+
+class SpecificityRule(Rule):
+    """Hints shared across verbs (validate_hints.py) and generic wording (raw/validate_hints_quality.py)."""
+
+    name = 'specificity'
+    title = 'Specificity'
+
+    GENERIC_TERMS = ('things', 'various', 'general', 'stuff', 'items', 'something',
+                     'activities', 'events', 'occasions', 'situations', 'related',
+                     'different', 'multiple', 'elements')
+
+    def __init__(self, generic_terms: Sequence[str] = GENERIC_TERMS, min_specific_pct: float = 85):
+        self.generic_terms = tuple(generic_terms)
+        self.generic = re.compile(r'\b(' + '|'.join(map(re.escape, generic_terms)) + r')\b')
+        self.min_specific_pct = min_specific_pct
+
+    def check(self, rows: List[VerbPairs]) -> dict:
+        verb_hints, flagged, generic_count = {}, [], 0
+        for verb, _, noun_hints in rows:
+            verb_hints[verb] = list(dict.fromkeys(noun_hints.values()))
+            count = sum(1 for hint in noun_hints.values() if self.generic.search(hint.lower()))
+            if count:
+                generic_count += count
+                flagged.append(verb)
+        return {'verb_hints': verb_hints, 'generic_count': generic_count, 'flagged': flagged}
+
+    def merge(self, partials: List[dict], index: PairIndex) -> dict:
+        hint_verbs: Dict[str, List[str]] = {}
+        for partial in partials:
+            for verb, phrases in partial['verb_hints'].items():
+                for phrase in phrases:
+                    hint_verbs.setdefault(phrase, []).append(verb)
+        shared_by = Counter(min(len(verbs), 3) for verbs in hint_verbs.values())
+        cross_verb = sorted(((phrase, verbs) for phrase, verbs in hint_verbs.items() if len(verbs) >= 3),
+                            key=lambda x: len(x[1]), reverse=True)
+
+        by_verb = {}
+        for partial in partials:
+            for verb, phrases in partial['verb_hints'].items():
+                if phrases:
+                    unique = sum(1 for phrase in phrases if len(hint_verbs[phrase]) == 1)
+                    by_verb[verb] = {'unique_hints': unique, 'shared_hints': len(phrases) - unique,
+                                     'specificity_pct': round(_pct(unique, len(phrases)), 2)}
+
+        examples = []
+        for verb, noun, hint in _flagged_pairs(index, partials):
+            match = self.generic.search(hint.lower())
+            if match:
+                examples.append((verb, noun, hint, match.group(1)))
+                if len(examples) == MAX_EXAMPLES:
+                    break
+
+        total = index.hint_count
+        generic_count = sum(partial['generic_count'] for partial in partials)
+        specific_pct = 100 - _pct(generic_count, total)
+        return {
+            'passed': specific_pct >= self.min_specific_pct,
+            'summary': {
+                'unique_hints': len(hint_verbs),
+                'hints_in_one_verb': shared_by[1],
+                'hints_in_two_verbs': shared_by[2],
+                'hints_in_three_plus_verbs': shared_by[3],
+                'generic_hints': generic_count,
+                'specific_pct': round(specific_pct, 2),
+            },
+            'cross_verb_hints': [{'hint': phrase, 'count': len(verbs), 'verbs': sorted(verbs)}
+                                 for phrase, verbs in cross_verb],
+            'least_specific_verbs': sorted(by_verb.items(), key=lambda x: x[1]['specificity_pct'])[:10],
+            'generic_examples': examples,
+        }
+
+    def markdown(self, result: dict) -> List[str]:
+        lines = super().markdown(result)
+        if result['cross_verb_hints']:
+            lines += ["", "### Cross-Verb Hints (Used in 3+ Verbs)", "",
+                      "| Hint Phrase | Count | Verbs Using It |", "|-------------|-------|----------------|"]
+            for info in result['cross_verb_hints'][:20]:
+                lines.append(f"| \"{info['hint']}\" | {info['count']} | {', '.join(info['verbs'])} |")
+        if result['least_specific_verbs']:
+            lines += ["", "### Least Specific Verbs", "",
+                      "| Verb | Unique Hints | Shared Hints | Specificity % |",
+                      "|------|--------------|--------------|---------------|"]
+            for verb, stats in result['least_specific_verbs']:
+                lines.append(f"| {verb} | {stats['unique_hints']} | {stats['shared_hints']} | "
+                             f"{stats['specificity_pct']:.1f}% |")
+        if result['generic_examples']:
+            lines += ["", "### Generic Wording (examples)", ""]
+            lines += [f"- **{verb}** + {noun}: \"{hint}\" ('{term}')"
+                      for verb, noun, hint, term in result['generic_examples']]
+        return lines
+
+
+class LengthRule(Rule):
+    """Hints of min_words-max_words words and at least min_chars characters."""
+
+    name = 'length'
+    title = 'Length'
+
+    def __init__(self, min_words: int = 2, max_words: int = 8, min_chars: int = 5, min_good_pct: float = 90):
+        self.min_words = min_words
+        self.max_words = max_words
+        self.min_chars = min_chars
+        self.min_good_pct = min_good_pct
+
+    KINDS = ('too_few_words', 'too_many_words', 'too_few_chars')
+
+    def issues(self, hint: str) -> List[str]:
+        """The length issue kinds of one hint."""
+        words = len(hint.split())
+        kinds = []
+        if words < self.min_words:
+            kinds.append('too_few_words')
+        elif words > self.max_words:
+            kinds.append('too_many_words')
+        if len(hint) < self.min_chars:
+            kinds.append('too_few_chars')
+        return kinds
+
+    def check(self, rows: List[VerbPairs]) -> dict:
+        counts = Counter()
+        flagged = []
+        for verb, _, noun_hints in rows:
+            bad = 0
+            for hint in noun_hints.values():
+                kinds = self.issues(hint)
+                counts.update(kinds)
+                bad += 1 if kinds else 0
+            counts['good'] += len(noun_hints) - bad
+            counts['bad'] += bad
+            if bad:
+                flagged.append(verb)
+        return {'counts': counts, 'flagged': flagged}
+
+    def merge(self, partials: List[dict], index: PairIndex) -> dict:
+        counts = Counter()
+        for partial in partials:
+            counts.update(partial['counts'])
+        good_pct = _pct(counts['good'], counts['good'] + counts['bad'])
+        return {
+            'passed': good_pct >= self.min_good_pct,
+            'summary': {
+                'total_hints': counts['good'] + counts['bad'],
+                'good_length': counts['good'],
+                'good_length_pct': round(good_pct, 2),
+                f'fewer_than_{self.min_words}_words': counts['too_few_words'],
+                f'more_than_{self.max_words}_words': counts['too_many_words'],
+                f'fewer_than_{self.min_chars}_chars': counts['too_few_chars'],
+            },
+            'examples': self.examples(partials, index, counts),
+        }
+
+    def examples(self, partials: List[dict], index: PairIndex, counts: Counter) -> Dict[str, list]:
+        examples = {kind: [] for kind in self.KINDS}
+        wanted = sum(min(counts[kind], MAX_EXAMPLES) for kind in self.KINDS)
+        for verb, noun, hint in _flagged_pairs(index, partials):
+            if not wanted:
+                break
+            for kind in self.issues(hint):
+                if len(examples[kind]) < MAX_EXAMPLES:
+                    examples[kind].append((verb, noun, hint))
+                    wanted -= 1
+        return examples
+
+    def markdown(self, result: dict) -> List[str]:
+        lines = super().markdown(result)
+        for kind, examples in result['examples'].items():
+            if examples:
+                lines += ["", f"### {kind.replace('_', ' ').capitalize()} (examples)", ""]
+                lines += [f"- **{verb}** + {noun}: \"{hint}\"" for verb, noun, hint in examples]
+        return lines
+
+
+def quality_score(max_hint_percentage: float) -> float:
+    """validate_hints_final's per-verb score: 100 - 2 x the share of its most used hint."""
+    return max(0, 100 - (max_hint_percentage * 2))
+
+
+def quality_band(score: float) -> str:
+    for band, floor in (('EXCELLENT', 90), ('GOOD', 70), ('FAIR', 50), ('POOR', 30)):
+        if score >= floor:
+            return band
+    return 'VERY POOR'
+
+
+class DiversityRule(Rule):
+    """Hint repetition overall (raw/validate_hints_quality.py) and per verb (validate_hints_final.py)."""
+
+    name = 'diversity'
+    title = 'Diversity'
+
+    def __init__(self, max_top_hint_pct: float = 10):
+        self.max_top_hint_pct = max_top_hint_pct
+
+    def check(self, rows: List[VerbPairs]) -> dict:
+        return {'distributions': {verb: Counter(noun_hints.values())
+                                  for verb, _, noun_hints in rows if noun_hints}}
+
+    def merge(self, partials: List[dict], index: PairIndex) -> dict:
+        hint_counts = Counter()
+        verbs = {}
+        for partial in partials:
+            for verb, distribution in partial['distributions'].items():
+                hint_counts.update(distribution)
+                # Counter.most_common(1): the first of the most used hints
+                max_hint, max_count = max(distribution.items(), key=lambda x: x[1])
+                total_nouns = sum(distribution.values())
+                max_pct = max_count / total_nouns * 100
+                verbs[verb] = {'total_nouns': total_nouns, 'unique_hints': len(distribution),
+                               'max_hint': max_hint, 'max_hint_count': max_count,
+                               'max_hint_percentage': max_pct, 'quality_score': quality_score(max_pct)}
+        total = sum(hint_counts.values())
+        most_common = hint_counts.most_common(20)
+        top_pct = _pct(most_common[0][1], total) if most_common else 0
+        bands = Counter(quality_band(stats['quality_score']) for stats in verbs.values())
+        overall = sum(stats['quality_score'] for stats in verbs.values()) / len(verbs) if verbs else 0
+        return {
+            'passed': top_pct < self.max_top_hint_pct,
+            'summary': {
+                'total_hints': total,
+                'unique_hints': len(hint_counts),
+                'diversity_pct': round(_pct(len(hint_counts), total), 2),
+                'top_hint_pct': round(top_pct, 2),
+                'overall_quality_score': round(overall, 2),
+                **{f"verbs_{band.lower().replace(' ', '_')}": bands[band]
+                   for band in ('EXCELLENT', 'GOOD', 'FAIR', 'POOR', 'VERY POOR')},
+            },
+            'most_repeated': [{'hint': hint, 'count': count} for hint, count in most_common],
+            'worst_verbs': [dict(verb=verb, **stats) for verb, stats in
+                            sorted(verbs.items(), key=lambda x: x[1]['quality_score'])[:10]],
+        }
+
+    def markdown(self, result: dict) -> List[str]:
+        lines = super().markdown(result)
+        total = result['summary']['total_hints']
+        if result['most_repeated']:
+            lines += ["", "### Most Repeated Hints", ""]
+            lines += [f"- {entry['count']} ({_pct(entry['count'], total):.1f}%): \"{entry['hint']}\""
+                      for entry in result['most_repeated']]
+        if result['worst_verbs']:
+            lines += ["", "### Worst Verbs by Quality Score", "",
+                      "| Verb | Quality Score | Worst Hint | Usage % |", "|------|---------------|------------|---------|"]
+            for stats in result['worst_verbs']:
+                lines.append(f"| {stats['verb']} | {stats['quality_score']:.1f} | {stats['max_hint']} | "
+                             f"{stats['max_hint_percentage']:.1f}% |")
+        return lines
+
+
+class QuoteRule(Rule):
+    """
+    Leftovers of model output: hints wrapped in or containing unbalanced
+    quotes, [verb] template markers, and hints cut off at the max_tokens
+    limit (trailing ellipsis, punctuation or a dangling connective).
+    """
+
+    name = 'quotes'
+    title = 'Quotes and Truncation'
+
+    QUOTES = '"\'“”‘’「」『』'
+    PAIRS = (('(', ')'), ('[', ']'), ('「', '」'), ('“', '”'))
+    DANGLING = ('and', 'or', 'of', 'the', 'a', 'an', 'to', 'with', 'for', 'in', 'on', 'at', 'that')
+
+    def __init__(self):
+        self.dangling = re.compile(r'\b(' + '|'.join(self.DANGLING) + r')$')
+
+    def issues(self, hint: str) -> List[str]:
+        """The issue kinds of one hint."""
+        kinds = []
+        stripped = hint.strip()
+        if stripped != hint:
+            kinds.append('whitespace')
+        if stripped[:1] in self.QUOTES or stripped[-1:] in self.QUOTES:
+            kinds.append('quoted')
+        if hint.count('"') % 2 or any(hint.count(open_) != hint.count(close) for open_, close in self.PAIRS):
+            kinds.append('unbalanced')
+        if re.search(r'\[[^\]]*\]', hint):
+            kinds.append('template_marker')
+        if (stripped.endswith(('...', '…')) or stripped[-1:] in ',;:-'
+                or self.dangling.search(stripped.lower()) or not stripped):
+            kinds.append('truncated')
+        return kinds
+
+    def check(self, rows: List[VerbPairs]) -> dict:
+        counts = Counter()
+        flagged = []
+        # Hint phrases repeat across nouns, so each is checked once
+        seen: Dict[str, List[str]] = {}
+        for verb, _, noun_hints in rows:
+            bad = False
+            for hint in noun_hints.values():
+                kinds = seen.get(hint)
+                if kinds is None:
+                    kinds = seen[hint] = self.issues(hint)
+                counts.update(kinds)
+                bad = bad or bool(kinds)
+            if bad:
+                flagged.append(verb)
+        return {'counts': counts, 'flagged': flagged}
+
+    def merge(self, partials: List[dict], index: PairIndex) -> dict:
+        counts = Counter()
+        for partial in partials:
+            counts.update(partial['counts'])
+        return {
+            'passed': not counts,
+            'summary': {kind: counts[kind] for kind in
+                        ('quoted', 'unbalanced', 'template_marker', 'truncated', 'whitespace')},
+            'examples': self.examples(partials, index),
+        }
+
+    def examples(self, partials: List[dict], index: PairIndex) -> list:
+        examples = []
+        for verb, noun, hint in _flagged_pairs(index, partials):
+            kinds = self.issues(hint)
+            if kinds:
+                examples.append((verb, noun, hint, kinds))
+                if len(examples) == MAX_EXAMPLES:
+                    break
+        return examples
+
+    def markdown(self, result: dict) -> List[str]:
+        lines = super().markdown(result)
+        if result['examples']:
+            lines += ["", "### Examples", ""]
+            lines += [f"- **{verb}** + {noun}: {json.dumps(hint, ensure_ascii=False)} ({', '.join(kinds)})"
+                      for verb, noun, hint, kinds in result['examples']]
+        return lines
+
+
+RULES = {rule.name: rule for rule in (CoverageRule, SpecificityRule, LengthRule, DiversityRule, QuoteRule)}
+
+
+def _check_partition(rules: Sequence[Rule], rows: List[VerbPairs]) -> List[dict]:
+    """Run every rule's check on one partition (the process pool's unit of work)."""
+    return [rule.check(rows) for rule in rules]
+
+
+def _check_verbs(rules: Sequence[Rule], rows: List[VerbPairs]) -> List[List[dict]]:
+    """Every rule's partial for each verb of a partition on its own, so they can be cached per verb."""
+    return [[rule.check([row]) for rule in rules] for row in rows]
+
+
+def file_hash(path: Path) -> str:
+    """sha256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def verb_hash(row: VerbPairs) -> str:
+    """sha256 of a verb, its collocation nouns and its {noun: hint} map (in file order)."""
+    # repr() of strings, lists and dicts is as stable as json.dumps() and several times faster
+    return hashlib.sha256(repr(row).encode('utf-8')).hexdigest()
+
+
+def rules_signature(rules: Sequence[Rule]) -> str:
+    """sha256 of this file and the rules' names and settings: cached partials are only valid under the same one."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(json.dumps([[rule.name, rule.settings()] for rule in rules], ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """
+    JSON-backed per-verb rule partials from earlier runs.
+
+        {"version": 1, "signature": "...",
+         "collocations": {"sha256": "...", "groups": {verb: [noun, ...]}},
+         "verbs": {verb: {"hash": "...", "partials": [partial per rule]}}}
+
+    Partials come back from JSON with lists for tuples and dicts for
+    Counters; every Rule.merge() accepts both.
+    """
+
+    def __init__(self, path: Path, rules: Sequence[Rule]):
+        self.path = Path(path)
+        self.signature = rules_signature(rules)
+        self.collocations: Dict[str, object] = {}
+        self.verbs: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.changed = False
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION and data.get('signature') == self.signature:
+                self.verbs = data['verbs']
+            if data.get('version') == CACHE_VERSION:
+                self.collocations = data.get('collocations', {})
+
+    def groups(self, collocations_path: Path) -> Dict[str, List[str]]:
+        """The verb -> nouns groups of collocations_complete.json, parsed only if it changed since last stored."""
+        digest = file_hash(collocations_path)
+        if self.collocations.get('sha256') != digest:
+            self.collocations = {'sha256': digest, 'groups': load_graph(collocations_path).groups()}
+            self.changed = True
+        return self.collocations['groups']
+
+    def lookup(self, verb: str, digest: str) -> Optional[List[dict]]:
+        entry = self.verbs.get(verb)
+        if entry is not None and entry['hash'] == digest:
+            self.hits += 1
+            return entry['partials']
+        self.misses += 1
+        return None
+
+    def store(self, verb: str, digest: str, partials: List[dict]) -> None:
+        self.verbs[verb] = {'hash': digest, 'partials': partials}
+        self.changed = True
+
+    def prune(self, verbs: Iterable[str]) -> None:
+        """Forget verbs that are no longer in the data."""
+        keep = set(verbs)
+        if any(verb not in keep for verb in self.verbs):
+            self.verbs = {verb: entry for verb, entry in self.verbs.items() if verb in keep}
+            self.changed = True
+
+    def save(self) -> None:
+        """Write the cache atomically (temp file + rename), if anything in it changed."""
+        if not self.changed:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        # dumps() encodes in C; dump() would stream through the pure-Python encoder
+        payload = json.dumps({'version': CACHE_VERSION, 'signature': self.signature,
+                              'collocations': self.collocations, 'verbs': self.verbs}, ensure_ascii=False)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, self.path)
+        self.changed = False
+
+    def summary(self) -> str:
+        return f"{self.hits} verb(s) reused, {self.misses} re-checked"
+
+
+class ValidationEngine:
+    """
+    Runs rules over a PairIndex, partitioned by verb across a process pool.
+
+    Args:
+        rules: Rule instances (default: one of each in RULES)
+        workers: Worker processes (1 checks every partition in this process)
+    """
+
+    def __init__(self, rules: Optional[Sequence[Rule]] = None, workers: int = 1):
+        self.rules = list(rules) if rules is not None else [rule() for rule in RULES.values()]
+        self.workers = max(1, workers)
+
+    def run(self, index: PairIndex, cache: Optional[ValidationCache] = None) -> Dict[str, dict]:
+        """
+        {rule name: merged result} for every rule, in rule order.
+
+        With a cache, only verbs whose verb_hash() changed are checked (each
+        on its own); the rest reuse their cached partials, and the cache is
+        updated with the fresh ones (call cache.save() to keep them).
+        """
+        if cache is None:
+            partials = self._check(_check_partition, index.rows())
+        else:
+            rows = index.rows()
+            digests = [verb_hash(row) for row in rows]
+            partials = [cache.lookup(row[0], digest) for row, digest in zip(rows, digests)]
+            dirty = [position for position, cached in enumerate(partials) if cached is None]
+            fresh = [verb_partials for checked in self._check(_check_verbs, [rows[position] for position in dirty])
+                     for verb_partials in checked]
+            for position, verb_partials in zip(dirty, fresh):
+                partials[position] = verb_partials
+                cache.store(rows[position][0], digests[position], verb_partials)
+            cache.prune(index.verbs)
+        return {rule.name: rule.merge([partial[position] for partial in partials], index)
+                for position, rule in enumerate(self.rules)}
+
+    def _check(self, check, rows: List[VerbPairs]) -> list:
+        """check(rules, partition) for each partition of rows, in order: in process, or across the pool."""
+        if self.workers == 1 or not rows:
+            return [check(self.rules, rows)]
+        partitions = partition(rows, self.workers * PARTITIONS_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(check, [self.rules] * len(partitions), partitions))
+
+
+def build_report(index: PairIndex, results: Dict[str, dict], inputs: Dict[str, str]) -> dict:
+    """The JSON report: inputs, data set size, pass/fail per rule and every rule's result."""
+    return {
+        'inputs': inputs,
+        'generated_date': index.header.get('generated_date'),
+        'dataset': {'verbs': len(index.verbs), 'pairs': index.pair_count, 'hints': index.hint_count},
+        'passed': all(result['passed'] for result in results.values()),
+        'rules': results,
+    }
+
+
+def render_markdown(report: dict, rules: Sequence[Rule]) -> str:
+    lines = ["# HINT VALIDATION REPORT", ""]
+    lines.append(f"- **Hints**: {report['inputs']['hints']} (generated {report['generated_date'] or 'Unknown'})")
+    lines.append(f"- **Collocations**: {report['inputs']['collocations']}")
+    dataset = report['dataset']
+    lines.append(f"- **Data set**: {dataset['verbs']} verbs, {dataset['pairs']} pairs, {dataset['hints']} hints")
+    lines += ["", "| Rule | Result |", "|------|--------|"]
+    for rule in rules:
+        lines.append(f"| {rule.title} | {'PASS' if report['rules'][rule.name]['passed'] else 'FAIL'} |")
+    for number, rule in enumerate(rules, 1):
+        lines += ["", f"## {number}. {rule.title.upper()}", ""]
+        lines += rule.markdown(report['rules'][rule.name])
+    return "\n".join(lines) + "\n"
+
+
+def write_report(report: dict, rules: Sequence[Rule], markdown_path: Path, json_path: Path) -> None:
+    """Write the Markdown and JSON reports atomically (temp file + rename)."""
+    for path, content in ((markdown_path, render_markdown(report, rules)),
+                          (json_path, json.dumps(report, ensure_ascii=False, indent=2) + "\n")):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
+def validate(collocations_path: Path = DEFAULT_COLLOCATIONS, hints_path: Path = DEFAULT_HINTS,
+             rules: Optional[Sequence[Rule]] = None, workers: int = 1,
+             cache_path: Optional[Path] = None) -> dict:
+    """Load the data once and run every rule on it (incrementally with a cache file); returns the JSON report."""
+    engine = ValidationEngine(rules, workers)
+    cache = ValidationCache(cache_path, engine.rules) if cache_path else None
+    index = PairIndex.load(collocations_path, hints_path, cache)
+    results = engine.run(index, cache)
+    if cache is not None:
+        cache.save()
+    return build_report(index, results, {'collocations': str(collocations_path), 'hints': str(hints_path)})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run every hint validation rule over one load of the data")
+    parser.add_argument('--collocations', type=Path, default=DEFAULT_COLLOCATIONS,
+                        help="collocations_complete.json (default: input/collocations_complete.json)")
+    parser.add_argument('--hints', type=Path, default=DEFAULT_HINTS,
+                        help="Hints file (default: input/collocation_hints.json)")
+    parser.add_argument('--rules', nargs='+', choices=list(RULES), default=list(RULES),
+                        help="Rules to run (default: all)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes the verb partitions are checked in (default: 1)")
+    parser.add_argument('--report', type=Path, default=DEFAULT_REPORT,
+                        help="Markdown report; the JSON report goes next to it (default: output/validation_report.md)")
+    parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE,
+                        help="Per-verb results reused by the next run (default: output/validation_cache.json)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Check every verb, without reading or writing the cache")
+    args = parser.parse_args()
+
+    rules = [RULES[name]() for name in args.rules]
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else ValidationCache(args.cache, rules)
+    try:
+        index = PairIndex.load(args.collocations, args.hints, cache)
+    except HintFormatError as e:
+        raise SystemExit(f"ERROR: {args.hints}: {e}")
+    loaded = time.perf_counter()
+    print(f"Loaded {len(index.verbs)} verbs, {index.pair_count} pairs and {index.hint_count} hints "
+          f"in {loaded - start:.2f}s")
+
+    results = ValidationEngine(rules, args.workers).run(index, cache)
+    print(f"Ran {len(rules)} rule(s) with {args.workers} worker(s) in {time.perf_counter() - loaded:.2f}s")
+    if cache is not None:
+        cache.save()
+        print(f"Cache: {cache.summary()}")
+
+    report = build_report(index, results, {'collocations': str(args.collocations), 'hints': str(args.hints)})
+    json_path = args.report.with_suffix('.json')
+    write_report(report, rules, args.report, json_path)
+
+    for rule in rules:
+        print(f"  [{'PASS' if results[rule.name]['passed'] else 'FAIL'}] {rule.title}")
+    print(f"\nReport written to {args.report} and {json_path}")
+
+
+if __name__ == '__main__':
+    main()
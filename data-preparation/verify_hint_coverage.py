@@ -11,6 +11,9 @@ from collections import defaultdict
 from typing import Dict, List, Tuple, Set
 from pathlib import Path
 
+from collocation_graph import CollocationGraph, load_graph
+from word_index import WordIndex, load_word_index
+
 
 def load_json_file(filepath: Path) -> Dict:
     """
@@ -26,36 +29,21 @@ def load_json_file(filepath: Path) -> Dict:
         return json.load(f)
 
 
-def extract_verb_noun_pairs(collocations_data: Dict) -> Dict[str, Set[str]]:
+def extract_verb_noun_pairs(graph: CollocationGraph) -> Dict[str, Set[str]]:
     """
-    Extract all verb-noun pairs from collocations data.
+    Extract all verb-noun pairs from the collocation graph.
 
     Args:
-        collocations_data: Complete collocations dictionary
+        graph: Loaded collocation graph
 
     Returns:
         Dictionary mapping verb keys to sets of noun keys
     """
-    verb_noun_pairs = defaultdict(set)
-
-    # Extract from the 'words' section
-    words_data = collocations_data.get('words', {})
-
-    for verb_key, verb_data in words_data.items():
-        if isinstance(verb_data, dict) and 'matches' in verb_data:
-            matches = verb_data['matches']
-            if isinstance(matches, dict) and 'nouns' in matches:
-                nouns_list = matches['nouns']
-                if isinstance(nouns_list, list):
-                    for noun_obj in nouns_list:
-                        if isinstance(noun_obj, dict) and 'word' in noun_obj:
-                            verb_noun_pairs[verb_key].add(noun_obj['word'])
-
-    return verb_noun_pairs
+    return {verb: set(nouns) for verb, nouns in graph.groups().items()}
 
 
 def analyze_hint_coverage(
-    collocations_data: Dict,
+    graph: CollocationGraph,
     hints_data: Dict,
     verb_noun_pairs: Dict[str, Set[str]]
 ) -> Dict:
@@ -63,7 +51,7 @@ def analyze_hint_coverage(
     Analyze hint coverage across all verb-noun pairs.
 
     Args:
-        collocations_data: Complete collocations dictionary
+        graph: Loaded collocation graph
         hints_data: Hints dictionary
         verb_noun_pairs: Dictionary mapping verbs to their noun pairs
 
@@ -82,13 +70,12 @@ def analyze_hint_coverage(
         'hint_usage': defaultdict(list),  # Maps hint phrases to list of (verb, noun) tuples
     }
 
-    # Get the words and hints dictionaries
-    words_data = collocations_data.get('words', {})
+    # Get the hints dictionary
     hints_dict = hints_data.get('hints', {})
 
     # Analyze each verb
     for verb_key, noun_set in verb_noun_pairs.items():
-        verb_info = words_data.get(verb_key, {})
+        verb_info = graph.info(verb_key)
         verb_display = f"{verb_info.get('word', verb_key)} ({verb_info.get('reading', '')}) - {verb_info.get('english', '')}"
 
         total_nouns = len(noun_set)
@@ -142,49 +129,43 @@ def analyze_hint_coverage(
     return results
 
 
-def find_noun_info(noun_word: str, collocations_data: Dict) -> Dict:
+def find_noun_info(noun_word: str, index: WordIndex) -> Dict:
     """
-    Find noun information from collocations data.
+    Find noun information in the word index.
 
     Args:
-        noun_word: The noun word to search for
-        collocations_data: Complete collocations dictionary
+        noun_word: The noun word to look up
+        index: Word index (word_index.py)
 
     Returns:
         Dictionary containing noun info (word, reading, english)
     """
-    words_data = collocations_data.get('words', {})
-
-    # Search through all verbs to find the noun
-    for verb_data in words_data.values():
-        if isinstance(verb_data, dict) and 'matches' in verb_data:
-            matches = verb_data['matches']
-            if isinstance(matches, dict) and 'nouns' in matches:
-                nouns_list = matches['nouns']
-                if isinstance(nouns_list, list):
-                    for noun_obj in nouns_list:
-                        if isinstance(noun_obj, dict) and noun_obj.get('word') == noun_word:
-                            return noun_obj
-
+    info = index.info(noun_word, 'noun') or index.info(noun_word)
+    if info is not None:
+        return info
     return {'word': noun_word, 'reading': '', 'english': ''}
 
 
 def generate_markdown_report(
     results: Dict,
-    collocations_data: Dict,
-    output_path: Path
+    graph: CollocationGraph,
+    output_path: Path,
+    index: WordIndex = None
 ) -> str:
     """
     Generate a comprehensive markdown report of hint coverage.
 
     Args:
         results: Analysis results dictionary
-        collocations_data: Complete collocations dictionary for lookups
+        graph: Loaded collocation graph
         output_path: Path to save the markdown report
+        index: Word index for word lookups (default: built from the graph)
 
     Returns:
         Report content as string
     """
+    if index is None:
+        index = WordIndex.build({}, graph)
     lines = []
 
     # Header
@@ -251,7 +232,7 @@ def generate_markdown_report(
             lines.append("")
             lines.append("**Missing nouns:**")
             for noun_key in missing_nouns[:10]:  # Show first 10
-                noun_info = find_noun_info(noun_key, collocations_data)
+                noun_info = find_noun_info(noun_key, index)
                 noun_display = f"{noun_info.get('word', noun_key)} ({noun_info.get('reading', '')}) - {noun_info.get('english', '')}"
                 lines.append(f"- {noun_display}")
 
@@ -301,10 +282,9 @@ def generate_markdown_report(
 
             # Show sample pairs
             lines.append("**Sample verb-noun pairs:**")
-            words_data = collocations_data.get('words', {})
             for verb_key, noun_key in pairs[:5]:
-                verb_info = words_data.get(verb_key, {})
-                noun_info = find_noun_info(noun_key, collocations_data)
+                verb_info = index.info(verb_key, graph.type(verb_key)) if verb_key in graph else {}
+                noun_info = find_noun_info(noun_key, index)
                 verb_disp = f"{verb_info.get('word', verb_key)} ({verb_info.get('reading', '')})"
                 noun_disp = f"{noun_info.get('word', noun_key)} ({noun_info.get('reading', '')})"
                 lines.append(f"- {verb_disp} + {noun_disp}")
@@ -364,19 +344,22 @@ def main():
     output_path = base_dir / "HINT_COVERAGE_REPORT.md"
 
     print("Loading collocation data...")
-    collocations_data = load_json_file(collocations_path)
+    graph = load_graph(collocations_path)
+
+    print("Loading word index...")
+    index = load_word_index(base_dir / "input" / "vocabulary.json", collocations_path)
 
     print("Loading hints data...")
     hints_data = load_json_file(hints_path)
 
     print("Extracting verb-noun pairs...")
-    verb_noun_pairs = extract_verb_noun_pairs(collocations_data)
+    verb_noun_pairs = extract_verb_noun_pairs(graph)
 
     print("Analyzing hint coverage...")
-    results = analyze_hint_coverage(collocations_data, hints_data, verb_noun_pairs)
+    results = analyze_hint_coverage(graph, hints_data, verb_noun_pairs)
 
     print("Generating markdown report...")
-    generate_markdown_report(results, collocations_data, output_path)
+    generate_markdown_report(results, graph, output_path, index)
 
     print(f"\n{'='*80}")
     print("SUMMARY")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Content-derived vocabulary IDs.
+
+raw/create_vocabulary_json.py used to give every word a uuid4, so each
+rebuild renumbered all of vocabulary.json and every ID stored by a client
+(wordProgress is keyed by wordId) stopped matching. word_id() derives the
+ID from the word itself instead: a uuid5 of (type, japanese, reading) in
+this project's namespace. A rebuild leaves the ID of every word whose
+surface form, reading and type are unchanged alone; editing the English
+gloss or the frequency does not change it either.
+
+assign_ids() fails the build if two entries share a key (the same word
+listed twice) or if two keys were to hash to the same ID.
+
+migration_map() pairs an earlier vocabulary.json with a new one by the same
+key, so IDs from a build with different (e.g. random) IDs can be carried
+over. compose_migrations() chains two maps, so one file maps the IDs of
+every earlier build to the current ones:
+
+    {"version": 1, "from": {...}, "to": {...},
+     "ids": {"<old id>": "<new id>", ...},   # only IDs that changed
+     "removed": ["<old id>", ...],           # words no longer in the vocabulary
+     "added": ["<new id>", ...]}
+
+Usage (from data-preparation/):
+    python vocabulary_ids.py old_vocabulary.json input/vocabulary.json   # print the migration summary
+"""
+
+import argparse
+import json
+import uuid
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Fixed forever: changing it renumbers every word
+NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, 'https://github.com/AlessandroFlati/SmartNihongoLearner/vocabulary')
+MIGRATION_VERSION = 1
+
+
+class IdCollisionError(ValueError):
+    """Vocabulary entries that share a key, or distinct keys that share an ID."""
+
+    def __init__(self, problems: List[str]):
+        self.problems = problems
+        super().__init__(f"{len(problems)} vocabulary ID collisions: " + "; ".join(problems[:10]))
+
+
+def word_key(entry: dict) -> Tuple[str, str, str]:
+    """The (japanese, reading, type) a word's ID is derived from."""
+    return entry['japanese'], entry['reading'], entry['type']
+
+
+def word_id(japanese: str, reading: str, word_type: str) -> str:
+    """The stable ID of a word: uuid5 of its type, surface form and reading."""
+    # JSON keeps the three fields apart whatever characters they contain
+    name = json.dumps([word_type, japanese, reading], ensure_ascii=False)
+    return str(uuid.uuid5(NAMESPACE, name))
+
+
+def assign_ids(entries: List[dict]) -> List[dict]:
+    """
+    Set every entry's `id` from its key, in place.
+
+    Returns:
+        The entries
+
+    Raises:
+        IdCollisionError: if two entries share a key or two keys share an ID
+    """
+    keys_by_id: Dict[str, Tuple[str, str, str]] = {}
+    problems = []
+    for entry in entries:
+        key = word_key(entry)
+        entry_id = word_id(*key)
+        seen = keys_by_id.get(entry_id)
+        if seen == key:
+            problems.append(f"{key[0]} ({key[1]}) [{key[2]}] is listed twice")
+        elif seen is not None:
+            problems.append(f"{key[0]} ({key[1]}) [{key[2]}] and {seen[0]} ({seen[1]}) [{seen[2]}] "
+                            f"share ID {entry_id}")
+        keys_by_id[entry_id] = key
+        entry['id'] = entry_id
+    if problems:
+        raise IdCollisionError(problems)
+    return entries
+
+
+def migration_map(old_data: dict, new_data: dict) -> dict:
+    """
+    Old vocabulary.json IDs -> new ones, matched by (japanese, reading, type).
+
+    Args:
+        old_data: An earlier vocabulary.json
+        new_data: The new vocabulary.json
+
+    Returns:
+        The migration document (see the module docstring)
+    """
+    new_ids = {word_key(entry): entry['id'] for entry in new_data.get('vocabulary', [])}
+    ids = {}
+    removed = []
+    kept = set()
+    for entry in old_data.get('vocabulary', []):
+        new_id = new_ids.get(word_key(entry))
+        if new_id is None:
+            removed.append(entry['id'])
+            continue
+        kept.add(new_id)
+        if new_id != entry['id']:
+            ids[entry['id']] = new_id
+    added = [new_id for new_id in new_ids.values() if new_id not in kept]
+
+    def summary(data: dict) -> dict:
+        return {key: value for key, value in data.items() if key != 'vocabulary'}
+
+    return {'version': MIGRATION_VERSION, 'from': summary(old_data), 'to': summary(new_data),
+            'ids': ids, 'removed': removed, 'added': added}
+
+
+def compose_migrations(earlier: dict, later: dict) -> dict:
+    """
+    One migration from earlier's "from" vocabulary to later's "to" vocabulary.
+
+    IDs that earlier added are not in the "from" vocabulary: they stay in
+    "added" (renumbered by later) unless later removed them, and never show
+    up in "ids" or "removed".
+    """
+    later_removed = set(later['removed'])
+    earlier_added = set(earlier['added'])
+    earlier_targets = set(earlier['ids'].values())
+    ids = {}
+    removed = list(earlier['removed'])
+    for old_id, new_id in earlier['ids'].items():
+        if new_id in later_removed:
+            removed.append(old_id)
+        else:
+            ids[old_id] = later['ids'].get(new_id, new_id)
+    # Words earlier kept under the same ID
+    for old_id, new_id in later['ids'].items():
+        if old_id not in earlier_added and old_id not in earlier_targets:
+            ids[old_id] = new_id
+    removed.extend(old_id for old_id in later['removed']
+                   if old_id not in earlier_added and old_id not in earlier_targets)
+    added = [later['ids'].get(new_id, new_id) for new_id in earlier['added'] if new_id not in later_removed]
+    return {'version': MIGRATION_VERSION, 'from': earlier['from'], 'to': later['to'],
+            'ids': {old_id: new_id for old_id, new_id in ids.items() if old_id != new_id},
+            'removed': removed, 'added': added + later['added']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize the ID migration between two vocabulary.json files")
+    parser.add_argument('old', type=Path, help="Earlier vocabulary.json")
+    parser.add_argument('new', type=Path, help="New vocabulary.json")
+    args = parser.parse_args()
+
+    with open(args.old, 'r', encoding='utf-8') as f:
+        old_data = json.load(f)
+    with open(args.new, 'r', encoding='utf-8') as f:
+        new_data = json.load(f)
+    migration = migration_map(old_data, new_data)
+    unchanged = len(old_data.get('vocabulary', [])) - len(migration['ids']) - len(migration['removed'])
+    print(f"{unchanged} unchanged, {len(migration['ids'])} renumbered, "
+          f"{len(migration['removed'])} removed, {len(migration['added'])} added")
+
+
+if __name__ == '__main__':
+    main()
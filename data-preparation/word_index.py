@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Persistable word-info index over vocabulary.json and collocations_complete.json.
+
+Reporting, coverage and hint scripts all need "what is this word": its
+reading, English gloss and type. Each used to answer that with its own scan
+of the loaded JSON (verify_hint_coverage.find_noun_info walked every verb's
+match list per noun). WordIndex holds every word once and answers lookups
+from dicts:
+
+    by surface form    index.info('水')                 # first entry, or None
+                       index.info('水', 'noun')         # the noun entry
+                       index.entries_for('上')          # every homograph
+    by reading         index.by_reading('mizu')         # exact stored reading
+    by romaji          index.by_romaji('Mi-zu')         # normalized: case, spaces, hyphens, macrons
+    by type            index.of_type('verb')
+
+Entries come from vocabulary.json (with its id and frequency) in list
+order, then words that only appear in collocations_complete.json (reading
+and gloss from the graph, no id). A collocation word is matched to a
+vocabulary entry by japanese and type, and the reading breaks ties between
+homographs, as collocation_refs.resolve_ids() does. The readings in this
+project are stored as romaji; the romaji key folds the spelling variants
+of one reading together ("ō", "o-o" and "oo" all become "oo").
+
+The index is saved as compact JSON together with the sha256 of both source
+files; load_word_index() reuses a saved index only while both hashes still
+match, and rebuilds (and saves) it otherwise.
+
+Usage (from data-preparation/):
+    python word_index.py                  # build output/word_index.json
+    python word_index.py 水 mizu          # look words up by surface form, reading or romaji
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from collocation_graph import CollocationGraph, load_graph
+
+PREP = Path(__file__).resolve().parent
+DEFAULT_VOCABULARY = PREP / "input" / "vocabulary.json"
+DEFAULT_COLLOCATIONS = PREP / "input" / "collocations_complete.json"
+DEFAULT_INDEX = PREP / "output" / "word_index.json"
+INDEX_VERSION = 1
+
+FIELDS = ('word', 'reading', 'english', 'type', 'id', 'frequency')
+MACRONS = {'ā': 'aa', 'ī': 'ii', 'ū': 'uu', 'ē': 'ee', 'ō': 'oo', 'â': 'aa', 'î': 'ii', 'û': 'uu', 'ê': 'ee', 'ô': 'oo'}
+NOT_LETTERS = re.compile(r"[^a-z]")
+
+
+def romaji_key(text: str) -> str:
+    """Lowercase romaji with macrons spelled out and spaces, hyphens and apostrophes dropped."""
+    text = unicodedata.normalize('NFC', text.lower())
+    text = ''.join(MACRONS.get(char, char) for char in text)
+    return NOT_LETTERS.sub('', text)
+
+
+def file_hash(path: Path) -> str:
+    """sha256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class WordIndex:
+    """
+    Word entries ({word, reading, english, type, id, frequency}) with
+    surface form, reading, romaji and type lookups.
+    """
+
+    def __init__(self, entries: List[dict], sources: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            entries: Word entries, in index order
+            sources: {name: sha256} of the files the entries were built from
+        """
+        self.entries = entries
+        self.sources = sources or {}
+        self._by_word: Dict[str, List[int]] = {}
+        self._by_reading: Dict[str, List[int]] = {}
+        self._by_romaji: Dict[str, List[int]] = {}
+        self._by_type: Dict[str, List[int]] = {}
+        for position, entry in enumerate(entries):
+            self._by_word.setdefault(entry['word'], []).append(position)
+            self._by_type.setdefault(entry['type'], []).append(position)
+            if entry['reading']:
+                self._by_reading.setdefault(entry['reading'], []).append(position)
+                self._by_romaji.setdefault(romaji_key(entry['reading']), []).append(position)
+
+    @classmethod
+    def build(cls, vocabulary_data: dict, graph: Optional[CollocationGraph] = None,
+              sources: Optional[Dict[str, str]] = None) -> 'WordIndex':
+        """Index vocabulary.json's entries, then the collocation words it does not have."""
+        entries = []
+        by_key: Dict[tuple, List[int]] = {}
+        for entry in vocabulary_data.get('vocabulary', []):
+            by_key.setdefault((entry['japanese'], entry['type']), []).append(len(entries))
+            entries.append({'word': entry['japanese'], 'reading': entry.get('reading', ''),
+                            'english': entry.get('english', ''), 'type': entry['type'],
+                            'id': entry.get('id'), 'frequency': entry.get('frequency')})
+
+        if graph is not None:
+            for word in graph.words:
+                info = graph.info(word)
+                candidates = by_key.get((word, info['type']), [])
+                if len(candidates) > 1:
+                    candidates = [position for position in candidates
+                                  if entries[position]['reading'] == info['reading']] or candidates
+                if not candidates:
+                    by_key[(word, info['type'])] = [len(entries)]
+                    entries.append({'word': word, 'reading': info['reading'], 'english': info['english'],
+                                    'type': info['type'], 'id': None, 'frequency': None})
+        return cls(entries, sources)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._by_word
+
+    def _entries(self, positions: List[int]) -> List[dict]:
+        return [self.entries[position] for position in positions]
+
+    def entries_for(self, word: str) -> List[dict]:
+        """Every entry spelled `word` (homographs in index order)."""
+        return self._entries(self._by_word.get(word, []))
+
+    def info(self, word: str, word_type: Optional[str] = None) -> Optional[dict]:
+        """The first entry spelled `word` (of `word_type`, if given), or None."""
+        for position in self._by_word.get(word, []):
+            if word_type is None or self.entries[position]['type'] == word_type:
+                return self.entries[position]
+        return None
+
+    def by_reading(self, reading: str) -> List[dict]:
+        """Entries whose stored reading is exactly `reading`."""
+        return self._entries(self._by_reading.get(reading, []))
+
+    def by_romaji(self, text: str) -> List[dict]:
+        """Entries whose reading matches `text` after romaji_key() normalization."""
+        return self._entries(self._by_romaji.get(romaji_key(text), []))
+
+    def of_type(self, word_type: str) -> List[dict]:
+        return self._entries(self._by_type.get(word_type, []))
+
+    def to_data(self) -> dict:
+        """Compact JSON form: one [word, reading, english, type, id, frequency] row per entry."""
+        return {'version': INDEX_VERSION, 'sources': self.sources, 'fields': list(FIELDS),
+                'entries': [[entry[field] for field in FIELDS] for entry in self.entries]}
+
+    @classmethod
+    def from_data(cls, data: dict) -> 'WordIndex':
+        return cls([dict(zip(data['fields'], row)) for row in data['entries']], data.get('sources'))
+
+    def save(self, path: Path) -> None:
+        """Write the index atomically (temp file + rename)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        # json.dumps() encodes in C; json.dump() streams through the pure-Python encoder
+        payload = json.dumps(self.to_data(), ensure_ascii=False, separators=(',', ':'))
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+
+def load_word_index(vocabulary_path: Path = DEFAULT_VOCABULARY, collocations_path: Path = DEFAULT_COLLOCATIONS,
+                    index_path: Optional[Path] = DEFAULT_INDEX) -> WordIndex:
+    """
+    The word index for these sources: the saved one while both files are
+    unchanged, otherwise rebuilt and saved (index_path None: build, never save).
+
+    A missing vocabulary file indexes the collocation words only.
+    """
+    sources = {'collocations': file_hash(collocations_path)}
+    if Path(vocabulary_path).exists():
+        sources['vocabulary'] = file_hash(vocabulary_path)
+
+    if index_path is not None and Path(index_path).exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == INDEX_VERSION and data.get('sources') == sources:
+            return WordIndex.from_data(data)
+
+    vocabulary_data = {}
+    if 'vocabulary' in sources:
+        with open(vocabulary_path, 'r', encoding='utf-8') as f:
+            vocabulary_data = json.load(f)
+    index = WordIndex.build(vocabulary_data, load_graph(collocations_path), sources)
+    if index_path is not None:
+        index.save(index_path)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the word-info index and look words up in it")
+    parser.add_argument('words', nargs='*', help="Surface forms, readings or romaji to look up")
+    parser.add_argument('--vocabulary', type=Path, default=DEFAULT_VOCABULARY)
+    parser.add_argument('--collocations', type=Path, default=DEFAULT_COLLOCATIONS)
+    parser.add_argument('--index', type=Path, default=DEFAULT_INDEX, help=f"Saved index (default: {DEFAULT_INDEX})")
+    args = parser.parse_args()
+
+    index = load_word_index(args.vocabulary, args.collocations, args.index)
+    with_ids = sum(1 for entry in index.entries if entry['id'])
+    print(f"{len(index)} words ({with_ids} from vocabulary.json) in {args.index}")
+    for word in args.words:
+        found = index.entries_for(word) or index.by_reading(word) or index.by_romaji(word)
+        print(f"\n{word}:")
+        for entry in found:
+            print(f"  {entry['word']} ({entry['reading']}) [{entry['type']}] - {entry['english']}")
+        if not found:
+            print("  (not found)")
+
+
+if __name__ == '__main__':
+    main()
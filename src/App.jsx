@@ -29,7 +29,7 @@ import {
   TrendingUp as TrendingUpIcon,
   School as SchoolIcon,
 } from '@mui/icons-material';
-import { initializeAllData, getVocabularyStats, getCollocationStats } from './services/dataLoader';
+import { initializeAllData, getVocabularyStats, getCollocationStats, fetchDataFile } from './services/dataLoader';
 import storage from './services/storage';
 import { getRecommendedPracticeWords, getRecommendedPracticeNouns, getSRSStatisticsForLevel } from './services/collocation';
 import GameModeSelector from './components/games/GameModeSelector';
@@ -73,7 +73,7 @@ function App() {
 
       try {
         const filename = jlptLevel === 'n5' ? 'studylist_n5.json' : 'studylist_n54.json';
-        const response = await fetch(`${import.meta.env.BASE_URL}data/${filename}`);
+        const response = await fetchDataFile(filename);
         if (!response.ok) {
           throw new Error(`Failed to load study list: ${response.statusText}`);
         }
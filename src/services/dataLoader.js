@@ -10,12 +10,54 @@ import storage from './storage';
 // Get the base URL from Vite configuration for correct asset paths
 const BASE_URL = import.meta.env.BASE_URL;
 
+let manifestPromise = null;
+
+/**
+ * Load data/manifest.json (logical file name -> content-hashed file)
+ * Revalidated on every app load; the hashed files it names never change.
+ * Resolves to null if there is no manifest.
+ */
+const loadManifest = () => {
+  if (!manifestPromise) {
+    manifestPromise = fetch(`${BASE_URL}data/manifest.json`, { cache: 'no-cache' })
+      .then(response => (response.ok ? response.json() : null))
+      .catch(error => {
+        console.warn('Data manifest not available, using plain file names:', error);
+        return null;
+      });
+  }
+  return manifestPromise;
+};
+
+/**
+ * Fetch a data file by its logical name (e.g. 'collocation_meanings.json')
+ * Uses the content-hashed copy from the manifest when there is one, so the
+ * browser can cache it until its content changes. Falls back to the plain
+ * file if the hashed copy is missing or fails its integrity check.
+ */
+export const fetchDataFile = async (name) => {
+  const manifest = await loadManifest();
+  const entry = manifest?.artifacts?.[name];
+  if (entry) {
+    try {
+      const response = await fetch(`${BASE_URL}data/${entry.file}`, { integrity: entry.integrity });
+      if (response.ok) {
+        return response;
+      }
+      console.warn(`Hashed copy of ${name} not available (${response.status}), using ${name}`);
+    } catch (error) {
+      console.warn(`Hashed copy of ${name} failed to load, using ${name}:`, error);
+    }
+  }
+  return fetch(`${BASE_URL}data/${name}`, { cache: 'no-cache' });
+};
+
 /**
  * Load vocabulary data from JSON file
  */
 export const loadVocabulary = async () => {
   try {
-    const response = await fetch(`${BASE_URL}data/vocabulary.json`);
+    const response = await fetchDataFile('vocabulary.json');
     if (!response.ok) {
       throw new Error(`Failed to load vocabulary: ${response.statusText}`);
     }
@@ -32,7 +74,7 @@ export const loadVocabulary = async () => {
  */
 export const loadCollocations = async () => {
   try {
-    const response = await fetch(`${BASE_URL}data/collocations_complete.json`);
+    const response = await fetchDataFile('collocations_complete.json');
     if (!response.ok) {
       throw new Error(`Failed to load collocations: ${response.statusText}`);
     }
@@ -49,9 +91,7 @@ export const loadCollocations = async () => {
  */
 export const loadMeanings = async () => {
   try {
-    // Add cache-busting parameter to force reload of updated meanings
-    const cacheBuster = Date.now();
-    const response = await fetch(`${BASE_URL}data/collocation_meanings.json?v=${cacheBuster}`);
+    const response = await fetchDataFile('collocation_meanings.json');
     if (!response.ok) {
       throw new Error(`Failed to load meanings: ${response.statusText}`);
     }
@@ -63,6 +103,38 @@ export const loadMeanings = async () => {
   }
 };
 
+/**
+ * Apply data/vocabulary_id_migration.json
+ * Word IDs used to change on every data build. The migration maps the IDs
+ * of every earlier build to the current ones: progress stored under an old
+ * ID is moved to the new one, and a stored vocabulary that still has old
+ * IDs is reloaded. Runs on every app load, so restored backups are migrated
+ * too; it only writes when something still uses an old ID.
+ */
+export const migrateVocabularyIds = async () => {
+  try {
+    const response = await fetchDataFile('vocabulary_id_migration.json');
+    if (!response.ok) {
+      return;
+    }
+    const migration = await response.json();
+    const ids = migration.ids || {};
+
+    const moved = await storage.migrateWordIds(ids);
+    if (moved > 0) {
+      console.log(`Moved progress of ${moved} words to their new IDs`);
+    }
+
+    const oldIds = [...Object.keys(ids), ...(migration.removed || [])];
+    if (oldIds.length > 0 && (await storage.hasAnyVocabularyId(oldIds))) {
+      console.log('Reloading vocabulary with new IDs...');
+      await storage.replaceVocabulary(await loadVocabulary());
+    }
+  } catch (error) {
+    console.warn('Vocabulary ID migration failed:', error);
+  }
+};
+
 /**
  * Initialize all data (vocabulary and collocations)
  * This should be called once when the app first loads
@@ -80,6 +152,9 @@ export const initializeAllData = async () => {
       console.log('Vocabulary already initialized');
     }
 
+    // Progress and the stored vocabulary may use IDs of an earlier data build
+    await migrateVocabularyIds();
+
     if (dbInfo.collocationsCount === 0) {
       console.log('Initializing collocation data...');
       const collocations = await loadCollocations();
@@ -154,9 +229,7 @@ let synonymGroupsCache = null;
  */
 export const loadReverseMeanings = async () => {
   try {
-    // Add cache-busting parameter to force reload of updated meanings
-    const cacheBuster = Date.now();
-    const response = await fetch(`${BASE_URL}data/reverse_meanings.json?v=${cacheBuster}`);
+    const response = await fetchDataFile('reverse_meanings.json');
     if (!response.ok) {
       console.warn('Reverse meanings not found, will use fallback');
       return null;
@@ -196,7 +269,7 @@ export const getMeaningsForWord = async (word, mode = 'forward') => {
  */
 export const loadSynonymGroups = async () => {
   try {
-    const response = await fetch(`${BASE_URL}data/synonym_groups.json`);
+    const response = await fetchDataFile('synonym_groups.json');
     if (!response.ok) {
       console.warn('Synonym groups not found');
       return null;
@@ -221,9 +294,11 @@ export const getSynonymGroups = async () => {
 };
 
 export default {
+  fetchDataFile,
   loadVocabulary,
   loadCollocations,
   loadMeanings,
+  migrateVocabularyIds,
   initializeAllData,
   getVocabularyStats,
   getCollocationStats,
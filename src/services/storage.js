@@ -103,6 +103,24 @@ export const storage = {
     }
   },
 
+  /**
+   * Replace the stored vocabulary (after a data build changed its IDs)
+   */
+  replaceVocabulary: async (vocabularyArray) => {
+    await db.transaction('rw', db.vocabulary, async () => {
+      await db.vocabulary.clear();
+      await db.vocabulary.bulkAdd(vocabularyArray);
+    });
+  },
+
+  /**
+   * Check whether any of the given IDs is in the stored vocabulary
+   */
+  hasAnyVocabularyId: async (ids) => {
+    const found = await db.vocabulary.bulkGet(ids);
+    return found.some(Boolean);
+  },
+
   /**
    * Get all vocabulary
    */
@@ -275,6 +293,27 @@ export const storage = {
     };
   },
 
+  /**
+   * Move word progress stored under old vocabulary IDs to the new ones
+   * ids: { oldId: newId } from data/vocabulary_id_migration.json
+   * Progress already stored under a new ID is kept. Returns the number of records moved.
+   */
+  migrateWordIds: async (ids) => {
+    const oldIds = Object.keys(ids);
+    if (oldIds.length === 0) return 0;
+    return await db.transaction('rw', db.wordProgress, async () => {
+      const stale = (await db.wordProgress.bulkGet(oldIds)).filter(Boolean);
+      for (const progress of stale) {
+        const newId = ids[progress.wordId];
+        if (!(await db.wordProgress.get(newId))) {
+          await db.wordProgress.put({ ...progress, wordId: newId });
+        }
+        await db.wordProgress.delete(progress.wordId);
+      }
+      return stale.length;
+    });
+  },
+
   // ============================================================================
   // Data Export/Import (Backup)
   // ============================================================================